@@ -0,0 +1,587 @@
+# In-process fake of the parts of supervisely.Api the pipeline uses
+#
+# Projects, datasets, images and annotations live in memory. Every call is a "request": it
+# sleeps for the configured latency plus the time to transfer its payload with the configured
+# bandwidth, so the benchmarks see the network cost without a server. Uploaded images are not
+# kept, only their info, so memory of long runs is the memory of the pipeline itself.
+
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+from supervisely import Annotation, ProjectMeta, ProjectType, VideoAnnotation
+from supervisely.api.annotation_api import AnnotationInfo
+from supervisely.api.dataset_api import DatasetInfo
+from supervisely.api.image_api import ImageInfo
+from supervisely.api.project_api import ProjectInfo
+from supervisely.api.video.video_api import VideoInfo
+from supervisely.api.workspace_api import WorkspaceInfo
+from supervisely.imaging import image as sly_image
+
+# encoded (jpeg) image size relative to raw pixels, used for the transferred bytes
+ENCODED_IMAGE_RATIO = 0.15
+
+
+def _make_info(info_cls, **fields):
+    return info_cls(**{field: fields.get(field) for field in info_cls._fields})
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+class NetworkModel:
+    """Latency (seconds per request) and bandwidth (MB/s, None for unlimited) of the fake server."""
+
+    def __init__(self, latency: float = 0.0, bandwidth: Optional[float] = None):
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def get_delay(self, nbytes: int) -> float:
+        delay = self.latency
+        if self.bandwidth:
+            delay += nbytes / (self.bandwidth * 1024 * 1024)
+        return delay
+
+
+class FakeApi:
+    """
+    Drop-in replacement of g.api for benchmarks. Items are added by the synthetic project
+    generators (see synthetic.py), stats counts requests, transferred bytes and the time spent
+    "on the network".
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        team_id: int = 1,
+        workspace_id: int = 1,
+    ):
+        self.network = NetworkModel(latency, bandwidth)
+        self.server_address = "http://fake-api"
+        self.team_id = team_id
+        self.workspace_id = workspace_id
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+        self.projects: Dict[int, ProjectInfo] = {}
+        self.project_metas: Dict[int, dict] = {}
+        self.datasets: Dict[int, DatasetInfo] = {}
+        self.images: Dict[int, ImageInfo] = {}
+        self.image_loaders: Dict[int, Callable[[], np.ndarray]] = {}
+        self.annotations: Dict[int, str] = {}
+        self.videos: Dict[int, VideoInfo] = {}
+        self.video_annotations: Dict[int, dict] = {}
+
+        self.project = _ProjectApi(self)
+        self.dataset = _DatasetApi(self)
+        self.image = _ImageApi(self)
+        self.annotation = _AnnotationApi(self)
+        self.video = _VideoApi(self)
+        self.workspace = _WorkspaceApi(self)
+
+    def new_id(self) -> int:
+        with self._lock:
+            new_id = self._next_id
+            self._next_id += 1
+        return new_id
+
+    def request(self, method: str, down: int = 0, up: int = 0):
+        """Accounts a request and sleeps for its simulated network time."""
+        delay = self.network.get_delay(down + up)
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[f"requests.{method}"] += 1
+            self.stats["bytes_down"] += down
+            self.stats["bytes_up"] += up
+            self.stats["network_sec"] += delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = Counter()
+
+    def _update_counts(self, dataset_id: int, delta: int):
+        dataset = self.datasets[dataset_id]
+        self.datasets[dataset_id] = dataset._replace(
+            items_count=dataset.items_count + delta, images_count=dataset.images_count + delta
+        )
+        project = self.projects[dataset.project_id]
+        self.projects[project.id] = project._replace(
+            items_count=project.items_count + delta, images_count=project.images_count + delta
+        )
+
+    def add_image(
+        self,
+        dataset_id: int,
+        name: str,
+        height: int,
+        width: int,
+        load: Optional[Callable[[], np.ndarray]] = None,
+        ann_json: dict = None,
+    ) -> ImageInfo:
+        """Adds an image without a request. load returns the pixels on download."""
+        dataset = self.datasets[dataset_id]
+        image_id = self.new_id()
+        info = _make_info(
+            ImageInfo,
+            id=image_id,
+            name=name,
+            hash=f"hash-{image_id}",
+            mime="image/jpeg",
+            ext=name.rsplit(".", 1)[-1],
+            size=int(height * width * 3 * ENCODED_IMAGE_RATIO),
+            width=width,
+            height=height,
+            labels_count=len(ann_json["objects"]) if ann_json else 0,
+            dataset_id=dataset_id,
+            project_id=dataset.project_id,
+            created_at=_now(),
+            updated_at=_now(),
+            meta={},
+            tags=[],
+        )
+        self.images[image_id] = info
+        if load is not None:
+            self.image_loaders[image_id] = load
+        if ann_json is None:
+            ann_json = Annotation((height, width)).to_json()
+        self.annotations[image_id] = json.dumps(ann_json)
+        self._update_counts(dataset_id, 1)
+        return info
+
+    def add_video(
+        self,
+        dataset_id: int,
+        name: str,
+        height: int,
+        width: int,
+        frames_count: int,
+        ann_json: dict = None,
+    ) -> VideoInfo:
+        """Adds a video without a request, its frames are generated on download."""
+        dataset = self.datasets[dataset_id]
+        video_id = self.new_id()
+        info = _make_info(
+            VideoInfo,
+            id=video_id,
+            name=name,
+            hash=f"hash-{video_id}",
+            team_id=self.team_id,
+            workspace_id=dataset.workspace_id,
+            project_id=dataset.project_id,
+            dataset_id=dataset_id,
+            frames_to_timecodes=[frame / 30 for frame in range(frames_count)],
+            frames_count=frames_count,
+            frame_width=width,
+            frame_height=height,
+            created_at=_now(),
+            updated_at=_now(),
+            tags=[],
+            file_meta={"size": int(height * width * 3 * frames_count * ENCODED_IMAGE_RATIO / 10)},
+            meta={},
+            custom_data={},
+        )
+        self.videos[video_id] = info
+        if ann_json is None:
+            ann_json = VideoAnnotation((height, width), frames_count).to_json()
+        self.video_annotations[video_id] = ann_json
+        self._update_counts(dataset_id, 1)
+        return info
+
+
+class _ProjectApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def _free_name(self, workspace_id: int, name: str) -> str:
+        taken = {p.name for p in self._api.projects.values() if p.workspace_id == workspace_id}
+        res_name, suffix = name, 1
+        while res_name in taken:
+            res_name = f"{name}_{suffix:03d}"
+            suffix += 1
+        return res_name
+
+    def create(
+        self,
+        workspace_id: int,
+        name: str,
+        type=ProjectType.IMAGES,
+        description: str = "",
+        change_name_if_conflict: bool = False,
+        **kwargs,
+    ) -> ProjectInfo:
+        self._api.request("project.create")
+        free_name = self._free_name(workspace_id, name)
+        if free_name != name and not change_name_if_conflict:
+            raise ValueError(f"Project {name!r} already exists")
+        project_id = self._api.new_id()
+        info = _make_info(
+            ProjectInfo,
+            id=project_id,
+            name=free_name,
+            description=description,
+            workspace_id=workspace_id,
+            team_id=self._api.team_id,
+            images_count=0,
+            items_count=0,
+            datasets_count=0,
+            type=getattr(type, "value", type),
+            custom_data={},
+            created_at=_now(),
+            updated_at=_now(),
+        )
+        self._api.projects[project_id] = info
+        self._api.project_metas[project_id] = ProjectMeta().to_json()
+        return info
+
+    def get_info_by_id(self, id: int, expected_type=None, raise_error: bool = False, **kwargs):
+        self._api.request("project.get_info_by_id")
+        info = self._api.projects.get(id)
+        if info is None and raise_error:
+            raise KeyError(f"Project {id} not found")
+        return info
+
+    def get_info_by_name(self, parent_id: int, name: str, raise_error: bool = False, **kwargs):
+        self._api.request("project.get_info_by_name")
+        for info in self._api.projects.values():
+            if info.workspace_id == parent_id and info.name == name:
+                return info
+        if raise_error:
+            raise KeyError(f"Project {name} not found")
+        return None
+
+    def get_list(self, workspace_id: int, **kwargs) -> List[ProjectInfo]:
+        self._api.request("project.get_list")
+        return [p for p in self._api.projects.values() if p.workspace_id == workspace_id]
+
+    def get_meta(self, id: int, **kwargs) -> dict:
+        meta_json = self._api.project_metas[id]
+        self._api.request("project.get_meta", down=len(json.dumps(meta_json)))
+        return meta_json
+
+    def update_meta(self, id: int, meta) -> ProjectMeta:
+        meta_json = meta.to_json() if isinstance(meta, ProjectMeta) else meta
+        self._api.request("project.update_meta", up=len(json.dumps(meta_json)))
+        self._api.project_metas[id] = meta_json
+        return ProjectMeta.from_json(meta_json)
+
+    def update_custom_data(self, id: int, data: dict, **kwargs) -> dict:
+        self._api.request("project.update_custom_data", up=len(json.dumps(data, default=str)))
+        self._api.projects[id] = self._api.projects[id]._replace(custom_data=data)
+        return data
+
+
+class _DatasetApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def _children(self, project_id: int, parent_id: Optional[int]) -> List[DatasetInfo]:
+        return [
+            ds
+            for ds in self._api.datasets.values()
+            if ds.project_id == project_id and ds.parent_id == parent_id
+        ]
+
+    def create(
+        self,
+        project_id: int,
+        name: str,
+        description: str = "",
+        change_name_if_conflict: bool = False,
+        parent_id: Optional[int] = None,
+        custom_data: dict = None,
+    ) -> DatasetInfo:
+        self._api.request("dataset.create")
+        taken = {ds.name for ds in self._children(project_id, parent_id)}
+        res_name, suffix = name, 1
+        while res_name in taken:
+            if not change_name_if_conflict:
+                raise ValueError(f"Dataset {name!r} already exists")
+            res_name = f"{name}_{suffix:03d}"
+            suffix += 1
+        dataset_id = self._api.new_id()
+        project = self._api.projects[project_id]
+        info = _make_info(
+            DatasetInfo,
+            id=dataset_id,
+            name=res_name,
+            description=description,
+            project_id=project_id,
+            images_count=0,
+            items_count=0,
+            team_id=project.team_id,
+            workspace_id=project.workspace_id,
+            parent_id=parent_id,
+            # DatasetInfo is a key of get_tree, custom data would make it unhashable
+            custom_data=None,
+            created_at=_now(),
+            updated_at=_now(),
+        )
+        self._api.datasets[dataset_id] = info
+        self._api.projects[project_id] = project._replace(datasets_count=project.datasets_count + 1)
+        return info
+
+    def get_info_by_id(self, id: int, raise_error: bool = False) -> Optional[DatasetInfo]:
+        self._api.request("dataset.get_info_by_id")
+        info = self._api.datasets.get(id)
+        if info is None and raise_error:
+            raise KeyError(f"Dataset {id} not found")
+        return info
+
+    def get_info_by_name(
+        self, project_id: int, name: str, parent_id: Optional[int] = None, **kwargs
+    ) -> Optional[DatasetInfo]:
+        self._api.request("dataset.get_info_by_name")
+        for ds in self._children(project_id, parent_id):
+            if ds.name == name:
+                return ds
+        return None
+
+    def exists(self, project_id: int, name: str, parent_id: Optional[int] = None) -> bool:
+        return self.get_info_by_name(project_id, name, parent_id) is not None
+
+    def get_or_create(
+        self, project_id: int, name: str, description: str = "", parent_id: Optional[int] = None
+    ) -> DatasetInfo:
+        info = self.get_info_by_name(project_id, name, parent_id)
+        if info is None:
+            info = self.create(project_id, name, description, parent_id=parent_id)
+        return info
+
+    def get_list(self, project_id: int, filters=None, recursive: bool = False, **kwargs):
+        self._api.request("dataset.get_list")
+        return [
+            ds
+            for ds in self._api.datasets.values()
+            if ds.project_id == project_id and (recursive or ds.parent_id is None)
+        ]
+
+    def get_tree(self, project_id: int) -> Dict[DatasetInfo, dict]:
+        self._api.request("dataset.get_tree")
+
+        def subtree(parent_id):
+            return {ds: subtree(ds.id) for ds in self._children(project_id, parent_id)}
+
+        return subtree(None)
+
+    def tree(self, project_id: int, dataset_id: Optional[int] = None):
+        def walk(tree: dict, parents: List[str]):
+            for ds, children in tree.items():
+                yield parents, ds
+                yield from walk(children, parents + [ds.name])
+
+        yield from walk(self.get_tree(project_id), [])
+
+
+class _ImageApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def get_list(self, dataset_id: int = None, filters=None, **kwargs) -> List[ImageInfo]:
+        infos = [info for info in self._api.images.values() if info.dataset_id == dataset_id]
+        ids = None
+        for f in filters or []:
+            if f["field"] == "id" and f["operator"] == "in":
+                ids = set(f["value"])
+        if ids is not None:
+            infos = [info for info in infos if info.id in ids]
+        self._api.request("image.get_list", down=256 * len(infos))
+        return infos
+
+    def get_list_generator(
+        self, dataset_id: int = None, filters=None, batch_size: int = None, **kwargs
+    ):
+        infos = [info for info in self._api.images.values() if info.dataset_id == dataset_id]
+        batch_size = batch_size or 500
+        for start in range(0, len(infos), batch_size):
+            batch = infos[start : start + batch_size]
+            self._api.request("image.get_list", down=256 * len(batch))
+            yield batch
+
+    def get_info_by_id(self, id: int, **kwargs) -> Optional[ImageInfo]:
+        self._api.request("image.get_info_by_id")
+        return self._api.images.get(id)
+
+    def get_info_by_id_batch(self, ids: List[int], **kwargs) -> List[ImageInfo]:
+        self._api.request("image.get_info_by_id_batch", down=256 * len(ids))
+        return [self._api.images[image_id] for image_id in ids]
+
+    def download_np(self, id: int, keep_alpha: bool = False) -> np.ndarray:
+        info = self._api.images[id]
+        self._api.request("image.download_np", down=info.size)
+        load = self._api.image_loaders.get(id)
+        if load is None:
+            return np.zeros((info.height, info.width, 3), dtype=np.uint8)
+        return load()
+
+    def download_nps(self, dataset_id: int, ids: List[int], **kwargs) -> List[np.ndarray]:
+        return [self.download_np(image_id) for image_id in ids]
+
+    def download_path(self, id: int, path: str):
+        sly_image.write(path, self.download_np(id))
+
+    def _upload(self, dataset_id: int, names: List[str], shapes: list, up: int, method: str):
+        self._api.request(method, up=up)
+        self._api.stats["uploaded_items"] += len(names)
+        return [
+            self._api.add_image(dataset_id, name, height, width)
+            for name, (height, width) in zip(names, shapes)
+        ]
+
+    def upload_nps(self, dataset_id: int, names: List[str], imgs: List[np.ndarray], **kwargs):
+        up = sum(int(img.nbytes * ENCODED_IMAGE_RATIO) for img in imgs)
+        shapes = [img.shape[:2] for img in imgs]
+        return self._upload(dataset_id, names, shapes, up, "image.upload_nps")
+
+    def upload_np(self, dataset_id: int, name: str, img: np.ndarray, **kwargs) -> ImageInfo:
+        return self.upload_nps(dataset_id, [name], [img])[0]
+
+    def upload_ids(self, dataset_id: int, names: List[str], ids: List[int], **kwargs):
+        shapes = [(self._api.images[i].height, self._api.images[i].width) for i in ids]
+        return self._upload(dataset_id, names, shapes, 256 * len(ids), "image.upload_ids")
+
+    def remove_batch(self, ids: List[int], **kwargs):
+        self._api.request("image.remove_batch", up=16 * len(ids))
+        for image_id in ids:
+            info = self._api.images.pop(image_id)
+            self._api.image_loaders.pop(image_id, None)
+            self._api.annotations.pop(image_id, None)
+            self._api._update_counts(info.dataset_id, -1)
+
+
+class _AnnotationApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def _info(self, image_id: int) -> AnnotationInfo:
+        image = self._api.images[image_id]
+        return AnnotationInfo(
+            image_id=image_id,
+            image_name=image.name,
+            annotation=json.loads(self._api.annotations[image_id]),
+            created_at=image.created_at,
+            updated_at=image.updated_at,
+            dataset_id=image.dataset_id,
+        )
+
+    def download(self, image_id: int, **kwargs) -> AnnotationInfo:
+        self._api.request("annotation.download", down=len(self._api.annotations[image_id]))
+        return self._info(image_id)
+
+    def download_json(self, image_id: int, **kwargs) -> dict:
+        return self.download(image_id).annotation
+
+    def download_batch(self, dataset_id: int, image_ids: List[int], **kwargs):
+        down = sum(len(self._api.annotations[image_id]) for image_id in image_ids)
+        self._api.request("annotation.download_batch", down=down)
+        return [self._info(image_id) for image_id in image_ids]
+
+    def download_json_batch(self, dataset_id: int, image_ids: List[int], **kwargs):
+        return [info.annotation for info in self.download_batch(dataset_id, image_ids)]
+
+    def get_list(self, dataset_id: int, filters=None, **kwargs) -> List[AnnotationInfo]:
+        images = self._api.image.get_list(dataset_id, filters)
+        return self.download_batch(dataset_id, [info.id for info in images])
+
+    def upload_jsons(self, img_ids: List[int], ann_jsons: List[dict], **kwargs):
+        ann_strs = [json.dumps(ann_json) for ann_json in ann_jsons]
+        self._api.request("annotation.upload", up=sum(len(s) for s in ann_strs))
+        for image_id, ann_str in zip(img_ids, ann_strs):
+            self._api.annotations[image_id] = ann_str
+
+    def upload_anns(self, img_ids: List[int], anns: List[Annotation], **kwargs):
+        self.upload_jsons(img_ids, [ann.to_json() for ann in anns])
+
+    def upload_ann(self, img_id: int, ann: Annotation, **kwargs):
+        self.upload_anns([img_id], [ann])
+
+
+class _VideoAnnotationApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def download(self, video_id: int, **kwargs) -> dict:
+        ann_json = self._api.video_annotations[video_id]
+        self._api.request("video.annotation.download", down=len(json.dumps(ann_json)))
+        return ann_json
+
+    def upload_paths(self, video_ids: List[int], ann_paths: List[str], project_meta, **kwargs):
+        for video_id, ann_path in zip(video_ids, ann_paths):
+            with open(ann_path, "r") as f:
+                ann_str = f.read()
+            self._api.request("video.annotation.upload", up=len(ann_str))
+            self._api.video_annotations[video_id] = json.loads(ann_str)
+
+
+class _VideoApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+        self.annotation = _VideoAnnotationApi(api)
+
+    def get_list(self, dataset_id: int = None, filters=None, **kwargs) -> List[VideoInfo]:
+        infos = [info for info in self._api.videos.values() if info.dataset_id == dataset_id]
+        self._api.request("video.get_list", down=512 * len(infos))
+        return infos
+
+    def get_list_generator(self, dataset_id: int = None, batch_size: int = None, **kwargs):
+        infos = [info for info in self._api.videos.values() if info.dataset_id == dataset_id]
+        batch_size = batch_size or 500
+        for start in range(0, len(infos), batch_size):
+            batch = infos[start : start + batch_size]
+            self._api.request("video.get_list", down=512 * len(batch))
+            yield batch
+
+    def get_info_by_id(self, id: int, **kwargs) -> Optional[VideoInfo]:
+        self._api.request("video.get_info_by_id")
+        return self._api.videos.get(id)
+
+    def download_path(self, id: int, path: str, **kwargs):
+        info = self._api.videos[id]
+        self._api.request("video.download_path", down=info.file_meta["size"])
+        writer = cv2.VideoWriter(
+            path, cv2.VideoWriter_fourcc(*"mp4v"), 30, (info.frame_width, info.frame_height)
+        )
+        frame = np.zeros((info.frame_height, info.frame_width, 3), dtype=np.uint8)
+        for frame_index in range(info.frames_count):
+            frame[:] = frame_index % 256
+            writer.write(frame)
+        writer.release()
+
+    def upload_paths(self, dataset_id: int, names: List[str], paths: List[str], **kwargs):
+        infos = []
+        for name, path in zip(names, paths):
+            capture = cv2.VideoCapture(path)
+            frames_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            capture.release()
+            info = self._api.add_video(dataset_id, name, height, width, frames_count)
+            self._api.request("video.upload_paths", up=info.file_meta["size"])
+            self._api.stats["uploaded_items"] += 1
+            infos.append(info)
+        return infos
+
+
+class _WorkspaceApi:
+    def __init__(self, api: FakeApi):
+        self._api = api
+
+    def get_info_by_id(self, id: int, **kwargs) -> WorkspaceInfo:
+        self._api.request("workspace.get_info_by_id")
+        return WorkspaceInfo(
+            id=id,
+            name=f"workspace {id}",
+            description="",
+            team_id=self._api.team_id,
+            created_at=_now(),
+            updated_at=_now(),
+        )
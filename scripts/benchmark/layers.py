@@ -0,0 +1,342 @@
+# Per-layer microbenchmarks on synthetic items
+#
+# Runs process_timed of the heavy geometry and augmentation layers on batches of synthetic items,
+# for every combination of image size, labels count and geometry type the layer works with.
+# The layer is created by a Net "images_project -> layer -> create_new_project" on an empty
+# synthetic project served by FakeApi, so its settings are validated and it gets the output meta
+# as in a real run. Prints ms per input item for every case.
+# Baselines: --save-baseline saves the results, --baseline compares the run with saved results
+# and exits with code 1 if some case is slower than --threshold times the baseline (or fails).
+# Run from the repository root:
+#   python -m scripts.benchmark.layers
+#   python -m scripts.benchmark.layers --layers rasterize skeletonize --sizes 1080x1920 \
+#       --labels 10 100 --geometries polygon bitmap
+#   python -m scripts.benchmark.layers --save-baseline layers_baseline.json
+#   python -m scripts.benchmark.layers --baseline layers_baseline.json --threshold 1.3
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# src.globals creates the real Api on import, it is never used for requests here
+for _name, _value in {
+    "SERVER_ADDRESS": "http://fake-api",
+    "API_TOKEN": "benchmark",
+    "TEAM_ID": "1",
+    "WORKSPACE_ID": "1",
+    "USER_ID": "1",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import src.globals as g
+from scripts.benchmark.fake_api import FakeApi
+from scripts.benchmark.pipelines import parse_size
+from scripts.benchmark.synthetic import GEOMETRIES, ImagesPool, make_annotation, make_project_meta
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.compute.Layer import Layer
+from src.compute.Net import Net
+from src.exceptions import CustomException
+from src.headless import _NoCircleProgress
+from src.utils import LegacyProjectItem
+from supervisely import Annotation, Bitmap, ObjClass, ProjectMeta, logger
+
+# bitmap class with the masks of bitwise_masks, labels of the project classes are corrected
+MASK_CLASS = "mask"
+
+
+@dataclass
+class LayerBenchmark:
+    # geometry types of the labels the layer processes
+    geometries: Tuple[str, ...]
+    # layer settings for the class of the processed labels
+    get_settings: Callable[[str], dict]
+    mask_class: bool = False
+
+
+BENCHMARKS = {
+    "mask_to_lines": LayerBenchmark(
+        ("bitmap",),
+        lambda cls: {"classes_mapping": {cls: f"{cls}_lines"}, "min_points_cnt": 2},
+    ),
+    "rasterize": LayerBenchmark(
+        ("rectangle", "polygon", "bitmap"),
+        # the layer looks up the rasterized labels classes by the source class names
+        lambda cls: {"classes_mapping": {cls: cls}},
+    ),
+    "skeletonize": LayerBenchmark(
+        ("bitmap",), lambda cls: {"classes": [cls], "method": "skeletonization"}
+    ),
+    "find_cracknets": LayerBenchmark(
+        ("polyline",),
+        lambda cls: {
+            "crack_class": cls,
+            "cracknet_class": f"{cls}_cracknet",
+            "mask_resolution": 160,
+            "loop_devide_eps": 2,
+            "min_area_in_bbox_coef": 0.3,
+            "min_poly_bbox_area_coef": 0.008,
+            "enable_subclustering": False,
+            "min_points_in_cluster": 10,
+        },
+    ),
+    "elastic_transformation": LayerBenchmark(
+        ("rectangle", "polygon", "bitmap"),
+        lambda cls: {
+            "alpha": {"min": 10, "max": 50},
+            "sigma": {"min": 3, "max": 8},
+            "classes_mapping": {cls: f"{cls}_bitmap"},
+        },
+    ),
+    "bitwise_masks": LayerBenchmark(
+        ("bitmap",),
+        lambda cls: {"type": "or", "class_mask": MASK_CLASS, "classes_to_correct": [cls]},
+        mask_class=True,
+    ),
+    "sliding_window": LayerBenchmark(
+        ("rectangle", "polygon", "bitmap"),
+        lambda cls: {"window": {"height": 256, "width": 256}, "min_overlap": {"x": 32, "y": 32}},
+    ),
+    "instances_crop": LayerBenchmark(
+        ("rectangle", "polygon", "bitmap"),
+        lambda cls: {
+            "classes": [cls],
+            "pad": {"sides": {"top": "5%", "left": "5%", "right": "10px", "bottom": "10px"}},
+        },
+    ),
+}
+
+
+def get_case_id(action: str, size: str, labels: int, geometry: str) -> str:
+    return f"{action}|{size}|{labels}|{geometry}"
+
+
+def format_error(e: Exception) -> str:
+    # str() of CustomException looks up layer titles in the UI actions, they are not loaded
+    message = e.args[0] if isinstance(e, CustomException) else str(e)
+    return f"{type(e).__name__}: {message}"
+
+
+def create_layer(api: FakeApi, action: str, geometry: str) -> Tuple[Layer, ProjectMeta]:
+    """Creates the layer in the Net of a synthetic project, returns it and the project meta."""
+    benchmark = BENCHMARKS[action]
+    meta = make_project_meta([geometry])
+    if benchmark.mask_class:
+        meta = meta.add_obj_class(ObjClass(MASK_CLASS, Bitmap))
+    project = api.project.create(
+        api.workspace_id, f"bench {action}", type="images", change_name_if_conflict=True
+    )
+    api.project.update_meta(project.id, meta)
+    api.dataset.create(project.id, "ds0")
+
+    graph = [
+        {
+            "action": "images_project",
+            "src": [f"{project.name}/*"],
+            "dst": "$data",
+            "settings": {"classes_mapping": "default", "tags_mapping": "default"},
+        },
+        {
+            "action": action,
+            "src": ["$data"],
+            "dst": "$out",
+            "settings": benchmark.get_settings(geometry),
+        },
+        {
+            "action": "create_new_project",
+            "src": ["$out"],
+            "dst": "bench result",
+            "settings": {"project_name": "bench result"},
+        },
+    ]
+    net = Net(graph, g.RESULTS_DIR, "images")
+    net.validate(_NoCircleProgress())
+    net.calc_metas()
+    layer = net.layers[1]
+    layer.preprocess()
+    return layer, meta
+
+
+def make_items(meta: ProjectMeta, height: int, width: int, labels: int, count: int, pool, rng):
+    """Annotations and image loaders of the batch items."""
+    return [
+        (make_annotation(meta, height, width, labels, rng), pool.get_loader(height, width, idx))
+        for idx in range(count)
+    ]
+
+
+def make_batch(items) -> List[Tuple[ImageDescriptor, Annotation]]:
+    batch = []
+    for idx, (ann, load_image) in enumerate(items):
+        img_desc = ImageDescriptor(
+            LegacyProjectItem(
+                project_name="bench",
+                ds_name="ds0",
+                ds_info=None,
+                item_name=f"img_{idx:06d}",
+                item_info=None,
+                ia_data={"item_ext": ".jpg"},
+                item_path="",
+                ann_path="",
+            ),
+            idx,
+            False,
+        )
+        img_desc.update_item(load_image())
+        batch.append((img_desc, ann))
+    return batch
+
+
+def run_case(layer: Layer, items, repeat: int) -> dict:
+    times = []
+    outputs_count = 0
+    for _ in range(repeat):
+        # fresh descriptors and images, layers may change them
+        batch = make_batch(items)
+        start = time.perf_counter()
+        outputs_count = sum(len(outputs) for outputs in layer.process_timed(batch))
+        times.append(time.perf_counter() - start)
+    ms_per_item = [elapsed / len(items) * 1000 for elapsed in times]
+    return {
+        "ms_per_item": round(statistics.median(ms_per_item), 3),
+        "ms_per_item_min": round(min(ms_per_item), 3),
+        "outputs_per_item": round(outputs_count / len(items), 2),
+    }
+
+
+def compare_with_baseline(results: List[dict], baseline: dict, threshold: float, min_delta: float):
+    """Marks slower cases with "regression", returns the ids of failed and regressed cases."""
+    failed = []
+    for result in results:
+        if result.get("error") is not None:
+            failed.append(result["case"])
+            continue
+        base = baseline.get(result["case"])
+        if base is None or base.get("error") is not None or not base["ms_per_item"]:
+            continue
+        ratio = result["ms_per_item"] / base["ms_per_item"]
+        result["baseline_ms_per_item"] = base["ms_per_item"]
+        result["ratio"] = round(ratio, 2)
+        if ratio > threshold and result["ms_per_item"] - base["ms_per_item"] > min_delta:
+            result["regression"] = True
+            failed.append(result["case"])
+    return failed
+
+
+def print_result(result: dict):
+    line = f"{result['case']:<48}"
+    if result.get("error") is not None:
+        print(f"{line} ERROR {result['error']}")
+        return
+    line += (
+        f"{result['ms_per_item']:10.3f} ms/item (min {result['ms_per_item_min']:.3f}), "
+        f"{result['outputs_per_item']:g} outputs/item"
+    )
+    if "ratio" in result:
+        line += f", x{result['ratio']} of baseline {result['baseline_ms_per_item']:.3f}"
+    if result.get("regression"):
+        line += "  REGRESSION"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks processing layers on synthetic items")
+    parser.add_argument("--layers", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--sizes", nargs="+", default=["720x1280"], help="image sizes, HxW")
+    parser.add_argument("--labels", nargs="+", type=int, default=[10], help="labels per image")
+    parser.add_argument(
+        "--geometries",
+        nargs="+",
+        choices=list(GEOMETRIES),
+        default=list(GEOMETRIES),
+        help="cases of the geometry types the layer does not work with are skipped",
+    )
+    parser.add_argument("--items", type=int, default=10, help="items in the batch")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, median is compared")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-baseline", help="save the results to the JSON file")
+    parser.add_argument("--baseline", help="compare with the results saved by --save-baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression"
+    )
+    parser.add_argument(
+        "--min-delta", type=float, default=0.5, help="ms/item, smaller slowdowns are ignored"
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = {result["case"]: result for result in json.load(f)["results"]}
+
+    logger.setLevel(logging.WARNING)
+    api = FakeApi(latency=0, bandwidth=None)
+    g.api = api
+    pool = ImagesPool(args.seed)
+
+    results = []
+    for action in args.layers:
+        geometries = [geom for geom in args.geometries if geom in BENCHMARKS[action].geometries]
+        for geometry in geometries:
+            try:
+                layer, meta = create_layer(api, action, geometry)
+                error = None
+            except Exception as e:
+                # e.g. a missing dependency of the layer, its cases are reported as failed
+                layer, meta = None, None
+                error = format_error(e)
+            for size, labels in itertools.product(args.sizes, args.labels):
+                result = {
+                    "case": get_case_id(action, size, labels, geometry),
+                    "layer": action,
+                    "size": size,
+                    "labels": labels,
+                    "geometry": geometry,
+                }
+                if error is not None:
+                    result["error"] = error
+                    results.append(result)
+                    continue
+                height, width = parse_size(size)
+                rng = np.random.default_rng([args.seed, height, width, labels])
+                items = make_items(meta, height, width, labels, args.items, pool, rng)
+                try:
+                    result.update(run_case(layer, items, args.repeat))
+                except Exception as e:
+                    result["error"] = format_error(e)
+                results.append(result)
+
+    failed = []
+    if baseline is not None:
+        failed = compare_with_baseline(results, baseline, args.threshold, args.min_delta)
+    for result in results:
+        print_result(result)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(
+                {
+                    "items": args.items,
+                    "repeat": args.repeat,
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if baseline is not None:
+        print(f"\n{len(failed)} of {len(results)} cases failed or regressed")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
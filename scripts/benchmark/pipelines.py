@@ -0,0 +1,206 @@
+# Pipeline benchmarks on synthetic projects, without a server
+#
+# Runs the preset templates (src/preconfigured/templates.py) with the headless runner on
+# synthetic projects served by FakeApi (see fake_api.py), with the configured latency and
+# bandwidth. For every scenario prints items/s, peak memory, network stats and time per layer.
+# Memory peak is traced with tracemalloc, which slows down allocation heavy python code: use
+# --no-trace-memory to compare timings only.
+# Run from the repository root:
+#   python -m scripts.benchmark.pipelines
+#   python -m scripts.benchmark.pipelines --scenarios copy basic-detection-augmentations \
+#       --items 200 --sizes 1080x1920 720x1280 --labels 10 100 --latency 30 --bandwidth 50
+#   python -m scripts.benchmark.pipelines --output bench.json
+
+import argparse
+import io
+import itertools
+import json
+import logging
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+# src.globals creates the real Api on import, it is never used for requests here
+for _name, _value in {
+    "SERVER_ADDRESS": "http://fake-api",
+    "API_TOKEN": "benchmark",
+    "TEAM_ID": "1",
+    "WORKSPACE_ID": "1",
+    "USER_ID": "1",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import src.globals as g
+from scripts.benchmark.fake_api import FakeApi
+from scripts.benchmark.synthetic import GEOMETRIES, ImagesPool, ProjectSpec, add_synthetic_project
+from src.compute.utils.stat_timer import global_timer
+from src.headless import JsonLinesReporter, get_layers_stats, run_preset
+from supervisely import logger
+
+DEFAULT_SCENARIOS = ["copy", "basic-detection-augmentations", "basic-segmentation-augmentations"]
+
+
+def parse_size(size: str):
+    height, width = size.lower().split("x")
+    return int(height), int(width)
+
+
+def load_templates(api: FakeApi, project_id: int) -> dict:
+    """Templates are made for the project the app is started from, the first one here."""
+    g.PROJECT_ID = project_id
+    g.DATASET_ID = None
+    from src.preconfigured.templates import templates
+
+    return templates
+
+
+def prepare_scenario(template: list) -> list:
+    graph = json.loads(json.dumps(template, default=lambda obj: None))
+    for layer in graph:
+        layer.pop("scene_location", None)  # position of the node in the UI
+        settings = layer.get("settings", {})
+        if layer["action"] == "images_project":
+            # the move and copy templates have the settings of the filtered project source
+            settings.pop("project_id", None)
+            settings.pop("filtered_entities_ids", None)
+        if layer["action"] == "move":
+            settings["move_confirmation"] = True  # every run has its own synthetic source
+        if layer["action"] == "output_project" and not settings.get("is_existing_project"):
+            # the app sets the destination of a new output project from its name
+            layer["dst"] = layer["dst"] or [settings["project_name"]]
+    return graph
+
+
+def run_scenario(api: FakeApi, graph: list, spec: ProjectSpec, pool, trace_memory: bool):
+    project = add_synthetic_project(api, spec, pool)
+    global_timer.reset()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    net = run_preset(
+        graph,
+        spec.modality,
+        srcs=[f"{project.name}/*"],
+        reporter=JsonLinesReporter(io.StringIO()),
+    )
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if net is None:
+        raise RuntimeError("Pipeline was stopped")
+
+    items = net.total_elements_cnt
+    return {
+        "items": items,
+        "elapsed_sec": round(elapsed, 3),
+        "items_per_sec": round(items / elapsed, 3),
+        "uploaded_items": api.stats["uploaded_items"],
+        "peak_memory_mb": round(peak / 2**20, 1) if peak is not None else None,
+        # process wide maximum, includes the previous runs
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "requests": api.stats["requests"],
+        "mb_down": round(api.stats["bytes_down"] / 2**20, 2),
+        "mb_up": round(api.stats["bytes_up"] / 2**20, 2),
+        "network_sec": round(api.stats["network_sec"], 3),
+        "layers": get_layers_stats(net),
+    }
+
+
+def print_result(result: dict):
+    print(
+        f"{result['scenario']} | {result['size']} | {result['labels']} labels: "
+        f"{result['items_per_sec']:.2f} items/s ({result['items']} items, "
+        f"{result['uploaded_items']} uploaded, "
+        f"{result['elapsed_sec']:.2f}s, network {result['network_sec']:.2f}s), "
+        f"peak memory {result['peak_memory_mb']} MB, max RSS {result['max_rss_mb']} MB, "
+        f"{result['requests']} requests, {result['mb_down']} MB down, {result['mb_up']} MB up"
+    )
+    for layer in sorted(result["layers"], key=lambda layer: -layer["total_sec"]):
+        print(
+            f"  {layer['action_name']:<24} {', '.join(map(str, layer['dst'])):<32} "
+            f"{layer['total_sec']:9.3f}s "
+            f"{layer['ms_per_item'] or 0:9.3f} ms/item  {layer['items_count']:6d} items"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks pipeline templates on a fake API")
+    parser.add_argument("--scenarios", nargs="+", default=DEFAULT_SCENARIOS)
+    parser.add_argument("--items", type=int, default=50, help="items per dataset")
+    parser.add_argument("--datasets", type=int, default=1)
+    parser.add_argument("--sizes", nargs="+", default=["720x1280"], help="image sizes, HxW")
+    parser.add_argument("--labels", nargs="+", type=int, default=[10], help="labels per image")
+    parser.add_argument(
+        "--geometries", nargs="+", choices=list(GEOMETRIES), default=list(ProjectSpec.geometries)
+    )
+    parser.add_argument("--latency", type=float, default=0, help="ms per request")
+    parser.add_argument("--bandwidth", type=float, default=None, help="MB/s, unlimited if unset")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario, best is shown")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-trace-memory", action="store_true")
+    parser.add_argument("--output", help="save the results to the JSON file")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    api = FakeApi(latency=args.latency / 1000, bandwidth=args.bandwidth)
+    g.api = api
+    pool = ImagesPool(args.seed)
+
+    base_spec = ProjectSpec(
+        datasets=args.datasets,
+        items_per_dataset=args.items,
+        geometries=tuple(args.geometries),
+        seed=args.seed,
+    )
+    templates = load_templates(api, add_synthetic_project(api, base_spec, pool).id)
+    unknown = [name for name in args.scenarios if name not in templates[base_spec.modality]]
+    if unknown:
+        parser.error(f"Unknown scenarios: {unknown}, available: {list(templates['images'])}")
+
+    results = []
+    for name, size, labels in itertools.product(args.scenarios, args.sizes, args.labels):
+        height, width = parse_size(size)
+        spec = ProjectSpec(
+            name=f"bench {name}",
+            datasets=args.datasets,
+            items_per_dataset=args.items,
+            height=height,
+            width=width,
+            labels_per_item=labels,
+            geometries=tuple(args.geometries),
+            seed=args.seed,
+        )
+        graph = prepare_scenario(templates[spec.modality][name])
+        # every run gets its own project, some templates change the source (e.g. "move")
+        runs = [
+            run_scenario(api, graph, spec, pool, not args.no_trace_memory)
+            for _ in range(args.repeat)
+        ]
+        best = max(runs, key=lambda run: run["items_per_sec"])
+        result = {"scenario": name, "size": size, "labels": labels, **best}
+        if args.repeat > 1:
+            result["runs_items_per_sec"] = [run["items_per_sec"] for run in runs]
+        print_result(result)
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "latency_ms": args.latency,
+                    "bandwidth_mb_per_sec": args.bandwidth,
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# Synthetic projects for the benchmarks
+#
+# Images are smooth gradients with noise, labels are random shapes of the requested geometry
+# types inside the image. Everything is generated from the seed, so runs are comparable.
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import cv2
+import numpy as np
+from supervisely import (
+    Annotation,
+    Bitmap,
+    Label,
+    ObjClass,
+    Point,
+    PointLocation,
+    Polygon,
+    Polyline,
+    ProjectMeta,
+    ProjectType,
+    Rectangle,
+)
+from supervisely.geometry.geometry import Geometry
+
+GEOMETRIES = {
+    "rectangle": Rectangle,
+    "polygon": Polygon,
+    "bitmap": Bitmap,
+    "polyline": Polyline,
+    "point": Point,
+}
+# geometry_name() of Polyline is "line"
+_GEOMETRY_NAMES = {geometry_type: name for name, geometry_type in GEOMETRIES.items()}
+
+# distinct images generated per image size, downloads return copies of them
+IMAGES_POOL_SIZE = 4
+
+
+@dataclass
+class ProjectSpec:
+    name: str = "synthetic"
+    datasets: int = 1
+    items_per_dataset: int = 50
+    height: int = 720
+    width: int = 1280
+    labels_per_item: int = 10
+    geometries: Tuple[str, ...] = ("rectangle", "polygon", "bitmap")
+    modality: str = "images"
+    frames_count: int = 30
+    seed: int = 0
+
+    @property
+    def items_count(self) -> int:
+        return self.datasets * self.items_per_dataset
+
+
+def make_project_meta(geometries: Sequence[str]) -> ProjectMeta:
+    """One class per geometry type, named after it."""
+    obj_classes = []
+    for idx, geometry in enumerate(geometries):
+        color = [(idx * 67) % 256, (idx * 131 + 80) % 256, (idx * 197 + 160) % 256]
+        obj_classes.append(ObjClass(geometry, GEOMETRIES[geometry], color=color))
+    return ProjectMeta(obj_classes=obj_classes)
+
+
+def make_image(height: int, width: int, rng: np.random.Generator) -> np.ndarray:
+    rows = np.linspace(0, 255, height, dtype=np.float32)[:, None, None]
+    cols = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+    phase = rng.uniform(0, 1, size=3).astype(np.float32)
+    img = (rows * phase + cols * (1 - phase)) % 256
+    img += rng.normal(0, 12, size=(height, width, 3)).astype(np.float32)
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+def _random_box(height: int, width: int, rng: np.random.Generator) -> Tuple[int, int, int, int]:
+    box_h = int(rng.uniform(0.02, 0.25) * height) + 2
+    box_w = int(rng.uniform(0.02, 0.25) * width) + 2
+    top = int(rng.integers(0, max(height - box_h, 1)))
+    left = int(rng.integers(0, max(width - box_w, 1)))
+    return top, left, min(top + box_h, height) - 1, min(left + box_w, width) - 1
+
+
+def make_geometry(
+    geometry: str, height: int, width: int, rng: np.random.Generator, vertices: int = 16
+) -> Geometry:
+    top, left, bottom, right = _random_box(height, width, rng)
+    if geometry == "rectangle":
+        return Rectangle(top, left, bottom, right)
+    if geometry == "point":
+        return Point(int(rng.integers(top, bottom + 1)), int(rng.integers(left, right + 1)))
+
+    center_r, center_c = (top + bottom) / 2, (left + right) / 2
+    radius_r, radius_c = (bottom - top) / 2, (right - left) / 2
+    if geometry == "polygon":
+        angles = np.sort(rng.uniform(0, 2 * np.pi, size=vertices))
+        scale = rng.uniform(0.6, 1.0, size=vertices)
+        return Polygon(
+            [
+                PointLocation(
+                    int(center_r + radius_r * s * np.sin(a)),
+                    int(center_c + radius_c * s * np.cos(a)),
+                )
+                for a, s in zip(angles, scale)
+            ]
+        )
+    if geometry == "polyline":
+        rows = rng.integers(top, bottom + 1, size=vertices)
+        cols = np.sort(rng.integers(left, right + 1, size=vertices))
+        return Polyline([PointLocation(int(r), int(c)) for r, c in zip(rows, cols)])
+    if geometry == "bitmap":
+        mask = np.zeros((bottom - top + 1, right - left + 1), dtype=np.uint8)
+        axes = (max(int(radius_c), 1), max(int(radius_r), 1))
+        center = (int(radius_c), int(radius_r))
+        cv2.ellipse(mask, center, axes, float(rng.uniform(0, 180)), 0, 360, 1, -1)
+        return Bitmap(mask.astype(bool), origin=PointLocation(top, left))
+    raise ValueError(f"Unknown geometry {geometry!r}, expected one of {list(GEOMETRIES)}")
+
+
+def make_annotation(
+    meta: ProjectMeta, height: int, width: int, labels_count: int, rng: np.random.Generator
+) -> Annotation:
+    """labels_count labels, geometry types of the meta classes in turn."""
+    obj_classes = list(meta.obj_classes)
+    labels: List[Label] = []
+    for idx in range(labels_count):
+        obj_class = obj_classes[idx % len(obj_classes)]
+        geometry = make_geometry(_GEOMETRY_NAMES[obj_class.geometry_type], height, width, rng)
+        labels.append(Label(geometry, obj_class))
+    return Annotation((height, width), labels=labels)
+
+
+class ImagesPool:
+    """A few generated images per size, loaders return copies (as a decoded download would)."""
+
+    def __init__(self, seed: int = 0, size: int = IMAGES_POOL_SIZE):
+        self.seed = seed
+        self.size = size
+        self._images: Dict[Tuple[int, int], List[np.ndarray]] = {}
+
+    def get_loader(self, height: int, width: int, idx: int):
+        images = self._images.get((height, width))
+        if images is None:
+            rng = np.random.default_rng([self.seed, height, width])
+            images = [make_image(height, width, rng) for _ in range(self.size)]
+            self._images[(height, width)] = images
+        image = images[idx % self.size]
+        return image.copy
+
+
+def add_synthetic_project(api, spec: ProjectSpec, pool: ImagesPool = None):
+    """Creates the project of the spec in the FakeApi, returns its ProjectInfo."""
+    rng = np.random.default_rng(spec.seed)
+    pool = pool or ImagesPool(spec.seed)
+    meta = make_project_meta(spec.geometries)
+    project_type = ProjectType.IMAGES if spec.modality == "images" else ProjectType.VIDEOS
+    project = api.project.create(
+        api.workspace_id, spec.name, type=project_type, change_name_if_conflict=True
+    )
+    api.project.update_meta(project.id, meta)
+    for ds_idx in range(spec.datasets):
+        dataset = api.dataset.create(project.id, f"ds{ds_idx}")
+        for item_idx in range(spec.items_per_dataset):
+            if spec.modality == "images":
+                ann = make_annotation(meta, spec.height, spec.width, spec.labels_per_item, rng)
+                api.add_image(
+                    dataset.id,
+                    f"img_{item_idx:06d}.jpg",
+                    spec.height,
+                    spec.width,
+                    pool.get_loader(spec.height, spec.width, item_idx),
+                    ann.to_json(),
+                )
+            else:
+                api.add_video(
+                    dataset.id,
+                    f"video_{item_idx:06d}.mp4",
+                    spec.height,
+                    spec.width,
+                    spec.frames_count,
+                )
+    project = api.project.get_info_by_id(project.id)
+    api.reset_stats()
+    return project
@@ -0,0 +1,57 @@
+# Import-time benchmark of the app modules
+#
+# Every module is imported in a fresh interpreter with "-X importtime", the script prints
+# the wall time of the import (best of N runs) and the heaviest imports by cumulative time.
+# Run from the repository root with the same env (local.env) as the app:
+#   python scripts/benchmark_imports.py
+#   python scripts/benchmark_imports.py --modules src.compute.Net --repeat 5 --top 30
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_MODULES = [
+    "src.globals",
+    "src.compute.Net",
+    "src.ui.dtl",
+]
+
+
+def import_once(module: str):
+    """Returns (wall time in seconds, [(cumulative us, self us, name)])."""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.getcwd())
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{result.stderr[-2000:]}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        imports.append((int(cumulative_us), int(self_us), name.strip()))
+    return elapsed, imports
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [import_once(module) for _ in range(args.repeat)]
+        best_time, imports = min(runs, key=lambda run: run[0])
+        print(f"{module}: best {best_time:.3f}s of {args.repeat} runs")
+        for cumulative_us, self_us, name in sorted(imports, reverse=True)[: args.top]:
+            print(f"  {cumulative_us / 1000:9.1f} ms  (self {self_us / 1000:7.1f} ms)  {name}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
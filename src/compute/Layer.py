@@ -9,8 +9,10 @@ from time import time
 
 import jsonschema
 
-from supervisely import ProjectMeta, TagMeta, ObjClass, Annotation, rand_str
+from supervisely import ProjectMeta, TagMeta, ObjClass, Annotation
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.compute.dtl_utils.name_allocator import NameAllocator
+from src.compute.dtl_utils.sharding import SharedNameAllocator
 from src.compute.utils import json_utils
 from src.compute.utils import os_utils
 from src.compute.utils.stat_timer import TinyTimer, global_timer
@@ -107,7 +109,13 @@ class Layer:
         self.output_meta = None
 
         # for save layers
-        self.existing_names = {}
+        self._shared_entities = {}
+        coordinator = getattr(net, "coordinator", None)
+        if coordinator is not None and coordinator.is_shard:
+            namespace = f"{self.action}:{','.join(self.dsts)}"
+            self.name_allocator = SharedNameAllocator(coordinator, namespace)
+        else:
+            self.name_allocator = NameAllocator()
 
     @classmethod
     def get_action(cls):
@@ -154,6 +162,17 @@ class Layer:
         """Defines if data or it's annotation is modified by the Layer"""
         return False
 
+    def saves_items(self):
+        """Defines if the save Layer saves the images of the items (not only annotations)"""
+        return self.type == "save"
+
+    def get_fan_out(self) -> float:
+        """
+        Estimated memory of the Layer outputs for one input item, in input items
+        (e.g. copies or crops of the image). Used to size batches, see dtl_utils.batch_sizing
+        """
+        return 1
+
     def validate_source_connections(self):
         for src in self.srcs:
             if src == Layer.null:
@@ -610,6 +629,54 @@ class Layer:
     def postprocess(self):
         pass
 
+    # sharded runs (see dtl_utils.sharding): postprocess runs in every shard, the work which has
+    # to be done once for the whole run (e.g. creating labeling jobs) is moved to finalize
+    def is_shard_run(self) -> bool:
+        coordinator = getattr(self.net, "coordinator", None)
+        return coordinator is not None and coordinator.defers_finalize
+
+    def get_shard_state(self):
+        """JSON serializable state of the shard which finalize needs."""
+        return None
+
+    def finalize(self, shard_states: list):
+        """Runs once after all shards are finished, shard_states are get_shard_state results."""
+        pass
+
+    # checkpointed runs (see dtl_utils.run_journal)
+    def checkpoint(self):
+        """Makes results of the processed items durable (e.g. flushes buffered uploads)."""
+        pass
+
+    def get_checkpoint_delta(self):
+        """JSON serializable state added since the previous checkpoint, None if no state."""
+        return None
+
+    def restore_checkpoint(self, deltas: list):
+        """Restores the state of a resumed run from the get_checkpoint_delta results."""
+        pass
+
+    def create_shared(self, key: str, create, load, get_id=lambda info: info.id):
+        """
+        Creates a destination entity (project, dataset) once for all shards of a sharded run:
+        create() runs in one of them, the others load(id) it. In regular runs calls create().
+        """
+        coordinator = getattr(self.net, "coordinator", None)
+        if coordinator is None:
+            return create()
+        if key in self._shared_entities:
+            return self._shared_entities[key]
+        created = []
+
+        def create_id():
+            created.append(create())
+            return get_id(created[0])
+
+        entity_id = coordinator.once(f"{self.action}:{','.join(self.dsts)}:{key}", create_id)
+        entity = created[0] if len(created) > 0 else load(entity_id)
+        self._shared_entities[key] = entity
+        return entity
+
     def process_timed(self, data_batch: List[Tuple[ImageDescriptor, Annotation]]):
         tm = TinyTimer()
         if self.has_batch_processing():
@@ -710,17 +777,10 @@ class Layer:
     #     return folder
 
     def get_free_name(self, name: str, dataset_name: str, project_name: str):
-        new_name = name
-        full_ds_name = f"{project_name}/{dataset_name}"
-        names_in_ds = self.existing_names.get(full_ds_name, set())
-
-        while new_name in names_in_ds:
-            new_name = name + "_" + rand_str(10)
-
-        names_in_ds.add(new_name)
-        self.existing_names[full_ds_name] = names_in_ds
+        return self.name_allocator.allocate(name, f"{project_name}/{dataset_name}")
 
-        return new_name
+    def get_free_names(self, names: List[str], dataset_name: str, project_name: str):
+        return self.name_allocator.allocate_batch(names, f"{project_name}/{dataset_name}")
 
 
 def add_false_additional_properties(params):
@@ -2,6 +2,7 @@
 
 import json
 import os
+from copy import copy
 from time import time
 
 import numpy as np
@@ -39,11 +40,34 @@ from supervisely.io.fs import get_file_ext
 
 
 class Net:
-    def __init__(self, graph_desc, output_folder, modality):
+    def __init__(
+        self,
+        graph_desc,
+        output_folder,
+        modality,
+        source=None,
+        sink=None,
+        coordinator=None,
+        journal=None,
+    ):
         self.layers = []
         self.preview_mode = False
         self.modality = modality
         self.total_elements_cnt = None
+        # storage backends, the API is used if not set (see dtl_utils.local_storage)
+        self.source = source
+        self.sink = sink
+        # sharded runs (see dtl_utils.sharding), shard_plan is set by load_shard_plan
+        self.coordinator = coordinator
+        self.shard_plan = None
+        # checkpointed runs (see dtl_utils.run_journal), requires the coordinator
+        self.journal = journal
+        # memory bounded batches of get_elements_generator_batched (see dtl_utils.batch_sizing)
+        self.batch_sizer = None
+        # images from the API are downloaded by the first layer which needs them, so the items
+        # dropped by annotation filters before it are not downloaded (see download_items)
+        self.download_on_demand = False
+        self.downloaded_items_cnt = 0
 
         if type(graph_desc) is str:
             graph_path = graph_desc
@@ -55,30 +79,100 @@ class Net:
         else:
             self.graph = graph_desc
 
+        self.output_folder = output_folder
+        self.layers_keys = None
+        self._output_metas = {}  # {id(layer): (layer, input_metas, output_meta)}
         for layer_config in self.graph:
-            if "action" not in layer_config:
-                raise BadSettingsError(
-                    'Missing "action" field in layer config', extra={"layer_config": layer_config}
-                )
-            action = layer_config["action"]
-            if action not in Layer.actions_mapping:
-                raise ActionNotFoundError(action)
-            layer_cls = Layer.actions_mapping[action]
-            if layer_cls.type == "data":
-                layer = layer_cls(layer_config, net=self)
-            elif layer_cls.type == "processing":
-                layer = layer_cls(layer_config, net=self)
-            elif layer_cls.type == "save":
-                layer = layer_cls(layer_config, output_folder, net=self)
-                self.save_layer = layer
-            else:
-                raise NotImplementedError()
-            self.layers.append(layer)
+            self.layers.append(self._create_layer(layer_config))
 
         self.flat_out_names = False  # @TODO: move out
         self.annot_archive = None
         self.reset_existing_names()
 
+    def _create_layer(self, layer_config):
+        if "action" not in layer_config:
+            raise BadSettingsError(
+                'Missing "action" field in layer config', extra={"layer_config": layer_config}
+            )
+        action = layer_config["action"]
+        if action not in Layer.actions_mapping:
+            raise ActionNotFoundError(action)
+        layer_cls = Layer.actions_mapping[action]
+        if layer_cls.type == "data":
+            layer = layer_cls(layer_config, net=self)
+        elif layer_cls.type == "processing":
+            layer = layer_cls(layer_config, net=self)
+        elif layer_cls.type == "save":
+            layer = layer_cls(layer_config, self.output_folder, net=self)
+            self.save_layer = layer
+        else:
+            raise NotImplementedError()
+        return layer
+
+    def update_layer(self, idx, layer_config) -> bool:
+        """Recreates the layer only if its config has changed. Returns True if recreated."""
+        layer = self.layers[idx]
+        if layer._config == layer_config:
+            return False
+        self._output_metas.pop(id(layer), None)
+        self.layers[idx] = self._create_layer(layer_config)
+        self.graph[idx] = layer_config
+        return True
+
+    def update_graph(self, graph_desc, layers_keys):
+        """
+        Applies a new graph to the existing net. Layers are matched by keys (ui layer ids),
+        layers with unchanged config are kept with their state, only added and reconfigured
+        layers are created. Returns indexes of created layers.
+        """
+        old_layers = {}
+        if self.layers_keys is not None:
+            old_layers = dict(zip(self.layers_keys, self.layers))
+
+        new_layers = []
+        created = []
+        for idx, (key, layer_config) in enumerate(zip(layers_keys, graph_desc)):
+            layer = old_layers.pop(key, None)
+            if layer is None or layer._config != layer_config:
+                layer = self._create_layer(layer_config)
+                created.append(idx)
+            elif layer.type == "save":
+                self.save_layer = layer
+            new_layers.append(layer)
+
+        for layer in old_layers.values():
+            self._output_metas.pop(id(layer), None)
+        self.graph = graph_desc
+        self.layers = new_layers
+        self.layers_keys = list(layers_keys)
+        return created
+
+    def snapshot(self):
+        """Returns a shallow copy of the net which shares layers with it but has its own
+        layers list, so routing of a running preview is stable while the net is updated."""
+        net = copy(self)
+        net.layers = list(self.layers)
+        net.graph = list(self.graph)
+        if self.layers_keys is not None:
+            net.layers_keys = list(self.layers_keys)
+        return net
+
+    def make_layer_output_meta(self, idx, input_metas_dict):
+        """Calculates output meta of the layer, the result is reused while the layer
+        and its input metas are unchanged."""
+        layer = self.layers[idx]
+        cached = self._output_metas.get(id(layer))
+        if cached is not None and layer.type != "data":
+            _, cached_inputs, output_meta = cached
+            if cached_inputs.keys() == input_metas_dict.keys() and all(
+                cached_inputs[src] is meta or cached_inputs[src] == meta
+                for src, meta in input_metas_dict.items()
+            ):
+                return output_meta
+        output_meta = layer.make_output_meta(input_metas_dict)
+        self._output_metas[id(layer)] = (layer, dict(input_metas_dict), output_meta)
+        return output_meta
+
     def validate(self, circle_progress: CircleProgress):
         graph_has_datal = False
         graph_has_savel = False
@@ -127,9 +221,14 @@ class Net:
             for src in data_layer.srcs:
                 project_name = src.split("/")[0]
                 if project_name not in input_project_metas:
-                    input_project_metas[project_name] = get_project_meta(
-                        get_project_by_name(project_name).id
-                    )
+                    if self.source is not None:
+                        input_project_metas[project_name] = self.source.get_project_meta(
+                            project_name
+                        )
+                    else:
+                        input_project_metas[project_name] = get_project_meta(
+                            get_project_by_name(project_name).id
+                        )
         return input_project_metas
 
     def preprocess(self):
@@ -139,6 +238,19 @@ class Net:
     def postprocess(self):
         for layer in self.layers:
             layer.postprocess()
+        if self.coordinator is not None and self.coordinator.defers_finalize:
+            self.coordinator.save_state(
+                {idx: layer.get_shard_state() for idx, layer in enumerate(self.layers)}
+            )
+
+    def finalize(self):
+        """Runs the once-per-run part of postprocess after all shards are finished."""
+        unfinished = self.coordinator.get_unfinished_shards()
+        if len(unfinished) > 0:
+            raise GraphError("Not all shards are finished", extra={"unfinished_shards": unfinished})
+        states = self.coordinator.load_states()
+        for idx, layer in enumerate(self.layers):
+            layer.finalize(states.get(idx, []))
 
     def may_require_items(self):
         for l in self.layers:
@@ -217,6 +329,8 @@ class Net:
 
     def reset_existing_names(self):
         self.existing_names = {}
+        for layer in self.layers:
+            layer.name_allocator.reset()
 
     def start(self, data_batch, layers_idx_whitelist=None):
         if len(data_batch) == 0:
@@ -302,9 +416,21 @@ class Net:
 
     def process(self, indx, data_batch, layers_idx_whitelist=None):
         layer: Layer = self.layers[indx]
+        journal = self.journal if layer.type == "save" else None
+        if journal is not None and journal.resumed:
+            data_batch = [
+                data_el for data_el in data_batch if not journal.is_saved(indx, data_el[0])
+            ]
+            if len(data_batch) == 0:
+                return
+        # save layers upload the images of all items if some layer requires them
+        if self.download_on_demand and (layer.requires_item() or layer.saves_items()):
+            self.download_items(data_batch)
         for layer_output in layer.process_timed(data_batch):
             if layer_output is None or len(layer_output) == 0:
                 raise RuntimeError("Layer_output ({}) is None.".format(layer))
+            if journal is not None:
+                journal.add_saved(indx, [data_el[0] for data_el in layer_output])
 
             # output layers
             if len(layer_output[0]) == 1:
@@ -360,11 +486,110 @@ class Net:
             ):
                 yield x
 
+    def download_items(self, data_batch):
+        """Downloads the images of the items of the batch which are not downloaded yet."""
+        datasets_items = {}
+        for img_desc, _ in data_batch:
+            if img_desc.item_data is None:
+                item_info = img_desc.info.item_info
+                items = datasets_items.setdefault(item_info.dataset_id, {})
+                items.setdefault(item_info.id, []).append(img_desc)
+        for dataset_id, items in datasets_items.items():
+            imgs = g.api.image.download_nps(dataset_id, list(items))
+            for img_descs, img in zip(items.values(), imgs):
+                # copies of the same item get their own images, layers may change them in place
+                for idx, img_desc in enumerate(img_descs):
+                    img_desc.update_item(img if idx == 0 else img.copy())
+            self.downloaded_items_cnt += len(items)
+
     ############################################################################################################
     # Process classes begin
     ############################################################################################################
+    def get_data_srcs(self):
+        return [src for layer in self.layers if layer.type == "data" for src in layer.srcs]
+
+    def get_input_datasets(self):
+        """Returns {project_id: [dataset_id]} of the data layers sources, every dataset once."""
+        data_layers_idxs = [idx for idx, layer in enumerate(self.layers) if layer.type == "data"]
+        project_datasets = {}
+        added = set()
+        for data_layer_idx in data_layers_idxs:
+            data_layer = self.layers[data_layer_idx]
+            for src in data_layer.srcs:
+                src_parts = src.split("/")
+                project_name, dataset_name = src_parts[0], src_parts[-1]
+                project = get_project_by_name(project_name)
+                if dataset_name == "*":
+                    project_datasets.setdefault(project.id, [])
+                    for dataset in get_all_datasets(project.id):
+                        if dataset.id not in added:
+                            project_datasets[project.id].append(dataset.id)
+                            added.add(dataset.id)
+                else:
+                    dataset = get_dataset_by_name(dataset_name, project.id)
+                    if dataset.id not in added:
+                        project_datasets.setdefault(project.id, []).append(dataset.id)
+                        added.add(dataset.id)
+        return project_datasets
+
+    def get_items_keys(self):
+        """Returns [(dataset_key, sorted item keys)] of the input items for sharding."""
+        if self.source is not None:
+            return self.source.get_items_keys(self.get_data_srcs())
+        datasets_keys = []
+        for dataset_ids in self.get_input_datasets().values():
+            for dataset_id in dataset_ids:
+                if self.modality == "images":
+                    infos = g.api.image.get_list(dataset_id)
+                else:
+                    infos = g.api.video.get_list(dataset_id)
+                ids = [info.id for info in infos]
+                if g.FILTERED_ENTITIES.has_selection:
+                    ids = [item_id for item_id in ids if item_id in g.FILTERED_ENTITIES]
+                datasets_keys.append((str(dataset_id), sorted(ids)))
+        return datasets_keys
+
+    def load_shard_plan(self):
+        self.shard_plan = self.coordinator.get_plan(self.graph, self.get_items_keys)
+        if self.journal is not None and self.journal.resumed:
+            self.shard_plan.skip(self.journal.done_items)
+            for idx, deltas in self.journal.layers_states.items():
+                self.layers[idx].restore_checkpoint(deltas)
+        logger.info(
+            f"Shard {self.coordinator.shard_index + 1}/{self.coordinator.shard_count}: "
+            f"{self.shard_plan.items_count} items"
+        )
+        return self.shard_plan
+
+    def checkpoint(self, data_batch, completed: bool):
+        """
+        Flushes buffered results of the layers and writes the journal record of the batch.
+        Items of a batch which is not completed (error or stop) are not marked as processed,
+        only the ones the save layers have saved.
+        """
+        for layer in self.layers:
+            layer.checkpoint()
+        layers_states = {}
+        for idx, layer in enumerate(self.layers):
+            delta = layer.get_checkpoint_delta()
+            if delta is not None:
+                layers_states[idx] = delta
+        processed_items = [item_desc for item_desc, _ in data_batch] if completed else []
+        self.journal.write_checkpoint(
+            len(data_batch) if completed else 0, processed_items, layers_states
+        )
+
     def get_total_elements(self):
-        if len(g.FILTERED_ENTITIES) > 0:
+        if self.shard_plan is not None:
+            self.total_elements_cnt = self.shard_plan.items_count
+            return self.total_elements_cnt
+
+        if self.source is not None:
+            total = self.source.get_total_elements(self.get_data_srcs())
+            self.total_elements_cnt = total
+            return total
+
+        if g.FILTERED_ENTITIES.has_selection:
             return len(g.FILTERED_ENTITIES)
 
         total = 0
@@ -484,39 +709,44 @@ class Net:
                             data_el = (vid_desc, ann)
                             yield data_el
 
+    def _split_batch(self, items_infos: list, batch_size: int):
+        if self.batch_sizer is None:
+            return batched(items_infos, batch_size)
+        return self.batch_sizer.split(items_infos)
+
     def get_elements_generator_batched(self, batch_size):
-        require_items = self.may_require_items()
-        data_layers_idxs = [idx for idx, layer in enumerate(self.layers) if layer.type == "data"]
-        project_datasets = {}
-        added = set()
+        shard = self.shard_plan
+        if self.source is not None:
+            yield from self.source.get_elements_generator_batched(
+                self.get_data_srcs(), batch_size, shard, self.batch_sizer
+            )
+            return
+
+        self.download_on_demand = self.modality == "images" and self.may_require_items()
+        project_datasets = self.get_input_datasets()
         item_idx = 0
-        for data_layer_idx in data_layers_idxs:
-            data_layer = self.layers[data_layer_idx]
-            for src in data_layer.srcs:
-                src_parts = src.split("/")
-                project_name, dataset_name = src_parts[0], src_parts[-1]
-                project = get_project_by_name(project_name)
-                if dataset_name == "*":
-                    project_datasets.setdefault(project.id, [])
-                    datasets = get_all_datasets(project.id)
-                    for dataset in datasets:
-                        if dataset.id not in added:
-                            project_datasets[project.id].append(dataset.id)
-                            added.add(dataset.id)
-                else:
-                    dataset = get_dataset_by_name(dataset_name, project.id)
-                    if dataset.id not in added:
-                        project_datasets.setdefault(project.id, []).append(dataset.id)
-                        added.add(dataset.id)
         for project_id, dataset_ids in project_datasets.items():
+            if shard is not None:
+                dataset_ids = [ds_id for ds_id in dataset_ids if shard.has_dataset(str(ds_id))]
+                if len(dataset_ids) == 0:
+                    continue
             project_meta = get_project_meta(project_id)
             project_info = get_project_by_id(project_id)
             for dataset_id in dataset_ids:
                 dataset_info = get_dataset_by_id(dataset_id)
                 if self.modality == "images":
                     images_list = g.api.image.get_list(dataset_id=dataset_id)
+                    if shard is not None:
+                        images_list = sorted(
+                            (
+                                info
+                                for info in images_list
+                                if shard.contains(str(dataset_id), info.id)
+                            ),
+                            key=lambda info: info.id,
+                        )
                     # check if we need to filter items
-                    if len(g.FILTERED_ENTITIES) > 0:
+                    if g.FILTERED_ENTITIES.has_selection:
                         images_list = [
                             item_info
                             for item_info in images_list
@@ -536,9 +766,10 @@ class Net:
                         images_ids = [item_info.id for item_info in images_list]
                         annotations = g.api.annotation.download_batch(dataset_id, images_ids)
 
-                    for batch, ann_batch in zip(
-                        batched(images_list, batch_size), batched(annotations, batch_size)
-                    ):
+                    ann_offset = 0
+                    for batch in self._split_batch(images_list, batch_size):
+                        ann_batch = annotations[ann_offset : ann_offset + len(batch)]
+                        ann_offset += len(batch)
                         start_items_batch_time = time()
 
                         items_batch = []
@@ -551,7 +782,10 @@ class Net:
                                     ds_info=dataset_info,
                                     item_name=".".join(img_info.name.split(".")[:-1]),
                                     item_info=img_info,
-                                    ia_data={"item_ext": "." + img_info.ext},
+                                    ia_data={
+                                        "item_ext": "." + img_info.ext,
+                                        "source_key": [str(dataset_id), img_info.id],
+                                    },
                                     item_path="",
                                     ann_path="",
                                 ),
@@ -563,10 +797,6 @@ class Net:
                             #     (img_info.height, img_info.width, 3), dtype=np.uint8
                             # )
 
-                            if require_items:
-                                img_data = g.api.image.download_np(img_info.id)
-                                img_desc.update_item(img_data)
-
                             # if require_ann:
                             ann = Annotation.from_json(ann_info.annotation, project_meta)
                             data_el = (img_desc, ann)
@@ -578,9 +808,18 @@ class Net:
                         yield items_batch
 
                 elif self.modality == "videos":
-                    for batch in g.api.video.get_list_generator(
+                    pages = g.api.video.get_list_generator(
                         dataset_id=dataset_id, batch_size=batch_size
-                    ):
+                    )
+                    if shard is not None:
+                        pages = (
+                            [info for info in page if shard.contains(str(dataset_id), info.id)]
+                            for page in pages
+                        )
+                    batches = (
+                        batch for page in pages for batch in self._split_batch(page, batch_size)
+                    )
+                    for batch in batches:
                         items_batch = []
                         for vid_info in batch:
                             item_idx += 1
@@ -592,7 +831,10 @@ class Net:
                                     ds_info=dataset_info,
                                     item_name=".".join(vid_info.name.split(".")[:-1]),
                                     item_info=vid_info,
-                                    ia_data={"item_ext": vid_ext},
+                                    ia_data={
+                                        "item_ext": vid_ext,
+                                        "source_key": [str(dataset_id), vid_info.id],
+                                    },
                                     item_path="",
                                     ann_path="",
                                 ),
@@ -1,4 +1,6 @@
-from typing import Union, Callable
+from typing import List, Optional, Tuple, Union, Callable
+
+import numpy as np
 from supervisely import (
     Annotation,
     VideoAnnotation,
@@ -7,7 +9,13 @@ from supervisely import (
     Frame,
     VideoObject,
     VideoObjectCollection,
+    Bitmap,
+    Label,
+    ObjClass,
+    PointLocation,
+    Rectangle,
 )
+from supervisely.geometry.geometry import Geometry
 
 
 def apply_to_labels(ann: Union[Annotation, VideoAnnotation], fn: Callable):
@@ -27,3 +35,40 @@ def apply_to_frames(ann: VideoAnnotation, fn: Callable):
     frames_col = FrameCollection(new_frames)
     ann = ann.clone(frames=frames_col)
     return ann
+
+
+def geometry_to_bitmap(
+    geometry: Geometry, img_size: Tuple[int, int], thickness: int = 1
+) -> Optional[Bitmap]:
+    """
+    Draws geometry into a canvas of its bounding box padded by thickness (instead of the whole
+    image) and clipped to the image. Returns Bitmap placed at the canvas origin or None if
+    nothing is drawn inside the image.
+    """
+    if isinstance(geometry, Bitmap):
+        cropped = geometry.crop(Rectangle.from_size(img_size))
+        return cropped[0] if len(cropped) > 0 else None
+
+    bbox = geometry.to_bbox()
+    top = max(bbox.top - thickness, 0)
+    left = max(bbox.left - thickness, 0)
+    bottom = min(bbox.bottom + thickness, img_size[0] - 1)
+    right = min(bbox.right + thickness, img_size[1] - 1)
+    if top > bottom or left > right:
+        return None
+
+    canvas = np.zeros((bottom - top + 1, right - left + 1), np.uint8)
+    geometry.translate(-top, -left).draw(canvas, color=1, thickness=thickness)
+    if not canvas.any():
+        return None
+    return Bitmap(canvas, origin=PointLocation(top, left), extra_validation=False)
+
+
+def label_to_bitmap(
+    label: Label, obj_class: ObjClass, img_size: Tuple[int, int], thickness: int = 1
+) -> List[Label]:
+    """Converts label to Bitmap of obj_class, see geometry_to_bitmap."""
+    bitmap = geometry_to_bitmap(label.geometry, img_size, thickness)
+    if bitmap is None:
+        return []
+    return [label.clone(geometry=bitmap, obj_class=obj_class)]
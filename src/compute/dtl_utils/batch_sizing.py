@@ -0,0 +1,119 @@
+# coding: utf-8
+
+from typing import Iterator, List, Optional, Sequence
+
+from supervisely import logger
+
+# decoded RGB uint8 image
+BYTES_PER_PIXEL = 3
+
+
+def get_item_memory(item_info, modality: str) -> int:
+    """
+    Estimated memory of the decoded item in bytes from its ImageInfo or VideoInfo, 0 if unknown.
+    For videos it is the file size if the server knows it, else the size of a decoded frame.
+    """
+    if item_info is None:
+        return 0
+    if modality == "images":
+        height, width = item_info.height, item_info.width
+    else:
+        size = (getattr(item_info, "file_meta", None) or {}).get("size")
+        if size is not None:
+            return int(size)
+        # infos of local videos have no frame size
+        height = getattr(item_info, "frame_height", None)
+        width = getattr(item_info, "frame_width", None)
+    if not height or not width:
+        return 0
+    return height * width * BYTES_PER_PIXEL
+
+
+def get_memory_factor(net) -> float:
+    """
+    Estimated peak memory of a batch in memory of its input items. Items are processed depth
+    first: the batch and the outputs of the layers on the path to the current one are kept,
+    branches (e.g. a copy to several destinations) are processed one after another, so the
+    path with the largest outputs counts. Only layers that require items make new images,
+    the others pass the images of their inputs, fan-out of the layers (see Layer.get_fan_out)
+    multiplies the items for the next layers.
+    """
+
+    def get_path_factor(idx: int, fan_out: float) -> float:
+        layer = net.layers[idx]
+        fan_out *= layer.get_fan_out()
+        outputs_factor = fan_out if layer.requires_item() else 0
+        next_factors = [get_path_factor(i, fan_out) for i in net.get_next_layer_indxs(idx)]
+        return outputs_factor + max(next_factors, default=0)
+
+    data_layers_idxs = [idx for idx, layer in enumerate(net.layers) if layer.type == "data"]
+    return 1 + max((get_path_factor(idx, 1) for idx in data_layers_idxs), default=0)
+
+
+class BatchSizer:
+    """
+    Splits items into batches of at most max_batch_size items with the estimated memory
+    (memory of the items multiplied by memory_factor, see get_memory_factor) under the budget.
+    An item larger than the budget gets a batch of its own. Sizes of the batches are collected
+    for the report (see get_summary).
+    """
+
+    def __init__(self, budget: int, max_batch_size: int, modality: str, memory_factor: float = 1):
+        self.budget = budget
+        self.max_batch_size = max_batch_size
+        self.modality = modality
+        self.memory_factor = memory_factor
+        self.batches_sizes: List[int] = []
+        self.max_batch_memory = 0
+        self.oversized_items = 0
+
+    def get_memory(self, item_info) -> float:
+        return get_item_memory(item_info, self.modality) * self.memory_factor
+
+    def split(self, items: Sequence, items_infos: Optional[Sequence] = None) -> Iterator[list]:
+        """Yields batches of the items, items_infos are the infos of the items if not them."""
+        if items_infos is None:
+            items_infos = items
+        batch = []
+        batch_memory = 0
+        for item, item_info in zip(items, items_infos):
+            memory = self.get_memory(item_info)
+            if len(batch) > 0 and (
+                len(batch) >= self.max_batch_size or batch_memory + memory > self.budget
+            ):
+                yield self._add_batch(batch, batch_memory)
+                batch = []
+                batch_memory = 0
+            if memory > self.budget:
+                self.oversized_items += 1
+                logger.warn(
+                    "Estimated memory of the item exceeds the batch memory budget",
+                    extra={
+                        "item_name": getattr(item_info, "name", None),
+                        "memory_mb": round(memory / 2**20, 1),
+                        "budget_mb": round(self.budget / 2**20, 1),
+                    },
+                )
+            batch.append(item)
+            batch_memory += memory
+        if len(batch) > 0:
+            yield self._add_batch(batch, batch_memory)
+
+    def _add_batch(self, batch: list, batch_memory: float) -> list:
+        self.batches_sizes.append(len(batch))
+        self.max_batch_memory = max(self.max_batch_memory, batch_memory)
+        return batch
+
+    def get_summary(self) -> dict:
+        sizes = self.batches_sizes
+        return {
+            "budget_mb": round(self.budget / 2**20, 1),
+            "max_batch_size": self.max_batch_size,
+            "memory_factor": round(self.memory_factor, 2),
+            "batches": len(sizes),
+            "min_size": min(sizes, default=0),
+            "max_size": max(sizes, default=0),
+            "mean_size": round(sum(sizes) / len(sizes), 1) if sizes else 0,
+            "max_batch_mb": round(self.max_batch_memory / 2**20, 1),
+            "oversized_items": self.oversized_items,
+        }
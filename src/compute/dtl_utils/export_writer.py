@@ -0,0 +1,91 @@
+# coding: utf-8
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Sequence
+
+import cv2
+import numpy as np
+from supervisely import Annotation
+from supervisely.imaging import image as sly_image
+from supervisely.io.fs import copy_file
+
+from src.compute.utils.os_utils import ensure_base_path
+
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", str(min(8, os.cpu_count() or 1))))
+# 0-9, OpenCV default is 1 (fastest), higher values give smaller files
+DEFAULT_PNG_COMPRESSION = 1
+
+
+def write_image(path: str, img: np.ndarray, png_compression: int = DEFAULT_PNG_COMPRESSION):
+    """Same as sly.image.write, but PNG files are encoded with the given compression level."""
+    if not path.lower().endswith(".png"):
+        sly_image.write(path, img)
+        return
+    ensure_base_path(path)
+    img = img.astype(np.uint8, copy=False)
+    if img.ndim == 2 or img.shape[2] == 1:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    elif img.shape[2] == 4:
+        img = cv2.cvtColor(img, cv2.COLOR_RGBA2BGR)
+    elif img.shape[2] == 3:
+        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+    if not cv2.imwrite(path, img, [cv2.IMWRITE_PNG_COMPRESSION, png_compression]):
+        raise RuntimeError(f"Failed to write image: {path}")
+
+
+def copy_image(src_path: str, dst_path: str):
+    ensure_base_path(dst_path)
+    copy_file(src_path, dst_path)
+
+
+def rasterize_classes(ann: Annotation, class_names: Sequence[str]) -> np.ndarray:
+    """
+    Draws labels of the classes into a map of class indexes (index in class_names + 1,
+    0 is background). Labels are drawn in the annotation order like on a color mask, so
+    the map can be colored with any color mapping of these classes (see colorize_classes).
+    """
+    indexes = {name: idx + 1 for idx, name in enumerate(class_names)}
+    dtype = np.uint8 if len(class_names) < 255 else np.uint16
+    index_map = np.zeros(ann.img_size, dtype=dtype)
+    for label in ann.labels:
+        idx = indexes.get(label.obj_class.name)
+        if idx is None:
+            continue
+        label.draw(index_map, idx)
+    return index_map
+
+
+def colorize_classes(
+    index_map: np.ndarray, class_names: Sequence[str], color_mapping: Dict[str, List[int]]
+) -> np.ndarray:
+    lut = np.zeros((len(class_names) + 1, 3), dtype=np.uint8)
+    for idx, name in enumerate(class_names):
+        lut[idx + 1] = color_mapping[name]
+    return lut[index_map]
+
+
+class ExportWriter:
+    """
+    Thread pool for encoding and writing export files. OpenCV encoders and file I/O release
+    the GIL, so images of a batch are written in parallel. wait() blocks until all submitted
+    jobs are finished and re-raises the first error.
+    """
+
+    def __init__(self, workers: int = EXPORT_WORKERS):
+        self._executor = ThreadPoolExecutor(max(1, workers), thread_name_prefix="Export")
+        self._futures: List[Future] = []
+
+    def submit(self, fn, *args, **kwargs):
+        self._futures.append(self._executor.submit(fn, *args, **kwargs))
+
+    def wait(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def shutdown(self):
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
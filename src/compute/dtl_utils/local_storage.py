@@ -0,0 +1,231 @@
+# coding: utf-8
+
+import os
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from PIL import Image
+from supervisely import (
+    Annotation,
+    Dataset,
+    ImageInfo,
+    KeyIdMap,
+    OpenMode,
+    Project,
+    ProjectMeta,
+    VideoAnnotation,
+    VideoProject,
+    batched,
+    logger,
+)
+from supervisely.io.fs import get_file_name, get_file_ext, silent_remove
+
+from src.compute.dtl_utils.batch_sizing import BatchSizer
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor, VideoDescriptor
+from src.compute.dtl_utils.sharding import ShardPlan
+from src.utils import LegacyProjectItem
+import src.globals as g
+
+
+def _project_class(modality: str):
+    if modality == "images":
+        return Project
+    if modality == "videos":
+        return VideoProject
+    raise ValueError(f"Modality {modality!r} is not supported by local projects")
+
+
+def _split_src(src: str) -> Tuple[str, str]:
+    src_parts = src.strip("/").split("/")
+    return src_parts[0], src_parts[-1] if len(src_parts) > 1 else "*"
+
+
+class LocalProjectSource:
+    """
+    Reads input projects from local Supervisely project directories instead of the API:
+    the data layer source "project_name/dataset_name" is the directory
+    <directory>/project_name/<dataset>. Images are not read in advance: descriptors point
+    to the files, which are decoded only when a layer reads the image (ImageDescriptor.read_image),
+    save layers copy or hardlink the files. Item infos are taken from the project if it was
+    downloaded with them, otherwise they have only the name and the size from the image header.
+    """
+
+    def __init__(self, directory: str, modality: str = "images"):
+        self.directory = directory
+        self.modality = modality
+        self._projects: Dict[str, Union[Project, VideoProject]] = {}
+
+    def get_project(self, project_name: str) -> Union[Project, VideoProject]:
+        project = self._projects.get(project_name)
+        if project is None:
+            project_dir = os.path.join(self.directory, project_name)
+            if not os.path.isdir(project_dir):
+                raise FileNotFoundError(f"Local project not found: {project_dir}")
+            project = _project_class(self.modality)(project_dir, OpenMode.READ)
+            self._projects[project_name] = project
+        return project
+
+    def get_project_meta(self, project_name: str) -> ProjectMeta:
+        return self.get_project(project_name).meta
+
+    def get_datasets(self, srcs: List[str]) -> List[Tuple[str, Dataset]]:
+        """Returns [(project_name, dataset)] of the sources, every dataset once."""
+        res = []
+        added = set()
+        for src in srcs:
+            project_name, dataset_name = _split_src(src)
+            project = self.get_project(project_name)
+            found = False
+            for dataset in project.datasets:
+                if dataset_name != "*" and dataset_name not in (dataset.name, dataset.short_name):
+                    continue
+                found = True
+                if dataset.directory not in added:
+                    res.append((project_name, dataset))
+                    added.add(dataset.directory)
+            if not found:
+                raise FileNotFoundError(
+                    f"Dataset {dataset_name!r} not found in local project {project_name!r}"
+                )
+        return res
+
+    def get_total_elements(self, srcs: List[str]) -> int:
+        return sum(len(dataset) for _, dataset in self.get_datasets(srcs))
+
+    @staticmethod
+    def _dataset_key(project_name: str, dataset: Dataset) -> str:
+        return f"{project_name}/{dataset.name}"
+
+    def get_items_keys(self, srcs: List[str]) -> List[Tuple[str, List[str]]]:
+        """Returns [(dataset_key, sorted item names)] for sharding (see dtl_utils.sharding)."""
+        return [
+            (self._dataset_key(project_name, dataset), sorted(dataset.get_items_names()))
+            for project_name, dataset in self.get_datasets(srcs)
+        ]
+
+    def get_item_info(self, dataset: Dataset, item_name: str) -> ImageInfo:
+        if os.path.isfile(dataset.get_item_info_path(item_name)):
+            return dataset.get_item_info(item_name)
+        info = {field: None for field in ImageInfo._fields}
+        info.update(name=item_name, ext=get_file_ext(item_name).lstrip("."))
+        if self.modality == "images":
+            # only the header is read here
+            with Image.open(dataset.get_item_path(item_name)) as img:
+                info["width"], info["height"] = img.size
+        return ImageInfo(**info)
+
+    def get_elements_generator_batched(
+        self,
+        srcs: List[str],
+        batch_size: int,
+        shard: Optional[ShardPlan] = None,
+        batch_sizer: Optional[BatchSizer] = None,
+    ) -> Iterator[List[Tuple[Union[ImageDescriptor, VideoDescriptor], Annotation]]]:
+        item_idx = 0
+        for project_name, dataset in self.get_datasets(srcs):
+            project_meta = self.get_project_meta(project_name)
+            items_names = sorted(dataset.get_items_names())
+            if shard is not None:
+                ds_key = self._dataset_key(project_name, dataset)
+                items_names = [name for name in items_names if shard.contains(ds_key, name)]
+            items_infos = [self.get_item_info(dataset, item_name) for item_name in items_names]
+            items = list(zip(items_names, items_infos))
+            if batch_sizer is None:
+                batches = batched(items, batch_size)
+            else:
+                batches = batch_sizer.split(items, items_infos)
+            for items_batch_infos in batches:
+                items_batch = []
+                for item_name, item_info in items_batch_infos:
+                    item_idx += 1
+                    info = LegacyProjectItem(
+                        project_name=project_name,
+                        ds_name=dataset.short_name,
+                        ds_info=None,
+                        item_name=get_file_name(item_name),
+                        item_info=item_info,
+                        ia_data={
+                            "item_ext": get_file_ext(item_name),
+                            "source_key": [self._dataset_key(project_name, dataset), item_name],
+                        },
+                        item_path=dataset.get_item_path(item_name),
+                        ann_path=dataset.get_ann_path(item_name),
+                    )
+                    if self.modality == "images":
+                        item_desc = ImageDescriptor(info, item_idx, False)
+                        ann = dataset.get_ann(item_name, project_meta)
+                    else:
+                        item_desc = VideoDescriptor(info, item_idx, False)
+                        item_desc.update_item(info.item_path)
+                        ann = dataset.get_ann(item_name, project_meta, KeyIdMap())
+                    items_batch.append((item_desc, ann))
+                yield items_batch
+
+
+class LocalProjectSink:
+    """
+    Writes output projects to local Supervisely project directories instead of uploading
+    them: <directory>/project_name. Unchanged images of local projects are hardlinked (copied
+    if the link is not possible), unchanged images of server projects are downloaded as files,
+    the changed ones are encoded from memory.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # directories of the projects created or opened through the sink, in creation order
+        self.projects_dirs: List[str] = []
+
+    def _add_project_dir(self, project_dir: str):
+        if project_dir not in self.projects_dirs:
+            self.projects_dirs.append(project_dir)
+
+    def get_free_project_name(self, name: str) -> str:
+        res = name
+        idx = 0
+        while os.path.exists(os.path.join(self.directory, res)):
+            idx += 1
+            res = f"{name}_{idx:03d}"
+        return res
+
+    def create_project(
+        self, name: str, meta: ProjectMeta, modality: str
+    ) -> Union[Project, VideoProject]:
+        project_dir = os.path.join(self.directory, self.get_free_project_name(name))
+        project = _project_class(modality)(project_dir, OpenMode.CREATE)
+        project.set_meta(meta)
+        self._add_project_dir(project_dir)
+        logger.info(f"Local project created: {project_dir}")
+        return project
+
+    def open_project(self, name: str, modality: str) -> Union[Project, VideoProject]:
+        """Opens a project created by create_project (e.g. by another shard) to add items."""
+        project_dir = os.path.join(self.directory, name)
+        self._add_project_dir(project_dir)
+        return _project_class(modality)(project_dir, OpenMode.READ)
+
+    def add_items(
+        self,
+        project: Union[Project, VideoProject],
+        dataset_name: str,
+        item_names: List[str],
+        items: List[Tuple[Union[ImageDescriptor, VideoDescriptor], Annotation]],
+    ):
+        dataset = project.datasets.get(dataset_name)
+        if dataset is None:
+            dataset = project.create_dataset(dataset_name)
+        for item_name, (item_desc, ann) in zip(item_names, items):
+            if isinstance(ann, VideoAnnotation):
+                dataset.add_item_file(item_name, item_desc.item_data, ann=ann, _validate_item=False)
+            elif item_desc.need_write():
+                dataset.add_item_np(item_name, item_desc.item_data, ann=ann)
+            elif item_desc.get_item_path():
+                dataset.add_item_file(
+                    item_name, item_desc.get_item_path(), ann=ann, _use_hardlink=True
+                )
+            else:
+                item_path = dataset.generate_item_path(item_name)
+                try:
+                    g.api.image.download_path(item_desc.info.item_info.id, item_path)
+                    dataset.add_item_file(item_name, item_path, ann=ann)
+                except Exception:
+                    silent_remove(item_path)
+                    raise
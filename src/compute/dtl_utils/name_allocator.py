@@ -0,0 +1,83 @@
+# coding: utf-8
+
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from supervisely.io.fs import get_file_name
+
+# Returns pages (iterables) of names which already exist in the destination dataset
+NamesSource = Callable[[], Iterable[Iterable[str]]]
+
+
+class NameAllocator:
+    """
+    Allocates unique item names per destination dataset (keyed by "project/dataset").
+    Names which already exist in the destination are loaded lazily from a registered
+    source on the first allocation in the dataset, so datasets which never receive items
+    are never listed. Collisions are resolved with deterministic suffixes "{name}_{:03d}"
+    and the next suffix is remembered per base name, so repeated collisions of the same
+    name do not rescan the already taken suffixes.
+    """
+
+    def __init__(self):
+        self._taken: Dict[str, Set[str]] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._sources: Dict[str, List[NamesSource]] = {}
+
+    def reset(self):
+        self._taken = {}
+        self._counters = {}
+        self._sources = {}
+
+    def register_existing(self, full_ds_name: str, source: NamesSource):
+        """Registers a lazy source of names which are already taken in the dataset."""
+        self._sources.setdefault(full_ds_name, []).append(source)
+
+    def add_existing(self, full_ds_name: str, names: Iterable[str]):
+        self._get_taken(full_ds_name).update(names)
+
+    def _get_taken(self, full_ds_name: str) -> Set[str]:
+        taken = self._taken.get(full_ds_name)
+        if taken is None:
+            taken = set()
+            self._taken[full_ds_name] = taken
+        sources = self._sources.pop(full_ds_name, None)
+        if sources is not None:
+            for source in sources:
+                for page in source():
+                    taken.update(page)
+        return taken
+
+    def _allocate(self, name: str, full_ds_name: str, taken: Set[str]) -> str:
+        new_name = name
+        if new_name in taken:
+            counter_key = (full_ds_name, name)
+            suffix = self._counters.get(counter_key, 1)
+            new_name = "{}_{:03d}".format(name, suffix)
+            while new_name in taken:
+                suffix += 1
+                new_name = "{}_{:03d}".format(name, suffix)
+            self._counters[counter_key] = suffix + 1
+        taken.add(new_name)
+        return new_name
+
+    def allocate(self, name: str, full_ds_name: str) -> str:
+        return self._allocate(name, full_ds_name, self._get_taken(full_ds_name))
+
+    def allocate_batch(self, names: Iterable[str], full_ds_name: str) -> List[str]:
+        """Allocates names for the whole batch, result order matches the input order."""
+        taken = self._get_taken(full_ds_name)
+        return [self._allocate(name, full_ds_name, taken) for name in names]
+
+
+def iter_dataset_item_names(
+    api, modality: str, dataset_id: int, batch_size: int = 1000
+) -> Iterator[List[str]]:
+    """Streams names (without extensions) of dataset items page by page."""
+    if modality == "images":
+        pages = api.image.get_list_generator(dataset_id, batch_size=batch_size)
+    elif modality == "videos":
+        pages = api.video.get_list_generator(dataset_id, batch_size=batch_size)
+    else:
+        raise NotImplementedError(f"Unsupported modality: {modality}")
+    for infos in pages:
+        yield [get_file_name(info.name) for info in infos]
@@ -0,0 +1,112 @@
+# coding: utf-8
+
+import json
+import os
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+from supervisely import logger
+
+from src.compute.dtl_utils.item_descriptor import ItemDescriptor
+
+
+def get_source_key(item_desc: ItemDescriptor) -> Optional[Hashable]:
+    """
+    Key of the input item the descriptor was made from: (dataset key, item id or name), the
+    same keys the shard plan is made of. Descriptors made by layers share it with the source.
+    """
+    source_key = item_desc.info.ia_data.get("source_key")
+    if source_key is None:
+        return None
+    return tuple(source_key)
+
+
+class RunJournal:
+    """
+    Append-only journal of a checkpointed run, one JSON line per checkpoint (a processed batch,
+    written after the save layers have flushed their buffers):
+    {"cursor": items processed, "items": [input items processed by the whole graph],
+     "saved": {layer_idx: [input items saved by the save layer]}, "state": {layer_idx: delta}}
+
+    On resume, processed input items are skipped and save layers skip the items they have
+    already saved (batches which failed half way). Destination projects and datasets are
+    reused through the shard coordinator, see ShardCoordinator.once.
+    Items are journaled after they are saved, so the items of a batch the process was killed
+    in between saving and writing the checkpoint are saved again (under new names).
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.resumed = False
+        self.cursor = 0
+        self.done_items: Set[Hashable] = set()
+        self.saved_items: Dict[int, Set[Hashable]] = {}
+        self.layers_states: Dict[int, list] = {}
+        self._pending_saved: Dict[int, List[Hashable]] = {}
+
+        exists = os.path.isfile(path) and os.path.getsize(path) > 0
+        if exists and not resume:
+            raise FileExistsError(
+                f"Run journal {path} already exists. Resume the run or use another directory"
+            )
+        if resume:
+            if not exists:
+                raise FileNotFoundError(f"Run journal {path} not found, nothing to resume")
+            self._load()
+            self.resumed = True
+            logger.info(
+                f"Resuming the run from item {self.cursor}: "
+                f"{len(self.done_items)} items are already processed"
+            )
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a")
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            lines = f.readlines()
+        valid_size = 0
+        for line_idx, line in enumerate(lines):
+            if line_idx == len(lines) - 1 and not line.endswith(b"\n"):
+                # the last checkpoint was interrupted while writing, new records go instead
+                logger.warning(f"Skipped incomplete record at the end of {self.path}")
+                os.truncate(self.path, valid_size)
+                break
+            record = json.loads(line)
+            valid_size += len(line)
+            self.cursor = record["cursor"]
+            self.done_items.update(tuple(key) for key in record["items"])
+            for layer_idx, keys in record["saved"].items():
+                self.saved_items.setdefault(int(layer_idx), set()).update(
+                    tuple(key) for key in keys
+                )
+            for layer_idx, delta in record["state"].items():
+                self.layers_states.setdefault(int(layer_idx), []).append(delta)
+
+    def is_saved(self, layer_idx: int, item_desc: ItemDescriptor) -> bool:
+        """True if the save layer has saved the item in a previous attempt of the run."""
+        saved = self.saved_items.get(layer_idx)
+        return saved is not None and get_source_key(item_desc) in saved
+
+    def add_saved(self, layer_idx: int, items_descs: Iterable[ItemDescriptor]):
+        pending = self._pending_saved.setdefault(layer_idx, [])
+        for item_desc in items_descs:
+            source_key = get_source_key(item_desc)
+            if source_key is not None:
+                pending.append(source_key)
+
+    def write_checkpoint(self, items_count: int, processed_items: list, layers_states: dict):
+        self.cursor += items_count
+        record = {
+            "cursor": self.cursor,
+            "items": [
+                key for key in (get_source_key(desc) for desc in processed_items) if key is not None
+            ],
+            "saved": {str(idx): keys for idx, keys in self._pending_saved.items() if keys},
+            "state": {str(idx): delta for idx, delta in layers_states.items()},
+        }
+        self._pending_saved = {}
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
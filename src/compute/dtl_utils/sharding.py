@@ -0,0 +1,259 @@
+# coding: utf-8
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from supervisely import logger
+
+from src.compute.dtl_utils.name_allocator import NameAllocator
+
+# seconds to wait for the shard which creates a shared entity (see ShardCoordinator.once)
+ONCE_TIMEOUT = float(os.getenv("SHARD_ONCE_TIMEOUT", "600"))
+ONCE_POLL_INTERVAL = 0.5
+
+
+def _digest(data: str) -> str:
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def split_items(
+    datasets_keys: Sequence[Tuple[str, Sequence]], shard_count: int
+) -> List[List[list]]:
+    """
+    Splits items into shard_count contiguous parts of (almost) equal size. Items are taken in
+    the order of the datasets and of the sorted item keys (ids or names) inside them, so a shard
+    gets whole datasets and/or a range of keys of one dataset on its borders.
+    Returns for every shard a list of [dataset_key, first_item_key, last_item_key, items_count].
+    """
+    total = sum(len(keys) for _, keys in datasets_keys)
+    shards = []
+    for shard_idx in range(shard_count):
+        start = total * shard_idx // shard_count
+        end = total * (shard_idx + 1) // shard_count
+        ranges = []
+        offset = 0
+        for dataset_key, keys in datasets_keys:
+            lo = max(start - offset, 0)
+            hi = min(end - offset, len(keys))
+            if lo < hi:
+                ranges.append([dataset_key, keys[lo], keys[hi - 1], hi - lo])
+            offset += len(keys)
+        shards.append(ranges)
+    return shards
+
+
+class ShardPlan:
+    """Items of one shard: ranges of sorted item keys per dataset (see split_items)."""
+
+    def __init__(self, ranges: List[list]):
+        self._ranges: Dict[str, List[Tuple[Any, Any]]] = {}
+        self._skipped: Set[Tuple[str, Any]] = set()
+        self.items_count = 0
+        for dataset_key, first, last, count in ranges:
+            self._ranges.setdefault(dataset_key, []).append((first, last))
+            self.items_count += count
+
+    def skip(self, items_keys: Iterable[Tuple[str, Any]]):
+        """Excludes already processed items (dataset_key, item_key) of a resumed run."""
+        skipped = {key for key in items_keys if self.contains(*key)}
+        self._skipped.update(skipped)
+        self.items_count -= len(skipped)
+
+    def has_dataset(self, dataset_key: str) -> bool:
+        return dataset_key in self._ranges
+
+    def contains(self, dataset_key: str, item_key) -> bool:
+        if (dataset_key, item_key) in self._skipped:
+            return False
+        for first, last in self._ranges.get(dataset_key, []):
+            if first <= item_key <= last:
+                return True
+        return False
+
+
+class ShardCoordinator:
+    """
+    Coordinates independent workers which run the same preset, each on its own shard of the
+    input items. Workers share only a directory (local or network file system); atomic file
+    creation is the only synchronization primitive, so there is no coordinator process:
+
+    - once(key, fn): fn runs in one worker (e.g. creating the destination project), the others
+      wait for its JSON result. Results are kept, so a resumed shard (see RunJournal) or the
+      finalize step gets the same entities instead of creating new ones.
+    - reserve_name(...): item names in destination datasets are reserved across the workers
+      (see SharedNameAllocator).
+    - save_state / load_states: layers state of finished shards for the finalize step.
+    - get_journal_path: checkpoints journal of the shard.
+
+    shard_index is None for the finalize step. A checkpointed run which is not sharded is a run
+    of the only shard with finalize_inline: postprocess does the once-per-run work itself, there
+    is no separate finalize step (see for_single_run).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        shard_count: int,
+        shard_index: Optional[int] = None,
+        finalize_inline: bool = False,
+    ):
+        if shard_count < 1:
+            raise ValueError(f"Shards count must be positive, got {shard_count}")
+        if shard_index is not None and not 0 <= shard_index < shard_count:
+            raise ValueError(f"Shard index must be in [0, {shard_count}), got {shard_index}")
+        if finalize_inline and (shard_count != 1 or shard_index is None):
+            raise ValueError("Only the shard of a single shard run can be finalized inline")
+        self.directory = directory
+        self.shard_count = shard_count
+        self.shard_index = shard_index
+        self.finalize_inline = finalize_inline
+        for subdir in ("once", "names", "shards"):
+            os.makedirs(os.path.join(directory, subdir), exist_ok=True)
+
+    @classmethod
+    def for_single_run(cls, directory: str) -> "ShardCoordinator":
+        """Coordinator of a checkpointed run which is not sharded."""
+        return cls(directory, 1, 0, finalize_inline=True)
+
+    @property
+    def is_shard(self) -> bool:
+        return self.shard_index is not None
+
+    @property
+    def defers_finalize(self) -> bool:
+        """True if the once-per-run work is left to the finalize step."""
+        return self.is_shard and not self.finalize_inline
+
+    def _write_json(self, path: str, data):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _read_json(self, path: str):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def once(self, key: str, fn: Callable[[], Any], timeout: float = ONCE_TIMEOUT):
+        """Runs fn in one worker only, returns its (JSON serializable) result in all of them."""
+        base_path = os.path.join(self.directory, "once", _digest(key))
+        result_path = base_path + ".json"
+        lock_path = base_path + ".lock"
+        deadline = time.monotonic() + timeout
+        while True:
+            if os.path.isfile(result_path):
+                return self._read_json(result_path)["result"]
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"Timed out waiting for another shard to create {key!r}. "
+                        f"If that shard has failed, remove {lock_path} and restart"
+                    )
+                time.sleep(ONCE_POLL_INTERVAL)
+                continue
+            os.close(fd)
+            try:
+                result = fn()
+                self._write_json(result_path, {"key": key, "result": result})
+            except Exception:
+                os.remove(lock_path)
+                raise
+            return result
+
+    def reserve_name(self, namespace: str, name: str) -> bool:
+        """
+        Reserves the name, returns False if it's already taken (by any shard or by a previous
+        attempt of this one, as the item with this name may be already saved).
+        """
+        names_dir = os.path.join(self.directory, "names", _digest(namespace))
+        os.makedirs(names_dir, exist_ok=True)
+        path = os.path.join(names_dir, _digest(name))
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        try:
+            os.write(fd, str(self.shard_index).encode())
+        finally:
+            os.close(fd)
+        return True
+
+    def get_journal_path(self) -> str:
+        return os.path.join(self.directory, "journal", f"{self.shard_index}.jsonl")
+
+    def get_plan(self, graph: list, get_items_keys: Callable[[], Sequence[Tuple[str, Sequence]]]):
+        """
+        Returns the ShardPlan of this shard. The split is made once, by the first shard to get
+        here, so all the shards use the same snapshot of the input items.
+        """
+        graph_hash = _digest(json.dumps(graph, sort_keys=True, default=str))
+
+        def make_plan():
+            datasets_keys = get_items_keys()
+            logger.info(
+                f"Splitting {sum(len(keys) for _, keys in datasets_keys)} items "
+                f"of {len(datasets_keys)} datasets into {self.shard_count} shards"
+            )
+            return {
+                "shard_count": self.shard_count,
+                "graph": graph_hash,
+                "shards": split_items(datasets_keys, self.shard_count),
+            }
+
+        plan = self.once("plan", make_plan)
+        if plan["shard_count"] != self.shard_count:
+            raise ValueError(
+                f"Shards directory {self.directory} was planned for {plan['shard_count']} shards"
+            )
+        if plan["graph"] != graph_hash:
+            raise ValueError(
+                f"Shards directory {self.directory} was planned for another preset, "
+                "all shards have to run the same preset"
+            )
+        return ShardPlan(plan["shards"][self.shard_index])
+
+    def _state_path(self, shard_index: int) -> str:
+        return os.path.join(self.directory, "shards", f"{shard_index}.json")
+
+    def save_state(self, layers_states: Dict[int, Any]):
+        """Marks the shard as finished and saves the state of its layers for finalize."""
+        self._write_json(
+            self._state_path(self.shard_index),
+            {"layers": {str(idx): state for idx, state in layers_states.items()}},
+        )
+
+    def get_unfinished_shards(self) -> List[int]:
+        return [idx for idx in range(self.shard_count) if not os.path.isfile(self._state_path(idx))]
+
+    def load_states(self) -> Dict[int, List[Any]]:
+        """Returns {layer_idx: [state of every shard]}."""
+        states = {}
+        for idx in range(self.shard_count):
+            shard_state = self._read_json(self._state_path(idx))
+            for layer_idx, state in shard_state["layers"].items():
+                states.setdefault(int(layer_idx), []).append(state)
+        return states
+
+
+class SharedNameAllocator(NameAllocator):
+    """
+    NameAllocator which also reserves every allocated name across the shards. Reserved names
+    are never released, a shard started again without resume allocates new names for the items
+    it saved before (the resumed one skips them, see RunJournal).
+    """
+
+    def __init__(self, coordinator: ShardCoordinator, namespace: str):
+        super().__init__()
+        self.coordinator = coordinator
+        self.namespace = namespace
+
+    def _allocate(self, name: str, full_ds_name: str, taken: Set[str]) -> str:
+        while True:
+            new_name = super()._allocate(name, full_ds_name, taken)
+            if self.coordinator.reserve_name(f"{self.namespace}/{full_ds_name}", new_name):
+                return new_name
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from shapely.geometry import LineString, Polygon as ShPolygon, box
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
+
+from supervisely import Annotation, Label, Polygon, Polyline, Rectangle
+
+
+# Shapely geometries here use the same (row, col) coordinates as supervisely `exterior_np`.
+def polygon_to_shapely(polygon: Polygon) -> ShPolygon:
+    poly = ShPolygon(shell=polygon.exterior_np, holes=polygon.interior_np)
+    if poly.is_valid == False:
+        poly = poly.buffer(0.001)
+    return poly
+
+
+def polyline_to_shapely(line: Polyline) -> LineString:
+    return LineString(line.exterior_np)
+
+
+def geometry_to_shapely(geometry) -> BaseGeometry:
+    if isinstance(geometry, Polygon):
+        return polygon_to_shapely(geometry)
+    if isinstance(geometry, Polyline):
+        return polyline_to_shapely(geometry)
+    bbox = geometry if isinstance(geometry, Rectangle) else geometry.to_bbox()
+    return box(bbox.top, bbox.left, bbox.bottom, bbox.right)
+
+
+class AnnotationSpatialIndex:
+    """
+    Spatial index over the labels of one annotation.
+    Shapely geometries, areas and STRtrees are created lazily and only once,
+    so several layers can run geometric predicates on the same annotation without
+    rebuilding them. Annotations are immutable (layers clone them), so the index never
+    has to be invalidated, use `get_spatial_index` to get the shared instance.
+    """
+
+    def __init__(self, ann: Annotation):
+        self._labels = ann.labels
+        self._label_idx = {id(label): idx for idx, label in enumerate(self._labels)}
+        self._shapes = {}
+        self._areas = {}
+        self._trees = {}
+
+    @property
+    def labels(self) -> List[Label]:
+        return self._labels
+
+    def _get_idx(self, label: Union[Label, int]) -> Optional[int]:
+        if isinstance(label, (int, np.integer)):
+            return int(label)
+        return self._label_idx.get(id(label))
+
+    def get_shape(self, label: Union[Label, int]) -> BaseGeometry:
+        idx = self._get_idx(label)
+        if idx is None:
+            return geometry_to_shapely(label.geometry)
+        if idx not in self._shapes:
+            self._shapes[idx] = geometry_to_shapely(self._labels[idx].geometry)
+        return self._shapes[idx]
+
+    def get_area(self, label: Union[Label, int]) -> float:
+        idx = self._get_idx(label)
+        if idx is None:
+            return label.area
+        if idx not in self._areas:
+            self._areas[idx] = self._labels[idx].area
+        return self._areas[idx]
+
+    def _get_tree(self, class_names: Optional[frozenset], geometry_types: Optional[tuple]):
+        key = (class_names, geometry_types)
+        if key not in self._trees:
+            idxs = [
+                idx
+                for idx, label in enumerate(self._labels)
+                if (class_names is None or label.obj_class.name in class_names)
+                and (geometry_types is None or isinstance(label.geometry, geometry_types))
+            ]
+            shapes = [self.get_shape(idx) for idx in idxs]
+            tree = STRtree(shapes) if len(shapes) > 0 else None
+            shape_idx = {id(shape): idx for idx, shape in zip(idxs, shapes)}
+            self._trees[key] = (tree, idxs, shape_idx)
+        return self._trees[key]
+
+    def query(
+        self,
+        geometry: BaseGeometry,
+        class_names: Optional[Iterable[str]] = None,
+        geometry_types: Optional[Tuple[type, ...]] = None,
+    ) -> List[int]:
+        """Returns indexes of labels whose bounds intersect the bounds of the geometry."""
+        if class_names is not None:
+            class_names = frozenset(class_names)
+        tree, idxs, shape_idx = self._get_tree(class_names, geometry_types)
+        if tree is None:
+            return []
+        found = tree.query(geometry)
+        # shapely>=2.0 returns positions, shapely<2.0 returns geometries
+        if len(found) > 0 and isinstance(found[0], BaseGeometry):
+            return sorted(shape_idx[id(shape)] for shape in found)
+        return sorted(idxs[pos] for pos in found)
+
+
+_indexes: Dict[int, AnnotationSpatialIndex] = {}
+
+
+def get_spatial_index(ann: Annotation) -> AnnotationSpatialIndex:
+    """Returns spatial index of the annotation, it is built once per annotation object."""
+    key = id(ann)
+    index = _indexes.get(key)
+    if index is None:
+        index = AnnotationSpatialIndex(ann)
+        _indexes[key] = index
+        weakref.finalize(ann, _indexes.pop, key, None)
+    return index
@@ -1,5 +1,8 @@
+import ast
+import importlib
 import inspect
 import pkgutil
+import threading
 
 import numpy as np
 
@@ -19,19 +22,116 @@ if not hasattr(np, "sctypes"):
 from src.compute.layers import data, processing, save
 
 
-def register_layers(package, type):
-    prefix = package.__name__ + "."
-    registered_classes = set()
+def _find_actions(module_path: str):
+    """
+    Returns [(action, legacy action or None)] of the layer classes defined in the module
+    without importing it.
+    """
+    with open(module_path, "r") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+    actions = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        attrs = {}
+        for stmt in node.body:
+            if (
+                isinstance(stmt, ast.Assign)
+                and isinstance(stmt.value, ast.Constant)
+                and isinstance(stmt.value.value, str)
+            ):
+                for t in stmt.targets:
+                    if isinstance(t, ast.Name) and t.id in ("action", "legacy_action"):
+                        attrs[t.id] = stmt.value.value
+        if "action" in attrs:
+            actions.append((attrs["action"], attrs.get("legacy_action")))
+    return actions
 
-    for importer, modname, ispkg in pkgutil.iter_modules(package.__path__, prefix):
-        module = __import__(modname, fromlist="dummy")
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, Layer) and obj != Layer:
-                if obj not in registered_classes:
-                    Layer.register_layer(obj, type)
-                    registered_classes.add(obj)
 
+class LazyLayersMapping(dict):
+    """
+    {action: layer class} mapping which imports layer modules on the first lookup of their
+    actions. Layer modules (and the heavy libraries they use, e.g. imgaug or moviepy) are
+    loaded only when the graph contains the layer.
+    """
 
-register_layers(data, "data")
-register_layers(processing, "processing")
-register_layers(save, "save")
+    def __init__(self):
+        super().__init__()
+        self._index = {}  # {action: (module name, layer type)}
+        self._legacy = {}  # {legacy action: action}
+        self._loaded = set()
+        self._lock = threading.RLock()
+
+    def add_package(self, package, type):
+        prefix = package.__name__ + "."
+        for module_info in pkgutil.iter_modules(package.__path__, prefix):
+            module_path = module_info.module_finder.find_spec(module_info.name).origin
+            for action, legacy_action in _find_actions(module_path):
+                self._index[action] = (module_info.name, type)
+                if legacy_action is not None:
+                    self._legacy[legacy_action] = action
+
+    def resolve_action(self, action: str) -> str:
+        """Returns the action of the layer by its legacy action (used in old presets)."""
+        return self._legacy.get(action, action)
+
+    def _load(self, action) -> bool:
+        if action not in self._index:
+            return False
+        modname, type = self._index[action]
+        with self._lock:
+            if modname in self._loaded:
+                return False
+            self._loaded.add(modname)
+            try:
+                module = importlib.import_module(modname)
+                for _, obj in inspect.getmembers(module, inspect.isclass):
+                    if issubclass(obj, Layer) and obj.__module__ == modname:
+                        Layer.register_layer(obj, type)
+            except Exception:
+                self._loaded.discard(modname)
+                raise
+        return True
+
+    def __contains__(self, action) -> bool:
+        if super().__contains__(action):
+            return True
+        return self._load(action) and super().__contains__(action)
+
+    def __getitem__(self, action):
+        if not super().__contains__(action):
+            self._load(action)
+        return super().__getitem__(action)
+
+    def get(self, action, default=None):
+        return self[action] if action in self else default
+
+    def load_all(self):
+        for action in list(self._index):
+            self._load(action)
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def keys(self):
+        self.load_all()
+        return super().keys()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def __iter__(self):
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load_all()
+        return super().__len__()
+
+
+Layer.actions_mapping = LazyLayersMapping()
+Layer.actions_mapping.add_package(data, "data")
+Layer.actions_mapping.add_package(processing, "processing")
+Layer.actions_mapping.add_package(save, "save")
@@ -46,6 +46,8 @@ class ImagesProjectLayer(Layer):
 
         if self.project_name is None:
             self.in_project_meta = ProjectMeta()
+        elif getattr(self.net, "source", None) is not None:
+            self.in_project_meta = self.net.source.get_project_meta(self.project_name)
         else:
             try:
                 self.in_project_meta = get_project_meta(get_project_by_name(self.project_name).id)
@@ -135,4 +137,5 @@ class ImagesProjectLayer(Layer):
         yield (img_desc, ann)
 
     def postprocess(self):
-        self.postprocess_cb()
+        if self.postprocess_cb is not None:
+            self.postprocess_cb()
@@ -54,6 +54,8 @@ class VideosProjectLayer(Layer):
 
         if self.project_name is None:
             self.in_project_meta = ProjectMeta()
+        elif getattr(self.net, "source", None) is not None:
+            self.in_project_meta = self.net.source.get_project_meta(self.project_name)
         else:
             self.in_project_meta = get_project_meta(get_project_by_name(self.project_name).id)
 
@@ -152,11 +154,12 @@ class VideosProjectLayer(Layer):
     ):
         item_desc, ann = data_el
 
-        if self.net.preview_mode:
+        if isinstance(ann, Annotation):
             ann = apply_to_labels(ann, self.class_mapper)
         else:
             ann = apply_to_frames(ann, self.class_mapper)
         yield (item_desc, ann)
 
     def postprocess(self):
-        self.postprocess_cb()
+        if self.postprocess_cb is not None:
+            self.postprocess_cb()
@@ -1,4 +1,7 @@
 # coding: utf-8
+import shutil
+import tempfile
+from collections import defaultdict
 from os.path import join
 from typing import List, Tuple
 
@@ -11,10 +14,12 @@ from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
 from src.compute.tags_utils import TagConstants
 from src.exceptions import GraphError
-from supervisely import Annotation, ObjClass, ProjectMeta, TagCollection, TagMeta
+from src.prediction_cache import PredictionCache, get_image_key, get_json_key, get_model_key
+from supervisely import Annotation, Label, ObjClass, ProjectMeta, Rectangle, TagCollection, TagMeta
 from supervisely import logger as sly_logger
 from supervisely.app import show_dialog
 from supervisely.collection.key_indexed_collection import KeyIndexedCollection
+from supervisely.geometry.sliding_windows import SlidingWindows
 from supervisely.io.fs import file_exists, silent_remove
 from supervisely.nn.inference import Session
 from supervisely._utils import batched
@@ -23,8 +28,7 @@ from supervisely._utils import batched
 
 def check_model_is_deployed(session_id: int, preview_mode: bool = False):
     try:
-        session = Session(g.api, session_id)
-        is_model_served = session.is_model_deployed()
+        is_model_served = g.model_sessions.is_deployed(session_id)
         if not is_model_served:
             if preview_mode:
                 show_dialog(
@@ -235,11 +239,18 @@ def apply_model_to_images(
     cls_sfx_mapping: dict,
     tag_sfx_mapping: dict,
     batch_size: int = 50,
+    cache_keys: List[str] = None,
 ):
     pred_anns = []
     try:
-        for paths_batch in batched(image_paths, batch_size):
+        for batch_start in range(0, len(image_paths), batch_size):
+            paths_batch = image_paths[batch_start : batch_start + batch_size]
             predictions = session.inference_image_paths(paths_batch)
+            if cache_keys is not None:
+                keys_batch = cache_keys[batch_start : batch_start + batch_size]
+                g.prediction_cache.put_many(
+                    {key: pred.to_json() for key, pred in zip(keys_batch, predictions)}
+                )
             for pred_ann in predictions:
                 pred_ann, res_meta = postprocess_ann(pred_ann, output_meta, model_meta, settings, cls_sfx_mapping, tag_sfx_mapping)
                 pred_anns.append(pred_ann)
@@ -254,6 +265,122 @@ def apply_model_to_images(
         return pred_anns
 
 
+DEFAULT_SLIDING_WINDOW = {
+    "window": {"height": 640, "width": 640},
+    "min_overlap": {"x": 64, "y": 64},
+    "iou_threshold": 0.5,
+}
+DEFAULT_ROI = {"classes": None, "padding": 0, "iou_threshold": 0.5}
+
+
+def get_sliding_windows(img_size: Tuple[int, int], params: dict) -> List[Rectangle]:
+    """Windows covering the image, windows larger than the image are shrinked to it."""
+    height, width = img_size
+    window = (min(params["window"]["height"], height), min(params["window"]["width"], width))
+    overlap = (
+        min(params["min_overlap"]["y"], window[0] - 1),
+        min(params["min_overlap"]["x"], window[1] - 1),
+    )
+    return list(SlidingWindows(window, overlap).get((height, width)))
+
+
+def get_roi_rects(ann: Annotation, params: dict) -> List[Rectangle]:
+    """Padded bounding boxes of the labels (of the selected classes) clipped to the image."""
+    classes = params.get("classes")
+    padding = params.get("padding", 0)
+    height, width = ann.img_size
+    rects = []
+    for label in ann.labels:
+        if classes is not None and label.obj_class.name not in classes:
+            continue
+        bbox = label.geometry.to_bbox()
+        top, left = max(bbox.top - padding, 0), max(bbox.left - padding, 0)
+        bottom, right = min(bbox.bottom + padding, height - 1), min(bbox.right + padding, width - 1)
+        if top <= bottom and left <= right:
+            rects.append(Rectangle(top, left, bottom, right))
+    return rects
+
+
+def _get_confidence(label: Label) -> float:
+    tag = label.tags.get("confidence")
+    if tag is None or not isinstance(tag.value, (int, float)):
+        return 1.0
+    return float(tag.value)
+
+
+def nms_labels(labels: List[Label], iou_threshold: float) -> List[Label]:
+    """Class-wise non-maximum suppression by bounding boxes and "confidence" tags."""
+    by_class = defaultdict(list)
+    for label in labels:
+        by_class[label.obj_class.name].append(label)
+
+    res_labels = []
+    for class_labels in by_class.values():
+        bboxes = [label.geometry.to_bbox() for label in class_labels]
+        boxes = np.array([[b.top, b.left, b.bottom, b.right] for b in bboxes], dtype=np.float64)
+        scores = np.array([_get_confidence(label) for label in class_labels])
+        areas = (boxes[:, 2] - boxes[:, 0] + 1) * (boxes[:, 3] - boxes[:, 1] + 1)
+        order = np.argsort(-scores, kind="stable")
+        while order.size > 0:
+            idx = order[0]
+            res_labels.append(class_labels[idx])
+            rest = order[1:]
+            inter_h = np.minimum(boxes[idx, 2], boxes[rest, 2]) - np.maximum(
+                boxes[idx, 0], boxes[rest, 0]
+            )
+            inter_w = np.minimum(boxes[idx, 3], boxes[rest, 3]) - np.maximum(
+                boxes[idx, 1], boxes[rest, 1]
+            )
+            inter = np.clip(inter_h + 1, 0, None) * np.clip(inter_w + 1, 0, None)
+            iou = inter / (areas[idx] + areas[rest] - inter)
+            order = rest[iou <= iou_threshold]
+    return res_labels
+
+
+def merge_crops_predictions(
+    img_size: Tuple[int, int],
+    rects: List[Rectangle],
+    crops_anns: List[Annotation],
+    iou_threshold: float,
+) -> Annotation:
+    """Moves predictions of the crops to the image coordinates and merges them with NMS."""
+    labels = []
+    for rect, crop_ann in zip(rects, crops_anns):
+        for label in crop_ann.labels:
+            labels.append(label.translate(rect.top, rect.left))
+    return Annotation(img_size=img_size, labels=nms_labels(labels, iou_threshold))
+
+
+def apply_model_to_crops(
+    session: Session,
+    img: np.ndarray,
+    rects: List[Rectangle],
+    image_desc: ImageDescriptor,
+    batch_size: int = 50,
+) -> List[Annotation]:
+    """Predicts every crop of the image, crops are sent to the model in batches."""
+    crops_anns = []
+    ext = image_desc.info.ia_data["item_ext"]
+    # own directory of the call, items of concurrent previews and runs may have the same names
+    crops_dir = tempfile.mkdtemp(prefix="crops_")
+    try:
+        for rects_batch in batched(list(enumerate(rects)), batch_size):
+            crop_paths = []
+            for idx, rect in rects_batch:
+                crop_path = join(crops_dir, f"crop_{idx}{ext}")
+                crop = img[rect.top : rect.bottom + 1, rect.left : rect.right + 1]
+                sly_image.write(crop_path, crop)
+                crop_paths.append(crop_path)
+            try:
+                crops_anns.extend(session.inference_image_paths(crop_paths))
+            finally:
+                for crop_path in crop_paths:
+                    silent_remove(crop_path)
+    finally:
+        shutil.rmtree(crops_dir, ignore_errors=True)
+    return crops_anns
+
+
 class ApplyNNInferenceLayer(Layer):
     action = "apply_nn_inference"
     legacy_action = "apply_nn"
@@ -291,6 +418,42 @@ class ApplyNNInferenceLayer(Layer):
                         "enum": ["merge", "replace", "replace_keep_img_tags"],
                     },
                     "apply_method": {"type": "string", "enum": ["image", "roi", "sliding_window"]},
+                    "sliding_window": {
+                        "type": "object",
+                        "required": ["window", "min_overlap"],
+                        "properties": {
+                            "window": {
+                                "type": "object",
+                                "required": ["height", "width"],
+                                "properties": {
+                                    "height": {"type": "integer", "minimum": 1},
+                                    "width": {"type": "integer", "minimum": 1},
+                                },
+                            },
+                            "min_overlap": {
+                                "type": "object",
+                                "required": ["x", "y"],
+                                "properties": {
+                                    "x": {"type": "integer", "minimum": 0},
+                                    "y": {"type": "integer", "minimum": 0},
+                                },
+                            },
+                            "iou_threshold": {"type": "number", "minimum": 0, "maximum": 1},
+                        },
+                    },
+                    "roi": {
+                        "type": "object",
+                        "properties": {
+                            "classes": {
+                                "oneOf": [
+                                    {"type": "null"},
+                                    {"type": "array", "items": {"type": "string"}},
+                                ]
+                            },
+                            "padding": {"type": "integer", "minimum": 0},
+                            "iou_threshold": {"type": "number", "minimum": 0, "maximum": 1},
+                        },
+                    },
                     "batch_size": {"type": "integer"},
                     "classes": {
                         "oneOf": [
@@ -432,7 +595,7 @@ class ApplyNNInferenceLayer(Layer):
             if apply_method == "image":
                 sly_image.write(img_path, img)
                 try:
-                    session = Session(g.api, session_id)
+                    session = g.model_sessions.get(session_id)
                     pred_ann = apply_model_to_image(
                         session,
                         img_path,
@@ -456,7 +619,8 @@ class ApplyNNInferenceLayer(Layer):
                         )
                         g.warn_notification.show()
                         try:
-                            session = Session(g.api, session_id)
+                            g.model_sessions.reset(session_id)
+                            session = g.model_sessions.get(session_id)
                             g.warn_notification.hide()
                             pred_ann = apply_model_to_image(
                                 session,
@@ -471,6 +635,7 @@ class ApplyNNInferenceLayer(Layer):
                             )
                         except:
                             g.api.app.stop(session_id)
+                            g.model_sessions.reset(session_id)
                             g.pipeline_running = False
                             raise ValueError(
                                 (
@@ -492,10 +657,12 @@ class ApplyNNInferenceLayer(Layer):
                 if file_exists(img_path):
                     silent_remove(img_path)
 
-            elif apply_method == "roi":
-                pass
-            elif apply_method == "sliding_window":
-                pass
+            elif apply_method in ("roi", "sliding_window"):
+                session = self._connect_session(session_id)
+                if session is None:
+                    pred_ann = Annotation(img_size=img.shape[:2])
+                else:
+                    pred_ann = self._apply_to_regions(session, [img], [img_desc], [ann])[0]
 
             add_pred_ann_method = self.settings["add_pred_ann_method"]
             if add_pred_ann_method == "merge":
@@ -523,26 +690,38 @@ class ApplyNNInferenceLayer(Layer):
             apply_method = self.settings["apply_method"]
             batch_size = self.settings["batch_size"]
             if apply_method == "image":
+                items = []
                 item_shapes = []
                 item_paths = []
                 new_item_descs = []
 
-                for item_desc in item_descs:
+                cache_keys = [None] * len(item_descs)
+                miss_keys = []
+                for idx, item_desc in enumerate(item_descs):
                     item_desc: ImageDescriptor
                     item = item_desc.read_image()
                     item = item.astype(np.uint8)
+                    items.append(item)
+                    new_item_descs.append(item_desc.clone_with_item(item))
+                    if g.prediction_cache.enabled:
+                        cache_keys[idx] = self._get_cache_key(item)
+                cached = g.prediction_cache.get_many(key for key in cache_keys if key is not None)
+
+                for item_desc, item, cache_key in zip(item_descs, items, cache_keys):
+                    if cache_key in cached:
+                        continue
                     item_path = join(
                         f"{g.PREVIEW_DIR}",
                         f"{item_desc.info.item_name}{item_desc.info.ia_data['item_ext']}",
                     )
                     sly_image.write(item_path, item)
-                    new_item_desc = item_desc.clone_with_item(item)
-
                     item_shapes.append(item.shape)
                     item_paths.append(item_path)
-                    new_item_descs.append(new_item_desc)
+                    miss_keys.append(cache_key)
+                if not g.prediction_cache.enabled:
+                    miss_keys = None
                 try:
-                    session = Session(g.api, session_id)
+                    session = g.model_sessions.get(session_id) if len(item_paths) > 0 else None
                     pred_anns = apply_model_to_images(
                         session,
                         item_paths,
@@ -554,6 +733,7 @@ class ApplyNNInferenceLayer(Layer):
                         self.cls_sfx_mapping,
                         self.tag_sfx_mapping,
                         batch_size=batch_size,
+                        cache_keys=miss_keys,
                     )
                 except:
                     if not self.net.preview_mode:
@@ -567,7 +747,8 @@ class ApplyNNInferenceLayer(Layer):
                         )
                         g.warn_notification.show()
                         try:
-                            session = Session(g.api, session_id)
+                            g.model_sessions.reset(session_id)
+                            session = g.model_sessions.get(session_id)
                             g.warn_notification.hide()
                             pred_anns = apply_model_to_images(
                                 session,
@@ -580,9 +761,11 @@ class ApplyNNInferenceLayer(Layer):
                                 self.cls_sfx_mapping,
                                 self.tag_sfx_mapping,
                                 batch_size=batch_size,
+                                cache_keys=miss_keys,
                             )
                         except:
                             g.api.app.stop(session_id)
+                            g.model_sessions.reset(session_id)
                             g.pipeline_running = False
                             raise ValueError(
                                 (
@@ -604,11 +787,22 @@ class ApplyNNInferenceLayer(Layer):
                 for item_path in item_paths:
                     if file_exists(item_path):
                         silent_remove(item_path)
+                pred_anns = self._merge_cached_predictions(
+                    items, cache_keys, cached, pred_anns, model_meta
+                )
 
-            elif apply_method == "roi":
-                pass
-            elif apply_method == "sliding_window":
-                pass
+            elif apply_method in ("roi", "sliding_window"):
+                items = []
+                new_item_descs = []
+                for item_desc in item_descs:
+                    item = item_desc.read_image().astype(np.uint8)
+                    items.append(item)
+                    new_item_descs.append(item_desc.clone_with_item(item))
+                session = self._connect_session(session_id)
+                if session is None:
+                    pred_anns = [Annotation(img_size=item.shape[:2]) for item in items]
+                else:
+                    pred_anns = self._apply_to_regions(session, items, item_descs, anns)
 
             add_pred_ann_method = self.settings["add_pred_ann_method"]
             ignore_labeled = self.settings["ignore_labeled"]
@@ -646,8 +840,202 @@ class ApplyNNInferenceLayer(Layer):
 
             yield tuple(zip(new_item_descs, new_anns))
 
+    def _connect_session(self, session_id: int):
+        """Returns the model session, None in preview mode if the model is not available."""
+        try:
+            return g.model_sessions.get(session_id)
+        except:
+            if self.net.preview_mode:
+                show_dialog(
+                    title="Couldn't preview image",
+                    description=(
+                        "Model is not served. "
+                        "<br>Check model session logs by visiting app session page: "
+                        f"<a href='{g.api.server_address}{g.api.app.get_url(session_id)}' target='_blank'>open app</a> "
+                    ),
+                    status="warning",
+                )
+                return None
+        g.warn_notification.set(
+            title="Model is not responding. Attempting to reconnect...",
+            description=(
+                "Make sure that the "
+                f"<a href='{g.api.server_address}{g.api.app.get_url(session_id)}' target='_blank'>app session</a> "
+                "is running and the model is served."
+            ),
+        )
+        g.warn_notification.show()
+        try:
+            g.model_sessions.reset(session_id)
+            session = g.model_sessions.get(session_id)
+            g.warn_notification.hide()
+            return session
+        except:
+            g.api.app.stop(session_id)
+            g.model_sessions.reset(session_id)
+            g.pipeline_running = False
+            raise ValueError(
+                (
+                    "Something went wrong while connecting to the model. Pipeline will be stopped. "
+                    f"Shutting down the model session ID: '{session_id}'."
+                )
+            )
+
+    def _apply_to_regions(
+        self,
+        session: Session,
+        items: List[np.ndarray],
+        item_descs: List[ImageDescriptor],
+        anns: List[Annotation],
+    ) -> List[Annotation]:
+        """
+        Applies the model to the ROIs (padded bboxes of the labels) or to the sliding windows of
+        every image and merges predictions of the crops into the image coordinates with NMS.
+        Sliding window is done by the model session if it supports it, so every image is sent
+        only once, otherwise windows are cropped here and sent in batches.
+        """
+        apply_method = self.settings["apply_method"]
+        model_meta = ProjectMeta().from_json(self.settings["model_meta"])
+        if apply_method == "sliding_window":
+            params = {**DEFAULT_SLIDING_WINDOW, **self.settings.get("sliding_window", {})}
+            sliding_window_support = self.settings["model_info"].get("sliding_window_support")
+            on_server = sliding_window_support in ("basic", "advanced")
+        else:
+            params = {**DEFAULT_ROI, **self.settings.get("roi", {})}
+            on_server = False
+
+        cache_keys = [None] * len(items)
+        if g.prediction_cache.enabled:
+            cache_keys = [self._get_cache_key(item) for item in items]
+            if apply_method == "roi":
+                # ROIs depend on the labels, not only on the image
+                cache_keys = [
+                    f"{key}:{get_json_key([r.to_json() for r in get_roi_rects(ann, params)])}"
+                    for key, ann in zip(cache_keys, anns)
+                ]
+        cached = g.prediction_cache.get_many(key for key in cache_keys if key is not None)
+
+        pred_anns = []
+        for item, item_desc, ann, cache_key in zip(items, item_descs, anns, cache_keys):
+            img_size = item.shape[:2]
+            try:
+                if cache_key in cached:
+                    pred_ann = Annotation.from_json(cached[cache_key], model_meta)
+                else:
+                    pred_ann = self._predict_regions(
+                        session, item, item_desc, ann, params, on_server
+                    )
+                    if cache_key is not None:
+                        g.prediction_cache.put_many({cache_key: pred_ann.to_json()})
+                pred_ann, _ = postprocess_ann(
+                    pred_ann,
+                    self.output_meta,
+                    model_meta,
+                    self.settings,
+                    self.cls_sfx_mapping,
+                    self.tag_sfx_mapping,
+                )
+            except:
+                sly_logger.warn(
+                    f"Could not apply model to image: {item_desc.info.item_info.name}(ID: {item_desc.info.item_info.id})"
+                )
+                pred_ann = Annotation(img_size=img_size)
+            pred_anns.append(pred_ann)
+        return pred_anns
+
+    def _predict_regions(
+        self,
+        session: Session,
+        item: np.ndarray,
+        item_desc: ImageDescriptor,
+        ann: Annotation,
+        params: dict,
+        on_server: bool,
+    ) -> Annotation:
+        img_size = item.shape[:2]
+        if self.settings["apply_method"] == "sliding_window":
+            rects = get_sliding_windows(img_size, params)
+        else:
+            rects = get_roi_rects(ann, params)
+
+        if len(rects) == 0:
+            return Annotation(img_size=img_size)
+        if not on_server:
+            crops_anns = apply_model_to_crops(
+                session, item, rects, item_desc, self.settings["batch_size"]
+            )
+            return merge_crops_predictions(img_size, rects, crops_anns, params["iou_threshold"])
+
+        window = rects[0]
+        img_dir = tempfile.mkdtemp(prefix="sliding_window_")
+        img_path = join(img_dir, f"image{item_desc.info.ia_data['item_ext']}")
+        try:
+            sly_image.write(img_path, item)
+            sw_session = session.with_settings(
+                {
+                    "inference_mode": "sliding_window",
+                    "sliding_window_params": {
+                        "windowHeight": window.height,
+                        "windowWidth": window.width,
+                        "overlapY": min(params["min_overlap"]["y"], window.height - 1),
+                        "overlapX": min(params["min_overlap"]["x"], window.width - 1),
+                    },
+                }
+            )
+            pred_ann = sw_session.inference_image_path(img_path)
+        finally:
+            shutil.rmtree(img_dir, ignore_errors=True)
+        return pred_ann.clone(labels=nms_labels(pred_ann.labels, params["iou_threshold"]))
+
+    def _get_model_key(self) -> str:
+        apply_method = self.settings["apply_method"]
+        inference_settings = {
+            "model_settings": self.settings["model_settings"],
+            "apply_method": apply_method,
+            apply_method: self.settings.get(apply_method),
+        }
+        return get_model_key(
+            self.settings["session_id"], self.settings["model_info"], inference_settings
+        )
+
+    def _get_cache_key(self, item: np.ndarray) -> str:
+        """Cache key of the item predictions: hash of the pixels and of the model."""
+        return PredictionCache.make_key(get_image_key(item), self._get_model_key())
+
+    def _merge_cached_predictions(
+        self,
+        items: List[np.ndarray],
+        cache_keys: List[str],
+        cached: dict,
+        pred_anns: List[Annotation],
+        model_meta: ProjectMeta,
+    ) -> List[Annotation]:
+        """Puts cached predictions between the predictions of the images sent to the model."""
+        if len(cached) == 0:
+            return pred_anns
+        pred_anns = iter(pred_anns)
+        res_anns = []
+        for item, cache_key in zip(items, cache_keys):
+            if cache_key in cached:
+                pred_ann = Annotation.from_json(cached[cache_key], model_meta)
+                pred_ann, _ = postprocess_ann(
+                    pred_ann,
+                    self.output_meta,
+                    model_meta,
+                    self.settings,
+                    self.cls_sfx_mapping,
+                    self.tag_sfx_mapping,
+                )
+            else:
+                pred_ann = next(pred_anns, None)
+                if pred_ann is None:
+                    pred_ann = Annotation(img_size=item.shape[:2])
+            res_anns.append(pred_ann)
+        return res_anns
+
     def has_batch_processing(self):
         return True
 
     def postprocess(self):
-        self.postprocess_cb()
\ No newline at end of file
+        if self.postprocess_cb is not None:
+            self.postprocess_cb()
\ No newline at end of file
@@ -1,8 +1,12 @@
 # coding: utf-8
 
-import numpy as np
+from typing import List, Tuple
 
+from supervisely import Annotation
+
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
+from src.compute.utils import pixel_ops
 from src.exceptions import BadSettingsError
 
 
@@ -57,23 +61,34 @@ class ContrastBrightnessLayer(Layer):
     def modifies_data(self):
         return True
 
-    def process(self, data_el):
-        img_desc, ann_orig = data_el
+    def _sample_params(self):
+        rng = pixel_ops.get_rng()
 
         contrast_b = self.settings["contrast"]
-        contrast_value = np.random.uniform(contrast_b["min"], contrast_b["max"])
+        contrast_value = rng.uniform(contrast_b["min"], contrast_b["max"])
         if contrast_b.get("center_grey", False):
             contrast_c = 128
         else:
             contrast_c = 0
 
         brightness_b = self.settings["brightness"]
-        brightness_value = np.random.uniform(brightness_b["min"], brightness_b["max"])
+        brightness_value = rng.uniform(brightness_b["min"], brightness_b["max"])
+        return contrast_value, brightness_value, contrast_c
 
-        img = img_desc.read_image()
-        img = img.astype(np.float32)
-        img = (img - contrast_c) * float(contrast_value) + (brightness_value + contrast_c)
+    def process(self, data_el: Tuple[ImageDescriptor, Annotation]):
+        img_desc, ann_orig = data_el
 
-        img = np.clip(img, 0, 255).astype(np.uint8)
+        img = pixel_ops.contrast_brightness(img_desc.read_image(), *self._sample_params())
         new_img_desc = img_desc.clone_with_item(img)
         yield new_img_desc, ann_orig
+
+    def process_batch(self, data_els: List[Tuple[ImageDescriptor, Annotation]]):
+        imgs = [img_desc.read_image() for img_desc, _ in data_els]
+        params = [self._sample_params() for _ in imgs]
+        res_imgs = pixel_ops.contrast_brightness_batch(imgs, params)
+        yield [
+            (img_desc.clone_with_item(img), ann) for (img_desc, ann), img in zip(data_els, res_imgs)
+        ]
+
+    def has_batch_processing(self) -> bool:
+        return True
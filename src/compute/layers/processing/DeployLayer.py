@@ -1,5 +1,4 @@
 # coding: utf-8
-from time import sleep
 from typing import List, Tuple, Union
 
 import src.globals as g
@@ -7,17 +6,10 @@ from src.compute.dtl_utils.item_descriptor import ImageDescriptor, VideoDescript
 from src.compute.Layer import Layer
 from src.exceptions import BadSettingsError
 from supervisely import Annotation, ProjectMeta, VideoAnnotation, logger
-from supervisely.nn.inference.session import Session
 
 
-def wait_model_served(session: Session, wait_attemtps: int = 10, wait_delay_sec: int = 10):
-    for _ in range(wait_attemtps):
-        is_model_served = session.is_model_deployed()
-        if is_model_served:
-            return
-        else:
-            sleep(wait_delay_sec)
-            logger.warning("Model is not served yet. Waiting for model to be served")
+def wait_model_served(session_id: int, timeout: float = 120) -> bool:
+    return g.model_sessions.wait_until_ready(session_id, timeout=timeout)
 
 
 def check_model_is_deployed(session_id: int, action_name):
@@ -30,10 +22,9 @@ def check_model_is_deployed(session_id: int, action_name):
     )
 
     try:
-        session = Session(g.api, session_id)
-        is_model_served = session.is_model_deployed()
+        is_model_served = g.model_sessions.is_deployed(session_id)
         if not is_model_served:
-            is_model_served = wait_model_served(session, 12)
+            is_model_served = wait_model_served(session_id)
             if not is_model_served:
                 raise TimeoutError(error_message)
     except:
@@ -101,12 +92,23 @@ class DeployLayer(Layer):
             super().validate()
 
     def postprocess(self):
+        if self.is_shard_run():
+            return  # other shards may still use the model, it's stopped in finalize
+        self.stop_session()
+
+    def finalize(self, shard_states: list):
+        self.stop_session()
+
+    def stop_session(self):
         if self.settings["stop_model_session"]:
             session_id = self.settings["session_id"]
             g.api.app.stop(session_id)
-            g.running_sessions_ids.remove(session_id)
+            if session_id in g.running_sessions_ids:
+                g.running_sessions_ids.remove(session_id)
+            g.model_sessions.reset(session_id)
             logger.info(f"Session ID: {session_id} has been stopped")
-            self.postprocess_cb()
+            if self.postprocess_cb is not None:
+                self.postprocess_cb()
 
     def process_batch(self, data_els: List[Tuple[ImageDescriptor, Annotation]]):
         yield data_els
@@ -6,25 +6,18 @@ import numpy as np
 from supervisely import Polyline, Polygon, Annotation, Label
 
 from src.compute.Layer import Layer
-from shapely.geometry import LineString, Polygon as shPolygon
+from shapely.geometry import LineString
+from shapely.geometry.base import BaseGeometry
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.dtl_utils import apply_to_labels
+from src.compute.dtl_utils.spatial_index import (
+    get_spatial_index,
+    polygon_to_shapely,
+    polyline_to_shapely,
+)
 
 
-def remove_polylines_inside_polygon(line: Polyline, polygons: List[Polygon]) -> List[Polyline]:
-    coords = line.exterior_np
-    sh_line = LineString(coords)
-
-    sh_polygons = []
-    for polygon in polygons:
-        c_exterior = polygon.exterior_np
-        c_interiors = polygon.interior_np
-        poly = shPolygon(shell=c_exterior, holes=c_interiors)
-        if poly.is_valid == False:
-            poly = poly.buffer(0.001)
-
-        sh_polygons.append(poly)
-
+def subtract_polygons_from_line(sh_line: LineString, sh_polygons: List[BaseGeometry]):
     for poly in sh_polygons:
         sh_line = sh_line.difference(poly)
 
@@ -34,7 +27,7 @@ def remove_polylines_inside_polygon(line: Polyline, polygons: List[Polygon]) ->
 
     if sh_line.geom_type == "MultiLineString":
         new_lines = []
-        for line in sh_line:
+        for line in sh_line.geoms:
             coords = np.transpose(line.coords.xy)
             new_lines.append(Polyline([(c[0], c[1]) for c in coords]))
         return new_lines
@@ -43,6 +36,13 @@ def remove_polylines_inside_polygon(line: Polyline, polygons: List[Polygon]) ->
         coords = np.transpose(sh_line.coords.xy)
         return [Polyline([(c[0], c[1]) for c in coords])]
 
+    return []
+
+
+def remove_polylines_inside_polygon(line: Polyline, polygons: List[Polygon]) -> List[Polyline]:
+    sh_polygons = [polygon_to_shapely(polygon) for polygon in polygons]
+    return subtract_polygons_from_line(polyline_to_shapely(line), sh_polygons)
+
 
 class DropLinesUnderPolygonLayer(Layer):
     action = "drop_lines_under_polygon"
@@ -73,15 +73,20 @@ class DropLinesUnderPolygonLayer(Layer):
         lines_class = self.settings.get("lines_class")
         polygons_class = self.settings.get("polygons_class")
 
-        polygons = []
-        for label in ann.labels:
-            if polygons_class == label.obj_class.name and isinstance(label.geometry, Polygon):
-                polygons.append(label.geometry)
+        index = get_spatial_index(ann)
 
         def drop_lines(label: Label):
             if lines_class != label.obj_class.name or not isinstance(label.geometry, Polyline):
                 return [label]
-            new_lines = remove_polylines_inside_polygon(label.geometry, polygons)
+            sh_line = index.get_shape(label)
+            # only polygons with intersecting bounds can cut the line
+            polygons_idxs = index.query(
+                sh_line, class_names=[polygons_class], geometry_types=(Polygon,)
+            )
+            if len(polygons_idxs) == 0:
+                return [label]
+            sh_polygons = [index.get_shape(idx) for idx in polygons_idxs]
+            new_lines = subtract_polygons_from_line(sh_line, sh_polygons)
             return [label.clone(geometry=line) for line in new_lines]
 
         ann = apply_to_labels(ann, drop_lines)
@@ -8,6 +8,7 @@ from supervisely import Annotation
 
 from src.compute.Layer import Layer
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.compute.dtl_utils.spatial_index import get_spatial_index
 from src.exceptions import BadSettingsError
 
 
@@ -212,8 +213,11 @@ class IfLayer(Layer):
         elif "sum_object_area" in condition:
             thresh = condition["sum_object_area"]
             req_classes = condition["classes"]
+            index = get_spatial_index(ann)
             sum_area = sum(
-                label.area for label in ann.labels if label.obj_class.name in req_classes
+                index.get_area(label)
+                for label in index.labels
+                if label.obj_class.name in req_classes
             )
             satisfies_cond = sum_area >= thresh
 
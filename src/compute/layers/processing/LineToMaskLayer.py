@@ -1,14 +1,13 @@
 # coding: utf-8
 
 from typing import Tuple
-import numpy as np
 
 from supervisely import Annotation, Label, Bitmap
 
 from src.compute.Layer import Layer
 from src.compute.classes_utils import ClassConstants
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
-from src.compute.dtl_utils import apply_to_labels
+from src.compute.dtl_utils import apply_to_labels, label_to_bitmap
 
 
 # converts ALL types to Bitmap
@@ -57,14 +56,8 @@ class LineToMaskLayer(Layer):
             new_title = self.settings["classes_mapping"].get(label.obj_class.name, None)
             if new_title is None:
                 return [label]
-
-            bmp_to_draw = np.zeros(ann.img_size, np.uint8)
-            label.geometry.draw(bmp_to_draw, color=1, thickness=thickness)
             new_obj_class = label.obj_class.clone(new_title, Bitmap)
-            new_label = label.clone(
-                geometry=Bitmap(bmp_to_draw, extra_validation=False), obj_class=new_obj_class
-            )
-            return [new_label]
+            return label_to_bitmap(label, new_obj_class, ann.img_size, thickness)
 
         ann = apply_to_labels(ann, to_bitmap)
         yield img_desc, ann
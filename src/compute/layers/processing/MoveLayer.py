@@ -50,7 +50,7 @@ class MoveLayer(Layer):
         if not g.disable_move:
             g.api.image.remove_batch(list(self.entity_ids_to_remove))
             self.entity_ids_to_remove = set()
-            g.FILTERED_ENTITIES = []
+            g.FILTERED_ENTITIES.clear()
 
     def has_batch_processing(self) -> bool:
         return True
@@ -23,6 +23,9 @@ class MultiplyLayer(Layer):
     def modifies_data(self):
         return True
 
+    def get_fan_out(self):
+        return self.settings["multiply"]
+
     def process(self, data_el):
         for _ in range(self.settings["multiply"]):
             yield data_el
@@ -1,8 +1,12 @@
 # coding: utf-8
 
-import numpy as np
+from typing import List, Tuple
 
+from supervisely import Annotation
+
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
+from src.compute.utils import pixel_ops
 
 
 class NoiseLayer(Layer):
@@ -28,13 +32,21 @@ class NoiseLayer(Layer):
     def modifies_data(self):
         return True
 
-    def process(self, data_el):
+    def process(self, data_el: Tuple[ImageDescriptor, Annotation]):
         img_desc, ann_orig = data_el
 
-        img = img_desc.read_image()
-        img = img.astype(np.float32)
-        img += np.random.normal(self.settings["mean"], self.settings["std"], img.shape)
-
-        img = np.clip(img, 0, 255).astype(np.uint8)
+        img = pixel_ops.gaussian_noise(
+            img_desc.read_image(), self.settings["mean"], self.settings["std"]
+        )
         new_img_desc = img_desc.clone_with_item(img)
         yield new_img_desc, ann_orig
+
+    def process_batch(self, data_els: List[Tuple[ImageDescriptor, Annotation]]):
+        imgs = [img_desc.read_image() for img_desc, _ in data_els]
+        res_imgs = pixel_ops.gaussian_noise_batch(imgs, self.settings["mean"], self.settings["std"])
+        yield [
+            (img_desc.clone_with_item(img), ann) for (img_desc, ann), img in zip(data_els, res_imgs)
+        ]
+
+    def has_batch_processing(self) -> bool:
+        return True
@@ -5,6 +5,7 @@ from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
 from supervisely import Annotation, Label, Tag, logger
 from src.compute.dtl_utils import apply_to_labels
+from src.compute.dtl_utils.spatial_index import get_spatial_index
 
 
 class ObjectsFilterByAreaLayer(Layer):
@@ -82,6 +83,8 @@ class ObjectsFilterByAreaLayer(Layer):
         else:
             tags = []
 
+        index = get_spatial_index(ann)
+
         def filtered_delete_area_pixels(label: Label):
             if comparator == "lt":
                 compar = lambda x: x < area
@@ -89,7 +92,7 @@ class ObjectsFilterByAreaLayer(Layer):
                 compar = lambda x: x > area
 
             if label.obj_class.name in classes:
-                label_area = label.area
+                label_area = index.get_area(label)
                 if compar(label_area):  # satisfied condition
                     return []  # action 'delete'
             return [label]
@@ -101,7 +104,7 @@ class ObjectsFilterByAreaLayer(Layer):
                 compar = lambda x: x > area
 
             if label.obj_class.name in classes:
-                label_area = label.area
+                label_area = index.get_area(label)
                 if compar(label_area):  # satisfied condition
                     return [label]  # action 'keep'
             return []
@@ -113,7 +116,7 @@ class ObjectsFilterByAreaLayer(Layer):
                 compar = lambda x: x > area
 
             if label.obj_class.name in classes:
-                label_area = label.area
+                label_area = index.get_area(label)
                 if compar(label_area):
                     try:
                         label = label.add_tags(tags)
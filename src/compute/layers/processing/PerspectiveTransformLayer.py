@@ -6,7 +6,7 @@ from src.compute.Layer import Layer
 from supervisely import Annotation, Label, Bitmap, Polygon, Rectangle
 from src.compute.classes_utils import ClassConstants
 from imgaug import augmenters as iaa
-from src.compute.dtl_utils import apply_to_labels
+from src.compute.dtl_utils import apply_to_labels, label_to_bitmap
 from src.exceptions import BadSettingsError
 from supervisely.aug.imgaug_utils import apply as apply_augs
 
@@ -95,7 +95,7 @@ class PerspectiveTransformLayer(Layer):
             if new_title is None:
                 return [label]
             new_obj_class = label.obj_class.clone(name=new_title, geometry_type=Bitmap)
-            return label.convert(new_obj_class)
+            return label_to_bitmap(label, new_obj_class, ann.img_size)
 
         ann = apply_to_labels(ann, to_bitmap)
         shapes_to_ignore = [Bitmap, Polygon, Rectangle]
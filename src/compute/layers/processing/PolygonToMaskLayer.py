@@ -6,7 +6,7 @@ from supervisely import Bitmap, Annotation, Label
 from src.compute.Layer import Layer
 from src.compute.classes_utils import ClassConstants
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
-from src.compute.dtl_utils import apply_to_labels
+from src.compute.dtl_utils import apply_to_labels, label_to_bitmap
 
 
 # converts ALL types to FigureBitmap
@@ -50,7 +50,7 @@ class PolygonToMaskLayer(Layer):
                 return [label]
             new_obj_class = label.obj_class.clone(name=new_title, geometry_type=Bitmap)
 
-            return label.convert(new_obj_class)
+            return label_to_bitmap(label, new_obj_class, ann.img_size)
 
         ann = apply_to_labels(ann, to_bitmap)
         yield img_desc, ann
@@ -1,8 +1,12 @@
 # coding: utf-8
 
-import numpy as np
+from typing import List, Tuple
 
+from supervisely import Annotation
+
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
+from src.compute.utils import pixel_ops
 
 
 class RandomColorLayer(Layer):
@@ -35,20 +39,27 @@ class RandomColorLayer(Layer):
     def modifies_data(self):
         return True
 
-    def process(self, data_el):
-        img_desc, ann_orig = data_el
+    def _get_strength(self):
+        return self.settings.get("strength", 0.25) / 5.0
 
-        strength = self.settings.get("strength", 0.25)
-        strength /= 5.0
+    def process(self, data_el: Tuple[ImageDescriptor, Annotation]):
+        img_desc, ann_orig = data_el
 
         img = img_desc.read_image()
-        img = img.astype(np.float32)
-
-        shape = img.shape
-        res_img = img.reshape(-1, 3)
-        rand = np.eye(3) + np.random.randn(3, 3) * strength
-        res_img = np.dot(res_img, rand).reshape(shape)
+        rand = pixel_ops.random_color_matrix(self._get_strength())
+        img = pixel_ops.color_transform(img, rand)
 
-        img = np.clip(res_img, 0, 255).astype(np.uint8)
         new_img_desc = img_desc.clone_with_item(img)
         yield new_img_desc, ann_orig
+
+    def process_batch(self, data_els: List[Tuple[ImageDescriptor, Annotation]]):
+        strength = self._get_strength()
+        imgs = [img_desc.read_image() for img_desc, _ in data_els]
+        matrices = [pixel_ops.random_color_matrix(strength) for _ in imgs]
+        res_imgs = pixel_ops.color_transform_batch(imgs, matrices)
+        yield [
+            (img_desc.clone_with_item(img), ann) for (img_desc, ann), img in zip(data_els, res_imgs)
+        ]
+
+    def has_batch_processing(self) -> bool:
+        return True
@@ -50,6 +50,13 @@ class SlidingWindowLayer(Layer):
     def modifies_data(self):
         return True
 
+    def get_fan_out(self):
+        # windows cover the image with the overlaps
+        window, overlap = self.settings["window"], self.settings["min_overlap"]
+        step_h = max(window["height"] - overlap["y"], 1)
+        step_w = max(window["width"] - overlap["x"], 1)
+        return window["height"] / step_h * window["width"] / step_w
+
     def preprocess(self):
         window_wh = (self.settings["window"]["width"], self.settings["window"]["height"])
         min_overlap_xy = (self.settings["min_overlap"]["x"], self.settings["min_overlap"]["y"])
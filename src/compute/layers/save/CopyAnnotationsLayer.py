@@ -1,7 +1,10 @@
 # coding: utf-8
 
-from typing import Tuple, List
-from collections import defaultdict
+import json
+import os
+from typing import Tuple, List, Dict, NamedTuple, Optional
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import supervisely as sly
 from supervisely import (
     Annotation,
@@ -16,6 +19,7 @@ from supervisely.api.app_api import SessionInfo
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
 from src.exceptions import GraphError
+from src.utils import invalidate_project_cache
 import src.globals as g
 from supervisely.io.fs import get_file_name
 
@@ -109,21 +113,102 @@ def match_properties(
     return True
 
 
-def map_matching_images_by_name(input_ds_images, destination_ds_images, strict_match):
-    name_to_id_map = {get_file_name(image.name): image for image in input_ds_images}
+class IndexedImage(NamedTuple):
+    id: int
+    name: str
+    height: int
+    width: int
+    hash: str
+    link: str
+
+
+class ImagesIndex:
+    """
+    Compact name index of dataset images: name without extension -> image properties.
+    The index is saved to the cache dir and reused while the dataset is not changed
+    (`updated_at` and `items_count` of the dataset are the same).
+    """
+
+    def __init__(self, dataset_id: int, version: str, rows: List[list]):
+        self.dataset_id = dataset_id
+        self.version = version
+        self._rows = rows
+        self._by_name = {get_file_name(row[1]): idx for idx, row in enumerate(rows)}
+
+    @staticmethod
+    def _get_version(dataset_info: DatasetInfo) -> str:
+        return f"{dataset_info.updated_at}:{dataset_info.items_count}"
+
+    @staticmethod
+    def _get_path(dataset_id: int) -> str:
+        return os.path.join(g.CACHE_DIR, "images_index", f"{dataset_id}.json")
+
+    @classmethod
+    def build(cls, dataset_info: DatasetInfo) -> "ImagesIndex":
+        rows = []
+        for batch in g.api.image.get_list_generator(dataset_info.id, batch_size=500):
+            for info in batch:
+                rows.append([info.id, info.name, info.height, info.width, info.hash, info.link])
+        return cls(dataset_info.id, cls._get_version(dataset_info), rows)
+
+    @classmethod
+    def load_or_build(cls, dataset_info: DatasetInfo) -> "ImagesIndex":
+        path = cls._get_path(dataset_info.id)
+        version = cls._get_version(dataset_info)
+        if os.path.isfile(path):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                if data["version"] == version:
+                    return cls(dataset_info.id, version, data["rows"])
+            except Exception as e:
+                sly.logger.debug(f"Failed to load images index for dataset {dataset_info.id}: {e}")
+        index = cls.build(dataset_info)
+        index.save()
+        return index
+
+    def save(self):
+        path = self._get_path(self.dataset_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self.version, "rows": self._rows}, f)
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        for row in self._rows:
+            yield IndexedImage(*row)
+
+    def get(self, name: str) -> Optional[IndexedImage]:
+        idx = self._by_name.get(name)
+        if idx is None:
+            return None
+        return IndexedImage(*self._rows[idx])
+
+
+def map_matching_images_by_name(
+    input_index: ImagesIndex, destination_index: ImagesIndex, strict_match: bool
+) -> Dict[int, int]:
     matched_mapping = {}
-    for image in destination_ds_images:
-        image_name = get_file_name(image.name)
-        if image_name in name_to_id_map and match_properties(
-            name_to_id_map[image_name], image, strict_match=strict_match
+    for image in input_index:
+        destination_image = destination_index.get(get_file_name(image.name))
+        if destination_image is not None and match_properties(
+            image, destination_image, strict_match=strict_match
         ):
-            matched_mapping[name_to_id_map[image_name].id] = image.id
+            matched_mapping[image.id] = destination_image.id
     return matched_mapping
 
 
 class CopyAnnotationsLayer(Layer):
     action = "copy_annotations"
 
+    # destination annotations are downloaded one batch ahead and uploaded in background
+    workers = 4
+    max_prefetched = 2000
+
     layer_settings = {
         "required": ["settings"],
         "properties": {
@@ -154,12 +239,24 @@ class CopyAnnotationsLayer(Layer):
     def __init__(self, config, output_folder, net):
         Layer.__init__(self, config, net=net)
         self.sly_project_info = None
-        self.ds_map = {}
+        self.ds_map = {}  # {input_dataset_id: {input_image_id: destination_image_id}}
+        self.dst_ds_map = {}  # {input_dataset_id: destination_dataset_id}
+        self.input_order = {}  # {input_dataset_id: [input_image_id, ...]}
+        self._input_positions = {}
+        self._executor = None
+        self._prefetched = OrderedDict()  # {destination_image_id: Future}
+        self._uploads = {}  # {destination_image_id: Future}
 
     def validate(self):
         if self.net.preview_mode:
             return
 
+        # images are matched with the source images on the server
+        if self.net.source is not None:
+            raise GraphError(
+                "'Add labels to existing project' layer can not be used with a local source"
+            )
+
         settings = self.settings
 
         if settings["project_id"] is None:
@@ -174,6 +271,10 @@ class CopyAnnotationsLayer(Layer):
 
         super().validate()
 
+    def saves_items(self):
+        # annotations are uploaded to the existing images
+        return False
+
     def validate_dest_connections(self):
         if len(self.dsts) != 1:
             raise GraphError("Destination ID in '{}' layer is empty!".format(self.action))
@@ -235,6 +336,7 @@ class CopyAnnotationsLayer(Layer):
             try:
                 self.output_meta = ProjectMeta.merge(dst_meta, self.output_meta)
                 g.api.project.update_meta(self.out_project_id, self.output_meta)
+                invalidate_project_cache(self.out_project_id)
             except Exception as e:
                 raise GraphError(f"Failed to merge meta: {e}")
 
@@ -254,6 +356,13 @@ class CopyAnnotationsLayer(Layer):
             if input_datasets_count == 1:
                 is_single_input_ds = True
 
+        destination_indexes = {}
+
+        def get_destination_index(ds_info: DatasetInfo) -> ImagesIndex:
+            if ds_info.id not in destination_indexes:
+                destination_indexes[ds_info.id] = ImagesIndex.load_or_build(ds_info)
+            return destination_indexes[ds_info.id]
+
         for input_project_id in input_projects_map:
             datasets = input_projects_map[input_project_id]
             for dataset in datasets:
@@ -262,25 +371,22 @@ class CopyAnnotationsLayer(Layer):
                     or len(self.settings["dataset_ids"]) == 1
                 ):
                     total_ds_images = dataset.items_count
-                    input_images = g.api.image.get_list(dataset.id)
+                    input_index = ImagesIndex.load_or_build(dataset)
 
                     if len(self.settings["dataset_ids"]) == 1 and is_single_input_ds:
-                        destination_images = g.api.image.get_list(self.settings["dataset_ids"][0])
+                        destination_ds = destination_dataset_infos[0]
                     else:
                         destination_ds = destination_ds_map.get(dataset.name)
-                        if destination_ds is not None:
-                            destination_images = g.api.image.get_list(
-                                destination_ds_map[dataset.name].id
-                            )
-                        else:
+                        if destination_ds is None:
                             sly.logger.warn(
                                 f"Destination project does not have dataset '{dataset.name}'. Skipping..."
                             )
                             continue
+                    destination_index = get_destination_index(destination_ds)
 
                     strict_match = self.settings.get("strict_match", False)
                     matched_images = map_matching_images_by_name(
-                        input_images, destination_images, strict_match
+                        input_index, destination_index, strict_match
                     )
                     if len(matched_images) == 0:
                         sly.logger.warn(
@@ -298,6 +404,9 @@ class CopyAnnotationsLayer(Layer):
                     else:
                         if len(matched_images) > 0:
                             self.ds_map[dataset.id] = matched_images
+                    self.dst_ds_map[dataset.id] = destination_ds.id
+                    # input images order is the order of the elements generator
+                    self.input_order[dataset.id] = [image.id for image in input_index]
                     datasets_matches += 1
                 else:
                     sly.logger.warn(
@@ -322,7 +431,8 @@ class CopyAnnotationsLayer(Layer):
 
             dst_item_id_map = defaultdict(list)
             dst_item_ann_map = defaultdict(list)
-            for item_desc, ann in zip(item_descs, anns):
+            dst_item_idx_map = defaultdict(list)
+            for item_idx, (item_desc, ann) in enumerate(zip(item_descs, anns)):
                 if item_desc.item_data is None:
                     local_item_size = (
                         item_desc.info.item_info.height,
@@ -354,30 +464,129 @@ class CopyAnnotationsLayer(Layer):
                         else:
                             dst_item_id_map[dataset_id].append(destination_image_id)
                             dst_item_ann_map[dataset_id].append(ann)
+                            dst_item_idx_map[dataset_id].append(item_idx)
 
+            self._check_finished_uploads()
+            add_option = self.settings["add_option"]
+            out_anns = list(anns)
             for dataset_id in dst_item_id_map:
                 destination_images_ids = dst_item_id_map[dataset_id]
                 image_anns = dst_item_ann_map[dataset_id]
 
-                add_option = self.settings["add_option"]
                 if add_option == "merge":
-                    ann_jsons = g.api.annotation.download_json_batch(
+                    destination_anns = self._get_destination_anns(
                         dataset_id, destination_images_ids
                     )
-                    destination_anns = [
-                        Annotation.from_json(ann_json, self.output_meta) for ann_json in ann_jsons
-                    ]
-                    anns = [
+                    merged_anns = [
                         ann.merge(destination_ann)
                         for ann, destination_ann in zip(image_anns, destination_anns)
                     ]
-
-                    g.api.annotation.upload_anns(destination_images_ids, anns)
+                    for idx, ann in zip(dst_item_idx_map[dataset_id], merged_anns):
+                        out_anns[idx] = ann
+                    self._upload_anns(destination_images_ids, merged_anns)
                 else:
-                    anns = image_anns
-                    g.api.annotation.upload_anns(destination_images_ids, anns)
+                    self._upload_anns(destination_images_ids, image_anns)
 
-            yield tuple(zip(item_descs, anns))
+            if add_option == "merge":
+                last_item_info = item_descs[-1].info.item_info
+                self._prefetch_next(last_item_info.dataset_id, last_item_info.id, len(item_descs))
+
+            yield tuple(zip(item_descs, out_anns))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _download_anns(self, dataset_id: int, destination_images_ids: List[int]) -> Dict[int, dict]:
+        ann_jsons = g.api.annotation.download_json_batch(
+            self.dst_ds_map.get(dataset_id, dataset_id), destination_images_ids
+        )
+        return dict(zip(destination_images_ids, ann_jsons))
+
+    def _prefetch_next(self, dataset_id: int, last_image_id: int, count: int):
+        """Starts downloading destination annotations of the next batch in background."""
+        order = self.input_order.get(dataset_id)
+        if order is None:
+            return
+        if dataset_id not in self._input_positions:
+            self._input_positions[dataset_id] = {
+                image_id: pos for pos, image_id in enumerate(order)
+            }
+        pos = self._input_positions[dataset_id].get(last_image_id)
+        if pos is None:
+            return
+        matched = self.ds_map.get(dataset_id, {})
+        next_ids = []
+        for image_id in order[pos + 1 : pos + 1 + count]:
+            destination_image_id = matched.get(image_id)
+            if (
+                destination_image_id is not None
+                and destination_image_id not in self._prefetched
+                and destination_image_id not in self._uploads
+            ):
+                next_ids.append(destination_image_id)
+        if len(next_ids) == 0:
+            return
+        future = self._get_executor().submit(self._download_anns, dataset_id, next_ids)
+        for destination_image_id in next_ids:
+            self._prefetched[destination_image_id] = future
+        while len(self._prefetched) > self.max_prefetched:
+            self._prefetched.popitem(last=False)
+
+    def _get_destination_anns(self, dataset_id: int, destination_images_ids: List[int]):
+        futures = {}
+        missing_ids = []
+        for destination_image_id in destination_images_ids:
+            upload = self._uploads.get(destination_image_id)
+            if upload is not None:
+                # annotation was changed in this run, wait for the upload and download it again
+                upload.result()
+                self._prefetched.pop(destination_image_id, None)
+            future = self._prefetched.pop(destination_image_id, None)
+            if future is None:
+                missing_ids.append(destination_image_id)
+            else:
+                futures[destination_image_id] = future
+        ann_jsons = {}
+        if len(missing_ids) > 0:
+            ann_jsons.update(self._download_anns(dataset_id, missing_ids))
+        for destination_image_id, future in futures.items():
+            ann_jsons[destination_image_id] = future.result()[destination_image_id]
+        return [
+            Annotation.from_json(ann_jsons[destination_image_id], self.output_meta)
+            for destination_image_id in destination_images_ids
+        ]
+
+    def _upload_anns(self, destination_images_ids: List[int], anns: List[Annotation]):
+        future = self._get_executor().submit(
+            g.api.annotation.upload_anns, destination_images_ids, anns
+        )
+        for destination_image_id in destination_images_ids:
+            self._uploads[destination_image_id] = future
+
+    def _check_finished_uploads(self):
+        for destination_image_id, future in list(self._uploads.items()):
+            if future.done():
+                future.result()  # raise upload error if any
+                del self._uploads[destination_image_id]
+
+    def checkpoint(self):
+        for future in set(self._uploads.values()):
+            future.result()
+        self._uploads = {}
+
+    def postprocess(self):
+        if self._executor is None:
+            return
+        try:
+            for future in set(self._uploads.values()):
+                future.result()
+        finally:
+            self._uploads = {}
+            self._prefetched.clear()
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def has_batch_processing(self) -> bool:
         return True
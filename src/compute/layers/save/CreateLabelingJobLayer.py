@@ -2,6 +2,7 @@
 
 from typing import Tuple, Union, List
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from supervisely import Annotation, VideoAnnotation, KeyIdMap, ProjectMeta, DatasetInfo
 import supervisely.io.fs as sly_fs
 import supervisely.io.json as sly_json
@@ -24,19 +25,15 @@ def _get_source_projects_ids_from_dtl():
     return source_projects_ids
 
 
-def _filter_meta(dataset_id: int, classes_to_label: List[str], tags_to_label: List[str]):
-    dataset_info = g.api.dataset.get_info_by_id(dataset_id)
-    project_id = dataset_info.project_id
-    project_meta_json = g.api.project.get_meta(project_id)
-    project_meta = ProjectMeta.from_json(project_meta_json)
-    obj_classes_names = [obj_class.name for obj_class in project_meta.obj_classes]
+def _filter_meta(project_meta: ProjectMeta, classes_to_label: List[str], tags_to_label: List[str]):
+    obj_classes_names = set(obj_class.name for obj_class in project_meta.obj_classes)
     filtered_classes_to_label = []
-    for obj_class_name in classes_to_label:
+    for obj_class_name in classes_to_label or []:
         if obj_class_name in obj_classes_names:
             filtered_classes_to_label.append(obj_class_name)
-    tag_metas_names = [tag_meta.name for tag_meta in project_meta.tag_metas]
+    tag_metas_names = set(tag_meta.name for tag_meta in project_meta.tag_metas)
     filtered_tags_to_label = []
-    for tag_meta_name in tags_to_label:
+    for tag_meta_name in tags_to_label or []:
         if tag_meta_name in tag_metas_names:
             filtered_tags_to_label.append(tag_meta_name)
     return filtered_classes_to_label, filtered_tags_to_label
@@ -46,6 +43,12 @@ class CreateLabelingJobLayer(Layer):
     action = "create_labeling_job"
     legacy_action = "labeling_job"
 
+    # items are accumulated per dataset and uploaded in chunks of this size
+    # (images that have to be uploaded as pixels are flushed every pipeline batch).
+    # The chunk size also limits pending items of all datasets, see _add_items_to_upload
+    upload_ids_chunk_size = 1000
+    create_jobs_workers = 8
+
     layer_settings = {
         "required": ["settings"],
         "properties": {
@@ -101,7 +104,12 @@ class CreateLabelingJobLayer(Layer):
         self.output_folder = output_folder
         self.sly_project_info = None
         self._labeling_job_map = defaultdict(list)  # {"dataset_id": ["images_ids"]}
+        self._pending_items = defaultdict(list)  # {"dataset_id": [(name, item_desc, ann)]}
+        self._datasets_project_ids = {}  # {"dataset_id": "project_id"}
+        self._filtered_metas = {}  # {"project_id": (classes_to_label, tags_to_label)}
+        self.ds_map = {}  # {"dataset_name": DatasetInfo}
         self.created_labeling_jobs = []
+        self._checkpointed_counts = {}  # {"dataset_id": items in the previous checkpoints}
 
     def validate(self):
         if self.net.preview_mode:
@@ -126,6 +134,12 @@ class CreateLabelingJobLayer(Layer):
         ):
             raise BadSettingsError("Set at least one class or tag to label")
 
+        if not settings["create_new_project"] and self.net.source is not None:
+            raise BadSettingsError(
+                "Labeling Job can not use the input project of a local source. "
+                "Check 'Create new project' option"
+            )
+
         if settings["create_new_project"]:
             if settings["project_name"] is None or settings["project_name"] == "":
                 raise BadSettingsError("Project name is not set")
@@ -153,6 +167,10 @@ class CreateLabelingJobLayer(Layer):
     def modifies_data(self):
         return False
 
+    def saves_items(self):
+        # jobs on the input project are created for the existing images
+        return self.settings["create_new_project"]
+
     def preprocess(self):
         if self.net.preview_mode:
             return
@@ -172,19 +190,9 @@ class CreateLabelingJobLayer(Layer):
             dst = self.dsts[0]
             self.out_project_name = dst
 
-            self.sly_project_info = g.api.project.create(
-                g.WORKSPACE_ID,
-                self.settings["project_name"],
-                type=self.net.modality,
-                change_name_if_conflict=True,
+            self.sly_project_info = self.create_shared(
+                "project", self.create_project, g.api.project.get_info_by_id
             )
-            g.api.project.update_meta(self.sly_project_info.id, self.output_meta)
-
-            custom_data = {
-                "source_projects": _get_source_projects_ids_from_dtl(),
-                "data-nodes": g.current_dtl_json,
-            }
-            g.api.project.update_custom_data(self.sly_project_info.id, custom_data)
         else:  # use input project
             project_id = _get_source_projects_ids_from_dtl()[0]
             src_project_info = g.api.project.get_info_by_id(project_id)
@@ -193,6 +201,25 @@ class CreateLabelingJobLayer(Layer):
             self.sly_project_info = g.api.project.get_info_by_id(project_id, self.net.modality)
             # need custom data update?
 
+    def create_project(self):
+        project_info = g.api.project.create(
+            g.WORKSPACE_ID,
+            self.settings["project_name"],
+            type=self.net.modality,
+            change_name_if_conflict=True,
+        )
+        g.api.project.update_meta(project_info.id, self.output_meta)
+
+        custom_data = {
+            # local source projects are not on the server
+            "source_projects": (
+                [] if self.net.source is not None else _get_source_projects_ids_from_dtl()
+            ),
+            "data-nodes": g.current_dtl_json,
+        }
+        g.api.project.update_custom_data(project_info.id, custom_data)
+        return project_info
+
     def get_ds_parents(self, dataset_info: DatasetInfo):
         ds_parents = None
         for parents, dataset in g.api.dataset.tree(dataset_info.project_id):
@@ -221,6 +248,13 @@ class CreateLabelingJobLayer(Layer):
         return dataset_info
 
     def get_or_create_dataset(self, dataset_name, ds_parents=None):
+        return self.create_shared(
+            f"dataset:{'/'.join(ds_parents or [])}/{dataset_name}",
+            lambda: self._get_or_create_dataset(dataset_name, ds_parents),
+            g.api.dataset.get_info_by_id,
+        )
+
+    def _get_or_create_dataset(self, dataset_name, ds_parents=None):
         if ds_parents is None:
             if not g.api.dataset.exists(self.sly_project_info.id, dataset_name):
                 return g.api.dataset.create(self.sly_project_info.id, dataset_name)
@@ -229,52 +263,85 @@ class CreateLabelingJobLayer(Layer):
         else:
             return self.get_or_create_nested_dataset(dataset_name, ds_parents)
 
+    def get_cached_dataset(self, dataset_name, orig_ds_info=None):
+        if dataset_name not in self.ds_map:
+            ds_parents = None
+            if orig_ds_info is not None:
+                ds_parents = self.get_ds_parents(orig_ds_info)
+            dataset_info = self.get_or_create_dataset(dataset_name, ds_parents)
+            self.ds_map[dataset_name] = dataset_info
+            self._datasets_project_ids[dataset_info.id] = dataset_info.project_id
+        return self.ds_map[dataset_name]
+
+    def _get_upload_chunk_size(self):
+        if self.net.modality == "videos":
+            return 1
+        if self.net.may_require_items() or self.net.source is not None:
+            return g.BATCH_SIZE
+        return self.upload_ids_chunk_size
+
+    def _add_items_to_upload(self, dataset_info: DatasetInfo, items: list):
+        pending = self._pending_items[dataset_info.id]
+        out_item_names = self.get_free_names(
+            [item_desc.get_item_name() for item_desc, _ in items],
+            dataset_info.name,
+            self.out_project_name,
+        )
+        for out_item_name, (item_desc, ann) in zip(out_item_names, items):
+            out_item_name += get_file_ext(item_desc.info.item_info.name)
+            pending.append((out_item_name, item_desc, ann))
+        # pending items of all datasets are limited, so the images kept for a pixels upload
+        # do not pile up when items go to many datasets: the largest buffers are flushed
+        chunk_size = self._get_upload_chunk_size()
+        pending_count = sum(len(items) for items in self._pending_items.values())
+        while pending_count >= chunk_size:
+            dataset_id = max(self._pending_items, key=lambda ds_id: len(self._pending_items[ds_id]))
+            pending_count -= len(self._pending_items[dataset_id])
+            self._flush_dataset(dataset_id)
+
+    def _flush_dataset(self, dataset_id: int):
+        pending = self._pending_items.pop(dataset_id, [])
+        if len(pending) == 0:
+            return
+        out_item_names = [name for name, _, _ in pending]
+        item_descs = [item_desc for _, item_desc, _ in pending]
+        anns = [ann for _, _, ann in pending]
+        if self.net.modality == "images":
+            # local items have no server ids to copy
+            if self.net.may_require_items() or self.net.source is not None:
+                item_infos = g.api.image.upload_nps(
+                    dataset_id, out_item_names, [item_desc.read_image() for item_desc in item_descs]
+                )
+            else:
+                item_infos = g.api.image.upload_ids(
+                    dataset_id,
+                    out_item_names,
+                    [item_desc.info.item_info.id for item_desc in item_descs],
+                )
+            g.api.annotation.upload_anns([item_info.id for item_info in item_infos], anns)
+        elif self.net.modality == "videos":
+            item_infos = g.api.video.upload_paths(
+                dataset_id, out_item_names, [item_desc.item_data for item_desc in item_descs]
+            )
+            for item_desc, ann, video_info in zip(item_descs, anns, item_infos):
+                ann_path = f"{item_desc.item_data}.json"
+                if not sly_fs.file_exists(ann_path):
+                    ann_json = ann.to_json(KeyIdMap())
+                    sly_json.dump_json_file(ann_json, ann_path)
+                g.api.video.annotation.upload_paths([video_info.id], [ann_path], self.output_meta)
+        self._labeling_job_map[dataset_id].extend([item_info.id for item_info in item_infos])
+
+    def _flush_all(self):
+        for dataset_id in list(self._pending_items.keys()):
+            self._flush_dataset(dataset_id)
+
     def process(
         self,
         data_el: Tuple[Union[ImageDescriptor, VideoDescriptor], Union[Annotation, VideoAnnotation]],
     ):
-        item_desc, ann = data_el
-
-        if not self.net.preview_mode:
-            if not self.settings["keep_original_ds"]:
-                dataset_name = self.settings["dataset_name"]
-            else:
-                dataset_name = item_desc.get_res_ds_name()
-            out_item_name = (
-                self.get_free_name(item_desc.get_item_name(), dataset_name, self.out_project_name)
-                + item_desc.get_item_ext()
-            )
-            if self.sly_project_info is not None:
-                if self.settings["create_new_project"]:
-                    dataset_info = self.get_or_create_dataset(dataset_name)
-                    if self.net.modality == "images":
-                        if self.net.may_require_items():
-                            item_info = g.api.image.upload_np(
-                                dataset_info.id, out_item_name, item_desc.read_image()
-                            )
-                        else:
-                            item_info = g.api.image.upload_id(
-                                dataset_info.id, out_item_name, item_desc.info.item_info.id
-                            )
-                        g.api.annotation.upload_ann(item_info.id, ann)
-                    elif self.net.modality == "videos":
-                        item_info = g.api.video.upload_path(
-                            dataset_info.id, out_item_name, item_desc.item_data
-                        )
-                        ann_path = f"{item_desc.item_data}.json"
-                        if not sly_fs.file_exists(ann_path):
-                            ann_json = ann.to_json(KeyIdMap())
-                            sly_json.dump_json_file(ann_json, ann_path)
-                        g.api.video.annotation.upload_paths(
-                            [item_info.id], [ann_path], self.output_meta
-                        )
-                    self._labeling_job_map[dataset_info.id].append(item_info.id)
-                else:
-                    self._labeling_job_map[item_desc.info.item_info.dataset_id].append(
-                        item_desc.info.item_info.id
-                    )
-
-        yield ([item_desc, ann])
+        for layer_outputs in self.process_batch([data_el]):
+            for layer_output in layer_outputs:
+                yield layer_output
 
     def process_batch(
         self,
@@ -302,65 +369,10 @@ class CreateLabelingJobLayer(Layer):
                             ds_item_map[dataset_name].append((item_desc, ann))
 
                     for dataset_name in ds_item_map:
-                        out_item_names = [
-                            self.get_free_name(
-                                item_desc.get_item_name(), dataset_name, self.out_project_name
-                            )
-                            + get_file_ext(item_desc.info.item_info.name)
-                            for item_desc, _ in ds_item_map[dataset_name]
-                        ]
                         # @TODO: not safe, fix later
                         orig_ds_info = ds_item_map[dataset_name][0][0].info.ds_info
-                        ds_parents = self.get_ds_parents(orig_ds_info)
-                        dataset_info = self.get_or_create_dataset(dataset_name, ds_parents)
-                        if self.net.modality == "images":
-                            if self.net.may_require_items():
-                                item_infos = g.api.image.upload_nps(
-                                    dataset_info.id,
-                                    out_item_names,
-                                    [
-                                        item_desc.read_image()
-                                        for item_desc, _ in ds_item_map[dataset_name]
-                                    ],
-                                )
-                            else:
-                                item_infos = g.api.image.upload_ids(
-                                    dataset_info.id,
-                                    out_item_names,
-                                    [
-                                        item_desc.info.item_info.id
-                                        for item_desc, _ in ds_item_map[dataset_name]
-                                    ],
-                                )
-
-                            # @TODO: BATCH UPLOAD
-                            # for item_info, (_, ann) in zip(item_infos, ds_item_map[dataset_name]):
-                            #     g.api.annotation.upload_ann(item_info.id, ann)
-                            g.api.annotation.upload_anns(
-                                [item_info.id for item_info in item_infos],
-                                [ann for _, ann in ds_item_map[dataset_name]],
-                            )
-                        elif self.net.modality == "videos":
-                            item_infos = g.api.video.upload_paths(
-                                dataset_info.id,
-                                out_item_names,
-                                [item_desc.item_data for item_desc, _ in ds_item_map[dataset_name]],
-                            )
-                            ann_paths = [
-                                f"{item_desc.item_data}.json"
-                                for item_desc, _ in ds_item_map[dataset_name]
-                            ]
-                            for ann, ann_path, video_info in zip(
-                                [ann for _, ann in ds_item_map[dataset_name]], ann_paths, item_infos
-                            ):
-                                if not sly_fs.file_exists(ann_path):
-                                    ann_json = ann.to_json(KeyIdMap())
-                                    sly_json.dump_json_file(ann_json, ann_path)
-                                g.api.video.annotation.upload_paths(
-                                    [video_info.id], [ann_path], self.output_meta
-                                )
-                        item_ids = [image_info.id for image_info in item_infos]
-                        self._labeling_job_map[dataset_info.id].extend(item_ids)
+                        dataset_info = self.get_cached_dataset(dataset_name, orig_ds_info)
+                        self._add_items_to_upload(dataset_info, ds_item_map[dataset_name])
                 else:
                     ds_map = {}
                     for item_desc, ann in data_els:
@@ -372,8 +384,7 @@ class CreateLabelingJobLayer(Layer):
                     for dataset_name in ds_map:
                         # @TODO: not safe, fix later
                         orig_ds_info = ds_map[dataset_name][0][0].info.ds_info
-                        ds_parents = self.get_ds_parents(orig_ds_info)
-                        dataset_info = self.get_or_create_dataset(dataset_name, ds_parents)
+                        dataset_info = self.get_cached_dataset(dataset_name, orig_ds_info)
                         item_ids = [
                             item_desc.info.item_info.id for item_desc, _ in ds_map[dataset_name]
                         ]
@@ -383,7 +394,61 @@ class CreateLabelingJobLayer(Layer):
     def has_batch_processing(self) -> bool:
         return True
 
+    def _get_filtered_meta(self, dataset_id: int, classes_to_label, tags_to_label):
+        project_id = self._datasets_project_ids.get(dataset_id)
+        if project_id is None:
+            project_id = g.api.dataset.get_info_by_id(dataset_id).project_id
+            self._datasets_project_ids[dataset_id] = project_id
+        if project_id not in self._filtered_metas:
+            if self.settings["create_new_project"] and project_id == self.sly_project_info.id:
+                project_meta = self.output_meta  # uploaded in preprocess
+            else:
+                project_meta = ProjectMeta.from_json(g.api.project.get_meta(project_id))
+            self._filtered_metas[project_id] = _filter_meta(
+                project_meta, classes_to_label, tags_to_label
+            )
+        return self._filtered_metas[project_id]
+
     def postprocess(self):
+        self._flush_all()
+        if self.is_shard_run():
+            return  # jobs are created for items of all shards in finalize
+        self.create_labeling_jobs()
+
+    def checkpoint(self):
+        self._flush_all()
+
+    def get_checkpoint_delta(self):
+        delta = {}
+        for dataset_id, items_ids in self._labeling_job_map.items():
+            count = self._checkpointed_counts.get(dataset_id, 0)
+            if len(items_ids) > count:
+                delta[str(dataset_id)] = items_ids[count:]
+                self._checkpointed_counts[dataset_id] = len(items_ids)
+        return delta
+
+    def restore_checkpoint(self, deltas: list):
+        for delta in deltas:
+            for dataset_id, items_ids in delta.items():
+                self._labeling_job_map[int(dataset_id)].extend(items_ids)
+        for dataset_id, items_ids in self._labeling_job_map.items():
+            self._checkpointed_counts[dataset_id] = len(items_ids)
+
+    def get_shard_state(self):
+        return {
+            "labeling_job_map": {
+                str(dataset_id): items_ids
+                for dataset_id, items_ids in self._labeling_job_map.items()
+            }
+        }
+
+    def finalize(self, shard_states: list):
+        for state in shard_states:
+            for dataset_id, items_ids in state["labeling_job_map"].items():
+                self._labeling_job_map[int(dataset_id)].extend(items_ids)
+        self.create_labeling_jobs()
+
+    def create_labeling_jobs(self):
         name = self.settings.get("job_name", None)
         description = self.settings.get("description", None)
         readme = self.settings.get("readme", None)
@@ -398,13 +463,15 @@ class CreateLabelingJobLayer(Layer):
         if tags_to_label == "default":
             tags_to_label = [tag_meta.name for tag_meta in self.output_meta.tag_metas]
 
-        dataset_ids = self._labeling_job_map.keys()
-        for dataset_id in dataset_ids:
-            filtered_classes_to_label, filtered_tags_to_label = _filter_meta(
-                dataset_id, classes_to_label, tags_to_label
-            )
-            items_ids = self._labeling_job_map[dataset_id]
-            created_lj_infos = g.api.labeling_job.create(
+        dataset_ids = list(self._labeling_job_map.keys())
+        filtered_metas = [
+            self._get_filtered_meta(dataset_id, classes_to_label, tags_to_label)
+            for dataset_id in dataset_ids
+        ]
+
+        def create_job(dataset_id, filtered_meta):
+            filtered_classes_to_label, filtered_tags_to_label = filtered_meta
+            return g.api.labeling_job.create(
                 name=name,
                 dataset_id=dataset_id,
                 user_ids=user_ids,
@@ -418,6 +485,13 @@ class CreateLabelingJobLayer(Layer):
                 exclude_images_with_tags=None,
                 images_range=None,
                 reviewer_id=reviewer_id,
-                images_ids=items_ids,
+                images_ids=self._labeling_job_map[dataset_id],
             )
-            self.created_labeling_jobs.extend(created_lj_infos)
+
+        if len(dataset_ids) == 0:
+            return
+        workers = min(self.create_jobs_workers, len(dataset_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map keeps the datasets order and re-raises the first error
+            for created_lj_infos in executor.map(create_job, dataset_ids, filtered_metas):
+                self.created_labeling_jobs.extend(created_lj_infos)
@@ -44,6 +44,7 @@ class CreateNewProjectLayer(Layer):
         Layer.__init__(self, config, net=net)
         self.output_folder = output_folder
         self.sly_project_info = None
+        self.local_project = None
 
     def validate_dest_connections(self):
         for dst in self.dsts:
@@ -68,19 +69,38 @@ class CreateNewProjectLayer(Layer):
         dst = self.dsts[0]
         self.out_project_name = dst
 
-        self.sly_project_info = g.api.project.create(
+        if self.net.sink is not None:
+            self.local_project = self.create_shared(
+                "project",
+                lambda: self.net.sink.create_project(dst, self.output_meta, self.net.modality),
+                lambda name: self.net.sink.open_project(name, self.net.modality),
+                get_id=lambda project: project.name,
+            )
+            self.out_project_name = self.local_project.name
+            return
+
+        self.sly_project_info = self.create_shared(
+            "project", self.create_project, g.api.project.get_info_by_id
+        )
+
+    def create_project(self):
+        project_info = g.api.project.create(
             g.WORKSPACE_ID,
             self.out_project_name,
             type=self.net.modality,
             change_name_if_conflict=True,
         )
-        g.api.project.update_meta(self.sly_project_info.id, self.output_meta)
+        g.api.project.update_meta(project_info.id, self.output_meta)
 
         custom_data = {
-            "source_projects": _get_source_projects_ids_from_dtl(),
+            # local source projects are not on the server
+            "source_projects": (
+                [] if self.net.source is not None else _get_source_projects_ids_from_dtl()
+            ),
             "data-nodes": g.current_dtl_json,
         }
-        g.api.project.update_custom_data(self.sly_project_info.id, custom_data)
+        g.api.project.update_custom_data(project_info.id, custom_data)
+        return project_info
 
     def get_ds_parents(self, dataset_info: DatasetInfo):
         if dataset_info is None:
@@ -112,6 +132,13 @@ class CreateNewProjectLayer(Layer):
         return dataset_info
 
     def get_or_create_dataset(self, dataset_name, ds_parents=None):
+        return self.create_shared(
+            f"dataset:{'/'.join(ds_parents or [])}/{dataset_name}",
+            lambda: self._get_or_create_dataset(dataset_name, ds_parents),
+            g.api.dataset.get_info_by_id,
+        )
+
+    def _get_or_create_dataset(self, dataset_name, ds_parents=None):
         if ds_parents is None:
             if not g.api.dataset.exists(self.sly_project_info.id, dataset_name):
                 return g.api.dataset.create(self.sly_project_info.id, dataset_name)
@@ -133,21 +160,37 @@ class CreateNewProjectLayer(Layer):
                 ds_item_map[dataset_name].append((item_desc, ann))
 
             for ds_name in ds_item_map:
-                if self.sly_project_info is not None:
+                if self.local_project is not None:
+                    out_item_names = self.get_free_names(
+                        [item_desc.get_item_name() for item_desc, _ in ds_item_map[ds_name]],
+                        ds_name,
+                        self.out_project_name,
+                    )
+                    out_item_names = [
+                        name + item_desc.get_item_ext()
+                        for name, (item_desc, _) in zip(out_item_names, ds_item_map[ds_name])
+                    ]
+                    self.net.sink.add_items(
+                        self.local_project, ds_name, out_item_names, ds_item_map[ds_name]
+                    )
+                elif self.sly_project_info is not None:
                     # @TODO: not safe, fix later
                     orig_ds_info = ds_item_map[ds_name][0][0].info.ds_info
                     ds_parents = self.get_ds_parents(orig_ds_info)
                     dataset_info = self.get_or_create_dataset(ds_name, ds_parents)
 
+                    out_item_names = self.get_free_names(
+                        [item_desc.get_item_name() for item_desc, _ in ds_item_map[ds_name]],
+                        ds_name,
+                        self.out_project_name,
+                    )
                     out_item_names = [
-                        self.get_free_name(
-                            item_desc.get_item_name(), ds_name, self.out_project_name
-                        )
-                        + get_file_ext(item_desc.info.item_info.name)
-                        for item_desc, _ in ds_item_map[ds_name]
+                        name + get_file_ext(item_desc.info.item_info.name)
+                        for name, (item_desc, _) in zip(out_item_names, ds_item_map[ds_name])
                     ]
                     if self.net.modality == "images":
-                        if self.net.may_require_items():
+                        # local items have no server ids to copy
+                        if self.net.may_require_items() or self.net.source is not None:
                             item_infos = g.api.image.upload_nps(
                                 dataset_info.id,
                                 out_item_names,
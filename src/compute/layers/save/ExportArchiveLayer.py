@@ -1,7 +1,7 @@
 # coding: utf-8
 import json
 import os.path as osp
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 
 import cv2
 import numpy as np
@@ -26,6 +26,12 @@ from supervisely.imaging.color import random_rgb
 import supervisely.io.json as sly_json
 import supervisely.io.fs as sly_fs
 
+from src.compute.dtl_utils.export_writer import (
+    DEFAULT_PNG_COMPRESSION,
+    ExportWriter,
+    copy_image,
+    write_image,
+)
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor, VideoDescriptor
 from src.compute.Layer import Layer
 from src.exceptions import GraphError, BadSettingsError
@@ -47,6 +53,7 @@ class ExportArchiveLayer(Layer):
                     "images": {"type": "boolean"},  # Deprecated
                     "annotations": {"type": "boolean"},  # Deprecated
                     "visualize": {"type": "boolean"},
+                    "png_compression": {"type": "integer", "minimum": 0, "maximum": 9},
                 },
             }
         },
@@ -73,6 +80,9 @@ class ExportArchiveLayer(Layer):
     def __init__(self, config, output_folder, net):
         Layer.__init__(self, config, net=net)
         self.output_folder = output_folder
+        self.writer = None
+        self.vis_cls_mapping = None
+        self._ds_parents = {}
 
     def requires_item(self):
         return True
@@ -96,6 +106,9 @@ class ExportArchiveLayer(Layer):
     def preprocess(self):
         if self.net.preview_mode:
             return
+        if self.net.journal is not None and self.net.journal.resumed:
+            # results dir is cleared on the app start, files of the interrupted run are lost
+            raise GraphError("Runs with the 'Export Archive' layer can not be resumed")
         if self.output_meta is None:
             raise GraphError(
                 "Output meta is not set. Check that node is connected", extra={"layer": self.action}
@@ -115,6 +128,8 @@ class ExportArchiveLayer(Layer):
             )
             with open(self.out_project.directory + "/meta.json", "w") as f:
                 json.dump(self.output_meta.to_json(), f)
+            self.writer = ExportWriter()
+            self.vis_cls_mapping = self.get_vis_cls_mapping()
 
             # Deprecate warning
             for param in ["images", "annotations"]:
@@ -131,6 +146,51 @@ class ExportArchiveLayer(Layer):
             with open(self.out_project.directory + "/meta.json", "w") as f:
                 json.dump(self.output_meta.to_json(), f)
 
+    def postprocess(self):
+        if self.writer is not None:
+            self.writer.shutdown()
+            self.writer = None
+
+    def get_vis_cls_mapping(self):
+        cls_mapping = {}
+        for obj_class in self.output_meta.obj_classes:
+            color = obj_class.color
+            if color is None:
+                color = random_rgb()
+            cls_mapping[obj_class.name] = color
+
+        # hack to draw 'black' regions
+        return {k: (1, 1, 1) if max(v) == 0 else v for k, v in cls_mapping.items()}
+
+    def get_nested_path(self, dataset_info: DatasetInfo):
+        """Returns (ds_parents, nested_path), parents are requested once per dataset."""
+        key = None if dataset_info is None else dataset_info.id
+        if key not in self._ds_parents:
+            ds_parents = self.get_ds_parents(dataset_info)
+            if ds_parents is None:
+                nested_path = ""
+            else:
+                nested_path = osp.join(*[parent + "/datasets" for parent in ds_parents])
+            self._ds_parents[key] = (ds_parents, nested_path)
+        return self._ds_parents[key]
+
+    def get_out_dataset(self, dataset_name: str, ds_parents, nested_path: str) -> Dataset:
+        if self.out_project.datasets.has_key(dataset_name):
+            return self.out_project.datasets.get(dataset_name)
+        if ds_parents is not None:
+            return self.out_project.create_dataset(
+                dataset_name, osp.join(nested_path, dataset_name)
+            )
+        return self.out_project.create_dataset(dataset_name)
+
+    def write_visualization(self, path: str, item_desc: ImageDescriptor, ann: Annotation):
+        vis_img = self.draw_colored_mask(ann, self.vis_cls_mapping)
+        orig_img = item_desc.read_image()
+        comb_img = imaging.overlay_images(orig_img, vis_img, 0.5)
+        sep = np.array([[[0, 255, 0]]] * orig_img.shape[0], dtype=np.uint8)
+        img = np.hstack((orig_img, sep, comb_img))
+        write_image(path, img, self.settings.get("png_compression", DEFAULT_PNG_COMPRESSION))
+
     def get_ds_parents(self, dataset_info: DatasetInfo):
         if dataset_info is None:
             return None
@@ -244,3 +304,60 @@ class ExportArchiveLayer(Layer):
                     ann_json = ann.to_json(KeyIdMap())
                     sly_json.dump_json_file(ann_json, ann_path)
         yield ([item_desc, ann])
+
+    def process_batch(
+        self, data_els: List[Tuple[Union[ImageDescriptor, VideoDescriptor], Annotation]]
+    ):
+        if self.net.preview_mode:
+            yield data_els
+            return
+        if self.net.modality != "images":
+            yield [output for data_el in data_els for output in self.process(data_el)]
+            return
+
+        # names are allocated per source dataset in the order of items
+        free_names = [None] * len(data_els)
+        ds_idxs = {}
+        for idx, (item_desc, _) in enumerate(data_els):
+            ds_idxs.setdefault(item_desc.get_ds_name(), []).append(idx)
+        for ds_name, idxs in ds_idxs.items():
+            names = self.get_free_names(
+                [data_els[idx][0].get_item_name() for idx in idxs], ds_name, self.out_project.name
+            )
+            for idx, name in zip(idxs, names):
+                free_names[idx] = name
+
+        # datasets are created here, images are encoded and written by the pool
+        png_compression = self.settings.get("png_compression", DEFAULT_PNG_COMPRESSION)
+        items = []
+        for (item_desc, ann), free_name in zip(data_els, free_names):
+            new_dataset_name = item_desc.get_res_ds_name()
+            ds_parents, nested_path = self.get_nested_path(item_desc.info.ds_info)
+            if self.settings.get("visualize"):
+                output_img_path = osp.join(
+                    self.output_folder,
+                    self.out_project.name,
+                    nested_path,
+                    new_dataset_name,
+                    "visualize",
+                    free_name + ".png",
+                )
+                self.writer.submit(self.write_visualization, output_img_path, item_desc, ann)
+
+            out_dataset = self.get_out_dataset(new_dataset_name, ds_parents, nested_path)
+            out_item_name = free_name + item_desc.get_item_ext()
+            item_path = out_dataset.generate_item_path(out_item_name)
+            if item_desc.need_write() and item_desc.item_data is not None:
+                self.writer.submit(write_image, item_path, item_desc.item_data, png_compression)
+            else:
+                self.writer.submit(copy_image, item_desc.get_item_path(), item_path)
+            items.append((out_dataset, out_item_name, item_path, ann))
+        self.writer.wait()
+
+        # files are already in place, only annotations are written
+        for out_dataset, out_item_name, item_path, ann in items:
+            out_dataset.add_item_file(out_item_name, item_path, ann=ann)
+        yield data_els
+
+    def has_batch_processing(self) -> bool:
+        return True
@@ -1,6 +1,6 @@
 # coding: utf-8
 
-from typing import Tuple
+from typing import List, Tuple
 import json
 import os
 import os.path as osp
@@ -9,6 +9,14 @@ import numpy as np
 
 from supervisely import Annotation, DatasetInfo, Project, Dataset, logger, OpenMode
 
+from src.compute.dtl_utils.export_writer import (
+    DEFAULT_PNG_COMPRESSION,
+    ExportWriter,
+    colorize_classes,
+    copy_image,
+    rasterize_classes,
+    write_image,
+)
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
 from src.compute.Layer import Layer
 from src.exceptions import GraphError, BadSettingsError
@@ -47,6 +55,7 @@ class ExportArchiveWithMasksLayer(Layer):
                     "annotations": {"type": "boolean"},  # Deprecated
                     "masks_machine": {"type": "boolean"},
                     "masks_human": {"type": "boolean"},
+                    "png_compression": {"type": "integer", "minimum": 0, "maximum": 9},
                 },
             }
         },
@@ -77,6 +86,8 @@ class ExportArchiveWithMasksLayer(Layer):
         Layer.__init__(self, config, net=net)
 
         self.output_folder = output_folder
+        self.writer = None
+        self._ds_parents = {}
 
     def requires_item(self):
         # res = self.settings['masks_human'] is True  # don't use img otherwise
@@ -140,6 +151,9 @@ class ExportArchiveWithMasksLayer(Layer):
     def preprocess(self):
         if self.net.preview_mode:
             return
+        if self.net.journal is not None and self.net.journal.resumed:
+            # results dir is cleared on the app start, files of the interrupted run are lost
+            raise GraphError("Runs with the 'Export Archive with Masks' layer can not be resumed")
         if self.output_meta is None:
             raise GraphError(
                 "Output meta is not set. Check that node is connected", extra={"layer": self.action}
@@ -155,6 +169,7 @@ class ExportArchiveWithMasksLayer(Layer):
         self.out_project = Project(directory=f"{self.output_folder}/{dst}", mode=OpenMode.CREATE)
         with open(self.out_project.directory + "/meta.json", "w") as f:
             json.dump(self.output_meta.to_json(), f)
+        self.writer = ExportWriter()
 
         # Deprecate warning
         for param in ["images", "annotations"]:
@@ -163,6 +178,121 @@ class ExportArchiveWithMasksLayer(Layer):
                     "'save_masks' layer: '{}' parameter is deprecated. Skipped.".format(param)
                 )
 
+    def postprocess(self):
+        if self.writer is not None:
+            self.writer.shutdown()
+            self.writer = None
+
+    def get_cls_mappings(self):
+        """Returns [(out_dir, flag_name, cls_mapping)] of the enabled masks."""
+        res = []
+        for out_dir, flag_name, mapping_name in self.odir_flag_mapping:
+            if not self.settings[flag_name]:
+                continue
+            cls_mapping = self.settings[mapping_name]
+
+            # hack to draw 'black' regions
+            if flag_name == "masks_human":
+                cls_mapping = {k: (1, 1, 1) if max(v) == 0 else v for k, v in cls_mapping.items()}
+            res.append((out_dir, flag_name, cls_mapping))
+        return res
+
+    def get_nested_path(self, dataset_info: DatasetInfo):
+        """Returns (ds_parents, nested_path), parents are requested once per dataset."""
+        key = None if dataset_info is None else dataset_info.id
+        if key not in self._ds_parents:
+            ds_parents = self.get_ds_parents(dataset_info)
+            if ds_parents is None:
+                nested_path = ""
+            else:
+                nested_path = osp.join(*[parent + "/datasets" for parent in ds_parents])
+            self._ds_parents[key] = (ds_parents, nested_path)
+        return self._ds_parents[key]
+
+    def get_out_dataset(self, dataset_name: str, ds_parents, nested_path: str) -> Dataset:
+        if self.out_project.datasets.has_key(dataset_name):
+            return self.out_project.datasets.get(dataset_name)
+        if ds_parents is not None:
+            return self.out_project.create_dataset(
+                dataset_name, osp.join(nested_path, dataset_name)
+            )
+        return self.out_project.create_dataset(dataset_name)
+
+    def write_masks(self, paths: List[str], item_desc: ImageDescriptor, ann: Annotation):
+        """
+        Labels are rasterized into a map of class indexes once for all masks with the same
+        classes, each mask is colored from the map by its mapping.
+        """
+        png_compression = self.settings.get("png_compression", DEFAULT_PNG_COMPRESSION)
+        index_maps = {}
+        for path, (_, flag_name, cls_mapping) in zip(paths, self.get_cls_mappings()):
+            class_names = tuple(sorted(cls_mapping))
+            if class_names not in index_maps:
+                index_maps[class_names] = rasterize_classes(ann, class_names)
+            img = colorize_classes(index_maps[class_names], class_names, cls_mapping)
+
+            if flag_name == "masks_human":
+                orig_img = item_desc.read_image()
+                comb_img = self.overlay_images(orig_img, img, 0.5)
+
+                sep = np.array([[[0, 255, 0]]] * orig_img.shape[0], dtype=np.uint8)
+                img = np.hstack((orig_img, sep, comb_img))
+            write_image(path, img, png_compression)
+
+    def process_batch(self, data_els: List[Tuple[ImageDescriptor, Annotation]]):
+        if self.net.preview_mode:
+            yield data_els
+            return
+
+        # names are allocated per source dataset in the order of items
+        free_names = [None] * len(data_els)
+        ds_idxs = {}
+        for idx, (item_desc, _) in enumerate(data_els):
+            ds_idxs.setdefault(item_desc.get_ds_name(), []).append(idx)
+        for ds_name, idxs in ds_idxs.items():
+            names = self.get_free_names(
+                [data_els[idx][0].get_item_name() for idx in idxs], ds_name, self.out_project.name
+            )
+            for idx, name in zip(idxs, names):
+                free_names[idx] = name
+
+        # datasets are created here, images and masks are encoded and written by the pool
+        png_compression = self.settings.get("png_compression", DEFAULT_PNG_COMPRESSION)
+        out_dirs = [out_dir for out_dir, _, _ in self.get_cls_mappings()]
+        items = []
+        for (item_desc, ann), free_name in zip(data_els, free_names):
+            new_dataset_name = item_desc.get_res_ds_name()
+            ds_parents, nested_path = self.get_nested_path(item_desc.info.ds_info)
+            masks_paths = [
+                osp.join(
+                    self.out_project.directory,
+                    nested_path,
+                    new_dataset_name,
+                    out_dir,
+                    free_name + ".png",
+                )
+                for out_dir in out_dirs
+            ]
+            self.writer.submit(self.write_masks, masks_paths, item_desc, ann)
+
+            out_dataset = self.get_out_dataset(new_dataset_name, ds_parents, nested_path)
+            out_item_name = free_name + item_desc.get_item_ext()
+            item_path = out_dataset.generate_item_path(out_item_name)
+            if item_desc.need_write() and item_desc.item_data is not None:
+                self.writer.submit(write_image, item_path, item_desc.item_data, png_compression)
+            else:
+                self.writer.submit(copy_image, item_desc.get_item_path(), item_path)
+            items.append((out_dataset, out_item_name, item_path, ann))
+        self.writer.wait()
+
+        # files are already in place, only annotations are written
+        for out_dataset, out_item_name, item_path, ann in items:
+            out_dataset.add_item_file(out_item_name, item_path, ann=ann)
+        yield data_els
+
+    def has_batch_processing(self) -> bool:
+        return True
+
     def process(self, data_el: Tuple[ImageDescriptor, Annotation]):
         item_desc, ann = data_el
         if not self.net.preview_mode:
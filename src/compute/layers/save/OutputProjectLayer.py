@@ -2,7 +2,6 @@
 
 from typing import Tuple, Union, List
 
-from supervisely.io.fs import get_file_name
 from supervisely import (
     Annotation,
     VideoAnnotation,
@@ -16,7 +15,9 @@ import supervisely.io.fs as sly_fs
 import supervisely.io.json as sly_json
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor, VideoDescriptor
 from src.compute.Layer import Layer
+from src.compute.dtl_utils.name_allocator import iter_dataset_item_names
 from src.exceptions import GraphError
+from src.utils import invalidate_project_cache
 import src.globals as g
 from supervisely.io.fs import get_file_ext
 
@@ -113,6 +114,8 @@ class OutputProjectLayer(Layer):
             self.out_project_id = dst
             if self.out_project_id is None:
                 raise GraphError("Project is not selected")
+            # the project selector gives the id as a string
+            self.out_project_id = int(self.out_project_id)
 
             self.sly_project_info = g.api.project.get_info_by_id(self.out_project_id)
             if self.sly_project_info is None:
@@ -143,44 +146,44 @@ class OutputProjectLayer(Layer):
                     try:
                         self.output_meta = ProjectMeta.merge(dst_meta, self.output_meta)
                         g.api.project.update_meta(self.out_project_id, self.output_meta)
+                        invalidate_project_cache(self.out_project_id)
                     except Exception as e:
                         raise GraphError(f"Failed to merge meta: {e}")
                 else:
                     raise GraphError("The meta update has not been confirmed")
 
             if self.settings["dataset_option"] == "existing":
-                if self.net.modality == "images":
-                    entities_info_list = g.api.image.get_list(self.settings["dataset_id"])
-                elif self.net.modality == "videos":
-                    entities_info_list = g.api.video.get_list(self.settings["dataset_id"])
-                dataset_info = self.get_dataset_by_id(self.settings["dataset_id"])
-                existing_names = set(get_file_name(info.name) for info in entities_info_list)
-
-                existing_dataset = self.existing_names.get(
-                    f"{self.sly_project_info.name}/{dataset_info.name}"
+                # existing names are listed lazily, on the first item saved to the dataset
+                dataset_id = self.settings["dataset_id"]
+                dataset_info = self.get_dataset_by_id(dataset_id)
+                modality = self.net.modality
+                self.name_allocator.register_existing(
+                    f"{self.sly_project_info.name}/{dataset_info.name}",
+                    lambda: iter_dataset_item_names(g.api, modality, dataset_id),
                 )
-                if existing_dataset is None:
-                    self.existing_names[f"{self.sly_project_info.name}/{dataset_info.name}"] = (
-                        existing_names
-                    )
-                else:
-                    self.existing_names[f"{self.sly_project_info.name}/{dataset_info.name}"].update(
-                        existing_names
-                    )
         else:
             self.out_project_name = dst
-            self.sly_project_info = g.api.project.create(
-                g.WORKSPACE_ID,
-                self.out_project_name,
-                type=self.net.modality,
-                change_name_if_conflict=True,
+            self.sly_project_info = self.create_shared(
+                "project", self.create_project, g.api.project.get_info_by_id
             )
-            g.api.project.update_meta(self.sly_project_info.id, self.output_meta)
-            custom_data = {
-                "source_projects": _get_source_projects_ids_from_dtl(),
-                "data-nodes": g.current_dtl_json,
-            }
-            g.api.project.update_custom_data(self.sly_project_info.id, custom_data)
+
+    def create_project(self):
+        project_info = g.api.project.create(
+            g.WORKSPACE_ID,
+            self.out_project_name,
+            type=self.net.modality,
+            change_name_if_conflict=True,
+        )
+        g.api.project.update_meta(project_info.id, self.output_meta)
+        custom_data = {
+            # local source projects are not on the server
+            "source_projects": (
+                [] if self.net.source is not None else _get_source_projects_ids_from_dtl()
+            ),
+            "data-nodes": g.current_dtl_json,
+        }
+        g.api.project.update_custom_data(project_info.id, custom_data)
+        return project_info
 
     def get_ds_parents(self, dataset_info: DatasetInfo):
         if dataset_info is None:
@@ -290,6 +293,13 @@ class OutputProjectLayer(Layer):
                 return self.ds_map[dataset_name]
 
     def get_or_create_dataset(self, dataset_name, ds_parents=None):
+        return self.create_shared(
+            f"dataset:{'/'.join(ds_parents or [])}/{dataset_name}",
+            lambda: self._get_or_create_dataset(dataset_name, ds_parents),
+            g.api.dataset.get_info_by_id,
+        )
+
+    def _get_or_create_dataset(self, dataset_name, ds_parents=None):
         is_existing_project = self.settings["is_existing_project"]
         if is_existing_project:
             dataset_info = self.get_or_create_existing_dataset(dataset_name, ds_parents)
@@ -328,15 +338,18 @@ class OutputProjectLayer(Layer):
                             ds_item_map[dataset_name].append((item_desc, ann))
 
                     if ds_item_map is None:
+                        out_item_names = self.get_free_names(
+                            [item_desc.get_item_name() for item_desc in item_descs],
+                            dataset_name,
+                            self.sly_project_info.name,
+                        )
                         out_item_names = [
-                            self.get_free_name(
-                                item_desc.get_item_name(), dataset_name, self.sly_project_info.name
-                            )
-                            + get_file_ext(item_desc.info.item_info.name)
-                            for item_desc in item_descs
+                            name + get_file_ext(item_desc.info.item_info.name)
+                            for name, item_desc in zip(out_item_names, item_descs)
                         ]
                         if self.net.modality == "images":
-                            if self.net.may_require_items():
+                            # local items have no server ids to copy
+                            if self.net.may_require_items() or self.net.source is not None:
                                 image_info = g.api.image.upload_nps(
                                     dataset_info.id,
                                     out_item_names,
@@ -373,18 +386,24 @@ class OutputProjectLayer(Layer):
                             dataset_info = self.get_or_create_dataset(ds_name, ds_parents)
                             dataset_name = dataset_info.name
 
+                            out_item_names = self.get_free_names(
+                                [
+                                    item_desc.get_item_name()
+                                    for item_desc, _ in ds_item_map[ds_name]
+                                ],
+                                dataset_name,
+                                self.sly_project_info.name,
+                            )
                             out_item_names = [
-                                self.get_free_name(
-                                    item_desc.get_item_name(),
-                                    dataset_name,
-                                    self.sly_project_info.name,
+                                name + get_file_ext(item_desc.info.item_info.name)
+                                for name, (item_desc, _) in zip(
+                                    out_item_names, ds_item_map[ds_name]
                                 )
-                                + get_file_ext(item_desc.info.item_info.name)
-                                for item_desc, _ in ds_item_map[ds_name]
                             ]
 
                             if self.net.modality == "images":
-                                if self.net.may_require_items():
+                                # local items have no server ids to copy
+                                if self.net.may_require_items() or self.net.source is not None:
                                     image_nps = [
                                         item_desc.read_image()
                                         for item_desc, _ in ds_item_map[ds_name]
@@ -433,12 +452,14 @@ class OutputProjectLayer(Layer):
                     ds_item_map[dataset_name].append((item_desc, ann))
 
                 for ds_name in ds_item_map:
+                    out_item_names = self.get_free_names(
+                        [item_desc.get_item_name() for item_desc, _ in ds_item_map[ds_name]],
+                        dataset_name,
+                        self.out_project_name,
+                    )
                     out_item_names = [
-                        self.get_free_name(
-                            item_desc.get_item_name(), dataset_name, self.out_project_name
-                        )
-                        + get_file_ext(item_desc.info.item_info.name)
-                        for item_desc, _ in ds_item_map[ds_name]
+                        name + get_file_ext(item_desc.info.item_info.name)
+                        for name, (item_desc, _) in zip(out_item_names, ds_item_map[ds_name])
                     ]
                     if self.sly_project_info is not None:
                         orig_ds_info = ds_item_map[ds_name][0][
@@ -447,7 +468,8 @@ class OutputProjectLayer(Layer):
                         ds_parents = self.get_ds_parents(orig_ds_info)
                         dataset_info = self.get_or_create_dataset(ds_name, ds_parents)
                         if self.net.modality == "images":
-                            if self.net.may_require_items():
+                            # local items have no server ids to copy
+                            if self.net.may_require_items() or self.net.source is not None:
                                 item_infos = g.api.image.upload_nps(
                                     dataset_info.id,
                                     out_item_names,
@@ -495,4 +517,5 @@ class OutputProjectLayer(Layer):
         return True
 
     def postprocess(self):
-        self.postprocess_cb()
+        if self.postprocess_cb is not None:
+            self.postprocess_cb()
@@ -8,12 +8,13 @@ from supervisely.app.widgets.sly_tqdm.sly_tqdm import Progress
 from src.ui.widgets import CircleProgress
 from supervisely.sly_logger import logger, EventType
 
+from src.compute.dtl_utils.batch_sizing import BatchSizer, get_memory_factor
 from src.compute.dtl_utils.dtl_helper import DtlHelper, DtlPaths
 from src.compute.tasks import task_helpers
 from src.compute.utils import logging_utils
 from src.compute.Net import Net
 from src.exceptions import CustomException, GraphError
-from src.utils import LegacyProjectItem
+from src.utils import LegacyProjectItem, invalidate_datasets_cache
 import src.globals as g
 from time import time
 
@@ -66,6 +67,10 @@ def main(
     circle_progress: CircleProgress,
     modality: str,
     postprocess_cb_list: list = None,
+    source=None,
+    sink=None,
+    coordinator=None,
+    journal=None,
 ):
     total_pipeline_time_start = time()
     task_helpers.task_verification(check_in_graph)
@@ -74,10 +79,19 @@ def main(
         return
 
     logger.info("Pipeline started")
+    invalidate_datasets_cache()
     helper = DtlHelper()
 
     try:
-        net = Net(helper.graph, helper.paths.results_dir, modality)
+        net = Net(
+            helper.graph,
+            helper.paths.results_dir,
+            modality,
+            source=source,
+            sink=sink,
+            coordinator=coordinator,
+            journal=journal,
+        )
 
         if postprocess_cb_list is not None:
             for layer, postprocess_cb in zip(net.layers, postprocess_cb_list):
@@ -123,10 +137,13 @@ def main(
         # logger.error("Error occurred on Pipeline graph initialization step!", exc_info=str(e))
         raise e
 
+    if coordinator is not None:
+        net.load_shard_plan()
+
     total = net.get_total_elements()
     g.total = total
     net.total_elements_cnt = total
-    if total == 0:
+    if total == 0 and net.shard_plan is None:
         g.disable_move = True
         raise GraphError(
             "There are no elements to process. Make sure that you selected input project and it's not empty"
@@ -142,6 +159,14 @@ def main(
         else:
             g.BATCH_SIZE = 1
 
+    # not downloaded items take no memory, batches are limited by BATCH_SIZE only
+    memory_factor = get_memory_factor(net) if net.may_require_items() else 0
+    net.batch_sizer = BatchSizer(g.BATCH_MEMORY_MB * 2**20, g.BATCH_SIZE, modality, memory_factor)
+    logger.info(
+        f"Batches are limited to {g.BATCH_SIZE} items and {g.BATCH_MEMORY_MB} MB",
+        extra={"memory_factor": round(memory_factor, 2)},
+    )
+
     elements_generator_batched = net.get_elements_generator_batched(batch_size=g.BATCH_SIZE)
     if not g.pipeline_running:
         return
@@ -150,6 +175,7 @@ def main(
     processing_time_start = time()
     with progress(message=f"Processing items...", total=total) as pbar:
         for data_batch in elements_generator_batched:
+            batch_completed = False
             try:
                 export_output_generator = net.start(data_batch)
                 if not g.pipeline_running:
@@ -166,6 +192,7 @@ def main(
                         },
                     )
                     results_counter += 1
+                batch_completed = True
             except Exception as e:
                 g.disable_move = True
                 logger.warn(
@@ -173,6 +200,8 @@ def main(
                     exc_info=True,
                 )
             finally:
+                if journal is not None:
+                    net.checkpoint(data_batch, batch_completed)
                 pbar.update(len(data_batch))
                 g.current = pbar.n
 
@@ -180,6 +209,9 @@ def main(
     logger.debug(
         f"Total items processing time: {processing_time_end-processing_time_start:.10f} seconds."
     )
+    logger.info("Batch sizes", extra=net.batch_sizer.get_summary())
+    if net.download_on_demand:
+        logger.info(f"Images downloaded: {net.downloaded_items_cnt} of {total}")
     if not g.pipeline_running:
         return
 
@@ -204,6 +236,34 @@ def main(
     return net
 
 
+def finalize(circle_progress: CircleProgress, modality: str, coordinator, source=None, sink=None):
+    """
+    Finalize step of a sharded run: runs the once-per-run postprocess actions of the layers
+    (e.g. creating labeling jobs) for the items of all shards. Destination entities created
+    by the shards are reused (see ShardCoordinator.once).
+    """
+    logger.info("Finalizing sharded pipeline")
+    helper = DtlHelper()
+    net = Net(
+        helper.graph,
+        helper.paths.results_dir,
+        modality,
+        source=source,
+        sink=sink,
+        coordinator=coordinator,
+    )
+    try:
+        net.validate(circle_progress)
+    except:
+        circle_progress.hide()
+        raise
+    net.calc_metas()
+    net.preprocess()
+    net.finalize()
+    logger.info("Sharded pipeline finalized")
+    return net
+
+
 if __name__ == "__main__":
     if os.getenv("DEBUG_LOG_TO_FILE", None):
         sly_logger.add_default_logging_into_file(logger, DtlPaths().debug_dir)
@@ -0,0 +1,158 @@
+# coding: utf-8
+
+# Shared pixel-level kernels for the color/noise layers.
+# All kernels work in float32 (or through uint8 LUTs) and saturate to uint8 in place,
+# so no float64 full-size temporaries are created. Kernels are elementwise and accept
+# either a single image (H, W[, C]) or a stacked batch (N, H, W[, C]).
+
+import os
+from typing import List, Optional, Sequence
+
+import cv2
+import numpy as np
+
+# random numbers are generated in chunks to bound the scratch buffer size
+_NOISE_CHUNK_ELEMENTS = 1 << 22
+# stacked batches are used only while the float32 stack fits into this budget
+_MAX_STACK_BYTES = int(os.getenv("PIXEL_OPS_MAX_STACK_MB", "256")) * 1024 * 1024
+
+_rng = None
+
+
+def get_rng() -> np.random.Generator:
+    global _rng
+    if _rng is None:
+        seed = os.getenv("PIXEL_OPS_SEED", None)
+        _rng = np.random.default_rng(int(seed) if seed is not None else None)
+    return _rng
+
+
+def set_seed(seed: Optional[int]) -> None:
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
+def to_float32(img: np.ndarray) -> np.ndarray:
+    """Returns a C-contiguous float32 copy which is safe to modify in place."""
+    return img.astype(np.float32, order="C", copy=True)
+
+
+def saturate_uint8(img_f32: np.ndarray) -> np.ndarray:
+    """Clips float32 buffer to [0, 255] in place and converts it to uint8."""
+    np.clip(img_f32, 0, 255, out=img_f32)
+    return img_f32.astype(np.uint8)
+
+
+def stack_uniform(imgs: Sequence[np.ndarray], dtype=None) -> Optional[np.ndarray]:
+    """Stacks images into one (N, H, W[, C]) array if all shapes match and the stack
+    fits into the memory budget, otherwise returns None."""
+    if len(imgs) == 0:
+        return None
+    shape = imgs[0].shape
+    if any(img.shape != shape for img in imgs):
+        return None
+    dtype = np.dtype(dtype or imgs[0].dtype)
+    if len(imgs) * int(np.prod(shape)) * dtype.itemsize > _MAX_STACK_BYTES:
+        return None
+    stack = np.empty((len(imgs),) + shape, dtype=dtype)
+    for idx, img in enumerate(imgs):
+        stack[idx] = img
+    return stack
+
+
+# Noise
+def add_gaussian_noise_(
+    img_f32: np.ndarray, mean: float, std: float, rng: np.random.Generator = None
+) -> np.ndarray:
+    """Adds gaussian noise to contiguous float32 buffer in place."""
+    rng = rng or get_rng()
+    if not img_f32.flags.c_contiguous:
+        raise ValueError("In-place noise requires a C-contiguous float32 buffer")
+    flat = img_f32.reshape(-1)
+    for start in range(0, flat.size, _NOISE_CHUNK_ELEMENTS):
+        chunk = flat[start : start + _NOISE_CHUNK_ELEMENTS]
+        noise = rng.standard_normal(chunk.size, dtype=np.float32)
+        noise *= std
+        noise += mean
+        chunk += noise
+    return img_f32
+
+
+def gaussian_noise(
+    img: np.ndarray, mean: float, std: float, rng: np.random.Generator = None
+) -> np.ndarray:
+    buf = to_float32(img)
+    add_gaussian_noise_(buf, mean, std, rng)
+    return saturate_uint8(buf)
+
+
+def gaussian_noise_batch(
+    imgs: Sequence[np.ndarray], mean: float, std: float, rng: np.random.Generator = None
+) -> List[np.ndarray]:
+    stack = stack_uniform(imgs, dtype=np.float32)
+    if stack is None:
+        return [gaussian_noise(img, mean, std, rng) for img in imgs]
+    add_gaussian_noise_(stack, mean, std, rng)
+    return list(saturate_uint8(stack))
+
+
+# Color mixing
+def random_color_matrix(strength: float, channels: int = 3, rng: np.random.Generator = None):
+    rng = rng or get_rng()
+    matrix = np.eye(channels, dtype=np.float32)
+    matrix += rng.standard_normal((channels, channels), dtype=np.float32) * np.float32(strength)
+    return matrix
+
+
+def color_transform(img: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Multiplies every pixel (row vector) by the channels matrix."""
+    channels = matrix.shape[0]
+    buf = to_float32(img).reshape(-1, channels)
+    res = np.matmul(buf, matrix.astype(np.float32, copy=False))
+    return saturate_uint8(res).reshape(img.shape)
+
+
+def color_transform_batch(
+    imgs: Sequence[np.ndarray], matrices: Sequence[np.ndarray]
+) -> List[np.ndarray]:
+    stack = stack_uniform(imgs, dtype=np.float32)
+    if stack is None:
+        return [color_transform(img, matrix) for img, matrix in zip(imgs, matrices)]
+    channels = matrices[0].shape[0]
+    flat = stack.reshape(len(imgs), -1, channels)
+    res = np.matmul(flat, np.stack(matrices).astype(np.float32, copy=False))
+    return list(saturate_uint8(res).reshape(stack.shape))
+
+
+# LUT based intensity transforms
+def contrast_brightness_lut(contrast: float, brightness: float, center: float = 0) -> np.ndarray:
+    values = np.arange(256, dtype=np.float32)
+    values -= center
+    values *= np.float32(contrast)
+    values += np.float32(brightness + center)
+    return saturate_uint8(values)
+
+
+def apply_lut(img: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    if img.ndim <= 3:
+        return cv2.LUT(img, lut)
+    return lut[img]
+
+
+def contrast_brightness(
+    img: np.ndarray, contrast: float, brightness: float, center: float = 0
+) -> np.ndarray:
+    if img.dtype == np.uint8:
+        return apply_lut(img, contrast_brightness_lut(contrast, brightness, center))
+    buf = to_float32(img)
+    buf -= center
+    buf *= np.float32(contrast)
+    buf += np.float32(brightness + center)
+    return saturate_uint8(buf)
+
+
+def contrast_brightness_batch(
+    imgs: Sequence[np.ndarray], params: Sequence[tuple]
+) -> List[np.ndarray]:
+    # LUT lookups are memory-bound per image, stacking would only add an extra copy
+    return [contrast_brightness(img, *img_params) for img, img_params in zip(imgs, params)]
@@ -46,6 +46,26 @@ class StatTimer:
 
         self.lock.release()
 
+    def summary(self):
+        """Returns per layer totals: [{action_name, id, calls, items_count, total_sec}]."""
+        with self.lock:
+            res = []
+            for object_id, values in self._q_dct.items():
+                res.append(
+                    {
+                        "action_name": values[0]["action_name"],
+                        "id": object_id,
+                        "calls": len(values),
+                        "items_count": sum(v["items_count"] for v in values),
+                        "total_sec": sum(v["val_sec"] for v in values),
+                    }
+                )
+            return res
+
+    def reset(self):
+        with self.lock:
+            self._q_dct = {}
+
     def dump(self):
         dump_json_file(self._q_dct, "stat_timer.json")
         self._q_dct = {}
@@ -0,0 +1,179 @@
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+from supervisely import Api
+from supervisely.api.module_api import ApiField
+from supervisely.sly_logger import logger
+
+from src.exceptions import CustomException
+
+
+class EntitySelection:
+    """
+    Ids of the entities selected when the app is started from the context menu: explicit ids
+    or the entities matching the filters. Filters are resolved in the background for every
+    dataset concurrently, page by page, so startup does not wait for them and only ids
+    (not full infos) are kept, in a compact int64 array. Reading the ids waits until the
+    resolution is finished and raises if it has failed. Membership checks use a set which is
+    built on the first check. clear() drops the selection without waiting, the background
+    resolution stops at the next page.
+    """
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids = array("q", ids)
+        self._ids_set = None
+        self._has_selection = len(self._ids) > 0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._ready.set()
+        self._first = threading.Event()  # first id is available or resolution is finished
+        self._first.set()
+        self._callbacks: List[Callable[[], None]] = []
+        self._error: Optional[CustomException] = None
+        # bumped by clear(), resolution of an older generation stops and keeps no ids
+        self._generation = 0
+
+    @property
+    def has_selection(self) -> bool:
+        """True if ids were given or filters are being resolved, does not wait."""
+        return self._has_selection
+
+    def resolve_filters(
+        self,
+        api: Api,
+        project_id: int,
+        filters: List[dict],
+        dataset_id: Optional[int] = None,
+        workers: int = 4,
+    ):
+        """Starts resolving filters in the background, ids are appended as pages arrive."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._has_selection = True
+            self._error = None
+            self._ready.clear()
+            self._first.clear()
+        thread = threading.Thread(
+            target=self._resolve,
+            args=(api, project_id, filters, dataset_id, workers, generation),
+            name="Entities filter",
+            daemon=True,
+        )
+        thread.start()
+
+    def _resolve(self, api: Api, project_id: int, filters, dataset_id, workers: int, generation):
+        try:
+            if dataset_id is not None:
+                datasets_ids = [dataset_id]
+            else:
+                datasets_ids = [ds.id for ds in api.dataset.get_list(project_id)]
+            with ThreadPoolExecutor(workers, thread_name_prefix="Entities filter") as executor:
+                futures = [
+                    executor.submit(self._resolve_dataset, api, ds_id, filters, generation)
+                    for ds_id in datasets_ids
+                ]
+                for future in futures:
+                    future.result()
+            if generation == self._generation:
+                logger.info(f"{len(self._ids)} entities selected via filters")
+        except Exception as e:
+            logger.error("Failed to resolve entities filters", exc_info=True)
+            with self._lock:
+                if generation == self._generation:
+                    self._error = CustomException(
+                        "Failed to resolve entities filters",
+                        error=e,
+                        extra={"project_id": project_id, "dataset_id": dataset_id},
+                    )
+        finally:
+            self._set_ready(generation)
+
+    def _set_ready(self, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return  # cleared, clear() has set the events
+            self._ready.set()
+            self._first.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _resolve_dataset(self, api: Api, dataset_id: int, filters: List[dict], generation: int):
+        data = {ApiField.DATASET_ID: dataset_id, ApiField.FILTERS: filters}
+        for page in api.image.get_list_all_pages_generator("images.list", data):
+            page_ids = array("q", (info.id for info in page))
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._ids.extend(page_ids)
+                self._ids_set = None
+            if len(page_ids) > 0:
+                self._first.set()
+
+    def _wait_resolved(self):
+        self.wait()
+        if self._error is not None:
+            raise self._error
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def on_ready(self, callback: Callable[[], None]):
+        """Calls callback when the ids are resolved (immediately if they already are)."""
+        with self._lock:
+            if not self._ready.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def first(self, timeout: float = None) -> Optional[int]:
+        """Returns the first available id without waiting for the whole resolution."""
+        self._first.wait(timeout)
+        with self._lock:
+            return self._ids[0] if len(self._ids) > 0 else None
+
+    def clear(self):
+        """Drops the selection, does not wait for the resolution of the filters."""
+        with self._lock:
+            self._generation += 1
+            self._ids = array("q")
+            self._ids_set = None
+            self._has_selection = False
+            self._error = None
+            self._ready.set()
+            self._first.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def to_list(self) -> List[int]:
+        self._wait_resolved()
+        return self._ids.tolist()
+
+    def __len__(self) -> int:
+        self._wait_resolved()
+        return len(self._ids)
+
+    def __iter__(self):
+        self._wait_resolved()
+        return iter(self._ids)
+
+    def __getitem__(self, idx):
+        self._wait_resolved()
+        return self._ids[idx]
+
+    def __contains__(self, entity_id) -> bool:
+        self._wait_resolved()
+        ids_set = self._ids_set
+        if ids_set is None:
+            with self._lock:
+                if self._ids_set is None:
+                    self._ids_set = set(self._ids)
+                ids_set = self._ids_set
+        return entity_id in ids_set
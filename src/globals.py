@@ -1,6 +1,5 @@
 import ast
 import os
-from queue import Queue
 
 import supervisely as sly
 from dotenv import load_dotenv
@@ -15,6 +14,12 @@ from supervisely.app.widgets import (
     Text,
 )
 
+from src.entity_selection import EntitySelection
+from src.metadata_cache import MetadataCache
+from src.model_sessions import ModelSessionManager
+from src.prediction_cache import PredictionCache
+from src.ui.preview_scheduler import PreviewScheduler
+
 if sly.is_development():
     load_dotenv("local.env")
     load_dotenv(os.path.expanduser("~/supervisely.env"))
@@ -29,6 +34,7 @@ DATA_DIR = "sly_task_data/data"
 RESULTS_DIR = "sly_task_data/results"
 PREVIEW_DIR = "sly_task_data/preview"
 WORKFLOW_DIR = "sly_task_data/workflow"
+CACHE_DIR = "sly_task_data/cache"  # persistent between pipeline runs
 STATIC_DIR = "static"
 
 if TASK_ID is not None:
@@ -41,6 +47,7 @@ WORKFLOW_ID = 1
 sly.fs.mkdir(DATA_DIR, True)
 sly.fs.mkdir(RESULTS_DIR, True)
 sly.fs.mkdir(PREVIEW_DIR, True)
+sly.fs.mkdir(CACHE_DIR)
 
 TEAM_FILES_PATH = "data-nodes"
 PROJECT_ID = sly.env.project_id(raise_not_found=False)
@@ -53,8 +60,6 @@ SUPPORTED_MODALITIES_MAP = {
     "videos": sly.ProjectType.VIDEOS,
 }
 
-ava_ag = api.agent.get_list_available(team_id=TEAM_ID)
-
 MODALITY_TYPE = os.getenv("modal.state.modalityType", "images")
 if PROJECT_ID is not None:
     project_type = api.project.get_info_by_id(PROJECT_ID).type
@@ -68,25 +73,20 @@ if PROJECT_ID is not None:
 PRESETS_PATH = os.path.join("/" + TEAM_FILES_PATH + "/presets", MODALITY_TYPE)
 
 PIPELINE_TEMPLATE = os.getenv("modal.state.pipelineTemplate", None)
-FILTERED_ENTITIES = []
+FILTERED_ENTITIES = EntitySelection()
 ENTITIES_FILTERS = []
 if PROJECT_ID is not None:
     ENTITIES_FILTERS = os.getenv("modal.state.entitiesFilter", [])
     if ENTITIES_FILTERS != []:
         ENTITIES_FILTERS = ast.literal_eval(ENTITIES_FILTERS)
-    FILTERED_ENTITIES = os.getenv("modal.state.selectedEntities", [])
-    if FILTERED_ENTITIES != []:
-        FILTERED_ENTITIES = ast.literal_eval(FILTERED_ENTITIES)
-    if FILTERED_ENTITIES == [] and ENTITIES_FILTERS != []:
-        if DATASET_ID is not None:
-            datasets = [api.dataset.get_info_by_id(DATASET_ID)]
-        else:
-            datasets = api.dataset.get_list(PROJECT_ID)
-        FILTERED_ENTITIES = []
-        for dataset in datasets:
-            FILTERED_ENTITIES.extend(api.image.get_filtered_list(dataset.id, ENTITIES_FILTERS))
-        if FILTERED_ENTITIES != []:
-            FILTERED_ENTITIES = [entity.id for entity in FILTERED_ENTITIES]
+    selected_entities = os.getenv("modal.state.selectedEntities", [])
+    if selected_entities != []:
+        selected_entities = ast.literal_eval(selected_entities)
+    if selected_entities != []:
+        FILTERED_ENTITIES = EntitySelection(selected_entities)
+    elif ENTITIES_FILTERS != []:
+        # resolved in the background, reading the ids waits for the result
+        FILTERED_ENTITIES.resolve_filters(api, PROJECT_ID, ENTITIES_FILTERS, DATASET_ID)
 
 
 FILTERED_DATASETS = []
@@ -103,26 +103,39 @@ if MODALITY_TYPE == "images":
     BATCH_SIZE = 50
 else:
     BATCH_SIZE = 1
+# memory of the decoded items of a batch, batches are smaller if it is exceeded
+# (see compute/dtl_utils/batch_sizing)
+BATCH_MEMORY_MB = int(os.getenv("BATCH_MEMORY_MB", "4096"))
 
 current_srcs: dict = {}
 
-cache = {
-    "workspace_info": {},
-    "project_id": {},
-    "project_info": {},
-    "project_meta": {},
-    "dataset_id": {},
-    "dataset_info": {},
-    "all_datasets": {},
-    "last_search": "",
-}
+# API metadata cache, TTLs are in seconds
+CACHE_TTL = int(os.getenv("METADATA_CACHE_TTL", "300"))
+cache = MetadataCache(
+    {
+        "workspace_info": {"ttl": CACHE_TTL, "max_size": 100},
+        "project_id": {"ttl": CACHE_TTL, "max_size": 1000},
+        "project_info": {"ttl": CACHE_TTL, "max_size": 1000},
+        "project_meta": {"ttl": CACHE_TTL, "max_size": 200},
+        "dataset_id": {"ttl": CACHE_TTL, "max_size": 10000},
+        "dataset_info": {"ttl": CACHE_TTL, "max_size": 10000},
+        "all_datasets": {"ttl": CACHE_TTL, "max_size": 200},
+    }
+)
+last_search = ""
+
+# Apply NN predictions cache, persistent between pipeline runs and previews, 0 disables it
+PREDICTION_CACHE_MB = int(os.getenv("PREDICTION_CACHE_MB", "512"))
+prediction_cache = PredictionCache(
+    os.path.join(CACHE_DIR, "predictions.sqlite"), PREDICTION_CACHE_MB * 1024 * 1024
+)
 
 layers_count = 0
 layers = {}
 nodes_history = []
 
 
-update_queue = Queue()
+update_scheduler = PreviewScheduler()
 stop_updates = False
 
 pipeline_running = False
@@ -130,12 +143,11 @@ pipeline_thread = None
 
 
 def updater(update: str):
-    global update_queue
     if stop_updates:
         sly.logger.debug("Skip update: %s", update)
         return
-    sly.logger.debug("Put update to queue: %s", update)
-    update_queue.put(update)
+    sly.logger.debug("Submit update: %s", update)
+    update_scheduler.submit(update)
 
 
 context_menu_position = None
@@ -185,6 +197,7 @@ warn_notification.hide()
 # src/ui/ui.py line 28
 # src/ui/tabs/configure.py line 158-176
 connect_node_checkbox = Checkbox("Auto-connect node", checked=False)
+full_resolution_preview_checkbox = Checkbox("Full resolution preview", checked=False)
 
 
 @error_close_btn.click
@@ -193,6 +206,7 @@ def on_error_close():
 
 
 running_sessions_ids = []
+model_sessions = ModelSessionManager(api)
 disable_move = False
 
 current = 0
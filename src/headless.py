@@ -0,0 +1,363 @@
+# Headless pipeline runner
+#
+# Runs a preset (layers JSON saved by the app, the format ui/tabs/presets.apply_json loads)
+# without the app UI: Net is built directly from the preset and compute/main.main runs it.
+# Progress, per layer stats and results are printed to stdout as JSON lines, logs go to stderr.
+# Run from the repository root with the same env as the app:
+#   python -m src.headless preset.json
+#   python -m src.headless /data-nodes/presets/images/my_preset.json --src "my_project/*"
+#   python -m src.headless preset.json --source-dir /data/projects --output-dir /data/results
+# Sharded run: N workers with the same preset and a shared directory, then the finalize step:
+#   python -m src.headless preset.json --shards 4 --shard-index 0 --shard-dir /shared/run1
+#   ...
+#   python -m src.headless preset.json --shards 4 --shard-dir /shared/run1 --finalize
+# Checkpointed run, continued with --resume after a failure or stop (shards are always checkpointed):
+#   python -m src.headless preset.json --checkpoint-dir /data/run1 [--resume]
+# Batches are sized to keep the decoded items under --batch-memory-mb (BATCH_MEMORY_MB env):
+#   python -m src.headless preset.json --batch-memory-mb 2048
+
+import argparse
+import copy
+import json
+import os
+import signal
+import sys
+import time
+import traceback
+from typing import List, Optional
+
+import src.globals as g
+import src.utils as utils
+from src.compute.dtl_utils.local_storage import LocalProjectSink, LocalProjectSource
+from src.compute.Layer import Layer
+from src.compute.dtl_utils.run_journal import RunJournal
+from src.compute.dtl_utils.sharding import ShardCoordinator
+from src.compute.main import finalize as finalize_dtls
+from src.compute.main import main as compute_dtls
+from src.compute.Net import Net
+from src.compute.utils.stat_timer import global_timer
+from src.exceptions import ActionNotFoundError, BadSettingsError, CustomException
+from supervisely import logger
+from supervisely.io.fs import get_file_name_with_ext
+
+
+class JsonLinesReporter:
+    """Writes events as JSON lines: {"event": ..., "time": ..., **data}."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def emit(self, event: str, **data):
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **data}, default=str)
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+class JsonLinesProgress:
+    """Progress for compute/main.main which reports every update as a "progress" event."""
+
+    def __init__(self, reporter: JsonLinesReporter):
+        self.reporter = reporter
+        self.message = None
+        self.total = None
+        self.n = 0
+        self._start = None
+
+    def __call__(self, message=None, total=None, **kwargs):
+        self.message = message
+        self.total = total
+        self.n = 0
+        self._start = time.monotonic()
+        return self
+
+    def __enter__(self):
+        self._report()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def update(self, n: int = 1):
+        self.n += n
+        self._report()
+
+    def _report(self):
+        elapsed = time.monotonic() - self._start
+        self.reporter.emit(
+            "progress",
+            message=self.message,
+            current=self.n,
+            total=self.total,
+            elapsed_sec=round(elapsed, 3),
+            items_per_sec=round(self.n / elapsed, 3) if elapsed > 0 else None,
+        )
+
+
+class _NoCircleProgress:
+    def show(self):
+        pass
+
+    def hide(self):
+        pass
+
+    def set_status(self, status):
+        pass
+
+
+def load_preset(path: str) -> List[dict]:
+    """Loads the preset from a local file or from Team Files."""
+    if not os.path.isfile(path):
+        utils.create_data_dir()
+        local_path = os.path.join(g.DATA_DIR, get_file_name_with_ext(path))
+        g.api.file.download(g.TEAM_ID, path, local_path)
+        path = local_path
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def prepare_graph(dtl_json: List[dict], modality: str, srcs: List[str] = None) -> List[dict]:
+    """
+    Replaces legacy actions with the current ones and, if srcs are given, the sources of the
+    project input layers (like the app does for template presets).
+    """
+    graph = copy.deepcopy(dtl_json)
+    for layer_json in graph:
+        if "action" not in layer_json:
+            raise BadSettingsError(
+                'Missing "action" field in layer config', extra={"layer_config": layer_json}
+            )
+        action = Layer.actions_mapping.resolve_action(layer_json["action"])
+        if action not in Layer.actions_mapping:
+            raise ActionNotFoundError(action)
+        layer_json["action"] = action
+        if srcs is not None and action == f"{modality}_project":
+            layer_json["src"] = list(srcs)
+    return graph
+
+
+def get_layers_stats(net: Net) -> List[dict]:
+    layers_idxs = {id(layer): idx for idx, layer in enumerate(net.layers)}
+    stats = []
+    for layer_stats in global_timer.summary():
+        idx = layers_idxs.get(layer_stats.pop("id"))
+        if idx is None:
+            continue
+        items_count = layer_stats["items_count"]
+        total_sec = layer_stats["total_sec"]
+        stats.append(
+            {
+                "layer_idx": idx,
+                "dst": net.layers[idx].dsts,
+                **layer_stats,
+                "total_sec": round(total_sec, 6),
+                "ms_per_item": round(total_sec / items_count * 1000, 3) if items_count else None,
+            }
+        )
+    return sorted(stats, key=lambda s: s["layer_idx"])
+
+
+def _init_run(dtl_json: List[dict], modality: str, srcs: List[str] = None) -> List[dict]:
+    graph = prepare_graph(dtl_json, modality, srcs)
+    g.MODALITY_TYPE = modality
+    g.current_dtl_json = graph
+    utils.delete_results_dir()
+    utils.create_results_dir()
+    utils.delete_data_dir()
+    utils.create_data_dir()
+    utils.save_dtl_json(graph)
+    return graph
+
+
+def _get_shard_info(coordinator: Optional[ShardCoordinator]) -> dict:
+    if coordinator is None:
+        return {}
+    return {"shard_index": coordinator.shard_index, "shard_count": coordinator.shard_count}
+
+
+def run_preset(
+    dtl_json: List[dict],
+    modality: str,
+    srcs: List[str] = None,
+    source=None,
+    sink=None,
+    reporter: JsonLinesReporter = None,
+    coordinator: ShardCoordinator = None,
+    resume: bool = False,
+) -> Optional[Net]:
+    """
+    Runs the preset, returns the Net or None if the run was stopped.
+    With a coordinator only the items of its shard are processed and the run is checkpointed
+    to the journal in the coordinator directory, resume continues the interrupted run.
+    """
+    reporter = reporter or JsonLinesReporter()
+    graph = _init_run(dtl_json, modality, srcs)
+    journal = None
+    if coordinator is not None:
+        journal = RunJournal(coordinator.get_journal_path(), resume=resume)
+
+    reporter.emit(
+        "started",
+        layers=[layer["action"] for layer in graph],
+        modality=modality,
+        **_get_shard_info(coordinator),
+        **({"resumed_from": journal.cursor} if resume else {}),
+    )
+    start = time.monotonic()
+    g.pipeline_running = True
+    try:
+        net = compute_dtls(
+            JsonLinesProgress(reporter),
+            _NoCircleProgress(),
+            modality,
+            source=source,
+            sink=sink,
+            coordinator=coordinator,
+            journal=journal,
+        )
+    finally:
+        stopped = not g.pipeline_running
+        g.pipeline_running = False
+        if journal is not None:
+            journal.close()
+    if net is None or stopped:
+        reporter.emit("stopped", current=g.current, total=g.total)
+        return None
+
+    reporter.emit("layer_stats", layers=get_layers_stats(net))
+    reporter.emit("batches", **net.batch_sizer.get_summary())
+    results = [
+        os.path.join(g.RESULTS_DIR, name)
+        for name in sorted(os.listdir(g.RESULTS_DIR))
+        if os.path.isdir(os.path.join(g.RESULTS_DIR, name))
+    ]
+    if sink is not None:
+        # the output directory may keep the projects of previous runs
+        results.extend(sink.projects_dirs)
+    reporter.emit(
+        "finished",
+        items=net.total_elements_cnt,
+        elapsed_sec=round(time.monotonic() - start, 3),
+        results=results,
+        **_get_shard_info(coordinator),
+    )
+    return net
+
+
+def finalize_preset(
+    dtl_json: List[dict],
+    modality: str,
+    coordinator: ShardCoordinator,
+    srcs: List[str] = None,
+    source=None,
+    sink=None,
+    reporter: JsonLinesReporter = None,
+) -> Net:
+    """Finalize step of a sharded run, all shards have to be finished."""
+    reporter = reporter or JsonLinesReporter()
+    _init_run(dtl_json, modality, srcs)
+    start = time.monotonic()
+    net = finalize_dtls(_NoCircleProgress(), modality, coordinator, source=source, sink=sink)
+    reporter.emit(
+        "finalized",
+        elapsed_sec=round(time.monotonic() - start, 3),
+        shard_count=coordinator.shard_count,
+    )
+    return net
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs a pipeline preset without the UI")
+    parser.add_argument("preset", help="path to the preset JSON, local or in Team Files")
+    parser.add_argument(
+        "--src", nargs="+", help='sources of the project input layers, e.g. "project/*"'
+    )
+    parser.add_argument("--modality", choices=g.SUPPORTED_MODALITIES, default=g.MODALITY_TYPE)
+    parser.add_argument("--source-dir", help="read input projects from local project directories")
+    parser.add_argument("--output-dir", help="write created projects to local directories")
+    parser.add_argument("--shards", type=int, help="number of shards of a sharded run")
+    parser.add_argument("--shard-index", type=int, help="shard to process, from 0")
+    parser.add_argument("--shard-dir", help="directory shared by the shards of the run")
+    parser.add_argument(
+        "--finalize", action="store_true", help="finalize the sharded run after all shards"
+    )
+    parser.add_argument(
+        "--checkpoint-dir", help="checkpoint the run to the directory to be able to resume it"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="resume the interrupted run from --checkpoint-dir or of the shard",
+    )
+    parser.add_argument(
+        "--batch-memory-mb",
+        type=int,
+        default=g.BATCH_MEMORY_MB,
+        help="memory budget of the decoded items of a batch",
+    )
+    args = parser.parse_args()
+    g.BATCH_MEMORY_MB = args.batch_memory_mb
+    if args.shards is not None:
+        if args.shard_dir is None or (args.shard_index is None) == (not args.finalize):
+            parser.error("--shards requires --shard-dir and either --shard-index or --finalize")
+        if args.checkpoint_dir is not None:
+            parser.error("sharded runs are checkpointed to --shard-dir")
+    elif args.shard_index is not None or args.shard_dir is not None or args.finalize:
+        parser.error("--shard-index, --shard-dir and --finalize require --shards")
+    if args.resume and (args.finalize or (args.shards is None and args.checkpoint_dir is None)):
+        parser.error("--resume requires --checkpoint-dir or --shard-index")
+
+    reporter = JsonLinesReporter()
+    source = LocalProjectSource(args.source_dir, args.modality) if args.source_dir else None
+    sink = None
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        sink = LocalProjectSink(args.output_dir)
+
+    def stop(signum, frame):
+        logger.info("Stopping the pipeline...")
+        g.pipeline_running = False
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    try:
+        coordinator = None
+        if args.shards is not None:
+            coordinator = ShardCoordinator(args.shard_dir, args.shards, args.shard_index)
+        elif args.checkpoint_dir is not None:
+            # checkpointed run is a run of one shard which finalizes itself
+            coordinator = ShardCoordinator.for_single_run(args.checkpoint_dir)
+        dtl_json = load_preset(args.preset)
+        if args.finalize:
+            net = finalize_preset(
+                dtl_json, args.modality, coordinator, args.src, source, sink, reporter
+            )
+        else:
+            net = run_preset(
+                dtl_json,
+                args.modality,
+                args.src,
+                source,
+                sink,
+                reporter,
+                coordinator,
+                args.resume,
+            )
+    except Exception as e:
+        # str() of CustomException looks up layer titles in the UI actions, they are not loaded
+        if isinstance(e, CustomException):
+            message, extra = e.args[0], e.extra
+        else:
+            message, extra = str(e), None
+        logger.error(
+            f"Pipeline failed. {type(e).__name__}: {message}",
+            extra={"traceback": traceback.format_tb(e.__traceback__)},
+        )
+        reporter.emit("error", error=type(e).__name__, message=message, extra=extra)
+        sys.exit(1)
+    if net is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-import threading
 import time
+from functools import partial
 
 from fastapi import Request, Response
 
@@ -14,11 +14,19 @@ from src.ui.dtl.actions.input.filtered_project.filtered_project import (
 from src.ui.dtl.actions.input.images_project.images_project import ImagesProjectAction
 from src.ui.dtl.actions.input.videos_project.videos_project import VideosProjectAction
 from src.ui.dtl.Layer import Layer
-from src.ui.tabs.configure import nodes_flow, update_nodes, update_state
+from src.ui.tabs.configure import (
+    create_preview_jobs,
+    nodes_flow,
+    prepare_preview,
+    run_preview_job,
+    update_nodes,
+    update_state,
+)
 from src.ui.tabs.presets import load_json
 from src.ui.tabs.run import circle_progress, error_notification, run_btn_clicked
 from src.ui.ui import header, layout
-from src.ui.utils import create_new_layer
+from src.ui.preview_images import preview_cache
+from src.ui.utils import create_new_layer, get_preview_source
 from src.ui.widgets import ApplyCss
 from src.utils import LegacyProjectItem
 from supervisely import (
@@ -46,50 +54,32 @@ app = Application(
 server = app.get_server()
 
 
-def _update_f():
-    while True:
-        updates = []
-        while not g.update_queue.empty():
-            updates.append(g.update_queue.get())
-        if len(updates) == 0:
-            time.sleep(0.1)
-            continue
-        updates = updates[::-1]
-        try:
-            if "load_json" in updates:
-                load_json()
-                continue
-            if "metas" in updates:
-                update_state()
-            update_all = False
-            for u in updates:
-                if isinstance(u, tuple):
-                    if u[0] == "nodes" and u[1] is None:
-                        update_all = True
-                        update_nodes()
-            if not update_all:
-                updated = set()
-                for u in updates:
-                    if isinstance(u, tuple):
-                        if u[0] == "nodes" and u[1] not in updated:
-                            updated.add(u[1])
-                            update_nodes(u[1])
-        finally:
-            for _ in range(len(updates)):
-                g.update_queue.task_done()
-        time.sleep(0.1)
-
-
-update_loop = threading.Thread(
-    target=_update_f,
-    name="App update loop",
-    daemon=True,
-)
+def _handle_updates(updates: list):
+    if "load_json" in updates:
+        g.update_scheduler.run_exclusive(load_json)
+        return
+    # layers of the preview net are changed only while no preview job is running
+    if "metas" in updates:
+        g.update_scheduler.run_exclusive(update_state)
+    if ("nodes", None) in updates:
+        g.update_scheduler.run_exclusive(update_nodes)
+        return
+    layers_ids = [u[1] for u in updates if isinstance(u, tuple) and u[0] == "nodes"]
+    jobs = create_preview_jobs(layers_ids)
+    if len(jobs) == 0:
+        return
+    preview = g.update_scheduler.run_exclusive(prepare_preview)
+    if preview is None:
+        return
+    for job in jobs:
+        g.update_scheduler.run_job(job, partial(run_preview_job, preview=preview))
 
 
 def generate_preview_for_project(layer: Layer):
-    if len(g.FILTERED_ENTITIES) > 0:
-        items = [g.api.image.get_info_by_id(g.FILTERED_ENTITIES[0])]
+    if g.FILTERED_ENTITIES.has_selection:
+        # does not wait until all the filters are resolved
+        first_entity_id = g.FILTERED_ENTITIES.first()
+        items = [] if first_entity_id is None else [g.api.image.get_info_by_id(first_entity_id)]
     elif g.DATASET_ID:
         items = g.api.image.get_list(g.DATASET_ID)
     elif len(g.FILTERED_DATASETS) > 0:
@@ -133,7 +123,7 @@ def generate_preview_for_project(layer: Layer):
             0,
             False,
         )
-        img = item_desc.read_image()
+        img, ann = get_preview_source(item_desc.read_image(), ann)
         item_desc.update_item(img)
 
         logger.info("Update project preview")
@@ -176,7 +166,7 @@ elif g.PROJECT_ID and len(g.FILTERED_DATASETS) > 0:
     node = layer.create_node()
     nodes_flow.add_node(node)
 
-elif g.PROJECT_ID and len(g.FILTERED_ENTITIES) == 0:
+elif g.PROJECT_ID and not g.FILTERED_ENTITIES.has_selection:
     ds_name = "*"
     if g.DATASET_ID:
         ds: DatasetInfo = g.api.dataset.get_info_by_id(g.DATASET_ID)
@@ -196,7 +186,7 @@ elif g.PROJECT_ID and len(g.FILTERED_ENTITIES) == 0:
     node = layer.create_node()
     nodes_flow.add_node(node)
 
-elif g.PROJECT_ID and len(g.FILTERED_ENTITIES) > 0:
+elif g.PROJECT_ID and g.FILTERED_ENTITIES.has_selection:
     pr: ProjectInfo = g.api.project.get_info_by_id(g.PROJECT_ID)
     src = [f"{pr.name}/*"]
     layer = create_new_layer(FilteredProjectAction.name)
@@ -205,7 +195,7 @@ elif g.PROJECT_ID and len(g.FILTERED_ENTITIES) > 0:
     node = layer.create_node()
     nodes_flow.add_node(node)
 
-update_loop.start()
+g.update_scheduler.start(_handle_updates)
 
 app.call_before_shutdown(u.on_app_shutdown)
 if layer is not None:
@@ -216,6 +206,25 @@ g.PROJECT_ID = None
 g.DATASET_ID = None
 
 
+def _get_layer_preview_image(layer_id: str):
+    layer = g.layers.get(layer_id)
+    img_desc = layer.get_preview_img_desc() if layer is not None else None
+    return img_desc.read_image() if img_desc is not None else None
+
+
+@server.get("/previews/{layer_id}.jpg")
+def get_preview_image(layer_id: str, request: Request):
+    # previews of the layers are encoded again if they were evicted from the cache
+    cached = preview_cache.get_or_put(layer_id, lambda: _get_layer_preview_image(layer_id))
+    if cached is None:
+        return Response(status_code=404)
+    etag, data = cached
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="image/jpeg", headers=headers)
+
+
 @server.post("/run_pipeline")
 def run_pipeline_from_api(response: Response, request: Request):
     try:
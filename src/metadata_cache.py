@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from supervisely.sly_logger import logger
+
+
+class _Flight:
+    """Load of one key which is in progress, concurrent misses wait for its result."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class CacheNamespace:
+    """
+    Thread-safe LRU cache with optional TTL (seconds) and size limit.
+    Concurrent misses of the same key are coalesced: only the first caller runs the loader,
+    the others wait and get its result (or its exception).
+    """
+
+    def __init__(self, name: str, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items = OrderedDict()  # {key: (expires_at, value)}
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def _get(self, key: Hashable):
+        item = self._items.get(key)
+        if item is None:
+            return False, None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._items[key]
+            self.evictions += 1
+            return False, None
+        self._items.move_to_end(key)
+        return True, value
+
+    def _set(self, key: Hashable, value):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            found, value = self._get(key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            return default
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get(key)[0]
+
+    def set(self, key: Hashable, value):
+        with self._lock:
+            self._set(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]):
+        with self._lock:
+            found, value = self._get(key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            flight = self._inflight.get(key)
+            is_owner = flight is None
+            if is_owner:
+                flight = _Flight()
+                self._inflight[key] = flight
+
+        if not is_owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self.loads += 1
+                if flight.error is None:
+                    self._set(key, flight.value)
+                self._inflight.pop(key, None)
+            flight.event.set()
+        return flight.value
+
+    def invalidate(self, key: Hashable = None):
+        """Drops the key or the whole namespace if key is None."""
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+
+class MetadataCache:
+    """
+    Set of named cache namespaces for the metadata received from the API
+    (project infos, metas, datasets etc.). Namespaces are configured with
+    {name: {"ttl": seconds, "max_size": items}}.
+    """
+
+    def __init__(self, namespaces: Dict[str, dict]):
+        self._namespaces = {
+            name: CacheNamespace(name, **params) for name, params in namespaces.items()
+        }
+
+    def __getitem__(self, name: str) -> CacheNamespace:
+        return self._namespaces[name]
+
+    def invalidate(self, name: str = None, key: Hashable = None):
+        if name is None:
+            for namespace in self._namespaces.values():
+                namespace.invalidate()
+        else:
+            self._namespaces[name].invalidate(key)
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: namespace.stats() for name, namespace in self._namespaces.items()}
+
+    def log_stats(self):
+        logger.debug("Metadata cache stats", extra={"stats": self.stats()})
@@ -0,0 +1,169 @@
+import copy
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from supervisely import Api, ProjectMeta
+from supervisely.io.network_exceptions import process_requests_exception
+from supervisely.nn.inference import Session
+from supervisely.sly_logger import logger
+
+from src.metadata_cache import CacheNamespace
+
+HEALTH_TTL = 5  # seconds
+MODEL_META_TTL = 60  # seconds
+
+
+class PooledSession(Session):
+    """
+    Inference session which sends requests through one requests.Session,
+    so connections to the model are kept alive and reused between batches.
+    """
+
+    def __init__(self, api: Api, task_id: int, pool_size: int = 4):
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        super().__init__(api, task_id)
+
+    def _post(self, *args, retries=5, **kwargs) -> requests.Response:
+        retries = min(self.api.retry_count, retries)
+        url = kwargs.get("url") or args[0]
+        method = url[len(self._base_url) :]
+        for retry_idx in range(retries):
+            response = None
+            try:
+                response = self._http.post(*args, **kwargs)
+                if response.status_code != requests.codes.ok:  # pylint: disable=no-member
+                    Api._raise_for_status(response)
+                return response
+            except requests.RequestException as exc:
+                process_requests_exception(
+                    logger,
+                    exc,
+                    method,
+                    url,
+                    verbose=True,
+                    swallow_exc=True,
+                    sleep_sec=5,
+                    response=response,
+                    retry_info={"retry_idx": retry_idx + 1, "retry_limit": retries},
+                )
+                if retry_idx + 1 == retries:
+                    raise exc
+
+    def with_settings(self, inference_settings: dict) -> "PooledSession":
+        """Returns a copy of the session (sharing its connections) with other inference settings."""
+        session = copy.copy(self)
+        session.inference_settings = inference_settings
+        return session
+
+    def close(self):
+        self._http.close()
+
+
+class ModelSessionManager:
+    """
+    Shares model sessions between the Apply NN and Deploy layers (both preview and pipeline
+    runs): one pooled client per session id, model meta and deployment health cached with
+    short TTLs. wait_until_ready polls with exponential backoff, waiters are woken up
+    as soon as any of them (or notify_ready) sees the model served.
+    """
+
+    def __init__(self, api: Api, health_ttl: float = HEALTH_TTL, meta_ttl: float = MODEL_META_TTL):
+        self.api = api
+        self._sessions = CacheNamespace("model_sessions")
+        self._health = CacheNamespace("model_health", ttl=health_ttl)
+        self._model_metas = CacheNamespace("model_metas", ttl=meta_ttl)
+        self._ready_events: Dict[int, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: int) -> PooledSession:
+        return self._sessions.get_or_load(session_id, lambda: self._connect(session_id))
+
+    def _connect(self, session_id: int) -> PooledSession:
+        session = PooledSession(self.api, session_id)
+        self._ready_event(session_id)
+        return session
+
+    def _ready_event(self, session_id: int) -> threading.Event:
+        with self._lock:
+            event = self._ready_events.get(session_id)
+            if event is None:
+                event = threading.Event()
+                self._ready_events[session_id] = event
+            return event
+
+    def is_deployed(self, session_id: int, use_cache: bool = True) -> bool:
+        if not use_cache:
+            self._health.invalidate(session_id)
+        is_deployed = self._health.get_or_load(
+            session_id, lambda: bool(self.get(session_id).is_model_deployed())
+        )
+        event = self._ready_event(session_id)
+        if is_deployed:
+            event.set()
+        else:
+            event.clear()
+        return is_deployed
+
+    def get_model_meta(self, session_id: int) -> ProjectMeta:
+        return self._model_metas.get_or_load(
+            session_id, lambda: self.get(session_id).get_model_meta()
+        )
+
+    def notify_ready(self, session_id: int):
+        """Marks the model as served (e.g. right after deploy) and wakes up the waiters."""
+        self._health.set(session_id, True)
+        self._ready_event(session_id).set()
+
+    def wait_until_ready(
+        self,
+        session_id: int,
+        timeout: Optional[float] = 120,
+        initial_delay: float = 1,
+        max_delay: float = 15,
+    ) -> bool:
+        """Returns True when the model is served or False if it is not served in timeout."""
+        event = self._ready_event(session_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            try:
+                if self.is_deployed(session_id, use_cache=False):
+                    return True
+            except Exception as e:
+                logger.debug(f"Model session {session_id} is not available yet: {repr(e)}")
+                self.reset(session_id)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            logger.warning("Model is not served yet. Waiting for model to be served")
+            if event.wait(delay):
+                return True
+            delay = min(delay * 2, max_delay)
+
+    def reset(self, session_id: int):
+        """Drops the client and cached data of the session, next call reconnects."""
+        session = self._sessions.get(session_id)
+        self._sessions.invalidate(session_id)
+        self._health.invalidate(session_id)
+        self._model_metas.invalidate(session_id)
+        with self._lock:
+            event = self._ready_events.get(session_id)
+        if event is not None:
+            event.clear()
+        if session is not None:
+            session.close()
+
+    def close(self):
+        with self._lock:
+            sessions_ids = list(self._ready_events)
+            self._ready_events.clear()
+        for session_id in sessions_ids:
+            self.reset(session_id)
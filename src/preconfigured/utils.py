@@ -21,7 +21,7 @@ def get_src():
 
 
 def get_src_action(src):
-    if len(g.FILTERED_ENTITIES) > 0:
+    if g.FILTERED_ENTITIES.has_selection:
         src_action = "filtered_project"
         src_action_template = {
             "action": f"{src_action}",
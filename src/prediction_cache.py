@@ -0,0 +1,159 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable
+
+import numpy as np
+from supervisely.sly_logger import logger
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def get_json_key(data) -> str:
+    return _digest(json.dumps(data, sort_keys=True, default=str).encode())
+
+
+def get_model_key(session_id: int, model_info: dict, inference_settings: dict) -> str:
+    """Identity of the model (session and the loaded checkpoint) and of the inference settings."""
+    return get_json_key(
+        {"session_id": session_id, "model_info": model_info, "settings": inference_settings}
+    )
+
+
+def get_image_key(img: np.ndarray) -> str:
+    """
+    Hash of the pixels. The server image hash is not used: items are downloaded before the
+    layer and previous layers may change them, there is no reliable way to tell they did not.
+    """
+    img = np.ascontiguousarray(img)
+    header = f"{img.shape}{img.dtype}".encode()
+    return f"pixels:{_digest(header + img.tobytes())}"
+
+
+class PredictionCache:
+    """
+    Persistent cache of model predictions (annotation JSON) in an SQLite file, keyed by
+    image key and model key. Entries are zlib-compressed, the least recently used ones
+    are evicted when the total size exceeds max_bytes. max_bytes=0 disables the cache.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS predictions_accessed ON predictions (accessed)"
+            )
+            self._size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM predictions"
+            ).fetchone()[0]
+        return self._conn
+
+    @staticmethod
+    def make_key(image_key: str, model_key: str) -> str:
+        return f"{model_key}/{image_key}"
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        keys = list(set(keys))
+        if not self.enabled or len(keys) == 0:
+            return {}
+        res = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, data FROM predictions WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    conn.execute(
+                        f"UPDATE predictions SET accessed = ? WHERE key IN ({placeholders})",
+                        [time.time(), *chunk],
+                    )
+                    for key, data in rows:
+                        res[key] = json.loads(zlib.decompress(data))
+                conn.commit()
+                self.hits += len(res)
+                self.misses += len(keys) - len(res)
+        except Exception:
+            logger.warning("Failed to read cached predictions", exc_info=True)
+            return {}
+        return res
+
+    def put_many(self, items: Dict[str, dict]):
+        if not self.enabled or len(items) == 0:
+            return
+        now = time.time()
+        rows = []
+        for key, ann_json in items.items():
+            data = zlib.compress(json.dumps(ann_json).encode())
+            rows.append((key, data, len(data), now))
+        try:
+            with self._lock:
+                conn = self._connect()
+                for key, _, size, _ in rows:
+                    old = conn.execute(
+                        "SELECT size FROM predictions WHERE key = ?", (key,)
+                    ).fetchone()
+                    if old is not None:
+                        self._size -= old[0]
+                    self._size += size
+                conn.executemany("INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)", rows)
+                self._evict(conn)
+                conn.commit()
+        except Exception:
+            logger.warning("Failed to cache predictions", exc_info=True)
+
+    def _evict(self, conn: sqlite3.Connection):
+        while self._size > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM predictions ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if len(rows) == 0:
+                self._size = 0
+                return
+            for key, size in rows:
+                if self._size <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM predictions WHERE key = ?", (key,))
+                self._size -= size
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM predictions")
+            conn.commit()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self._size, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,7 +1,6 @@
 import os
 import copy
 from collections import defaultdict
-import time
 from typing import Optional, List, Tuple
 import random
 
@@ -14,7 +13,6 @@ from supervisely.app.widgets import (
     Text,
     Container,
 )
-from supervisely.imaging.image import write as write_image
 
 from src.ui.dtl.Action import Action
 from src.ui.dtl.utils import (
@@ -25,6 +23,7 @@ from src.ui.dtl.utils import (
 )
 import src.globals as g
 from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.ui.preview_images import get_preview_url, preview_cache
 
 
 loading_widget = Text("Loading...")
@@ -104,9 +103,6 @@ class Layer:
                 sidebar_width=600,
             ),
         )
-        # preview option
-        self._preview_img_path = f"{g.STATIC_DIR}/{self.id}.jpg"
-        self._preview_img_url = f"static/{self.id}.jpg"
         self._ann = None
         self._res_ann = None
         self._img_desc = None
@@ -292,6 +288,7 @@ class Layer:
         self._ann = None
         self._res_img_desc = None
         self._res_ann = None
+        preview_cache.pop(self.id)
         if self._need_preview:
             self._preview_widget.clean_up()
             self._preview_widget.hide()
@@ -321,10 +318,11 @@ class Layer:
         if not self._need_preview:
             return
         self._res_img_desc = img_desc
-        write_image(self._preview_img_path, self._res_img_desc.read_image())
+        # encoded preview is kept in memory and served by the "previews" endpoint
+        etag = preview_cache.put(self.id, self._res_img_desc.read_image())
         self._res_ann = ann
         self._preview_widget.set(
-            image_url=f"{self._preview_img_url}?q={time.time()}",
+            image_url=get_preview_url(self.id, etag),
             ann=self._res_ann,
             project_meta=project_meta,
         )
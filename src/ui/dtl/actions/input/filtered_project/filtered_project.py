@@ -2,11 +2,13 @@ from typing import Optional, List
 from os.path import realpath, dirname
 from supervisely.app.widgets import ProjectThumbnail, NodesFlow, Text, Button, Container, FastTable
 from supervisely import ProjectMeta
+from supervisely.app.content import DataJson
 
 from src.ui.dtl import SourceAction
 from src.ui.dtl.Layer import Layer
 from src.ui.dtl.utils import get_layer_docs
 import src.globals as g
+from src.entity_selection import EntitySelection
 from src.ui.widgets import ClassesListPreview, TagsListPreview
 from src.ui.dtl.utils import (
     get_text_font_size,
@@ -37,10 +39,7 @@ class FilteredProjectAction(SourceAction):
         _current_info = g.api.project.get_info_by_id(cls.project_id)
         _current_meta: ProjectMeta = ProjectMeta.from_json(g.api.project.get_meta(cls.project_id))
 
-        filtered_table_data = build_filtered_table(
-            g.api, cls.project_id, cls.filtered_entities, cls.dataset_id
-        )
-        filtered_table = FastTable(data=filtered_table_data)
+        filtered_table = FastTable()
         filtered_data_btn = Button("Close", call_on_click="closeSidebar();")
 
         filtered_data_container = Container([filtered_table, filtered_data_btn])
@@ -48,7 +47,7 @@ class FilteredProjectAction(SourceAction):
         filtered_project_text = Text("Selected Project", font_size=get_text_font_size())
         filtered_project_preview = ProjectThumbnail(
             info=_current_info,
-            description=f"{len(cls.filtered_entities)} {_current_info.type} selected via filters",
+            description=f"Selecting {_current_info.type} via filters...",
         )
         show_filtered_data_btn = Button(
             text="SHOW",
@@ -73,6 +72,26 @@ class FilteredProjectAction(SourceAction):
         )
         tags_preview = TagsListPreview([obj_class for obj_class in _current_meta.tag_metas])
 
+        def _update_filtered_data(dataset_id: Optional[int] = None):
+            filtered_table.read_pandas(
+                build_filtered_table(g.api, cls.project_id, cls.filtered_entities, dataset_id)
+            )
+            filtered_project_preview._set_info(
+                _current_info,
+                f"{len(cls.filtered_entities)} {_current_info.type} selected via filters",
+            )
+            filtered_project_preview.update_data()
+            DataJson().send_changes()
+
+        def _update_filtered_data_when_ready(dataset_id: Optional[int] = None):
+            # entities selected via filters may still be resolving in the background
+            if isinstance(cls.filtered_entities, EntitySelection):
+                cls.filtered_entities.on_ready(lambda: _update_filtered_data(dataset_id))
+            else:
+                _update_filtered_data(dataset_id)
+
+        _update_filtered_data_when_ready(cls.dataset_id)
+
         def data_changed_cb(**kwargs):
             pass
 
@@ -82,7 +101,7 @@ class FilteredProjectAction(SourceAction):
         def get_settings(options_json: dict) -> dict:
             return {
                 "project_id": cls.project_id,
-                "filtered_entities_ids": cls.filtered_entities,
+                "filtered_entities_ids": list(cls.filtered_entities),
                 "classes_mapping": "default",
                 "tags_mapping": "default",
             }
@@ -97,14 +116,15 @@ class FilteredProjectAction(SourceAction):
                 _current_meta = ProjectMeta.from_json(g.api.project.get_meta(cls.project_id))
 
             filtered_entities_ids = settings.get("filtered_entities_ids", [])
-            if len(filtered_entities_ids) > 0:
+            if isinstance(filtered_entities_ids, EntitySelection):
+                has_entities = filtered_entities_ids.has_selection
+            else:
+                has_entities = len(filtered_entities_ids) > 0
+            if has_entities:
                 cls.filtered_entities = filtered_entities_ids
 
-            if project_id is not None and len(filtered_entities_ids) > 0:
-                filtered_table_data = build_filtered_table(
-                    g.api, cls.project_id, cls.filtered_entities
-                )
-                filtered_table.read_pandas(filtered_table_data)
+            if project_id is not None and has_entities:
+                _update_filtered_data_when_ready()
 
         def create_options(src: list, dst: list, settings: dict) -> dict:
             _set_settings_from_json(settings)
@@ -18,6 +18,7 @@ def build_filtered_table(
         # for images
         all_item_infos.extend(item_list)
 
+    filtered_items_ids = set(filtered_items_ids)
     filtered_item_infos = [
         item_info for item_info in all_item_infos if item_info.id in filtered_items_ids
     ]
@@ -92,6 +92,13 @@ class ApplyNNInferenceAction(ApplyNNAction):
             resolve_conflict_method_selector,
             inf_settings_editor,
             apply_nn_methods_selector,
+            sliding_window_height_input,
+            sliding_window_width_input,
+            sliding_window_overlap_y_input,
+            sliding_window_overlap_x_input,
+            sliding_window_field,
+            roi_padding_input,
+            roi_field,
             batch_size_input,
             inf_settings_save_btn,
             inf_settings_set_default_btn,
@@ -138,6 +145,10 @@ class ApplyNNInferenceAction(ApplyNNAction):
         connect_notification = create_connect_notification_widget()
         update_preview_btn = create_preview_button_widget()
 
+        @apply_nn_methods_selector.value_changed
+        def apply_method_changed(apply_method):
+            show_apply_method_params(apply_method, sliding_window_field, roi_field)
+
         ### CONNECT TO MODEL BUTTONS
         @connect_nn_model_selector.value_changed
         def select_model_session(session_id):
@@ -499,6 +510,17 @@ class ApplyNNInferenceAction(ApplyNNAction):
                 "add_suffix_method": add_suffix_method,
                 "ignore_labeled": ignore_labeled,
                 "apply_method": apply_method,
+                "sliding_window": {
+                    "window": {
+                        "height": sliding_window_height_input.get_value(),
+                        "width": sliding_window_width_input.get_value(),
+                    },
+                    "min_overlap": {
+                        "x": sliding_window_overlap_x_input.get_value(),
+                        "y": sliding_window_overlap_y_input.get_value(),
+                    },
+                },
+                "roi": {"padding": roi_padding_input.get_value()},
                 "batch_size": batch_size,
                 "classes": saved_classes_settings,
                 "tags": saved_tags_settings,
@@ -573,6 +595,17 @@ class ApplyNNInferenceAction(ApplyNNAction):
             set_model_conflict_from_json(settings, resolve_conflict_method_selector)
             _model_settings = set_model_settings_from_json(settings, inf_settings_editor)
             set_model_apply_method_from_json(settings, apply_nn_methods_selector)
+            set_apply_method_params_from_json(
+                settings,
+                sliding_window_height_input,
+                sliding_window_width_input,
+                sliding_window_overlap_y_input,
+                sliding_window_overlap_x_input,
+                roi_padding_input,
+            )
+            show_apply_method_params(
+                apply_nn_methods_selector.get_value(), sliding_window_field, roi_field
+            )
             set_batch_size_from_json(settings, batch_size_input)
             set_model_settings_preview(
                 model_suffix_input,
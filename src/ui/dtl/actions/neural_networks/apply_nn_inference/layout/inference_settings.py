@@ -83,8 +83,8 @@ def create_inference_settings_widgets():
 
     apply_nn_selector_methods = [
         Select.Item("image", "Full Image"),
-        Select.Item("roi", "ROI defined by object BBox (Coming Soon)", disabled=True),
-        Select.Item("sliding_window", "Sliding Window (Coming Soon)", disabled=True),
+        Select.Item("roi", "ROI defined by object BBox"),
+        Select.Item("sliding_window", "Sliding Window"),
     ]
 
     apply_nn_method_text = Text("Apply Method", font_size=get_text_font_size())
@@ -94,6 +94,34 @@ def create_inference_settings_widgets():
         description="Select how you want to apply the model: to the images, to the ROI defined by object BBox or by using sliding window approach",
         content=apply_nn_methods_selector,
     )
+
+    sliding_window_height_input = InputNumber(value=640, min=1, step=1, size="small")
+    sliding_window_width_input = InputNumber(value=640, min=1, step=1, size="small")
+    sliding_window_overlap_y_input = InputNumber(value=64, min=0, step=1, size="small")
+    sliding_window_overlap_x_input = InputNumber(value=64, min=0, step=1, size="small")
+    sliding_window_field = Field(
+        title="Sliding Window",
+        description=(
+            "Window size (height, width) and minimum overlap (y, x) in pixels. "
+            "Predictions of the windows are merged with NMS"
+        ),
+        content=Container(
+            widgets=[
+                Flexbox(widgets=[sliding_window_height_input, sliding_window_width_input]),
+                Flexbox(widgets=[sliding_window_overlap_y_input, sliding_window_overlap_x_input]),
+            ]
+        ),
+    )
+    sliding_window_field.hide()
+
+    roi_padding_input = InputNumber(value=0, min=0, step=1, size="small")
+    roi_field = Field(
+        title="ROI Padding",
+        description="Pixels added to every side of the object bounding box",
+        content=roi_padding_input,
+    )
+    roi_field.hide()
+
     batch_size_input = InputNumber(value=50, min=1, max=50, step=1)
     batch_size_field = Field(
         title="Batch Size",
@@ -107,6 +135,8 @@ def create_inference_settings_widgets():
             resolve_conflict_method_field,
             inf_settings_editor_field,
             apply_nn_methods_field,
+            sliding_window_field,
+            roi_field,
             batch_size_field,
             Flexbox(
                 widgets=[
@@ -176,6 +206,13 @@ def create_inference_settings_widgets():
         resolve_conflict_method_selector,
         inf_settings_editor,
         apply_nn_methods_selector,
+        sliding_window_height_input,
+        sliding_window_width_input,
+        sliding_window_overlap_y_input,
+        sliding_window_overlap_x_input,
+        sliding_window_field,
+        roi_padding_input,
+        roi_field,
         batch_size_input,
         inf_settings_save_btn,
         inf_settings_set_default_btn,
@@ -7,6 +7,7 @@ from supervisely.app.widgets import (
     CheckboxField,
     Container,
     Editor,
+    Field,
     Input,
     InputNumber,
     ModelInfo,
@@ -64,8 +65,8 @@ def get_model_settings(
     is_deploy_connected: bool = False,
 ) -> tuple:
     try:
-        session = Session(g.api, session_id)
-        model_meta = session.get_model_meta()
+        session = g.model_sessions.get(session_id)
+        model_meta = g.model_sessions.get_model_meta(session_id)
         session_json = SessionJSON(g.api, session_id)
         model_info = session_json.get_session_info()
         model_settings = session.get_default_inference_settings()
@@ -243,10 +244,40 @@ def set_model_settings_from_json(settings: dict, inf_settings_editor: Editor) ->
 
 
 def set_model_apply_method_from_json(settings: dict, apply_nn_methods_selector: Select) -> None:
-    apply_method = settings.get("type", "image")
+    apply_method = settings.get("apply_method", settings.get("type", "image"))
     apply_nn_methods_selector.set_value(apply_method)
 
 
+def set_apply_method_params_from_json(
+    settings: dict,
+    sliding_window_height_input: InputNumber,
+    sliding_window_width_input: InputNumber,
+    sliding_window_overlap_y_input: InputNumber,
+    sliding_window_overlap_x_input: InputNumber,
+    roi_padding_input: InputNumber,
+) -> None:
+    sliding_window = settings.get("sliding_window")
+    if sliding_window is not None:
+        sliding_window_height_input.value = sliding_window["window"]["height"]
+        sliding_window_width_input.value = sliding_window["window"]["width"]
+        sliding_window_overlap_y_input.value = sliding_window["min_overlap"]["y"]
+        sliding_window_overlap_x_input.value = sliding_window["min_overlap"]["x"]
+    roi = settings.get("roi")
+    if roi is not None:
+        roi_padding_input.value = roi.get("padding", 0)
+
+
+def show_apply_method_params(apply_method: str, sliding_window_field: Field, roi_field: Field):
+    if apply_method == "sliding_window":
+        sliding_window_field.show()
+    else:
+        sliding_window_field.hide()
+    if apply_method == "roi":
+        roi_field.show()
+    else:
+        roi_field.hide()
+
+
 def set_batch_size_from_json(settings: dict, batch_size_input: InputNumber) -> None:
     batch_size = settings.get("batch_size", 50)
     batch_size_input.value = batch_size
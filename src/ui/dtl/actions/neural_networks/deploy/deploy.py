@@ -23,17 +23,6 @@ import src.globals as g
 from src.ui.dtl.Action import DeployNNAction
 from supervisely.nn.artifacts import YOLOv5v2, YOLOv8, MMDetection3, MMSegmentation, RTDETR
 
-from src.ui.dtl.actions.neural_networks.deploy.layout.pretrained_models import (
-    yolov5 as pretrained_yolov5,
-    yolov8 as pretrained_yolov8,
-    mmdetection3 as pretrained_mmdetection3,
-    mmsegmentation as pretrained_mmsegmentation,
-    rtdetr as pretrained_rtdetr,
-    rtdetrv2 as pretrained_rtdetrv2,
-    yolo as pretrained_yolo,
-    deim as pretrained_deim,
-)
-
 
 class DeployBaseAction(DeployNNAction):
     name = "deploy_base"
@@ -146,7 +135,7 @@ class DeployBaseAction(DeployNNAction):
             model_selector_stop_model_after_pipeline_checkbox,
         ) = create_model_selector_widgets(
             cls.framework_name,
-            cls.pretrained_models,
+            utils.get_pretrained_models(cls.pretrained_models_table),
             custom_models,
         )
         if cls.need_runtime_selector is False:
@@ -197,6 +186,7 @@ class DeployBaseAction(DeployNNAction):
                 utils.set_model_serve_preview("Stopping...", model_serve_preview)
                 g.api.app.stop(session.task_id)
                 g.running_sessions_ids.remove(session.task_id)
+                g.model_sessions.reset(session.task_id)
                 model_serve_btn.text = "SERVE"
                 model_serve_btn.icon = "zmdi zmdi-play"
                 model_serve_btn.enable()
@@ -234,6 +224,7 @@ class DeployBaseAction(DeployNNAction):
                 utils.set_model_serve_preview("Deploying model...", model_serve_preview)
                 utils.deploy_model(g.api, session.task_id, saved_settings, cls.train_version)
                 logger.info(f"Session ID: {session.task_id} has been deployed")
+                g.model_sessions.notify_ready(session.task_id)
 
                 app_link_message = (
                     f"Model deployed - <a href='{g.api.server_address}{g.api.app.get_url(session.task_id)}' target='_blank'>open app</a>"
@@ -354,7 +345,7 @@ class DeployYOLOV5Action(DeployBaseAction):
     framework_name = "YOLOv5"
     slug = "supervisely-ecosystem/yolov5_2.0/serve"
     artifacts = YOLOv5v2(g.TEAM_ID)
-    pretrained_models = pretrained_yolov5
+    pretrained_models_table = "yolov5"
 
 
 class DeployYOLOV8Action(DeployBaseAction):
@@ -370,7 +361,7 @@ class DeployYOLOV8Action(DeployBaseAction):
     framework_name = "YOLOv8"
     slug = "supervisely-ecosystem/yolov8/serve"
     artifacts = YOLOv8(g.TEAM_ID)
-    pretrained_models = pretrained_yolov8
+    pretrained_models_table = "yolov8"
 
 
 class DeployYOLOAction(DeployBaseAction):
@@ -385,7 +376,7 @@ class DeployYOLOAction(DeployBaseAction):
     framework_name = "YOLO"
     slug = "supervisely-ecosystem/yolo/supervisely_integration/serve"
     artifacts = None
-    pretrained_models = pretrained_yolo
+    pretrained_models_table = "yolo"
     need_runtime_selector = True
 
 
@@ -401,7 +392,7 @@ class DeployMMDetectionAction(DeployBaseAction):
     framework_name = "MMDetection"
     slug = "supervisely-ecosystem/serve-mmdetection-v3"
     artifacts = MMDetection3(g.TEAM_ID)
-    pretrained_models = pretrained_mmdetection3
+    pretrained_models_table = "mmdetection3"
 
 
 class DeployMMSegmentationAction(DeployBaseAction):
@@ -418,7 +409,7 @@ class DeployMMSegmentationAction(DeployBaseAction):
     framework_name = "MMSegmentation"
     slug = "supervisely-ecosystem/mmsegmentation/serve"
     artifacts = MMSegmentation(g.TEAM_ID)
-    pretrained_models = pretrained_mmsegmentation
+    pretrained_models_table = "mmsegmentation"
 
 
 class DeployRTDETRAction(DeployBaseAction):
@@ -433,7 +424,7 @@ class DeployRTDETRAction(DeployBaseAction):
     framework_name = "RT-DETR"
     slug = "supervisely-ecosystem/rt-detr/supervisely_integration/serve"
     artifacts = RTDETR(g.TEAM_ID)
-    pretrained_models = pretrained_rtdetr
+    pretrained_models_table = "rtdetr"
     need_runtime_selector = True
 
 
@@ -449,7 +440,7 @@ class DeployRTDETRv2Action(DeployBaseAction):
     framework_name = "RT-DETRv2"
     slug = "supervisely-ecosystem/rt-detrv2/supervisely_integration/serve"
     artifacts = None
-    pretrained_models = pretrained_rtdetrv2
+    pretrained_models_table = "rtdetrv2"
     need_runtime_selector = True
 
 
@@ -465,5 +456,5 @@ class DeployDEIMAction(DeployBaseAction):
     framework_name = "DEIM"
     slug = "supervisely-ecosystem/deim/supervisely_integration/serve"
     artifacts = None
-    pretrained_models = pretrained_deim
+    pretrained_models_table = "deim"
     need_runtime_selector = True
@@ -1,14953 +0,0 @@
-yolov5 = [
-    {
-        "Model": "YOLOv5nu",
-        "Size (pixels)": "640",
-        "mAP": "34.3",
-        "params (M)": "2.6",
-        "FLOPs (B)": "7.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5nu.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5su",
-        "Size (pixels)": "640",
-        "mAP": "43.0",
-        "params (M)": "9.1",
-        "FLOPs (B)": "24.0",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5su.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5mu",
-        "Size (pixels)": "640",
-        "mAP": "59.0",
-        "params (M)": "25.1",
-        "FLOPs (B)": "64.2",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5mu.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5lu",
-        "Size (pixels)": "640",
-        "mAP": "52.2",
-        "params (M)": "43.2",
-        "FLOPs (B)": "135.0",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5lu.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5xu",
-        "Size (pixels)": "640",
-        "mAP": "53.2",
-        "params (M)": "97.2",
-        "FLOPs (B)": "246.4",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5xu.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5n6u",
-        "Size (pixels)": "1280",
-        "mAP": "42.1",
-        "params (M)": "4.3",
-        "FLOPs (B)": "7.8",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5n6u.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5s6u",
-        "Size (pixels)": "1280",
-        "mAP": "48.6",
-        "params (M)": "15.3",
-        "FLOPs (B)": "24.6",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5s6u.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5m6u",
-        "Size (pixels)": "1280",
-        "mAP": "53.6",
-        "params (M)": "41.2",
-        "FLOPs (B)": "65.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5m6u.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5l6u",
-        "Size (pixels)": "1280",
-        "mAP": "55.7",
-        "params (M)": "86.1",
-        "FLOPs (B)": "137.4",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5l6u.pt",
-        },
-    },
-    {
-        "Model": "YOLOv5x6u",
-        "Size (pixels)": "1280",
-        "mAP": "56.8",
-        "params (M)": "155.4",
-        "FLOPs (B)": "250.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov5x6u.pt",
-        },
-    },
-]
-
-yolov8 = [
-    {
-        "Model": "YOLOv8n-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "37.3",
-        "params (M)": "3.2",
-        "FLOPs (B)": "8.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8n.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8n-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "18.4",
-        "params (M)": "3.5",
-        "FLOPs (B)": "10.5",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8n-oiv7.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8s-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "44.9",
-        "params (M)": "11.2",
-        "FLOPs (B)": "28.6",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8s.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8s-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "27.7",
-        "params (M)": "11.4",
-        "FLOPs (B)": "29.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8s-oiv7.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8m-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "50.2",
-        "params (M)": "25.9",
-        "FLOPs (B)": "78.9",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8m.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8m-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "33.6",
-        "params (M)": "26.2",
-        "FLOPs (B)": "80.6",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8m-oiv7.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8l-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "52.9",
-        "params (M)": "43.7",
-        "FLOPs (B)": "165.2",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8l.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8l-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "34.9",
-        "params (M)": "44.1",
-        "FLOPs (B)": "167.4",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8l-oiv7.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8x-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "53.9",
-        "params (M)": "68.2",
-        "FLOPs (B)": "257.8",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8x.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8x-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "36.3",
-        "params (M)": "68.7",
-        "FLOPs (B)": "260.6",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8x-oiv7.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8n-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "36.7",
-        "mAP (mask)": "30.5",
-        "params (M)": "3.4",
-        "FLOPs (B)": "12.6",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8n-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8s-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "44.6",
-        "mAP (mask)": "36.8",
-        "params (M)": "11.8",
-        "FLOPs (B)": "42.6",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8s-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8m-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "49.9",
-        "mAP (mask)": "40.8",
-        "params (M)": "27.3",
-        "FLOPs (B)": "110.2",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8m-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8l-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "52.3",
-        "mAP (mask)": "42.6",
-        "params (M)": "46.0",
-        "FLOPs (B)": "220.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8l-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8x-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "53.4",
-        "mAP (mask)": "43.4",
-        "params (M)": "71.8",
-        "FLOPs (B)": "344.1",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8x-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8n-pose",
-        "Size (pixels)": "640",
-        "mAP": "50.4",
-        "params (M)": "3.3",
-        "FLOPs (B)": "9.2",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8n-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8s-pose",
-        "Size (pixels)": "640",
-        "mAP": "60.0",
-        "params (M)": "11.6",
-        "FLOPs (B)": "30.2",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8s-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8m-pose",
-        "Size (pixels)": "640",
-        "mAP": "65.0",
-        "params (M)": "26.4",
-        "FLOPs (B)": "81.0",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8m-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8l-pose",
-        "Size (pixels)": "640",
-        "mAP": "67.6",
-        "params (M)": "44.4",
-        "FLOPs (B)": "168.6",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8l-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8x-pose",
-        "Size (pixels)": "640",
-        "mAP": "69.2",
-        "params (M)": "69.4",
-        "FLOPs (B)": "263.2",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8x-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLOv8x-pose-p6",
-        "Size (pixels)": "640",
-        "mAP": "71.6",
-        "params (M)": "99.1",
-        "FLOPs (B)": "1066.4",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/YOLOv8x-pose-p6.pt",
-        },
-    },
-    {
-        "Model": "YOLOv9c-det",
-        "Size (pixels)": "640",
-        "mAP": "53.0",
-        "params (M)": "25.5",
-        "FLOPs (B)": "102.8",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9c.pt",
-        },
-    },
-    {
-        "Model": "YOLOv9e-det",
-        "Size (pixels)": "640",
-        "mAP": "55.6",
-        "params (M)": "58.1",
-        "FLOPs (B)": "192.5",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9e.pt",
-        },
-    },
-    {
-        "Model": "YOLOv9c-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "52.4",
-        "mAP (mask)": "42.2",
-        "params (M)": "27.9",
-        "FLOPs (B)": "159.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9c-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv9e-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "55.1",
-        "mAP (mask)": "44.3",
-        "params (M)": "60.5",
-        "FLOPs (B)": "248.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9e-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLOv10n-det",
-        "Size (pixels)": "640",
-        "mAP": "39.5",
-        "params (M)": "2.3",
-        "FLOPs (B)": "6.7",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10n.pt",
-        },
-    },
-    {
-        "Model": "YOLOv10s-det",
-        "Size (pixels)": "640",
-        "mAP": "46.8",
-        "params (M)": "7.2",
-        "FLOPs (B)": "21.6",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10s.pt",
-        },
-    },
-    {
-        "Model": "YOLOv10m-det",
-        "Size (pixels)": "640",
-        "mAP": "51.3",
-        "params (M)": "15.4",
-        "FLOPs (B)": "59.1",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10m.pt",
-        },
-    },
-    {
-        "Model": "YOLOv10l-det",
-        "Size (pixels)": "640",
-        "mAP": "53.4",
-        "params (M)": "24.4",
-        "FLOPs (B)": "120.3",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10l.pt",
-        },
-    },
-    {
-        "Model": "YOLOv10x-det",
-        "Size (pixels)": "640",
-        "mAP": "54.4",
-        "params (M)": "29.5",
-        "FLOPs (B)": "160.4",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10x.pt",
-        },
-    },
-    {
-        "Model": "YOLO11n-det",
-        "Size (pixels)": "640",
-        "mAP": "39.5",
-        "params (M)": "2.6",
-        "FLOPs (B)": "6.5",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n.pt",
-        },
-    },
-    {
-        "Model": "YOLO11s-det",
-        "Size (pixels)": "640",
-        "mAP": "47.0",
-        "params (M)": "9.4",
-        "FLOPs (B)": "21.5",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11s.pt",
-        },
-    },
-    {
-        "Model": "YOLO11m-det",
-        "Size (pixels)": "640",
-        "mAP": "51.5",
-        "params (M)": "20.1",
-        "FLOPs (B)": "68.0",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11m.pt",
-        },
-    },
-    {
-        "Model": "YOLO11l-det",
-        "Size (pixels)": "640",
-        "mAP": "53.4",
-        "params (M)": "25.3",
-        "FLOPs (B)": "86.9",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11l.pt",
-        },
-    },
-    {
-        "Model": "YOLO11x-det",
-        "Size (pixels)": "640",
-        "mAP": "54.7",
-        "params (M)": "56.9",
-        "FLOPs (B)": "194.9",
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11x.pt",
-        },
-    },
-    {
-        "Model": "YOLO11n-pose",
-        "Size (pixels)": "640",
-        "mAP": "50.0",
-        "params (M)": "2.9",
-        "FLOPs (B)": "7.6",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLO11s-pose",
-        "Size (pixels)": "640",
-        "mAP": "58.9",
-        "params (M)": "9.9",
-        "FLOPs (B)": "23.2",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11s-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLO11m-pose",
-        "Size (pixels)": "640",
-        "mAP": "64.9",
-        "params (M)": "20.9",
-        "FLOPs (B)": "71.7",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11m-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLO11l-pose",
-        "Size (pixels)": "640",
-        "mAP": "66.1",
-        "params (M)": "26.2",
-        "FLOPs (B)": "90.7",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11l-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLO11x-pose",
-        "Size (pixels)": "640",
-        "mAP": "69.5",
-        "params (M)": "58.8",
-        "FLOPs (B)": "203.3",
-        "meta": {
-            "task_type": "pose estimation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11x-pose.pt",
-        },
-    },
-    {
-        "Model": "YOLO11n-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "38.9",
-        "mAP (mask)": "32.0",
-        "params (M)": "2.9",
-        "FLOPs (B)": "10.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLO11s-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "46.6",
-        "mAP (mask)": "37.8",
-        "params (M)": "10.1",
-        "FLOPs (B)": "35.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11s-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLO11m-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "51.5",
-        "mAP (mask)": "41.5",
-        "params (M)": "22.4",
-        "FLOPs (B)": "123.3",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11m-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLO11l-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "53.4",
-        "mAP (mask)": "42.9",
-        "params (M)": "27.6",
-        "FLOPs (B)": "142.2",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11l-seg.pt",
-        },
-    },
-    {
-        "Model": "YOLO11x-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "54.7",
-        "mAP (mask)": "43.8",
-        "params (M)": "62.1",
-        "FLOPs (B)": "319.0",
-        "meta": {
-            "task_type": "instance segmentation",
-            "weights_url": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11x-seg.pt",
-        },
-    },
-]
-
-mmdetection3 = [
-    {
-        "Model": "dino-4scale_r50_8xb2-12e_coco.py",
-        "Method": "DINO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 49.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DINO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dino",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/dino/dino-4scale_r50_8xb2-12e_coco/dino-4scale_r50_8xb2-12e_coco_20221202_182705-55b2bba2.pth",
-            "config_url": "configs/dino/dino-4scale_r50_8xb2-12e_coco.py",
-        },
-    },
-    {
-        "Model": "dino-5scale_swin-l_8xb2-12e_coco.py",
-        "Method": "DINO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 57.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DINO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dino",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/dino/dino-5scale_swin-l_8xb2-12e_coco/dino-5scale_swin-l_8xb2-12e_coco_20230228_072924-a654145f.pth",
-            "config_url": "configs/dino/dino-5scale_swin-l_8xb2-12e_coco.py",
-        },
-    },
-    {
-        "Model": "dino-5scale_swin-l_8xb2-36e_coco.py",
-        "Method": "DINO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 58.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DINO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dino",
-            "weights_url": "https://github.com/RistoranteRist/mmlab-weights/releases/download/dino-swinl/dino-5scale_swin-l_8xb2-36e_coco-5486e051.pth",
-            "config_url": "configs/dino/dino-5scale_swin-l_8xb2-36e_coco.py",
-        },
-    },
-    {
-        "Model": "dab-detr_r50_8xb2-50e_coco.py",
-        "Method": "DAB-DETR",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 50,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 42.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DAB-DETR",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dab_detr",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/dab_detr/dab-detr_r50_8xb2-50e_coco/dab-detr_r50_8xb2-50e_coco_20221122_120837-c1035c8c.pth",
-            "config_url": "configs/dab_detr/dab-detr_r50_8xb2-50e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet_tiny_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 11.7,
-        "Dataset": "COCO",
-        "box AP": 40.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet_tiny_8xb32-300e_coco/rtmdet_tiny_8xb32-300e_coco_20220902_112414-78e30dcc.pth",
-            "config_url": "configs/rtmdet/rtmdet_tiny_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet_s_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 15.9,
-        "Dataset": "COCO",
-        "box AP": 44.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet_s_8xb32-300e_coco/rtmdet_s_8xb32-300e_coco_20220905_161602-387a891e.pth",
-            "config_url": "configs/rtmdet/rtmdet_s_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet_m_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 27.8,
-        "Dataset": "COCO",
-        "box AP": 49.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet_m_8xb32-300e_coco/rtmdet_m_8xb32-300e_coco_20220719_112220-229f527c.pth",
-            "config_url": "configs/rtmdet/rtmdet_m_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet_l_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 43.2,
-        "Dataset": "COCO",
-        "box AP": 51.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet_l_8xb32-300e_coco/rtmdet_l_8xb32-300e_coco_20220719_112030-5a0be7c4.pth",
-            "config_url": "configs/rtmdet/rtmdet_l_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet_x_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 61.1,
-        "Dataset": "COCO",
-        "box AP": 52.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet_x_8xb32-300e_coco/rtmdet_x_8xb32-300e_coco_20220715_230555-cc79b9ae.pth",
-            "config_url": "configs/rtmdet/rtmdet_x_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvt-t_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.5,
-        "Dataset": "COCO",
-        "box AP": 36.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvt-t_fpn_1x_coco/retinanet_pvt-t_fpn_1x_coco_20210831_103110-17b566bd.pth",
-            "config_url": "configs/pvt/retinanet_pvt-t_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvt-s_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 14.5,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvt-s_fpn_1x_coco/retinanet_pvt-s_fpn_1x_coco_20210906_142921-b6c94a5b.pth",
-            "config_url": "configs/pvt/retinanet_pvt-s_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvt-m_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 20.9,
-        "Dataset": "COCO",
-        "box AP": 41.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvt-m_fpn_1x_coco/retinanet_pvt-m_fpn_1x_coco_20210831_103243-55effa1b.pth",
-            "config_url": "configs/pvt/retinanet_pvt-m_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b0_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.4,
-        "Dataset": "COCO",
-        "box AP": 37.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b0_fpn_1x_coco/retinanet_pvtv2-b0_fpn_1x_coco_20210831_103157-13e9aabe.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b0_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b1_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.5,
-        "Dataset": "COCO",
-        "box AP": 41.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b1_fpn_1x_coco/retinanet_pvtv2-b1_fpn_1x_coco_20210831_103318-7e169a7d.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b1_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b2_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 16.2,
-        "Dataset": "COCO",
-        "box AP": 44.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b2_fpn_1x_coco/retinanet_pvtv2-b2_fpn_1x_coco_20210901_174843-529f0b9a.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b2_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b3_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 23.0,
-        "Dataset": "COCO",
-        "box AP": 46.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b3_fpn_1x_coco/retinanet_pvtv2-b3_fpn_1x_coco_20210903_151512-8357deff.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b3_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b4_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 17.0,
-        "Dataset": "COCO",
-        "box AP": 46.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b4_fpn_1x_coco/retinanet_pvtv2-b4_fpn_1x_coco_20210901_170151-83795c86.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b4_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_pvtv2-b5_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 18.7,
-        "Dataset": "COCO",
-        "box AP": 46.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PVT: Pyramid Vision Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/pvt",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/pvt/retinanet_pvtv2-b5_fpn_1x_coco/retinanet_pvtv2-b5_fpn_1x_coco_20210902_201800-3420eb57.pth",
-            "config_url": "configs/pvt/retinanet_pvtv2-b5_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "atss_r50-caffe_fpn_dyhead_1x_coco",
-        "Method": "DyHead",
-        "Inference Time (ms/im)": 75.7,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.4,
-        "Dataset": "COCO",
-        "box AP": 42.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DyHead",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dyhead",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/dyhead/atss_r50_fpn_dyhead_for_reproduction_1x_coco/atss_r50_fpn_dyhead_for_reproduction_4x4_1x_coco_20220107_213939-162888e6.pth",
-            "config_url": "configs/dyhead/atss_r50-caffe_fpn_dyhead_1x_coco.py",
-        },
-    },
-    {
-        "Model": "atss_r50_fpn_dyhead_1x_coco",
-        "Method": "DyHead",
-        "Inference Time (ms/im)": 73.1,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.9,
-        "Dataset": "COCO",
-        "box AP": 43.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DyHead",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dyhead",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/dyhead/atss_r50_fpn_dyhead_4x4_1x_coco/atss_r50_fpn_dyhead_4x4_1x_coco_20211219_023314-eaa620c6.pth",
-            "config_url": "configs/dyhead/atss_r50_fpn_dyhead_1x_coco.py",
-        },
-    },
-    {
-        "Model": "atss_swin-l-p4-w12_fpn_dyhead_ms-2x_coco",
-        "Method": "DyHead",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 58.4,
-        "Dataset": "COCO",
-        "box AP": 56.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DyHead",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dyhead",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/dyhead/atss_swin-l-p4-w12_fpn_dyhead_mstrain_2x_coco/atss_swin-l-p4-w12_fpn_dyhead_mstrain_2x_coco_20220509_100315-bc5b6516.pth",
-            "config_url": "configs/dyhead/atss_swin-l-p4-w12_fpn_dyhead_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "ddod_r50_fpn_1x_coco",
-        "Method": "DDOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.4,
-        "Dataset": "COCO",
-        "box AP": 41.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DDOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ddod",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ddod/ddod_r50_fpn_1x_coco/ddod_r50_fpn_1x_coco_20220523_223737-29b2fc67.pth",
-            "config_url": "configs/ddod/ddod_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "lad_r101-paa-r50_fpn_2xb8_coco_1x",
-        "Method": "Label Assignment Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 12.4,
-        "Dataset": "COCO",
-        "box AP": 43.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LAD: Label Assignment Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/lad",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/lad/lad_r101_paa_r50_fpn_coco_1x/lad_r101_paa_r50_fpn_coco_1x_20220708_124357-9407ac54.pth",
-            "config_url": "configs/lad/lad_r101-paa-r50_fpn_2xb8_coco_1x.py",
-        },
-    },
-    {
-        "Model": "lad_r50-paa-r101_fpn_2xb8_coco_1x",
-        "Method": "Label Assignment Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.9,
-        "Dataset": "COCO",
-        "box AP": 41.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LAD: Label Assignment Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/lad",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/lad/lad_r50_paa_r101_fpn_coco_1x/lad_r50_paa_r101_fpn_coco_1x_20220708_124246-74c76ff0.pth",
-            "config_url": "configs/lad/lad_r50-paa-r101_fpn_2xb8_coco_1x.py",
-        },
-    },
-    {
-        "Model": "ld_r18-gflv1-r101_fpn_1x_coco",
-        "Method": "Localization Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 1.8,
-        "Dataset": "COCO",
-        "box AP": 36.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LD: Localization Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ld",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ld/ld_r18_gflv1_r101_fpn_coco_1x/ld_r18_gflv1_r101_fpn_coco_1x_20220702_062206-330e6332.pth",
-            "config_url": "configs/ld/ld_r18-gflv1-r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ld_r34-gflv1-r101_fpn_1x_coco",
-        "Method": "Localization Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 2.2,
-        "Dataset": "COCO",
-        "box AP": 39.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LD: Localization Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ld",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ld/ld_r34_gflv1_r101_fpn_coco_1x/ld_r34_gflv1_r101_fpn_coco_1x_20220630_134007-9bc69413.pth",
-            "config_url": "configs/ld/ld_r34-gflv1-r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ld_r50-gflv1-r101_fpn_1x_coco",
-        "Method": "Localization Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.6,
-        "Dataset": "COCO",
-        "box AP": 41.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LD: Localization Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ld",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ld/ld_r50_gflv1_r101_fpn_coco_1x/ld_r50_gflv1_r101_fpn_coco_1x_20220629_145355-8dc5bad8.pth",
-            "config_url": "configs/ld/ld_r50-gflv1-r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ld_r101-gflv1-r101-dcn_fpn_2x_coco",
-        "Method": "Localization Distillation",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 45.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "LD: Localization Distillation",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ld",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ld/ld_r101_gflv1_r101dcn_fpn_coco_2x/ld_r101_gflv1_r101dcn_fpn_coco_2x_20220629_185920-9e658426.pth",
-            "config_url": "configs/ld/ld_r101-gflv1-r101-dcn_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "crowddet-rcnn_refine_r50_fpn_8xb2-30e_crowdhuman",
-        "Method": "CrowdDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 30,
-        "Memory (Training, GB)": 4.8,
-        "Dataset": "CrowdHuman",
-        "box AP": 90.32,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CrowdDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/crowddet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/crowddet/crowddet-rcnn_refine_r50_fpn_8xb2-30e_crowdhuman/crowddet-rcnn_refine_r50_fpn_8xb2-30e_crowdhuman_20221024_215917-45602806.pth",
-            "config_url": "configs/crowddet/crowddet-rcnn_refine_r50_fpn_8xb2-30e_crowdhuman.py",
-        },
-    },
-    {
-        "Model": "crowddet-rcnn_r50_fpn_8xb2-30e_crowdhuman",
-        "Method": "CrowdDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 30,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "CrowdHuman",
-        "box AP": 90.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CrowdDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/crowddet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/crowddet/crowddet-rcnn_r50_fpn_8xb2-30e_crowdhuman/crowddet-rcnn_r50_fpn_8xb2-30e_crowdhuman_20221023_174954-dc319c2d.pth",
-            "config_url": "configs/crowddet/crowddet-rcnn_r50_fpn_8xb2-30e_crowdhuman.py",
-        },
-    },
-    {
-        "Model": "tood_r101_fpn_ms-2x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "box AP": 46.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_r101_fpn_mstrain_2x_coco/tood_r101_fpn_mstrain_2x_coco_20211210_144232-a18f53c8.pth",
-            "config_url": "configs/tood/tood_r101_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "tood_x101-64x4d_fpn_ms-2x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 10.2,
-        "Dataset": "COCO",
-        "box AP": 47.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_x101_64x4d_fpn_mstrain_2x_coco/tood_x101_64x4d_fpn_mstrain_2x_coco_20211211_003519-a4f36113.pth",
-            "config_url": "configs/tood/tood_x101-64x4d_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "tood_r101-dconv-c3-c5_fpn_ms-2x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 6.2,
-        "Dataset": "COCO",
-        "box AP": 49.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_r101_fpn_dconv_c3-c5_mstrain_2x_coco/tood_r101_fpn_dconv_c3-c5_mstrain_2x_coco_20211210_213728-4a824142.pth",
-            "config_url": "configs/tood/tood_r101-dconv-c3-c5_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "tood_r50_fpn_anchor-based_1x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.1,
-        "Dataset": "COCO",
-        "box AP": 42.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_r50_fpn_anchor_based_1x_coco/tood_r50_fpn_anchor_based_1x_coco_20211214_100105-b776c134.pth",
-            "config_url": "configs/tood/tood_r50_fpn_anchor-based_1x_coco.py",
-        },
-    },
-    {
-        "Model": "tood_r50_fpn_1x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.1,
-        "Dataset": "COCO",
-        "box AP": 42.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_r50_fpn_1x_coco/tood_r50_fpn_1x_coco_20211210_103425-20e20746.pth",
-            "config_url": "configs/tood/tood_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "tood_r50_fpn_ms-2x_coco",
-        "Method": "TOOD",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 4.1,
-        "Dataset": "COCO",
-        "box AP": 44.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TOOD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tood",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tood/tood_r50_fpn_mstrain_2x_coco/tood_r50_fpn_mstrain_2x_coco_20211210_144231-3b23174c.pth",
-            "config_url": "configs/tood/tood_r50_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "deformable-detr_r50_16xb2-50e_coco",
-        "Method": "Deformable DETR",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 50,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 44.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Deformable DETR",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/deformable_detr",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/deformable_detr/deformable-detr_r50_16xb2-50e_coco/deformable-detr_r50_16xb2-50e_coco_20221029_210934-6bc7d21b.pth",
-            "config_url": "configs/deformable_detr/deformable-detr_r50_16xb2-50e_coco.py",
-        },
-    },
-    {
-        "Model": "deformable-detr_refine_r50_16xb2-50e_coco",
-        "Method": "Deformable DETR",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 50,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 46.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Deformable DETR",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/deformable_detr",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/deformable_detr/deformable-detr-refine_r50_16xb2-50e_coco/deformable-detr-refine_r50_16xb2-50e_coco_20221022_225303-844e0f93.pth",
-            "config_url": "configs/deformable_detr/deformable-detr-refine_r50_16xb2-50e_coco.py",
-        },
-    },
-    {
-        "Model": "deformable-detr_refine_twostage_r50_16xb2-50e_coco",
-        "Method": "Deformable DETR",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 50,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 47.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Deformable DETR",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/deformable_detr",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/deformable_detr/deformable-detr-refine-twostage_r50_16xb2-50e_coco/deformable-detr-refine-twostage_r50_16xb2-50e_coco_20221021_184714-acc8a5ff.pth",
-            "config_url": "configs/deformable_detr/deformable-detr-refine-twostage_r50_16xb2-50e_coco.py",
-        },
-    },
-    {
-        "Model": "yolox_s_8x8_300e_coco",
-        "Method": "YOLOX",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "box AP": 40.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOX",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolox/yolox_s_8x8_300e_coco/yolox_s_8x8_300e_coco_20211121_095711-4592a793.pth",
-            "config_url": "configs/yolox/yolox_s_8xb8-300e_coco.py",
-        },
-    },
-    {
-        "Model": "yolox_l_8x8_300e_coco",
-        "Method": "YOLOX",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 19.9,
-        "Dataset": "COCO",
-        "box AP": 49.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOX",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolox/yolox_l_8x8_300e_coco/yolox_l_8x8_300e_coco_20211126_140236-d3bd2b23.pth",
-            "config_url": "configs/yolox/yolox_l_8xb8-300e_coco.py",
-        },
-    },
-    {
-        "Model": "yolox_x_8x8_300e_coco",
-        "Method": "YOLOX",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 28.1,
-        "Dataset": "COCO",
-        "box AP": 50.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOX",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolox/yolox_x_8x8_300e_coco/yolox_x_8x8_300e_coco_20211126_140254-1ef88d67.pth",
-            "config_url": "configs/yolox/yolox_x_8xb8-300e_coco.py",
-        },
-    },
-    {
-        "Model": "yolox_tiny_8x8_300e_coco",
-        "Method": "YOLOX",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 3.5,
-        "Dataset": "COCO",
-        "box AP": 32.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOX",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolox/yolox_tiny_8x8_300e_coco/yolox_tiny_8x8_300e_coco_20211124_171234-b4047906.pth",
-            "config_url": "configs/yolox/yolox_tiny_8xb8-300e_coco.py",
-        },
-    },
-    {
-        "Model": "yolof_r50_c5_8x8_1x_coco",
-        "Method": "YOLOF",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.3,
-        "Dataset": "COCO",
-        "box AP": 37.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOF",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolof",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolof/yolof_r50_c5_8x8_1x_coco/yolof_r50_c5_8x8_1x_coco_20210425_024427-8e864411.pth",
-            "config_url": "configs/yolof/yolof_r50-c5_8xb8-1x_coco.py",
-        },
-    },
-    {
-        "Model": "sparse-rcnn_r50_fpn_1x_coco",
-        "Method": "Sparse R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Sparse R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sparse_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sparse_rcnn/sparse_rcnn_r50_fpn_1x_coco/sparse_rcnn_r50_fpn_1x_coco_20201222_214453-dc79b137.pth",
-            "config_url": "configs/sparse_rcnn/sparse-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sparse-rcnn_r50_fpn_ms-480-800-3x_coco",
-        "Method": "Sparse R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 42.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Sparse R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sparse_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sparse_rcnn/sparse_rcnn_r50_fpn_mstrain_480-800_3x_coco/sparse_rcnn_r50_fpn_mstrain_480-800_3x_coco_20201218_154234-7bc5c054.pth",
-            "config_url": "configs/sparse_rcnn/sparse-rcnn_r50_fpn_ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "sparse-rcnn_r50_fpn_300-proposals_crop-ms-480-800-3x_coco",
-        "Method": "Sparse R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 45.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Sparse R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sparse_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sparse_rcnn/sparse_rcnn_r50_fpn_300_proposals_crop_mstrain_480-800_3x_coco/sparse_rcnn_r50_fpn_300_proposals_crop_mstrain_480-800_3x_coco_20201223_024605-9fe92701.pth",
-            "config_url": "configs/sparse_rcnn/sparse-rcnn_r50_fpn_300-proposals_crop-ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "sparse-rcnn_r101_fpn_ms-480-800-3x_coco",
-        "Method": "Sparse R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 44.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Sparse R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sparse_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sparse_rcnn/sparse_rcnn_r101_fpn_mstrain_480-800_3x_coco/sparse_rcnn_r101_fpn_mstrain_480-800_3x_coco_20201223_121552-6c46c9d6.pth",
-            "config_url": "configs/sparse_rcnn/sparse-rcnn_r101_fpn_ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "sparse-rcnn_r101_fpn_300-proposals_crop-ms-480-800-3x_coco",
-        "Method": "Sparse R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 46.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Sparse R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sparse_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sparse_rcnn/sparse_rcnn_r101_fpn_300_proposals_crop_mstrain_480-800_3x_coco/sparse_rcnn_r101_fpn_300_proposals_crop_mstrain_480-800_3x_coco_20201223_023452-c23c3564.pth",
-            "config_url": "configs/sparse_rcnn/sparse-rcnn_r101_fpn_300-proposals_crop-ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r50_fpn_1x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 41.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r50_fpn_1x_coco/vfnet_r50_fpn_1x_coco_20201027-38db6f58.pth",
-            "config_url": "configs/vfnet/vfnet_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r50_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 44.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r50_fpn_mstrain_2x_coco/vfnet_r50_fpn_mstrain_2x_coco_20201027-7cc75bd2.pth",
-            "config_url": "configs/vfnet/vfnet_r50_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r50-mdconv-c3-c5_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 48.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r50_fpn_mdconv_c3-c5_mstrain_2x_coco/vfnet_r50_fpn_mdconv_c3-c5_mstrain_2x_coco_20201027pth-6879c318.pth",
-            "config_url": "configs/vfnet/vfnet_r50-mdconv-c3-c5_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r101_fpn_1x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 43.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r101_fpn_1x_coco/vfnet_r101_fpn_1x_coco_20201027pth-c831ece7.pth",
-            "config_url": "configs/vfnet/vfnet_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r101_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 46.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r101_fpn_mstrain_2x_coco/vfnet_r101_fpn_mstrain_2x_coco_20201027pth-4a5d53f1.pth",
-            "config_url": "configs/vfnet/vfnet_r101_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_r101-mdconv-c3-c5_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 49.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_r101_fpn_mdconv_c3-c5_mstrain_2x_coco/vfnet_r101_fpn_mdconv_c3-c5_mstrain_2x_coco_20201027pth-7729adb5.pth",
-            "config_url": "configs/vfnet/vfnet_r101-mdconv-c3-c5_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_x101-32x4d-mdconv-c3-c5_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 50.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_x101_32x4d_fpn_mdconv_c3-c5_mstrain_2x_coco/vfnet_x101_32x4d_fpn_mdconv_c3-c5_mstrain_2x_coco_20201027pth-d300a6fc.pth",
-            "config_url": "configs/vfnet/vfnet_x101-32x4d-mdconv-c3-c5_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "vfnet_x101-64x4d-mdconv-c3-c5_fpn_ms-2x_coco",
-        "Method": "VFNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 50.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "VarifocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/vfnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/vfnet/vfnet_x101_64x4d_fpn_mdconv_c3-c5_mstrain_2x_coco/vfnet_x101_64x4d_fpn_mdconv_c3-c5_mstrain_2x_coco_20201027pth-b5f6da5e.pth",
-            "config_url": "configs/vfnet/vfnet_x101-64x4d-mdconv-c3-c5_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r50_fpn_1x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r50_fpn_1x_coco/paa_r50_fpn_1x_coco_20200821-936edec3.pth",
-            "config_url": "configs/paa/paa_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r50_fpn_1.5x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 18,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 41.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r50_fpn_1.5x_coco/paa_r50_fpn_1.5x_coco_20200823-805d6078.pth",
-            "config_url": "configs/paa/paa_r50_fpn_1.5x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r50_fpn_2x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 41.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r50_fpn_2x_coco/paa_r50_fpn_2x_coco_20200821-c98bfc4e.pth",
-            "config_url": "configs/paa/paa_r50_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r50_fpn_mstrain_3x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 43.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r50_fpn_mstrain_3x_coco/paa_r50_fpn_mstrain_3x_coco_20210121_145722-06a6880b.pth",
-            "config_url": "configs/paa/paa_r50_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r101_fpn_1x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.2,
-        "Dataset": "COCO",
-        "box AP": 42.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r101_fpn_1x_coco/paa_r101_fpn_1x_coco_20200821-0a1825a4.pth",
-            "config_url": "configs/paa/paa_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r101_fpn_2x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 6.2,
-        "Dataset": "COCO",
-        "box AP": 43.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r101_fpn_2x_coco/paa_r101_fpn_2x_coco_20200821-6829f96b.pth",
-            "config_url": "configs/paa/paa_r101_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "paa_r101_fpn_mstrain_3x_coco",
-        "Method": "PAA",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 6.2,
-        "Dataset": "COCO",
-        "box AP": 45.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "PAA",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/paa",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/paa/paa_r101_fpn_mstrain_3x_coco/paa_r101_fpn_mstrain_3x_coco_20210122_084202-83250d22.pth",
-            "config_url": "configs/paa/paa_r101_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "detr_r50_8xb2-150e_coco",
-        "Method": "DETR",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 150,
-        "Memory (Training, GB)": 7.9,
-        "Dataset": "COCO",
-        "box AP": 39.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DETR",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detr",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/detr/detr_r50_8xb2-150e_coco/detr_r50_8xb2-150e_coco_20221023_153551-436d03e8.pth",
-            "config_url": "configs/detr/detr_r50_8xb2-150e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r50-rfp_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.5,
-        "Dataset": "COCO",
-        "box AP": 44.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/cascade_rcnn_r50_rfp_1x_coco/cascade_rcnn_r50_rfp_1x_coco-8cf51bfd.pth",
-            "config_url": "configs/detectors/cascade-rcnn_r50-rfp_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r50-sac_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.6,
-        "Dataset": "COCO",
-        "box AP": 45.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/cascade_rcnn_r50_sac_1x_coco/cascade_rcnn_r50_sac_1x_coco-24bfda62.pth",
-            "config_url": "configs/detectors/cascade-rcnn_r50-sac_1x_coco.py",
-        },
-    },
-    {
-        "Model": "detectors_cascade-rcnn_r50_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.9,
-        "Dataset": "COCO",
-        "box AP": 47.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/detectors_cascade_rcnn_r50_1x_coco/detectors_cascade_rcnn_r50_1x_coco-32a10ba0.pth",
-            "config_url": "configs/detectors/detectors_cascade-rcnn_r50_1x_coco.py",
-        },
-    },
-    {
-        "Model": "dynamic-rcnn_r50_fpn_1x_coco",
-        "Method": "Dynamic R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.8,
-        "Dataset": "COCO",
-        "box AP": 38.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Dynamic R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/dynamic_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/dynamic_rcnn/dynamic_rcnn_r50_fpn_1x/dynamic_rcnn_r50_fpn_1x-62a3f276.pth",
-            "config_url": "configs/dynamic_rcnn/dynamic-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-faster-rcnn_r50_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 39.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_faster_rcnn_r50_fpn_1x_coco/sabl_faster_rcnn_r50_fpn_1x_coco-e867595b.pth",
-            "config_url": "configs/sabl/sabl-faster-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-faster-rcnn_r101_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 41.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_faster_rcnn_r101_fpn_1x_coco/sabl_faster_rcnn_r101_fpn_1x_coco-f804c6c1.pth",
-            "config_url": "configs/sabl/sabl-faster-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r50_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r50_fpn_1x_coco/sabl_retinanet_r50_fpn_1x_coco-6c54fd4f.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r50-gn_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 38.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r50_fpn_gn_1x_coco/sabl_retinanet_r50_fpn_gn_1x_coco-e16dfcf1.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r50-gn_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r101_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 39.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r101_fpn_1x_coco/sabl_retinanet_r101_fpn_1x_coco-42026904.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r101-gn_fpn_1x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 40.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r101_fpn_gn_1x_coco/sabl_retinanet_r101_fpn_gn_1x_coco-40a893e8.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r101-gn_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r101-gn_fpn_ms-640-800-2x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 42.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r101_fpn_gn_2x_ms_640_800_coco/sabl_retinanet_r101_fpn_gn_2x_ms_640_800_coco-1e63382c.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r101-gn_fpn_ms-640-800-2x_coco.py",
-        },
-    },
-    {
-        "Model": "sabl-retinanet_r101-gn_fpn_ms-480-960-2x_coco",
-        "Method": "SABL",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 43.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Side-Aware Boundary Localization",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/sabl",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/sabl/sabl_retinanet_r101_fpn_gn_2x_ms_480_960_coco/sabl_retinanet_r101_fpn_gn_2x_ms_480_960_coco-5342f857.pth",
-            "config_url": "configs/sabl/sabl-retinanet_r101-gn_fpn_ms-480-960-2x_coco.py",
-        },
-    },
-    {
-        "Model": "autoassign_r50-caffe_fpn_1x_coco",
-        "Method": "AutoAssign",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.08,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "AutoAssign",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/autoassign",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/autoassign/auto_assign_r50_fpn_1x_coco/auto_assign_r50_fpn_1x_coco_20210413_115540-5e17991f.pth",
-            "config_url": "configs/autoassign/autoassign_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "nas-fcos_r50-caffe_fpn_nashead-gn-head_4xb4-1x_coco",
-        "Method": "NAS-FCOS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 39.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "NAS-FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/nas_fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/nas_fcos/nas_fcos_nashead_r50_caffe_fpn_gn-head_4x4_1x_coco/nas_fcos_nashead_r50_caffe_fpn_gn-head_4x4_1x_coco_20200520-1bdba3ce.pth",
-            "config_url": "configs/nas_fcos/nas-fcos_r50-caffe_fpn_nashead-gn-head_4xb4-1x_coco.py",
-        },
-    },
-    {
-        "Model": "nas-fcos_r50-caffe_fpn_fcoshead-gn-head_4xb4-1x_coco",
-        "Method": "NAS-FCOS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 38.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "NAS-FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/nas_fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/nas_fcos/nas_fcos_fcoshead_r50_caffe_fpn_gn-head_4x4_1x_coco/nas_fcos_fcoshead_r50_caffe_fpn_gn-head_4x4_1x_coco_20200521-7fdcbce0.pth",
-            "config_url": "configs/nas_fcos/nas-fcos_r50-caffe_fpn_fcoshead-gn-head_4xb4-1x_coco.py",
-        },
-    },
-    {
-        "Model": "atss_r50_fpn_1x_coco",
-        "Method": "ATSS",
-        "Inference Time (ms/im)": 50.76,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 39.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "ATSS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/atss",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/atss/atss_r50_fpn_1x_coco/atss_r50_fpn_1x_coco_20200209-985f7bd0.pth",
-            "config_url": "configs/atss/atss_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "atss_r101_fpn_1x_coco",
-        "Method": "ATSS",
-        "Inference Time (ms/im)": 81.3,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.6,
-        "Dataset": "COCO",
-        "box AP": 41.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "ATSS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/atss",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/atss/atss_r101_fpn_1x_coco/atss_r101_fpn_1x_20200825-dfcadd6f.pth",
-            "config_url": "configs/atss/atss_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "dh-faster-rcnn_r50_fpn_1x_coco",
-        "Method": "Rethinking Classification and Localization for Object Detection",
-        "Inference Time (ms/im)": 105.26,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.8,
-        "Dataset": "COCO",
-        "box AP": 40.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Double-Head R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/double_heads",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/double_heads/dh_faster_rcnn_r50_fpn_1x_coco/dh_faster_rcnn_r50_fpn_1x_coco_20200130-586b67df.pth",
-            "config_url": "configs/double_heads/dh-faster-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r50_fpn_4xb4-1x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 41.49,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.6,
-        "Dataset": "COCO",
-        "box AP": 36.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_r50_fpn_4x4_1x_coco/fovea_r50_fpn_4x4_1x_coco_20200219-ee4d5303.pth",
-            "config_url": "configs/foveabox/fovea_r50_fpn_4xb4-1x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r50_fpn_4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 41.49,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.6,
-        "Dataset": "COCO",
-        "box AP": 37.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_r50_fpn_4x4_2x_coco/fovea_r50_fpn_4x4_2x_coco_20200203-2df792b1.pth",
-            "config_url": "configs/foveabox/fovea_r50_fpn_4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r50_fpn_gn-head-align_4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 51.55,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 8.1,
-        "Dataset": "COCO",
-        "box AP": 37.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_align_r50_fpn_gn-head_4x4_2x_coco/fovea_align_r50_fpn_gn-head_4x4_2x_coco_20200203-8987880d.pth",
-            "config_url": "configs/foveabox/fovea_r50_fpn_gn-head-align_4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r50_fpn_gn-head-align_ms-640-800-4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 54.64,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 8.1,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_align_r50_fpn_gn-head_mstrain_640-800_4x4_2x_coco/fovea_align_r50_fpn_gn-head_mstrain_640-800_4x4_2x_coco_20200205-85ce26cb.pth",
-            "config_url": "configs/foveabox/fovea_r50_fpn_gn-head-align_ms-640-800-4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r101_fpn_4xb4-1x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 57.47,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.2,
-        "Dataset": "COCO",
-        "box AP": 38.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_r101_fpn_4x4_1x_coco/fovea_r101_fpn_4x4_1x_coco_20200219-05e38f1c.pth",
-            "config_url": "configs/foveabox/fovea_r101_fpn_4xb4-1x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r101_fpn_4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 11.7,
-        "Dataset": "COCO",
-        "box AP": 40.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_r101_fpn_4x4_2x_coco/fovea_r101_fpn_4x4_2x_coco_20200208-02320ea4.pth",
-            "config_url": "configs/foveabox/fovea_r101_fpn_4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r101_fpn_gn-head-align_4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 68.03,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 11.7,
-        "Dataset": "COCO",
-        "box AP": 40.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_align_r101_fpn_gn-head_4x4_2x_coco/fovea_align_r101_fpn_gn-head_4x4_2x_coco_20200208-c39a027a.pth",
-            "config_url": "configs/foveabox/fovea_r101_fpn_gn-head-align_4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fovea_r101_fpn_gn-head-align_ms-640-800-4xb4-2x_coco",
-        "Method": "FoveaBox",
-        "Inference Time (ms/im)": 68.03,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 11.7,
-        "Dataset": "COCO",
-        "box AP": 42.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Foveabox",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/foveabox",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/foveabox/fovea_align_r101_fpn_gn-head_mstrain_640-800_4x4_2x_coco/fovea_align_r101_fpn_gn-head_mstrain_640-800_4x4_2x_coco_20200208-649c5eb6.pth",
-            "config_url": "configs/foveabox/fovea_r101_fpn_gn-head-align_ms-640-800-4xb4-2x_coco.py",
-        },
-    },
-    {
-        "Model": "freeanchor_r50_fpn_1x_coco",
-        "Method": "FreeAnchor",
-        "Inference Time (ms/im)": 54.35,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.9,
-        "Dataset": "COCO",
-        "box AP": 38.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Free Anchor",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/free_anchor",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/free_anchor/retinanet_free_anchor_r50_fpn_1x_coco/retinanet_free_anchor_r50_fpn_1x_coco_20200130-0f67375f.pth",
-            "config_url": "configs/free_anchor/freeanchor_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "freeanchor_r101_fpn_1x_coco",
-        "Method": "FreeAnchor",
-        "Inference Time (ms/im)": 67.11,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.8,
-        "Dataset": "COCO",
-        "box AP": 40.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Free Anchor",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/free_anchor",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/free_anchor/retinanet_free_anchor_r101_fpn_1x_coco/retinanet_free_anchor_r101_fpn_1x_coco_20200130-358324e6.pth",
-            "config_url": "configs/free_anchor/freeanchor_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "freeanchor_x101-32x4d_fpn_1x_coco",
-        "Method": "FreeAnchor",
-        "Inference Time (ms/im)": 90.09,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.1,
-        "Dataset": "COCO",
-        "box AP": 41.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Free Anchor",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/free_anchor",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/free_anchor/retinanet_free_anchor_x101_32x4d_fpn_1x_coco/retinanet_free_anchor_x101_32x4d_fpn_1x_coco_20200130-d4846968.pth",
-            "config_url": "configs/free_anchor/freeanchor_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-bbox_r50_fpn-gn_head-gn-grid_1x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 62.89,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.9,
-        "Dataset": "COCO",
-        "box AP": 36.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/bbox_r50_grid_fpn_gn-neck%2Bhead_1x_coco/bbox_r50_grid_fpn_gn-neck%2Bhead_1x_coco_20200329_145916-0eedf8d1.pth",
-            "config_url": "configs/reppoints/reppoints-bbox_r50_fpn-gn_head-gn-grid_1x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-bbox_r50-center_fpn-gn_head-gn-grid_1x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 64.94,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.9,
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/bbox_r50_grid_fpn_gn-neck%2Bhead_1x_coco/bbox_r50_grid_fpn_gn-neck%2Bhead_1x_coco_20200329_145916-0eedf8d1.pth",
-            "config_url": "configs/reppoints/reppoints-bbox_r50-center_fpn-gn_head-gn-grid_1x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_r50_fpn_1x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 54.05,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.3,
-        "Dataset": "COCO",
-        "box AP": 37.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_r50_fpn_1x_coco/reppoints_moment_r50_fpn_1x_coco_20200330-b73db8d1.pth",
-            "config_url": "configs/reppoints/reppoints-moment_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_r50_fpn-gn_head-gn_1x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 57.14,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.9,
-        "Dataset": "COCO",
-        "box AP": 38.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_r50_fpn_gn-neck%2Bhead_1x_coco/reppoints_moment_r50_fpn_gn-neck%2Bhead_1x_coco_20200329_145952-3e51b550.pth",
-            "config_url": "configs/reppoints/reppoints-moment_r50_fpn-gn_head-gn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_r50_fpn-gn_head-gn_2x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 57.14,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 3.9,
-        "Dataset": "COCO",
-        "box AP": 38.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_r50_fpn_gn-neck%2Bhead_2x_coco/reppoints_moment_r50_fpn_gn-neck%2Bhead_2x_coco_20200329-91babaa2.pth",
-            "config_url": "configs/reppoints/reppoints-moment_r50_fpn-gn_head-gn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_r101_fpn-gn_head-gn_2x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 72.99,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.8,
-        "Dataset": "COCO",
-        "box AP": 40.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_r101_fpn_gn-neck%2Bhead_2x_coco/reppoints_moment_r101_fpn_gn-neck%2Bhead_2x_coco_20200329-4fbc7310.pth",
-            "config_url": "configs/reppoints/reppoints-moment_r101_fpn-gn_head-gn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_r101-dconv-c3-c5_fpn-gn_head-gn_2x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 82.64,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.9,
-        "Dataset": "COCO",
-        "box AP": 42.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_r101_fpn_dconv_c3-c5_gn-neck%2Bhead_2x_coco/reppoints_moment_r101_fpn_dconv_c3-c5_gn-neck%2Bhead_2x_coco_20200329-3309fbf2.pth",
-            "config_url": "configs/reppoints/reppoints-moment_r101-dconv-c3-c5_fpn-gn_head-gn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "reppoints-moment_x101-dconv-c3-c5_fpn-gn_head-gn_2x_coco",
-        "Method": "RepPoints",
-        "Inference Time (ms/im)": 107.53,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 7.1,
-        "Dataset": "COCO",
-        "box AP": 44.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RepPoints",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/reppoints",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/reppoints/reppoints_moment_x101_fpn_dconv_c3-c5_gn-neck%2Bhead_2x_coco/reppoints_moment_x101_fpn_dconv_c3-c5_gn-neck%2Bhead_2x_coco_20200329-f87da1ea.pth",
-            "config_url": "configs/reppoints/reppoints-moment_x101-dconv-c3-c5_fpn-gn_head-gn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r50-caffe_fpn_gn-head_1x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": 44.05,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.6,
-        "Dataset": "COCO",
-        "box AP": 36.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_r50_caffe_fpn_gn-head_1x_coco/fcos_r50_caffe_fpn_gn-head_1x_coco-821213aa.pth",
-            "config_url": "configs/fcos/fcos_r50-caffe_fpn_gn-head_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r50-caffe_fpn_gn-head-center-normbbox-centeronreg-giou_1x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 38.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_center-normbbox-centeronreg-giou_r50_caffe_fpn_gn-head_1x_coco/fcos_center-normbbox-centeronreg-giou_r50_caffe_fpn_gn-head_1x_coco-0a0d75a8.pth",
-            "config_url": "configs/fcos/fcos_r50-caffe_fpn_gn-head-center-normbbox-centeronreg-giou_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r50-dcn-caffe_fpn_gn-head-center-normbbox-centeronreg-giou_1x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.8,
-        "Dataset": "COCO",
-        "box AP": 42.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_center-normbbox-centeronreg-giou_r50_caffe_fpn_gn-head_dcn_1x_coco/fcos_center-normbbox-centeronreg-giou_r50_caffe_fpn_gn-head_dcn_1x_coco-ae4d8b3d.pth",
-            "config_url": "configs/fcos/fcos_r50-dcn-caffe_fpn_gn-head-center-normbbox-centeronreg-giou_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r101-caffe_fpn_gn-head-1x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": 57.8,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 39.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_r101_caffe_fpn_gn-head_1x_coco/fcos_r101_caffe_fpn_gn-head_1x_coco-0e37b982.pth",
-            "config_url": "configs/fcos/fcos_r101-caffe_fpn_gn-head-1x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r50-caffe_fpn_gn-head_ms-640-800-2x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": 43.67,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 2.6,
-        "Dataset": "COCO",
-        "box AP": 38.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_r50_caffe_fpn_gn-head_mstrain_640-800_2x_coco/fcos_r50_caffe_fpn_gn-head_mstrain_640-800_2x_coco-d92ceeea.pth",
-            "config_url": "configs/fcos/fcos_r50-caffe_fpn_gn-head_ms-640-800-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_r101-caffe_fpn_gn-head_ms-640-800-2x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": 57.8,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 40.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_r101_caffe_fpn_gn-head_mstrain_640-800_2x_coco/fcos_r101_caffe_fpn_gn-head_mstrain_640-800_2x_coco-511424d6.pth",
-            "config_url": "configs/fcos/fcos_r101-caffe_fpn_gn-head_ms-640-800-2x_coco.py",
-        },
-    },
-    {
-        "Model": "fcos_x101-64x4d_fpn_gn-head_ms-640-800-2x_coco",
-        "Method": "FCOS",
-        "Inference Time (ms/im)": 103.09,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 10.0,
-        "Dataset": "COCO",
-        "box AP": 42.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FCOS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fcos",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fcos/fcos_x101_64x4d_fpn_gn-head_mstrain_640-800_2x_coco/fcos_x101_64x4d_fpn_gn-head_mstrain_640-800_2x_coco-ede514a8.pth",
-            "config_url": "configs/fcos/fcos_x101-64x4d_fpn_gn-head_ms-640-800-2x_coco.py",
-        },
-    },
-    {
-        "Model": "tridentnet_r50-caffe_1x_coco",
-        "Method": "TridentNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TridentNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tridentnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tridentnet/tridentnet_r50_caffe_1x_coco/tridentnet_r50_caffe_1x_coco_20201230_141838-2ec0b530.pth",
-            "config_url": "configs/tridentnet/tridentnet_r50-caffe_1x_coco.py",
-        },
-    },
-    {
-        "Model": "tridentnet_r50-caffe_ms-1x_coco",
-        "Method": "TridentNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TridentNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tridentnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tridentnet/tridentnet_r50_caffe_mstrain_1x_coco/tridentnet_r50_caffe_mstrain_1x_coco_20201230_141839-6ce55ccb.pth",
-            "config_url": "configs/tridentnet/tridentnet_r50-caffe_ms-1x_coco.py",
-        },
-    },
-    {
-        "Model": "tridentnet_r50-caffe_ms-3x_coco",
-        "Method": "TridentNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 40.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "TridentNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/tridentnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/tridentnet/tridentnet_r50_caffe_mstrain_3x_coco/tridentnet_r50_caffe_mstrain_3x_coco_20201130_100539-46d227ba.pth",
-            "config_url": "configs/tridentnet/tridentnet_r50-caffe_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "libra-faster-rcnn_r50_fpn_1x_coco",
-        "Method": "Libra R-CNN",
-        "Inference Time (ms/im)": 52.63,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.6,
-        "Dataset": "COCO",
-        "box AP": 38.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Libra R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/libra_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/libra_rcnn/libra_faster_rcnn_r50_fpn_1x_coco/libra_faster_rcnn_r50_fpn_1x_coco_20200130-3afee3a9.pth",
-            "config_url": "configs/libra_rcnn/libra-faster-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "libra-faster-rcnn_r101_fpn_1x_coco",
-        "Method": "Libra R-CNN",
-        "Inference Time (ms/im)": 69.44,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.5,
-        "Dataset": "COCO",
-        "box AP": 40.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Libra R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/libra_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/libra_rcnn/libra_faster_rcnn_r101_fpn_1x_coco/libra_faster_rcnn_r101_fpn_1x_coco_20200203-8dba6a5a.pth",
-            "config_url": "configs/libra_rcnn/libra-faster-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "libra-faster-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Libra R-CNN",
-        "Inference Time (ms/im)": 117.65,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.8,
-        "Dataset": "COCO",
-        "box AP": 42.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Libra R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/libra_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/libra_rcnn/libra_faster_rcnn_x101_64x4d_fpn_1x_coco/libra_faster_rcnn_x101_64x4d_fpn_1x_coco_20200315-3a7d0488.pth",
-            "config_url": "configs/libra_rcnn/libra-faster-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "libra-retinanet_r50_fpn_1x_coco",
-        "Method": "Libra R-CNN",
-        "Inference Time (ms/im)": 56.5,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.2,
-        "Dataset": "COCO",
-        "box AP": 37.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Libra R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/libra_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/libra_rcnn/libra_retinanet_r50_fpn_1x_coco/libra_retinanet_r50_fpn_1x_coco_20200205-804d94ce.pth",
-            "config_url": "configs/libra_rcnn/libra-retinanet_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "centernet_r18-dcnv2_8xb16-crop512-140e_coco",
-        "Method": "CenterNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 140,
-        "Memory (Training, GB)": 3.47,
-        "Dataset": "COCO",
-        "box AP": 29.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CenterNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/centernet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/centernet/centernet_resnet18_dcnv2_140e_coco/centernet_resnet18_dcnv2_140e_coco_20210702_155131-c8cd631f.pth",
-            "config_url": "configs/centernet/centernet_r18-dcnv2_8xb16-crop512-140e_coco.py",
-        },
-    },
-    {
-        "Model": "centernet_r18_8xb16-crop512-140e_coco",
-        "Method": "CenterNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 140,
-        "Memory (Training, GB)": 3.45,
-        "Dataset": "COCO",
-        "box AP": 25.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CenterNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/centernet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/centernet/centernet_resnet18_140e_coco/centernet_resnet18_140e_coco_20210705_093630-bb5b3bf7.pth",
-            "config_url": "configs/centernet/centernet_r18_8xb16-crop512-140e_coco.py",
-        },
-    },
-    {
-        "Model": "fsaf_r50_fpn_1x_coco",
-        "Method": "FSAF",
-        "Inference Time (ms/im)": 76.92,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.15,
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FSAF",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fsaf",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fsaf/fsaf_r50_fpn_1x_coco/fsaf_r50_fpn_1x_coco-94ccc51f.pth",
-            "config_url": "configs/fsaf/fsaf_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fsaf_r101_fpn_1x_coco",
-        "Method": "FSAF",
-        "Inference Time (ms/im)": 92.59,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.08,
-        "Dataset": "COCO",
-        "box AP": 39.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FSAF",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fsaf",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fsaf/fsaf_r101_fpn_1x_coco/fsaf_r101_fpn_1x_coco-9e71098f.pth",
-            "config_url": "configs/fsaf/fsaf_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "fsaf_x101-64x4d_fpn_1x_coco",
-        "Method": "FSAF",
-        "Inference Time (ms/im)": 178.57,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.38,
-        "Dataset": "COCO",
-        "box AP": 42.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "FSAF",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/fsaf",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fsaf/fsaf_x101_64x4d_fpn_1x_coco/fsaf_x101_64x4d_fpn_1x_coco-e3f6e6fd.pth",
-            "config_url": "configs/fsaf/fsaf_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-faster-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 39.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_faster_r50_caffe_fpn_1x_coco/ga_faster_r50_caffe_fpn_1x_coco_20200702_000718-a11ccfe6.pth",
-            "config_url": "configs/guided_anchoring/ga-faster-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-faster-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.5,
-        "Dataset": "COCO",
-        "box AP": 41.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_faster_r101_caffe_fpn_1x_coco/ga_faster_r101_caffe_fpn_1x_coco_bbox_mAP-0.415_20200505_115528-fb82e499.pth",
-            "config_url": "configs/guided_anchoring/ga-faster-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-faster-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 103.09,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.7,
-        "Dataset": "COCO",
-        "box AP": 43.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_faster_x101_32x4d_fpn_1x_coco/ga_faster_x101_32x4d_fpn_1x_coco_20200215-1ded9da3.pth",
-            "config_url": "configs/guided_anchoring/ga-faster-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-faster-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 136.99,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 11.8,
-        "Dataset": "COCO",
-        "box AP": 43.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_faster_x101_64x4d_fpn_1x_coco/ga_faster_x101_64x4d_fpn_1x_coco_20200215-0fa7bde7.pth",
-            "config_url": "configs/guided_anchoring/ga-faster-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-retinanet_r50-caffe_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 59.52,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.5,
-        "Dataset": "COCO",
-        "box AP": 36.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_retinanet_r50_caffe_fpn_1x_coco/ga_retinanet_r50_caffe_fpn_1x_coco_20201020-39581c6f.pth",
-            "config_url": "configs/guided_anchoring/ga-retinanet_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-retinanet_r101-caffe_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 77.52,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 39.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_retinanet_r101_caffe_fpn_1x_coco/ga_retinanet_r101_caffe_fpn_1x_coco_20200531-6266453c.pth",
-            "config_url": "configs/guided_anchoring/ga-retinanet_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-retinanet_x101-32x4d_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 94.34,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.9,
-        "Dataset": "COCO",
-        "box AP": 40.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_retinanet_x101_32x4d_fpn_1x_coco/ga_retinanet_x101_32x4d_fpn_1x_coco_20200219-40c56caa.pth",
-            "config_url": "configs/guided_anchoring/ga-retinanet_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ga-retinanet_x101-64x4d_fpn_1x_coco",
-        "Method": "Guided Anchoring",
-        "Inference Time (ms/im)": 129.87,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.9,
-        "Dataset": "COCO",
-        "box AP": 41.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Guided Anchoring",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/guided_anchoring",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/guided_anchoring/ga_retinanet_x101_64x4d_fpn_1x_coco/ga_retinanet_x101_64x4d_fpn_1x_coco_20200226-ef9f7f1f.pth",
-            "config_url": "configs/guided_anchoring/ga-retinanet_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "grid-rcnn_r50_fpn_gn-head_2x_coco",
-        "Method": "Grid R-CNN",
-        "Inference Time (ms/im)": 66.67,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.1,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Grid R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/grid_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/grid_rcnn/grid_rcnn_r50_fpn_gn-head_2x_coco/grid_rcnn_r50_fpn_gn-head_2x_coco_20200130-6cca8223.pth",
-            "config_url": "configs/grid_rcnn/grid-rcnn_r50_fpn_gn-head_2x_coco.py",
-        },
-    },
-    {
-        "Model": "grid-rcnn_r101_fpn_gn-head_2x_coco",
-        "Method": "Grid R-CNN",
-        "Inference Time (ms/im)": 79.37,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "box AP": 41.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Grid R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/grid_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/grid_rcnn/grid_rcnn_r101_fpn_gn-head_2x_coco/grid_rcnn_r101_fpn_gn-head_2x_coco_20200309-d6eca030.pth",
-            "config_url": "configs/grid_rcnn/grid-rcnn_r101_fpn_gn-head_2x_coco.py",
-        },
-    },
-    {
-        "Model": "grid-rcnn_x101-32x4d_fpn_gn-head_2x_coco",
-        "Method": "Grid R-CNN",
-        "Inference Time (ms/im)": 92.59,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 8.3,
-        "Dataset": "COCO",
-        "box AP": 42.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Grid R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/grid_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/grid_rcnn/grid_rcnn_x101_32x4d_fpn_gn-head_2x_coco/grid_rcnn_x101_32x4d_fpn_gn-head_2x_coco_20200130-d8f0e3ff.pth",
-            "config_url": "configs/grid_rcnn/grid-rcnn_x101-32x4d_fpn_gn-head_2x_coco.py",
-        },
-    },
-    {
-        "Model": "grid-rcnn_x101-64x4d_fpn_gn-head_2x_coco",
-        "Method": "Grid R-CNN",
-        "Inference Time (ms/im)": 129.87,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 11.3,
-        "Dataset": "COCO",
-        "box AP": 43.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Grid R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/grid_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/grid_rcnn/grid_rcnn_x101_64x4d_fpn_gn-head_2x_coco/grid_rcnn_x101_64x4d_fpn_gn-head_2x_coco_20200204-ec76a754.pth",
-            "config_url": "configs/grid_rcnn/grid-rcnn_x101-64x4d_fpn_gn-head_2x_coco.py",
-        },
-    },
-    {
-        "Model": "cornernet_hourglass104_10xb5-crop511-210e-mstest_coco",
-        "Method": "CornerNet",
-        "Inference Time (ms/im)": 238.1,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 210,
-        "Memory (Training, GB)": 13.9,
-        "Dataset": "COCO",
-        "box AP": 41.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CornerNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cornernet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cornernet/cornernet_hourglass104_mstest_10x5_210e_coco/cornernet_hourglass104_mstest_10x5_210e_coco_20200824_185720-5fefbf1c.pth",
-            "config_url": "configs/cornernet/cornernet_hourglass104_10xb5-crop511-210e-mstest_coco.py",
-        },
-    },
-    {
-        "Model": "cornernet_hourglass104_8xb6-210e-mstest_coco",
-        "Method": "CornerNet",
-        "Inference Time (ms/im)": 238.1,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 210,
-        "Memory (Training, GB)": 15.9,
-        "Dataset": "COCO",
-        "box AP": 41.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CornerNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cornernet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cornernet/cornernet_hourglass104_mstest_8x6_210e_coco/cornernet_hourglass104_mstest_8x6_210e_coco_20200825_150618-79b44c30.pth",
-            "config_url": "configs/cornernet/cornernet_hourglass104_8xb6-210e-mstest_coco.py",
-        },
-    },
-    {
-        "Model": "cornernet_hourglass104_32xb3-210e-mstest_coco",
-        "Method": "CornerNet",
-        "Inference Time (ms/im)": 256.41,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 210,
-        "Memory (Training, GB)": 9.5,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "CornerNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cornernet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cornernet/cornernet_hourglass104_mstest_32x3_210e_coco/cornernet_hourglass104_mstest_32x3_210e_coco_20200819_203110-1efaea91.pth",
-            "config_url": "configs/cornernet/cornernet_hourglass104_32xb3-210e-mstest_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_d53_320_273e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": 15.65,
-        "Input Size (H, W)": "(320, 320)",
-        "LR scheduler (epochs)": 273,
-        "Memory (Training, GB)": 2.7,
-        "Dataset": "COCO",
-        "box AP": 27.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_d53_320_273e_coco/yolov3_d53_320_273e_coco-421362b6.pth",
-            "config_url": "configs/yolo/yolov3_d53_8xb8-320-273e_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_d53_mstrain-416_273e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": 16.34,
-        "Input Size (H, W)": "(416, 416)",
-        "LR scheduler (epochs)": 273,
-        "Memory (Training, GB)": 3.8,
-        "Dataset": "COCO",
-        "box AP": 30.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_d53_mstrain-416_273e_coco/yolov3_d53_mstrain-416_273e_coco-2b60fcd9.pth",
-            "config_url": "configs/yolo/yolov3_d53_8xb8-ms-416-273e_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_d53_mstrain-608_273e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": 20.79,
-        "Input Size (H, W)": "(608, 608)",
-        "LR scheduler (epochs)": 273,
-        "Memory (Training, GB)": 7.4,
-        "Dataset": "COCO",
-        "box AP": 33.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_d53_mstrain-608_273e_coco/yolov3_d53_mstrain-608_273e_coco_20210518_115020-a2c3acb8.pth",
-            "config_url": "configs/yolo/yolov3_d53_8xb8-ms-608-273e_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_d53_fp16_mstrain-608_273e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": 20.79,
-        "Input Size (H, W)": "(608, 608)",
-        "LR scheduler (epochs)": 273,
-        "Memory (Training, GB)": 4.7,
-        "Dataset": "COCO",
-        "box AP": 33.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_d53_fp16_mstrain-608_273e_coco/yolov3_d53_fp16_mstrain-608_273e_coco_20210517_213542-4bc34944.pth",
-            "config_url": "configs/yolo/yolov3_d53_8xb8-amp-ms-608-273e_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_mobilenetv2_8xb24-320-300e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 3.2,
-        "Dataset": "COCO",
-        "box AP": 22.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_mobilenetv2_320_300e_coco/yolov3_mobilenetv2_320_300e_coco_20210719_215349-d18dff72.pth",
-            "config_url": "configs/yolo/yolov3_mobilenetv2_8xb24-320-300e_coco.py",
-        },
-    },
-    {
-        "Model": "yolov3_mobilenetv2_8xb24-ms-416-300e_coco",
-        "Method": "YOLOv3",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 5.3,
-        "Dataset": "COCO",
-        "box AP": 23.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "YOLOv3",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolo/yolov3_mobilenetv2_mstrain-416_300e_coco/yolov3_mobilenetv2_mstrain-416_300e_coco_20210718_010823-f68a07b3.pth",
-            "config_url": "configs/yolo/yolov3_mobilenetv2_8xb24-ms-416-300e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.2,
-        "Dataset": "COCO",
-        "box AP": 40.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r50_caffe_fpn_1x_coco/cascade_rcnn_r50_caffe_fpn_1x_coco_bbox_mAP-0.404_20200504_174853-b857be87.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r50_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 62.11,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "box AP": 40.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r50_fpn_1x_coco/cascade_rcnn_r50_fpn_1x_coco_20200316-3dc56deb.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r50_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 62.11,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "box AP": 41.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r50_fpn_20e_coco/cascade_rcnn_r50_fpn_20e_coco_bbox_mAP-0.41_20200504_175131-e9872a90.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r50_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.2,
-        "Dataset": "COCO",
-        "box AP": 42.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r101_caffe_fpn_1x_coco/cascade_rcnn_r101_caffe_fpn_1x_coco_bbox_mAP-0.423_20200504_175649-cab8dbd5.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r101_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 74.07,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.4,
-        "Dataset": "COCO",
-        "box AP": 42.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r101_fpn_1x_coco/cascade_rcnn_r101_fpn_1x_coco_20200317-0b6a2fbf.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_r101_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 74.07,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 6.4,
-        "Dataset": "COCO",
-        "box AP": 42.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_r101_fpn_20e_coco/cascade_rcnn_r101_fpn_20e_coco_bbox_mAP-0.425_20200504_231812-5057dcc5.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_r101_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 91.74,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "box AP": 43.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_x101_32x4d_fpn_1x_coco/cascade_rcnn_x101_32x4d_fpn_1x_coco_20200316-95c2deb6.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_x101-32x4d_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "box AP": 43.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_x101_32x4d_fpn_20e_coco/cascade_rcnn_x101_32x4d_fpn_20e_coco_20200906_134608-9ae0a720.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_x101-32x4d_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.7,
-        "Dataset": "COCO",
-        "box AP": 44.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_x101_64x4d_fpn_1x_coco/cascade_rcnn_x101_64x4d_fpn_1x_coco_20200515_075702-43ce6a30.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-rcnn_x101_64x4d_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 10.7,
-        "Dataset": "COCO",
-        "box AP": 44.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Cascade R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_rcnn_x101_64x4d_fpn_20e_coco/cascade_rcnn_x101_64x4d_fpn_20e_coco_20200509_224357-051557b1.pth",
-            "config_url": "configs/cascade_rcnn/cascade-rcnn_x101_64x4d_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r18_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 1.7,
-        "Dataset": "COCO",
-        "box AP": 31.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r18_fpn_1x_coco/retinanet_r18_fpn_1x_coco_20220407_171055-614fd399.pth",
-            "config_url": "configs/retinanet/retinanet_r18_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r18_fpn_1xb8-1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.0,
-        "Dataset": "COCO",
-        "box AP": 31.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r18_fpn_1x8_1x_coco/retinanet_r18_fpn_1x8_1x_coco_20220407_171255-4ea310d7.pth",
-            "config_url": "configs/retinanet/retinanet_r18_fpn_1xb8-1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r50-caffe_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 53.76,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.5,
-        "Dataset": "COCO",
-        "box AP": 36.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r50_caffe_fpn_1x_coco/retinanet_r50_caffe_fpn_1x_coco_20200531-f11027c5.pth",
-            "config_url": "configs/retinanet/retinanet_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r50_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 52.63,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.8,
-        "Dataset": "COCO",
-        "box AP": 36.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r50_fpn_1x_coco/retinanet_r50_fpn_1x_coco_20200130-c2398f9e.pth",
-            "config_url": "configs/retinanet/retinanet_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r50_fpn_amp-1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 31.65,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 2.8,
-        "Dataset": "COCO",
-        "box AP": 36.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fp16/retinanet_r50_fpn_fp16_1x_coco/retinanet_r50_fpn_fp16_1x_coco_20200702-0dbfb212.pth",
-            "config_url": "configs/retinanet/retinanet_r50_fpn_amp-1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r50_fpn_2x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r50_fpn_2x_coco/retinanet_r50_fpn_2x_coco_20200131-fdb43119.pth",
-            "config_url": "configs/retinanet/retinanet_r50_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r50_fpn_ms-640-800-3x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 39.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r50_fpn_mstrain_3x_coco/retinanet_r50_fpn_mstrain_3x_coco_20210718_220633-88476508.pth",
-            "config_url": "configs/retinanet/retinanet_r50_fpn_ms-640-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r101-caffe_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 68.03,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.5,
-        "Dataset": "COCO",
-        "box AP": 38.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r101_caffe_fpn_1x_coco/retinanet_r101_caffe_fpn_1x_coco_20200531-b428fa0f.pth",
-            "config_url": "configs/retinanet/retinanet_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r101-caffe_fpn_ms-3x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 40.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r101_caffe_fpn_mstrain_3x_coco/retinanet_r101_caffe_fpn_mstrain_3x_coco_20210721_063439-88a8a944.pth",
-            "config_url": "configs/retinanet/retinanet_r101-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r101_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 66.67,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.7,
-        "Dataset": "COCO",
-        "box AP": 38.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r101_fpn_1x_coco/retinanet_r101_fpn_1x_coco_20200130-7a93545f.pth",
-            "config_url": "configs/retinanet/retinanet_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r101_fpn_2x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 66.67,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 5.7,
-        "Dataset": "COCO",
-        "box AP": 38.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r101_fpn_2x_coco/retinanet_r101_fpn_2x_coco_20200131-5560aee8.pth",
-            "config_url": "configs/retinanet/retinanet_r101_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_r101_fpn_ms-640-800-3x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 41,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_r101_fpn_mstrain_3x_coco/retinanet_r101_fpn_mstrain_3x_coco_20210720_214650-7ee888e0.pth",
-            "config_url": "configs/retinanet/retinanet_r101_fpn_ms-640-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_x101-32x4d_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 82.64,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "box AP": 39.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_x101_32x4d_fpn_1x_coco/retinanet_x101_32x4d_fpn_1x_coco_20200130-5c8b7ec4.pth",
-            "config_url": "configs/retinanet/retinanet_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_x101-32x4d_fpn_2x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 82.64,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "box AP": 40.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_x101_32x4d_fpn_2x_coco/retinanet_x101_32x4d_fpn_2x_coco_20200131-237fc5e1.pth",
-            "config_url": "configs/retinanet/retinanet_x101-32x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_x101-64x4d_fpn_1x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 114.94,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.0,
-        "Dataset": "COCO",
-        "box AP": 41.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_x101_64x4d_fpn_1x_coco/retinanet_x101_64x4d_fpn_1x_coco_20200130-366f5af1.pth",
-            "config_url": "configs/retinanet/retinanet_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_x101-64x4d_fpn_2x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": 114.94,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 10.0,
-        "Dataset": "COCO",
-        "box AP": 40.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_x101_64x4d_fpn_2x_coco/retinanet_x101_64x4d_fpn_2x_coco_20200131-bca068ab.pth",
-            "config_url": "configs/retinanet/retinanet_x101-64x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "retinanet_x101-64x4d_fpn_ms-640-800-3x_coco",
-        "Method": "RetinaNet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 41.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "RetinaNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/retinanet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/retinanet/retinanet_x101_64x4d_fpn_mstrain_3x_coco/retinanet_x101_64x4d_fpn_mstrain_3x_coco_20210719_051838-022c2187.pth",
-            "config_url": "configs/retinanet/retinanet_x101-64x4d_fpn_ms-640-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "ssd300_coco",
-        "Method": "SSD",
-        "Inference Time (ms/im)": 22.88,
-        "Input Size (H, W)": "(300, 300)",
-        "LR scheduler (epochs)": 120,
-        "Memory (Training, GB)": 9.9,
-        "Dataset": "COCO",
-        "box AP": 25.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "SSD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ssd",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ssd/ssd300_coco/ssd300_coco_20210803_015428-d231a06e.pth",
-            "config_url": "configs/ssd/ssd300_coco.py",
-        },
-    },
-    {
-        "Model": "ssd512_coco",
-        "Method": "SSD",
-        "Inference Time (ms/im)": 32.57,
-        "Input Size (H, W)": "(512, 512)",
-        "LR scheduler (epochs)": 120,
-        "Memory (Training, GB)": 19.4,
-        "Dataset": "COCO",
-        "box AP": 29.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "SSD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ssd",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ssd/ssd512_coco/ssd512_coco_20210803_022849-0a47a1ca.pth",
-            "config_url": "configs/ssd/ssd512_coco.py",
-        },
-    },
-    {
-        "Model": "ssdlite_mobilenetv2-scratch_8xb24-600e_coco",
-        "Method": "SSD",
-        "Inference Time (ms/im)": 14.3,
-        "Input Size (H, W)": "(320, 320)",
-        "LR scheduler (epochs)": 600,
-        "Memory (Training, GB)": 4.0,
-        "Dataset": "COCO",
-        "box AP": 21.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "SSD",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ssd",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ssd/ssdlite_mobilenetv2_scratch_600e_coco/ssdlite_mobilenetv2_scratch_600e_coco_20210629_110627-974d9307.pth",
-            "config_url": "configs/ssd/ssdlite_mobilenetv2-scratch_8xb24-600e_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe-c4_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 35.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_c4_1x_coco/faster_rcnn_r50_caffe_c4_1x_coco_20220316_150152-3f885b85.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe_c4-1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe-c4_mstrain_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 35.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_c4_mstrain_1x_coco/faster_rcnn_r50_caffe_c4_mstrain_1x_coco_20220316_150527-db276fed.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe-c4_ms-1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe-dc5_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_dc5_1x_coco/faster_rcnn_r50_caffe_dc5_1x_coco_20201030_151909-531f0f43.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe-dc5_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.8,
-        "Dataset": "COCO",
-        "box AP": 37.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_fpn_1x_coco/faster_rcnn_r50_caffe_fpn_1x_coco_bbox_mAP-0.378_20200504_180032-c5925ee5.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 46.73,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.0,
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_1x_coco/faster_rcnn_r50_fpn_1x_coco_20200130-047c8118.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_fp16_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 34.72,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.4,
-        "Dataset": "COCO",
-        "box AP": 37.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fp16/faster_rcnn_r50_fpn_fp16_1x_coco/faster_rcnn_r50_fpn_fp16_1x_coco_20200204-d4dc1471.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_amp-1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_2x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 46.73,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 4.0,
-        "Dataset": "COCO",
-        "box AP": 38.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_2x_coco/faster_rcnn_r50_fpn_2x_coco_bbox_mAP-0.384_20200504_210434-a5d8aa15.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.7,
-        "Dataset": "COCO",
-        "box AP": 39.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r101_caffe_fpn_1x_coco/faster_rcnn_r101_caffe_fpn_1x_coco_bbox_mAP-0.398_20200504_180057-b269e9dd.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r101_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 64.1,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "box AP": 39.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r101_fpn_1x_coco/faster_rcnn_r101_fpn_1x_coco_20200130-f513f705.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r101_fpn_2x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 64.1,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "box AP": 39.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r101_fpn_2x_coco/faster_rcnn_r101_fpn_2x_coco_bbox_mAP-0.398_20200504_210455-1d2dac9c.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r101_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 72.46,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.2,
-        "Dataset": "COCO",
-        "box AP": 41.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_32x4d_fpn_1x_coco/faster_rcnn_x101_32x4d_fpn_1x_coco_20200203-cff10310.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-32x4d_fpn_2x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 72.46,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 7.2,
-        "Dataset": "COCO",
-        "box AP": 41.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_32x4d_fpn_2x_coco/faster_rcnn_x101_32x4d_fpn_2x_coco_bbox_mAP-0.412_20200506_041400-64a12c0b.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-32x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 106.38,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.3,
-        "Dataset": "COCO",
-        "box AP": 42.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_64x4d_fpn_1x_coco/faster_rcnn_x101_64x4d_fpn_1x_coco_20200204-833ee192.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-64x4d_fpn_2x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 106.38,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 10.3,
-        "Dataset": "COCO",
-        "box AP": 41.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_64x4d_fpn_2x_coco/faster_rcnn_x101_64x4d_fpn_2x_coco_20200512_161033-5961fa95.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-64x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_iou_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_iou_1x_coco/faster_rcnn_r50_fpn_iou_1x_coco_20200506_095954-938e81f0.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_iou_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_giou_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.6,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_1x_coco/faster_rcnn_r50_fpn_giou_1x_coco-0eada910.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_giou_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_bounded_iou_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_1x_coco/faster_rcnn_r50_fpn_bounded_iou_1x_coco-98ad993b.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_bounded-iou_1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe-dc5_mstrain_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 37.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_dc5_mstrain_1x_coco/faster_rcnn_r50_caffe_dc5_mstrain_1x_coco_20201028_233851-b33d21b9.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe-dc5_ms-1x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe-dc5_mstrain_3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "box AP": 38.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_dc5_mstrain_3x_coco/faster_rcnn_r50_caffe_dc5_mstrain_3x_coco_20201028_002107-34a53b2c.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe-dc5_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe_fpn_ms-2x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 4.3,
-        "Dataset": "COCO",
-        "box AP": 39.7,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_fpn_mstrain_2x_coco/faster_rcnn_r50_caffe_fpn_mstrain_2x_coco_bbox_mAP-0.397_20200504_231813-10b2de58.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe_fpn_ms-2x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50-caffe_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 3.7,
-        "Dataset": "COCO",
-        "box AP": 39.9,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_caffe_fpn_mstrain_3x_coco/faster_rcnn_r50_caffe_fpn_mstrain_3x_coco_20210526_095054-1f77628b.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_mstrain_3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 3.9,
-        "Dataset": "COCO",
-        "box AP": 40.3,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_mstrain_3x_coco/faster_rcnn_r50_fpn_mstrain_3x_coco_20210524_110822-e10bd31c.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r101-caffe_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 5.6,
-        "Dataset": "COCO",
-        "box AP": 42.0,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r101_caffe_fpn_mstrain_3x_coco/faster_rcnn_r101_caffe_fpn_mstrain_3x_coco_20210526_095742-a7ae426d.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r101-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r101_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 5.8,
-        "Dataset": "COCO",
-        "box AP": 41.8,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r101_fpn_mstrain_3x_coco/faster_rcnn_r101_fpn_mstrain_3x_coco_20210524_110822-4d4d2ca8.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r101_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-32x4d_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "box AP": 42.5,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_32x4d_fpn_mstrain_3x_coco/faster_rcnn_x101_32x4d_fpn_mstrain_3x_coco_20210524_124151-16b9b260.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-32x4d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-32x8d_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 10.1,
-        "Dataset": "COCO",
-        "box AP": 42.4,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_32x8d_fpn_mstrain_3x_coco/faster_rcnn_x101_32x8d_fpn_mstrain_3x_coco_20210604_182954-002e082a.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-32x8d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_x101-64x4d_fpn_ms-3x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 10.0,
-        "Dataset": "COCO",
-        "box AP": 43.1,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_x101_64x4d_fpn_mstrain_3x_coco/faster_rcnn_x101_64x4d_fpn_mstrain_3x_coco_20210524_124528-26c63de6.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_x101-64x4d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "faster-rcnn_r50_fpn_tnr-pretrain_1x_coco",
-        "Method": "Faster R-CNN",
-        "Inference Time (ms/im)": 46.73,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.0,
-        "Dataset": "COCO",
-        "box AP": 40.2,
-        "meta": {
-            "task_type": "object detection",
-            "arch_type": "Faster R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/faster_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/faster_rcnn/faster_rcnn_r50_fpn_tnr-pretrain_1x_coco/faster_rcnn_r50_fpn_tnr-pretrain_1x_coco_20220320_085147-efedfda4.pth",
-            "config_url": "configs/faster_rcnn/faster-rcnn_r50-tnr-pre_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_convnext-t-p4-w7_fpn_amp-ms-crop-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.3,
-        "Dataset": "COCO",
-        "mask AP": 41.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/convnext/mask_rcnn_convnext-t_p4_w7_fpn_fp16_ms-crop_3x_coco/mask_rcnn_convnext-t_p4_w7_fpn_fp16_ms-crop_3x_coco_20220426_154953-050731f4.pth",
-            "config_url": "configs/convnext/mask-rcnn_convnext-t-p4-w7_fpn_amp-ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_convnext-t-p4-w7_fpn_4conv1fc-giou_amp-ms-crop-3x_coco",
-        "Method": "Cascade Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 9.0,
-        "Dataset": "COCO",
-        "mask AP": 43.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/convnext/cascade_mask_rcnn_convnext-t_p4_w7_fpn_giou_4conv1f_fp16_ms-crop_3x_coco/cascade_mask_rcnn_convnext-t_p4_w7_fpn_giou_4conv1f_fp16_ms-crop_3x_coco_20220509_204200-8f07c40b.pth",
-            "config_url": "configs/convnext/cascade-mask-rcnn_convnext-t-p4-w7_fpn_4conv1fc-giou_amp-ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_convnext-s-p4-w7_fpn_4conv1fc-giou_amp-ms-crop-3x_coco",
-        "Method": "Cascade Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 12.3,
-        "Dataset": "COCO",
-        "mask AP": 44.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/convnext/cascade_mask_rcnn_convnext-s_p4_w7_fpn_giou_4conv1f_fp16_ms-crop_3x_coco/cascade_mask_rcnn_convnext-s_p4_w7_fpn_giou_4conv1f_fp16_ms-crop_3x_coco_20220510_201004-3d24f5a4.pth",
-            "config_url": "configs/convnext/cascade-mask-rcnn_convnext-s-p4-w7_fpn_4conv1fc-giou_amp-ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet-ins_tiny_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 18.4,
-        "Dataset": "COCO",
-        "mask AP": 35.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet-ins_tiny_8xb32-300e_coco/rtmdet-ins_tiny_8xb32-300e_coco_20221130_151727-ec670f7e.pth",
-            "config_url": "configs/rtmdet/rtmdet-ins_tiny_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet-ins_s_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 27.6,
-        "Dataset": "COCO",
-        "mask AP": 38.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet-ins_s_8xb32-300e_coco/rtmdet-ins_s_8xb32-300e_coco_20221121_212604-fdc5d7ec.pth",
-            "config_url": "configs/rtmdet/rtmdet-ins_s_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet-ins_m_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 42.5,
-        "Dataset": "COCO",
-        "mask AP": 42.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet-ins_m_8xb32-300e_coco/rtmdet-ins_m_8xb32-300e_coco_20221123_001039-6eba602e.pth",
-            "config_url": "configs/rtmdet/rtmdet-ins_m_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet-ins_l_8xb32-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 59.8,
-        "Dataset": "COCO",
-        "mask AP": 43.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet-ins_l_8xb32-300e_coco/rtmdet-ins_l_8xb32-300e_coco_20221124_103237-78d1d652.pth",
-            "config_url": "configs/rtmdet/rtmdet-ins_l_8xb32-300e_coco.py",
-        },
-    },
-    {
-        "Model": "rtmdet-ins_x_8xb16-300e_coco",
-        "Method": "RTMDet",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 300,
-        "Memory (Training, GB)": 33.7,
-        "Dataset": "COCO",
-        "mask AP": 44.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "RTMDet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/rtmdet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/rtmdet/rtmdet-ins_x_8xb16-300e_coco/rtmdet-ins_x_8xb16-300e_coco_20221124_111313-33d4595b.pth",
-            "config_url": "configs/rtmdet/rtmdet-ins_x_8xb16-300e_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_swin-s-p4-w7_fpn_amp-ms-crop-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 11.9,
-        "Dataset": "COCO",
-        "mask AP": 43.2,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/swin/mask_rcnn_swin-s-p4-w7_fpn_fp16_ms-crop-3x_coco/mask_rcnn_swin-s-p4-w7_fpn_fp16_ms-crop-3x_coco_20210903_104808-b92c91f1.pth",
-            "config_url": "configs/swin/mask-rcnn_swin-s-p4-w7_fpn_amp-ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_swin-t-p4-w7_fpn_ms-crop-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 10.2,
-        "Dataset": "COCO",
-        "mask AP": 41.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/swin/mask_rcnn_swin-t-p4-w7_fpn_ms-crop-3x_coco/mask_rcnn_swin-t-p4-w7_fpn_ms-crop-3x_coco_20210906_131725-bacf6f7b.pth",
-            "config_url": "configs/swin/mask-rcnn_swin-t-p4-w7_fpn_ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_swin-t-p4-w7_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "mask AP": 39.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/swin/mask_rcnn_swin-t-p4-w7_fpn_1x_coco/mask_rcnn_swin-t-p4-w7_fpn_1x_coco_20210902_120937-9d6b7cfa.pth",
-            "config_url": "configs/swin/mask-rcnn_swin-t-p4-w7_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_swin-t-p4-w7_fpn_amp-ms-crop-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.8,
-        "Dataset": "COCO",
-        "mask AP": 41.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/swin/mask_rcnn_swin-t-p4-w7_fpn_fp16_ms-crop-3x_coco/mask_rcnn_swin-t-p4-w7_fpn_fp16_ms-crop-3x_coco_20210908_165006-90a4008c.pth",
-            "config_url": "configs/swin/mask-rcnn_swin-t-p4-w7_fpn_amp-ms-crop-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask2former_r101_8xb2-lsj-50e_coco",
-        "Method": "Mask2Former",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": 15.5,
-        "Dataset": "COCO",
-        "mask AP": 44.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask2Former",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask2former",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/mask2former/mask2former_r101_8xb2-lsj-50e_coco/mask2former_r101_8xb2-lsj-50e_coco_20220426_100250-ecf181e2.pth",
-            "config_url": "configs/mask2former/mask2former_r101_8xb2-lsj-50e_coco.py",
-        },
-    },
-    {
-        "Model": "mask2former_r50_8xb2-lsj-50e_coco",
-        "Method": "Mask2Former",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": 13.7,
-        "Dataset": "COCO",
-        "mask AP": 42.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask2Former",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask2former",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/mask2former/mask2former_r50_8xb2-lsj-50e_coco/mask2former_r50_8xb2-lsj-50e_coco_20220506_191028-41b088b6.pth",
-            "config_url": "configs/mask2former/mask2former_r50_8xb2-lsj-50e_coco.py",
-        },
-    },
-    {
-        "Model": "mask2former_swin-t-p4-w7-224_8xb2-lsj-50e_coco",
-        "Method": "Mask2Former",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": 15.3,
-        "Dataset": "COCO",
-        "mask AP": 44.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask2Former",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask2former",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/mask2former/mask2former_swin-t-p4-w7-224_8xb2-lsj-50e_coco/mask2former_swin-t-p4-w7-224_8xb2-lsj-50e_coco_20220508_091649-01b0f990.pth",
-            "config_url": "configs/mask2former/mask2former_swin-t-p4-w7-224_8xb2-lsj-50e_coco.py",
-        },
-    },
-    {
-        "Model": "mask2former_swin-s-p4-w7-224_8xb2-lsj-50e_coco",
-        "Method": "Mask2Former",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": 18.8,
-        "Dataset": "COCO",
-        "mask AP": 46.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask2Former",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask2former",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/mask2former/mask2former_swin-s-p4-w7-224_8xb2-lsj-50e_coco/mask2former_swin-s-p4-w7-224_8xb2-lsj-50e_coco_20220504_001756-c9d0c4f2.pth",
-            "config_url": "configs/mask2former/mask2former_swin-s-p4-w7-224_8xb2-lsj-50e_coco.py",
-        },
-    },
-    {
-        "Model": "boxinst_r50_fpn_ms-90k_coco",
-        "Method": "BoxInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 30.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "BoxInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/boxinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/boxinst/boxinst_r50_fpn_ms-90k_coco/boxinst_r50_fpn_ms-90k_coco_20221228_163052-6add751a.pth",
-            "config_url": "configs/boxinst/boxinst_r50_fpn_ms-90k_coco.py",
-        },
-    },
-    {
-        "Model": "boxinst_r101_fpn_ms-90k_coco",
-        "Method": "BoxInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 32.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "BoxInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/boxinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/boxinst/boxinst_r101_fpn_ms-90k_coco/boxinst_r101_fpn_ms-90k_coco_20221229_145106-facf375b.pth",
-            "config_url": "configs/boxinst/boxinst_r101_fpn_ms-90k_coco.py",
-        },
-    },
-    {
-        "Model": "queryinst_r50_fpn_1x_coco",
-        "Method": "QueryInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 37.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "QueryInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/queryinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/queryinst/queryinst_r50_fpn_1x_coco/queryinst_r50_fpn_1x_coco_20210907_084916-5a8f1998.pth",
-            "config_url": "configs/queryinst/queryinst_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "queryinst_r50_fpn_ms-480-800-3x_coco",
-        "Method": "QueryInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 39.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "QueryInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/queryinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/queryinst/queryinst_r50_fpn_mstrain_480-800_3x_coco/queryinst_r50_fpn_mstrain_480-800_3x_coco_20210901_103643-7837af86.pth",
-            "config_url": "configs/queryinst/queryinst_r50_fpn_ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "queryinst_r50_fpn_300-proposals_crop-ms-480-800-3x_coco",
-        "Method": "QueryInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 41.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "QueryInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/queryinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/queryinst/queryinst_r50_fpn_300_proposals_crop_mstrain_480-800_3x_coco/queryinst_r50_fpn_300_proposals_crop_mstrain_480-800_3x_coco_20210904_101802-85cffbd8.pth",
-            "config_url": "configs/queryinst/queryinst_r50_fpn_300-proposals_crop-ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "queryinst_r101_fpn_ms-480-800-3x_coco",
-        "Method": "QueryInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 41.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "QueryInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/queryinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/queryinst/queryinst_r101_fpn_mstrain_480-800_3x_coco/queryinst_r101_fpn_mstrain_480-800_3x_coco_20210904_104048-91f9995b.pth",
-            "config_url": "configs/queryinst/queryinst_r101_fpn_ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "queryinst_r101_fpn_300-proposals_crop-ms-480-800-3x_coco",
-        "Method": "QueryInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 42.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "QueryInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/queryinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/queryinst/queryinst_r101_fpn_300_proposals_crop_mstrain_480-800_3x_coco/queryinst_r101_fpn_300_proposals_crop_mstrain_480-800_3x_coco_20210904_153621-76cce59f.pth",
-            "config_url": "configs/queryinst/queryinst_r101_fpn_300-proposals_crop-ms-480-800-3x_coco.py",
-        },
-    },
-    {
-        "Model": "condinst_r50_fpn_ms-poly-90k_coco_instance",
-        "Method": "CondInst",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": "-",
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "mask AP": 36.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "CondInst",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/condinst",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v3.0/condinst/condinst_r50_fpn_ms-poly-90k_coco_instance/condinst_r50_fpn_ms-poly-90k_coco_instance_20221129_125223-4c186406.pth",
-            "config_url": "configs/condinst/condinst_r50_fpn_ms-poly-90k_coco_instance.py",
-        },
-    },
-    {
-        "Model": "scnet_r50_fpn_1x_coco",
-        "Method": "SCNet",
-        "Inference Time (ms/im)": 161.29,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "mask AP": 39.2,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SCNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/scnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/scnet/scnet_r50_fpn_1x_coco/scnet_r50_fpn_1x_coco-c3f09857.pth",
-            "config_url": "configs/scnet/scnet_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "scnet_r50_fpn_20e_coco",
-        "Method": "SCNet",
-        "Inference Time (ms/im)": 161.29,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 7.0,
-        "Dataset": "COCO",
-        "mask AP": 40.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SCNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/scnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/scnet/scnet_r50_fpn_20e_coco/scnet_r50_fpn_20e_coco-a569f645.pth",
-            "config_url": "configs/scnet/scnet_r50_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "scnet_r101_fpn_20e_coco",
-        "Method": "SCNet",
-        "Inference Time (ms/im)": 172.41,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 8.9,
-        "Dataset": "COCO",
-        "mask AP": 40.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SCNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/scnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/scnet/scnet_r101_fpn_20e_coco/scnet_r101_fpn_20e_coco-294e312c.pth",
-            "config_url": "configs/scnet/scnet_r101_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "scnet_x101-64x4d_fpn_20e_coco",
-        "Method": "SCNet",
-        "Inference Time (ms/im)": 204.08,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 13.2,
-        "Dataset": "COCO",
-        "mask AP": 42.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SCNet",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/scnet",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/scnet/scnet_x101_64x4d_fpn_20e_coco/scnet_x101_64x4d_fpn_20e_coco-fb09dec9.pth",
-            "config_url": "configs/scnet/scnet_x101-64x4d_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_r50-rfp_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 11.2,
-        "Dataset": "COCO",
-        "mask AP": 40.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/htc_r50_rfp_1x_coco/htc_r50_rfp_1x_coco-8ff87c51.pth",
-            "config_url": "configs/detectors/htc_r50-rfp_1x_coco.py",
-        },
-    },
-    {
-        "Model": "htc_r50-sac_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.3,
-        "Dataset": "COCO",
-        "mask AP": 40.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/htc_r50_sac_1x_coco/htc_r50_sac_1x_coco-bfa60c54.pth",
-            "config_url": "configs/detectors/htc_r50-sac_1x_coco.py",
-        },
-    },
-    {
-        "Model": "detectors_htc-r50_1x_coco",
-        "Method": "DetectoRS",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 13.6,
-        "Dataset": "COCO",
-        "mask AP": 42.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "DetectoRS",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/detectors",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/detectors/detectors_htc_r50_1x_coco/detectors_htc_r50_1x_coco-329b1453.pth",
-            "config_url": "configs/detectors/detectors_htc-r50_1x_coco.py",
-        },
-    },
-    {
-        "Model": "point_rend_r50_caffe_fpn_mstrain_1x_coco",
-        "Method": "PointRend",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.6,
-        "Dataset": "COCO",
-        "mask AP": 36.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/point_rend/point_rend_r50_caffe_fpn_mstrain_1x_coco/point_rend_r50_caffe_fpn_mstrain_1x_coco-1bcb5fb4.pth",
-            "config_url": "configs/point_rend/point-rend_r50-caffe_fpn_ms-1x_coco.py",
-        },
-    },
-    {
-        "Model": "point_rend_r50_caffe_fpn_mstrain_3x_coco",
-        "Method": "PointRend",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 4.6,
-        "Dataset": "COCO",
-        "mask AP": 38.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/point_rend/point_rend_r50_caffe_fpn_mstrain_3x_coco/point_rend_r50_caffe_fpn_mstrain_3x_coco-e0ebb6b7.pth",
-            "config_url": "configs/point_rend/point-rend_r50-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "decoupled-solo_r50_fpn_1x_coco",
-        "Method": "SOLO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.8,
-        "Dataset": "COCO",
-        "mask AP": 33.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SOLO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/solo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/solo/decoupled_solo_r50_fpn_1x_coco/decoupled_solo_r50_fpn_1x_coco_20210820_233348-6337c589.pth",
-            "config_url": "configs/solo/decoupled-solo_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "decoupled-solo_r50_fpn_3x_coco",
-        "Method": "SOLO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.9,
-        "Dataset": "COCO",
-        "mask AP": 36.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SOLO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/solo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/solo/decoupled_solo_r50_fpn_3x_coco/decoupled_solo_r50_fpn_3x_coco_20210821_042504-7b3301ec.pth",
-            "config_url": "configs/solo/decoupled-solo_r50_fpn_3x_coco.py",
-        },
-    },
-    {
-        "Model": "decoupled-solo-light_r50_fpn_3x_coco",
-        "Method": "SOLO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 2.2,
-        "Dataset": "COCO",
-        "mask AP": 32.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SOLO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/solo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/solo/decoupled_solo_light_r50_fpn_3x_coco/decoupled_solo_light_r50_fpn_3x_coco_20210906_142703-e70e226f.pth",
-            "config_url": "configs/solo/decoupled-solo-light_r50_fpn_3x_coco.py",
-        },
-    },
-    {
-        "Model": "solo_r50_fpn_3x_coco",
-        "Method": "SOLO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.4,
-        "Dataset": "COCO",
-        "mask AP": 35.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SOLO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/solo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/solo/solo_r50_fpn_3x_coco/solo_r50_fpn_3x_coco_20210901_012353-11d224d7.pth",
-            "config_url": "configs/solo/solo_r50_fpn_3x_coco.py",
-        },
-    },
-    {
-        "Model": "solo_r50_fpn_1x_coco",
-        "Method": "SOLO",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.0,
-        "Dataset": "COCO",
-        "mask AP": 33.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "SOLO",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/solo",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/solo/solo_r50_fpn_1x_coco/solo_r50_fpn_1x_coco_20210821_035055-2290a6b8.pth",
-            "config_url": "configs/solo/solo_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50_fpn_instaboost_4x_coco",
-        "Method": "InstaBoost",
-        "Inference Time (ms/im)": 57.14,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 48,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "mask AP": 36.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "InstaBoost",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/instaboost",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/instaboost/mask_rcnn_r50_fpn_instaboost_4x_coco/mask_rcnn_r50_fpn_instaboost_4x_coco_20200307-d025f83a.pth",
-            "config_url": "configs/instaboost/mask-rcnn_r50_fpn_instaboost-4x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101_fpn_instaboost-4x_coco",
-        "Method": "InstaBoost",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 48,
-        "Memory (Training, GB)": 6.4,
-        "Dataset": "COCO",
-        "mask AP": 38.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "InstaBoost",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/instaboost",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/instaboost/mask_rcnn_r101_fpn_instaboost_4x_coco/mask_rcnn_r101_fpn_instaboost_4x_coco_20200703_235738-f23f3a5f.pth",
-            "config_url": "configs/instaboost/mask-rcnn_r101_fpn_instaboost-4x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-64x4d_fpn_instaboost-4x_coco",
-        "Method": "InstaBoost",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 48,
-        "Memory (Training, GB)": 10.7,
-        "Dataset": "COCO",
-        "mask AP": 39.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "InstaBoost",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/instaboost",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/instaboost/mask_rcnn_x101_64x4d_fpn_instaboost_4x_coco/mask_rcnn_x101_64x4d_fpn_instaboost_4x_coco_20200515_080947-8ed58c1b.pth",
-            "config_url": "configs/instaboost/mask-rcnn_x101-64x4d_fpn_instaboost-4x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50_fpn_instaboost_4x_coco",
-        "Method": "InstaBoost",
-        "Inference Time (ms/im)": 83.33,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 48,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "mask AP": 38.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "InstaBoost",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/instaboost",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/instaboost/cascade_mask_rcnn_r50_fpn_instaboost_4x_coco/cascade_mask_rcnn_r50_fpn_instaboost_4x_coco_20200307-c19d98d9.pth",
-            "config_url": "configs/instaboost/cascade-mask-rcnn_r50_fpn_instaboost-4x_coco.py",
-        },
-    },
-    {
-        "Model": "yolact_r50_1x8_coco",
-        "Method": "YOLACT",
-        "Inference Time (ms/im)": 23.53,
-        "Input Size (H, W)": "(550, 550)",
-        "LR scheduler (epochs)": 55,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 29.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "YOLACT",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolact",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolact/yolact_r50_1x8_coco/yolact_r50_1x8_coco_20200908-f38d58df.pth",
-            "config_url": "configs/yolact/yolact_r50_1xb8-55e_coco.py",
-        },
-    },
-    {
-        "Model": "yolact_r50_8x8_coco",
-        "Method": "YOLACT",
-        "Inference Time (ms/im)": 23.53,
-        "Input Size (H, W)": "(550, 550)",
-        "LR scheduler (epochs)": 55,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 28.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "YOLACT",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolact",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolact/yolact_r50_8x8_coco/yolact_r50_8x8_coco_20200908-ca34f5db.pth",
-            "config_url": "configs/yolact/yolact_r50_8xb8-55e_coco.py",
-        },
-    },
-    {
-        "Model": "yolact_r101_1x8_coco",
-        "Method": "YOLACT",
-        "Inference Time (ms/im)": 29.85,
-        "Input Size (H, W)": "(550, 550)",
-        "LR scheduler (epochs)": 55,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 30.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "YOLACT",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/yolact",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/yolact/yolact_r101_1x8_coco/yolact_r101_1x8_coco_20200908-4cbe9101.pth",
-            "config_url": "configs/yolact/yolact_r101_1xb8-55e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_r50_fpn_1x_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": 172.41,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 8.2,
-        "Dataset": "COCO",
-        "mask AP": 37.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_r50_fpn_1x_coco/htc_r50_fpn_1x_coco_20200317-7332cf16.pth",
-            "config_url": "configs/htc/htc_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "htc_r50_fpn_20e_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": 172.41,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 8.2,
-        "Dataset": "COCO",
-        "mask AP": 38.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_r50_fpn_20e_coco/htc_r50_fpn_20e_coco_20200319-fe28c577.pth",
-            "config_url": "configs/htc/htc_r50_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_r101_fpn_20e_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": 181.82,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 10.2,
-        "Dataset": "COCO",
-        "mask AP": 39.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_r101_fpn_20e_coco/htc_r101_fpn_20e_coco_20200317-9b41b48f.pth",
-            "config_url": "configs/htc/htc_r101_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_x101-32x4d_fpn_16xb1-20e_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": 200,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 11.4,
-        "Dataset": "COCO",
-        "mask AP": 40.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_x101_32x4d_fpn_16x1_20e_coco/htc_x101_32x4d_fpn_16x1_20e_coco_20200318-de97ae01.pth",
-            "config_url": "configs/htc/htc_x101-32x4d_fpn_16xb1-20e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_x101-64x4d_fpn_16xb1-20e_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": 227.27,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 14.5,
-        "Dataset": "COCO",
-        "mask AP": 41.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_x101_64x4d_fpn_16x1_20e_coco/htc_x101_64x4d_fpn_16x1_20e_coco_20200318-b181fd7a.pth",
-            "config_url": "configs/htc/htc_x101-64x4d_fpn_16xb1-20e_coco.py",
-        },
-    },
-    {
-        "Model": "htc_x101-64x4d-dconv-c3-c5_fpn_ms-400-1400-16xb1-20e_coco",
-        "Method": "HTC",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 43.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Hybrid Task Cascade",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/htc",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/htc/htc_x101_64x4d_fpn_dconv_c3-c5_mstrain_400_1400_16x1_20e_coco/htc_x101_64x4d_fpn_dconv_c3-c5_mstrain_400_1400_16x1_20e_coco_20200312-946fd751.pth",
-            "config_url": "configs/htc/htc_x101-64x4d-dconv-c3-c5_fpn_ms-400-1400-16xb1-20e_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.5,
-        "Dataset": "COCO",
-        "mask AP": 36.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_r50_caffe_fpn_1x_coco/ms_rcnn_r50_caffe_fpn_1x_coco_20200702_180848-61c9355e.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_r50-caffe_fpn_2x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 36.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_r50_caffe_fpn_2x_coco/ms_rcnn_r50_caffe_fpn_2x_coco_bbox_mAP-0.388__segm_mAP-0.363_20200506_004738-ee87b137.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_r50-caffe_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.5,
-        "Dataset": "COCO",
-        "mask AP": 37.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_r101_caffe_fpn_1x_coco/ms_rcnn_r101_caffe_fpn_1x_coco_bbox_mAP-0.404__segm_mAP-0.376_20200506_004755-b9b12a37.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_r101-caffe_fpn_2x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 38.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_r101_caffe_fpn_2x_coco/ms_rcnn_r101_caffe_fpn_2x_coco_bbox_mAP-0.411__segm_mAP-0.381_20200506_011134-5f3cc74f.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_r101-caffe_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": 90.91,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.9,
-        "Dataset": "COCO",
-        "mask AP": 38.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_x101_32x4d_fpn_1x_coco/ms_rcnn_x101_32x4d_fpn_1x_coco_20200206-81fd1740.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": 125,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 11.0,
-        "Dataset": "COCO",
-        "mask AP": 39.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_x101_64x4d_fpn_1x_coco/ms_rcnn_x101_64x4d_fpn_1x_coco_20200206-86ba88d2.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "ms-rcnn_x101-64x4d_fpn_2x_coco",
-        "Method": "Mask Scoring R-CNN",
-        "Inference Time (ms/im)": 125,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 11.0,
-        "Dataset": "COCO",
-        "mask AP": 39.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask Scoring R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/ms_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/ms_rcnn/ms_rcnn_x101_64x4d_fpn_2x_coco/ms_rcnn_x101_64x4d_fpn_2x_coco_20200308-02a445e2.pth",
-            "config_url": "configs/ms_rcnn/ms-rcnn_x101-64x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 5.9,
-        "Dataset": "COCO",
-        "mask AP": 36.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r50_caffe_fpn_1x_coco/cascade_mask_rcnn_r50_caffe_fpn_1x_coco_bbox_mAP-0.412__segm_mAP-0.36_20200504_174659-5004b251.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 89.29,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "mask AP": 35.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r50_fpn_1x_coco/cascade_mask_rcnn_r50_fpn_1x_coco_20200203-9d4dcb24.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 89.29,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 6.0,
-        "Dataset": "COCO",
-        "mask AP": 36.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r50_fpn_20e_coco/cascade_mask_rcnn_r50_fpn_20e_coco_bbox_mAP-0.419__segm_mAP-0.365_20200504_174711-4af8e66e.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r50_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.8,
-        "Dataset": "COCO",
-        "mask AP": 37.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r101_caffe_fpn_1x_coco/cascade_mask_rcnn_r101_caffe_fpn_1x_coco_bbox_mAP-0.432__segm_mAP-0.376_20200504_174813-5c1e9599.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r101_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 102.04,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.9,
-        "Dataset": "COCO",
-        "mask AP": 37.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r101_fpn_1x_coco/cascade_mask_rcnn_r101_fpn_1x_coco_20200203-befdf6ee.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r101_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 102.04,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 7.9,
-        "Dataset": "COCO",
-        "mask AP": 37.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r101_fpn_20e_coco/cascade_mask_rcnn_r101_fpn_20e_coco_bbox_mAP-0.434__segm_mAP-0.378_20200504_174836-005947da.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r101_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 116.28,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 9.2,
-        "Dataset": "COCO",
-        "mask AP": 38.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_32x4d_fpn_1x_coco/cascade_mask_rcnn_x101_32x4d_fpn_1x_coco_20200201-0f411b1f.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-32x4d_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 116.28,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 9.2,
-        "Dataset": "COCO",
-        "mask AP": 39.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_32x4d_fpn_20e_coco/cascade_mask_rcnn_x101_32x4d_fpn_20e_coco_20200528_083917-ed1f4751.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-32x4d_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": 149.25,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 12.2,
-        "Dataset": "COCO",
-        "mask AP": 39.2,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_64x4d_fpn_1x_coco/cascade_mask_rcnn_x101_64x4d_fpn_1x_coco_20200203-9a2db89d.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-64x4d_fpn_20e_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 20,
-        "Memory (Training, GB)": 12.2,
-        "Dataset": "COCO",
-        "mask AP": 39.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_64x4d_fpn_20e_coco/cascade_mask_rcnn_x101_64x4d_fpn_20e_coco_20200512_161033-bdb5126a.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-64x4d_fpn_20e_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50-caffe_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 5.7,
-        "Dataset": "COCO",
-        "mask AP": 38.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r50_caffe_fpn_mstrain_3x_coco/cascade_mask_rcnn_r50_caffe_fpn_mstrain_3x_coco_20210707_002651-6e29b3a6.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r50-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r50_fpn_mstrain_3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 5.9,
-        "Dataset": "COCO",
-        "mask AP": 38.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r50_fpn_mstrain_3x_coco/cascade_mask_rcnn_r50_fpn_mstrain_3x_coco_20210628_164719-5bdc3824.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r50_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r101-caffe_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.7,
-        "Dataset": "COCO",
-        "mask AP": 39.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r101_caffe_fpn_mstrain_3x_coco/cascade_mask_rcnn_r101_caffe_fpn_mstrain_3x_coco_20210707_002620-a5bd2389.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r101-caffe_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_r101_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.8,
-        "Dataset": "COCO",
-        "mask AP": 39.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_r101_fpn_mstrain_3x_coco/cascade_mask_rcnn_r101_fpn_mstrain_3x_coco_20210628_165236-51a2d363.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_r101_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-32x4d_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 9.0,
-        "Dataset": "COCO",
-        "mask AP": 40.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_32x4d_fpn_mstrain_3x_coco/cascade_mask_rcnn_x101_32x4d_fpn_mstrain_3x_coco_20210706_225234-40773067.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-32x4d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-32x8d_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 12.1,
-        "Dataset": "COCO",
-        "mask AP": 39.9,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_32x8d_fpn_mstrain_3x_coco/cascade_mask_rcnn_x101_32x8d_fpn_mstrain_3x_coco_20210719_180640-9ff7e76f.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-32x8d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "cascade-mask-rcnn_x101-64x4d_fpn_ms-3x_coco",
-        "Method": "Cascade R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 12.0,
-        "Dataset": "COCO",
-        "mask AP": 40.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Cascade Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/cascade_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/cascade_rcnn/cascade_mask_rcnn_x101_64x4d_fpn_mstrain_3x_coco/cascade_mask_rcnn_x101_64x4d_fpn_mstrain_3x_coco_20210719_210311-d3e64ba0.pth",
-            "config_url": "configs/cascade_rcnn/cascade-mask-rcnn_x101-64x4d_fpn_ms-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50-caffe_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.3,
-        "Dataset": "COCO",
-        "mask AP": 34.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_caffe_fpn_1x_coco/mask_rcnn_r50_caffe_fpn_1x_coco_bbox_mAP-0.38__segm_mAP-0.344_20200504_231812-0ebd1859.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 62.11,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "mask AP": 34.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_fpn_1x_coco/mask_rcnn_r50_fpn_1x_coco_20200205-d4b0c5d6.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50_fpn_fp16_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 41.49,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 3.6,
-        "Dataset": "COCO",
-        "mask AP": 34.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/fp16/mask_rcnn_r50_fpn_fp16_1x_coco/mask_rcnn_r50_fpn_fp16_1x_coco_20200205-59faf7e4.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50_fpn_amp-1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50_fpn_2x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 62.11,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 4.4,
-        "Dataset": "COCO",
-        "mask AP": 35.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_fpn_2x_coco/mask_rcnn_r50_fpn_2x_coco_bbox_mAP-0.392__segm_mAP-0.354_20200505_003907-3e542a40.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101-caffe_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": "-",
-        "Dataset": "COCO",
-        "mask AP": 36.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r101_caffe_fpn_1x_coco/mask_rcnn_r101_caffe_fpn_1x_coco_20200601_095758-805e06c1.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r101-caffe_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 74.07,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 6.4,
-        "Dataset": "COCO",
-        "mask AP": 36.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r101_fpn_1x_coco/mask_rcnn_r101_fpn_1x_coco_20200204-1efe0ed5.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r101_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101_fpn_2x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 74.07,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 6.4,
-        "Dataset": "COCO",
-        "mask AP": 36.6,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r101_fpn_2x_coco/mask_rcnn_r101_fpn_2x_coco_bbox_mAP-0.408__segm_mAP-0.366_20200505_071027-14b391c7.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r101_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x4d_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 88.5,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "mask AP": 37.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x4d_fpn_1x_coco/mask_rcnn_x101_32x4d_fpn_1x_coco_20200205-478d0b67.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x4d_fpn_2x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 88.5,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 7.6,
-        "Dataset": "COCO",
-        "mask AP": 37.8,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x4d_fpn_2x_coco/mask_rcnn_x101_32x4d_fpn_2x_coco_bbox_mAP-0.422__segm_mAP-0.378_20200506_004702-faef898c.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-64x4d_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 125,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.7,
-        "Dataset": "COCO",
-        "mask AP": 38.4,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_64x4d_fpn_1x_coco/mask_rcnn_x101_64x4d_fpn_1x_coco_20200201-9352eb0d.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-64x4d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-64x4d_fpn_2x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": 125,
-        "Input Size (H, W)": "(800, 1333)",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 10.7,
-        "Dataset": "COCO",
-        "mask AP": 38.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_64x4d_fpn_2x_coco/mask_rcnn_x101_64x4d_fpn_2x_coco_20200509_224208-39d6f70c.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-64x4d_fpn_2x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x8d_fpn_1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.6,
-        "Dataset": "COCO",
-        "mask AP": 38.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x8d_fpn_1x_coco/mask_rcnn_x101_32x8d_fpn_1x_coco_20220630_173841-0aaf329e.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x8d_fpn_1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50-caffe_fpn_ms-poly-2x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 24,
-        "Memory (Training, GB)": 4.3,
-        "Dataset": "COCO",
-        "mask AP": 36.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_caffe_fpn_mstrain-poly_2x_coco/mask_rcnn_r50_caffe_fpn_mstrain-poly_2x_coco_bbox_mAP-0.403__segm_mAP-0.365_20200504_231822-a75c98ce.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50-caffe_fpn_ms-poly-2x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50-caffe_fpn_ms-poly-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 4.3,
-        "Dataset": "COCO",
-        "mask AP": 37.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_caffe_fpn_mstrain-poly_3x_coco/mask_rcnn_r50_caffe_fpn_mstrain-poly_3x_coco_bbox_mAP-0.408__segm_mAP-0.37_20200504_163245-42aa3d00.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50-caffe_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r50_fpn_mstrain-poly_3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 4.1,
-        "Dataset": "COCO",
-        "mask AP": 37.1,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r50_fpn_mstrain-poly_3x_coco/mask_rcnn_r50_fpn_mstrain-poly_3x_coco_20210524_201154-21b550bb.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r50_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101_fpn_ms-poly-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 6.1,
-        "Dataset": "COCO",
-        "mask AP": 38.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r101_fpn_mstrain-poly_3x_coco/mask_rcnn_r101_fpn_mstrain-poly_3x_coco_20210524_200244-5675c317.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r101_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_r101-caffe_fpn_ms-poly-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 5.9,
-        "Dataset": "COCO",
-        "mask AP": 38.5,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_r101_caffe_fpn_mstrain-poly_3x_coco/mask_rcnn_r101_caffe_fpn_mstrain-poly_3x_coco_20210526_132339-3c33ce02.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_r101-caffe_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x4d_fpn_ms-poly-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 7.3,
-        "Dataset": "COCO",
-        "mask AP": 39.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x4d_fpn_mstrain-poly_3x_coco/mask_rcnn_x101_32x4d_fpn_mstrain-poly_3x_coco_20210524_201410-abcd7859.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x4d_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x8d_fpn_ms-poly-1x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 12,
-        "Memory (Training, GB)": 10.4,
-        "Dataset": "COCO",
-        "mask AP": 39.0,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x8d_fpn_mstrain-poly_1x_coco/mask_rcnn_x101_32x8d_fpn_mstrain-poly_1x_coco_20220630_170346-b4637974.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x8d_fpn_ms-poly-1x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-32x8d_fpn_ms-poly-3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 10.3,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_32x8d_fpn_mstrain-poly_3x_coco/mask_rcnn_x101_32x8d_fpn_mstrain-poly_3x_coco_20210607_161042-8bd2c639.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-32x8d_fpn_ms-poly-3x_coco.py",
-        },
-    },
-    {
-        "Model": "mask-rcnn_x101-64x4d_fpn_ms-poly_3x_coco",
-        "Method": "Mask R-CNN",
-        "Inference Time (ms/im)": "-",
-        "Input Size (H, W)": "-",
-        "LR scheduler (epochs)": 36,
-        "Memory (Training, GB)": 10.4,
-        "Dataset": "COCO",
-        "mask AP": 39.7,
-        "meta": {
-            "task_type": "instance segmentation",
-            "arch_type": "Mask R-CNN",
-            "arch_link": "https://github.com/open-mmlab/mmdetection/tree/v3.3.0/configs/mask_rcnn",
-            "weights_url": "https://download.openmmlab.com/mmdetection/v2.0/mask_rcnn/mask_rcnn_x101_64x4d_fpn_mstrain-poly_3x_coco/mask_rcnn_x101_64x4d_fpn_mstrain-poly_3x_coco_20210526_120447-c376f129.pth",
-            "config_url": "configs/mask_rcnn/mask-rcnn_x101-64x4d_fpn_ms-poly_3x_coco.py",
-        },
-    },
-]
-
-mmsegmentation = [
-    {
-        "Model": "upernet_convnext_tiny_fp16_512x512_160k_ade20k",
-        "Backbone": "ConvNeXt-T",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 46.11,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_tiny_fp16_512x512_160k_ade20k/upernet_convnext_tiny_fp16_512x512_160k_ade20k_20220227_124553-cad485de.pth",
-            "config_url": "configs/convnext/upernet_convnext_tiny_fp16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_convnext_small_fp16_512x512_160k_ade20k",
-        "Backbone": "ConvNeXt-S",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 48.56,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_small_fp16_512x512_160k_ade20k/upernet_convnext_small_fp16_512x512_160k_ade20k_20220227_131208-1b1e394f.pth",
-            "config_url": "configs/convnext/upernet_convnext_small_fp16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_convnext_base_fp16_512x512_160k_ade20k",
-        "Backbone": "ConvNeXt-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 48.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_base_fp16_512x512_160k_ade20k/upernet_convnext_base_fp16_512x512_160k_ade20k_20220227_181227-02a24fc6.pth",
-            "config_url": "configs/convnext/upernet_convnext_base_fp16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_convnext_base_fp16_640x640_160k_ade20k",
-        "Backbone": "ConvNeXt-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 52.13,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_base_fp16_640x640_160k_ade20k/upernet_convnext_base_fp16_640x640_160k_ade20k_20220227_182859-9280e39b.pth",
-            "config_url": "configs/convnext/upernet_convnext_base_fp16_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_convnext_large_fp16_640x640_160k_ade20k",
-        "Backbone": "ConvNeXt-L",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 53.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_large_fp16_640x640_160k_ade20k/upernet_convnext_large_fp16_640x640_160k_ade20k_20220226_040532-e57aa54d.pth",
-            "config_url": "configs/convnext/upernet_convnext_large_fp16_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_convnext_xlarge_fp16_640x640_160k_ade20k",
-        "Backbone": "ConvNeXt-XL",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 53.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ConvNeXt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/convnext",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/convnext/upernet_convnext_xlarge_fp16_640x640_160k_ade20k/upernet_convnext_xlarge_fp16_640x640_160k_ade20k_20220226_080344-95fc38c2.pth",
-            "config_url": "configs/convnext/upernet_convnext_xlarge_fp16_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_beit-base_8x2_640x640_160k_ade20k",
-        "Backbone": "BEiT-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 53.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BEiT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/beit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/beit/upernet_beit-base_8x2_640x640_160k_ade20k/upernet_beit-base_8x2_640x640_160k_ade20k-eead221d.pth",
-            "config_url": "configs/beit/upernet_beit-base_8x2_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_beit-large_fp16_8x1_640x640_160k_ade20k",
-        "Backbone": "BEiT-L",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 56.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BEiT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/beit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/beit/upernet_beit-large_fp16_8x1_640x640_160k_ade20k/upernet_beit-large_fp16_8x1_640x640_160k_ade20k-8fc0dd5d.pth",
-            "config_url": "configs/beit/upernet_beit-large_fp16_8x1_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_fcn_r50-d8_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_fcn_r50-d8_8x2_512x512_adamw_80k_ade20k/knet_s3_fcn_r50-d8_8x2_512x512_adamw_80k_ade20k_20220228_043751-abcab920.pth",
-            "config_url": "configs/knet/knet_s3_fcn_r50-d8_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_pspnet_r50-d8_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.18,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_pspnet_r50-d8_8x2_512x512_adamw_80k_ade20k/knet_s3_pspnet_r50-d8_8x2_512x512_adamw_80k_ade20k_20220228_054634-d2c72240.pth",
-            "config_url": "configs/knet/knet_s3_pspnet_r50-d8_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_deeplabv3_r50-d8_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_deeplabv3_r50-d8_8x2_512x512_adamw_80k_ade20k/knet_s3_deeplabv3_r50-d8_8x2_512x512_adamw_80k_ade20k_20220228_041642-00c8fbeb.pth",
-            "config_url": "configs/knet/knet_s3_deeplabv3_r50-d8_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_upernet_r50-d8_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_upernet_r50-d8_8x2_512x512_adamw_80k_ade20k/knet_s3_upernet_r50-d8_8x2_512x512_adamw_80k_ade20k_20220304_125657-215753b0.pth",
-            "config_url": "configs/knet/knet_s3_upernet_r50-d8_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_upernet_swin-t_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "Swin-T",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.84,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_upernet_swin-t_8x2_512x512_adamw_80k_ade20k/knet_s3_upernet_swin-t_8x2_512x512_adamw_80k_ade20k_20220303_133059-7545e1dc.pth",
-            "config_url": "configs/knet/knet_s3_upernet_swin-t_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_upernet_swin-l_8x2_512x512_adamw_80k_ade20k",
-        "Backbone": "Swin-L",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 52.05,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_upernet_swin-l_8x2_512x512_adamw_80k_ade20k/knet_s3_upernet_swin-l_8x2_512x512_adamw_80k_ade20k_20220303_154559-d8da9a90.pth",
-            "config_url": "configs/knet/knet_s3_upernet_swin-l_8x2_512x512_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "knet_s3_upernet_swin-l_8x2_640x640_adamw_80k_ade20k",
-        "Backbone": "Swin-L",
-        "Method": "KNet",
-        "Dataset": "ADE20K",
-        "mIoU": 52.21,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "KNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/knet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/knet/knet_s3_upernet_swin-l_8x2_640x640_adamw_80k_ade20k/knet_s3_upernet_swin-l_8x2_640x640_adamw_80k_ade20k_20220301_220747-8787fc71.pth",
-            "config_url": "configs/knet/knet_s3_upernet_swin-l_8x2_640x640_adamw_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b0_512x512_160k_ade20k",
-        "Backbone": "MIT-B0",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 37.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b0_512x512_160k_ade20k/segformer_mit-b0_512x512_160k_ade20k_20210726_101530-8ffa8fda.pth",
-            "config_url": "configs/segformer/segformer_mit-b0_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b1_512x512_160k_ade20k",
-        "Backbone": "MIT-B1",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 40.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b1_512x512_160k_ade20k/segformer_mit-b1_512x512_160k_ade20k_20210726_112106-d70e859d.pth",
-            "config_url": "configs/segformer/segformer_mit-b1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b2_512x512_160k_ade20k",
-        "Backbone": "MIT-B2",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 45.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b2_512x512_160k_ade20k/segformer_mit-b2_512x512_160k_ade20k_20210726_112103-cbd414ac.pth",
-            "config_url": "configs/segformer/segformer_mit-b2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b3_512x512_160k_ade20k",
-        "Backbone": "MIT-B3",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 47.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b3_512x512_160k_ade20k/segformer_mit-b3_512x512_160k_ade20k_20210726_081410-962b98d2.pth",
-            "config_url": "configs/segformer/segformer_mit-b3_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b4_512x512_160k_ade20k",
-        "Backbone": "MIT-B4",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 48.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b4_512x512_160k_ade20k/segformer_mit-b4_512x512_160k_ade20k_20210728_183055-7f509d7d.pth",
-            "config_url": "configs/segformer/segformer_mit-b4_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b5_512x512_160k_ade20k",
-        "Backbone": "MIT-B5",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 49.13,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b5_512x512_160k_ade20k/segformer_mit-b5_512x512_160k_ade20k_20210726_145235-94cedf59.pth",
-            "config_url": "configs/segformer/segformer_mit-b5_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b5_640x640_160k_ade20k",
-        "Backbone": "MIT-B5",
-        "Method": "Segformer",
-        "Dataset": "ADE20K",
-        "mIoU": 49.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b5_640x640_160k_ade20k/segformer_mit-b5_640x640_160k_ade20k_20210801_121243-41d2845b.pth",
-            "config_url": "configs/segformer/segformer_mit-b5_640x640_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b0_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B0",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.54,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b0_8x1_1024x1024_160k_cityscapes/segformer_mit-b0_8x1_1024x1024_160k_cityscapes_20211208_101857-e7f88502.pth",
-            "config_url": "configs/segformer/segformer_mit-b0_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b1_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B1",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.56,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b1_8x1_1024x1024_160k_cityscapes/segformer_mit-b1_8x1_1024x1024_160k_cityscapes_20211208_064213-655c7b3f.pth",
-            "config_url": "configs/segformer/segformer_mit-b1_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b2_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B2",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 81.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b2_8x1_1024x1024_160k_cityscapes/segformer_mit-b2_8x1_1024x1024_160k_cityscapes_20211207_134205-6096669a.pth",
-            "config_url": "configs/segformer/segformer_mit-b2_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b3_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B3",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 81.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b3_8x1_1024x1024_160k_cityscapes/segformer_mit-b3_8x1_1024x1024_160k_cityscapes_20211206_224823-a8f8a177.pth",
-            "config_url": "configs/segformer/segformer_mit-b3_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b4_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B4",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 81.89,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b4_8x1_1024x1024_160k_cityscapes/segformer_mit-b4_8x1_1024x1024_160k_cityscapes_20211207_080709-07f6c333.pth",
-            "config_url": "configs/segformer/segformer_mit-b4_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segformer_mit-b5_8x1_1024x1024_160k_cityscapes",
-        "Backbone": "MIT-B5",
-        "Method": "Segformer",
-        "Dataset": "Cityscapes",
-        "mIoU": 82.25,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segformer",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segformer/segformer_mit-b5_8x1_1024x1024_160k_cityscapes/segformer_mit-b5_8x1_1024x1024_160k_cityscapes_20211206_072934-87a052ec.pth",
-            "config_url": "configs/segformer/segformer_mit-b5_8x1_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "segmenter_vit-t_mask_8x1_512x512_160k_ade20k",
-        "Backbone": "ViT-T_16",
-        "Method": "Segmenter",
-        "Dataset": "ADE20K",
-        "mIoU": 39.99,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segmenter",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segmenter",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segmenter/segmenter_vit-t_mask_8x1_512x512_160k_ade20k/segmenter_vit-t_mask_8x1_512x512_160k_ade20k_20220105_151706-ffcf7509.pth",
-            "config_url": "configs/segmenter/segmenter_vit-t_mask_8x1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segmenter_vit-s_linear_8x1_512x512_160k_ade20k",
-        "Backbone": "ViT-S_16",
-        "Method": "Segmenter",
-        "Dataset": "ADE20K",
-        "mIoU": 45.75,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segmenter",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segmenter",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segmenter/segmenter_vit-s_linear_8x1_512x512_160k_ade20k/segmenter_vit-s_linear_8x1_512x512_160k_ade20k_20220105_151713-39658c46.pth",
-            "config_url": "configs/segmenter/segmenter_vit-s_linear_8x1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segmenter_vit-s_mask_8x1_512x512_160k_ade20k",
-        "Backbone": "ViT-S_16",
-        "Method": "Segmenter",
-        "Dataset": "ADE20K",
-        "mIoU": 46.19,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segmenter",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segmenter",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segmenter/segmenter_vit-s_mask_8x1_512x512_160k_ade20k/segmenter_vit-s_mask_8x1_512x512_160k_ade20k_20220105_151706-511bb103.pth",
-            "config_url": "configs/segmenter/segmenter_vit-s_mask_8x1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segmenter_vit-b_mask_8x1_512x512_160k_ade20k",
-        "Backbone": "ViT-B_16",
-        "Method": "Segmenter",
-        "Dataset": "ADE20K",
-        "mIoU": 49.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segmenter",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segmenter",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segmenter/segmenter_vit-b_mask_8x1_512x512_160k_ade20k/segmenter_vit-b_mask_8x1_512x512_160k_ade20k_20220105_151706-bc533b08.pth",
-            "config_url": "configs/segmenter/segmenter_vit-b_mask_8x1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "segmenter_vit-l_mask_8x1_512x512_160k_ade20k",
-        "Backbone": "ViT-L_16",
-        "Method": "Segmenter",
-        "Dataset": "ADE20K",
-        "mIoU": 52.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Segmenter",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/segmenter",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/segmenter/segmenter_vit-l_mask_8x1_512x512_160k_ade20k/segmenter_vit-l_mask_8x1_512x512_160k_ade20k_20220105_162750-7ef345be.pth",
-            "config_url": "configs/segmenter/segmenter_vit-l_mask_8x1_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-s_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "PCPVT-S",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 43.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-s_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_pcpvt-s_fpn_fpnhead_8x4_512x512_80k_ade20k_20211201_204132-41acd132.pth",
-            "config_url": "configs/twins/twins_pcpvt-s_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-s_uperhead_8x4_512x512_160k_ade20k",
-        "Backbone": "PCPVT-S",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 46.04,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-s_uperhead_8x4_512x512_160k_ade20k/twins_pcpvt-s_uperhead_8x4_512x512_160k_ade20k_20211201_233537-8e99c07a.pth",
-            "config_url": "configs/twins/twins_pcpvt-s_uperhead_8x4_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-b_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "PCPVT-B",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 45.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-b_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_pcpvt-b_fpn_fpnhead_8x4_512x512_80k_ade20k_20211130_141019-d396db72.pth",
-            "config_url": "configs/twins/twins_pcpvt-b_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-b_uperhead_8x2_512x512_160k_ade20k",
-        "Backbone": "PCPVT-B",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 47.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-b_uperhead_8x2_512x512_160k_ade20k/twins_pcpvt-b_uperhead_8x2_512x512_160k_ade20k_20211130_141020-02094ea5.pth",
-            "config_url": "configs/twins/twins_pcpvt-b_uperhead_8x2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-l_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "PCPVT-L",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 45.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-l_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_pcpvt-l_fpn_fpnhead_8x4_512x512_80k_ade20k_20211201_105226-bc6d61dc.pth",
-            "config_url": "configs/twins/twins_pcpvt-l_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_pcpvt-l_uperhead_8x2_512x512_160k_ade20k",
-        "Backbone": "PCPVT-L",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 49.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_pcpvt-l_uperhead_8x2_512x512_160k_ade20k/twins_pcpvt-l_uperhead_8x2_512x512_160k_ade20k_20211201_075053-c6095c07.pth",
-            "config_url": "configs/twins/twins_pcpvt-l_uperhead_8x2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-s_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "SVT-S",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 44.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-s_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_svt-s_fpn_fpnhead_8x4_512x512_80k_ade20k_20211130_141006-0a0d3317.pth",
-            "config_url": "configs/twins/twins_svt-s_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-s_uperhead_8x2_512x512_160k_ade20k",
-        "Backbone": "SVT-S",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 46.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-s_uperhead_8x2_512x512_160k_ade20k/twins_svt-s_uperhead_8x2_512x512_160k_ade20k_20211130_141005-e48a2d94.pth",
-            "config_url": "configs/twins/twins_svt-s_uperhead_8x2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-b_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "SVT-B",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 46.77,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-b_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_svt-b_fpn_fpnhead_8x4_512x512_80k_ade20k_20211201_113849-88b2907c.pth",
-            "config_url": "configs/twins/twins_svt-b_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-b_uperhead_8x2_512x512_160k_ade20k",
-        "Backbone": "SVT-B",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 48.04,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-b_uperhead_8x2_512x512_160k_ade20k/twins_svt-b_uperhead_8x2_512x512_160k_ade20k_20211202_040826-0943a1f1.pth",
-            "config_url": "configs/twins/twins_svt-b_uperhead_8x2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-l_fpn_fpnhead_8x4_512x512_80k_ade20k",
-        "Backbone": "SVT-L",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 46.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-l_fpn_fpnhead_8x4_512x512_80k_ade20k/twins_svt-l_fpn_fpnhead_8x4_512x512_80k_ade20k_20211130_141005-1d59bee2.pth",
-            "config_url": "configs/twins/twins_svt-l_fpn_fpnhead_8x4_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "twins_svt-l_uperhead_8x2_512x512_160k_ade20k",
-        "Backbone": "SVT-L",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 49.65,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Twins",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/twins",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/twins/twins_svt-l_uperhead_8x2_512x512_160k_ade20k/twins_svt-l_uperhead_8x2_512x512_160k_ade20k_20211130_141005-3e2cae61.pth",
-            "config_url": "configs/twins/twins_svt-l_uperhead_8x2_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_tiny_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K",
-        "Backbone": "Swin-T",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_tiny_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K/upernet_swin_tiny_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K_20210531_112542-e380ad3e.pth",
-            "config_url": "configs/swin/upernet_swin_tiny_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_small_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K",
-        "Backbone": "Swin-S",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 47.72,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_small_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K/upernet_swin_small_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K_20210526_192015-ee2fff1c.pth",
-            "config_url": "configs/swin/upernet_swin_small_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K",
-        "Backbone": "Swin-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 47.99,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K_20210526_192340-593b0e13.pth",
-            "config_url": "configs/swin/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_1K.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_22K",
-        "Backbone": "Swin-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 50.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_22K/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_22K_20210526_211650-762e2178.pth",
-            "config_url": "configs/swin/upernet_swin_base_patch4_window7_512x512_160k_ade20k_pretrain_224x224_22K.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_1K",
-        "Backbone": "Swin-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 48.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_1K/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_1K_20210531_132020-05b22ea4.pth",
-            "config_url": "configs/swin/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_1K.py",
-        },
-    },
-    {
-        "Model": "upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_22K",
-        "Backbone": "Swin-B",
-        "Method": "UperNet",
-        "Dataset": "ADE20K",
-        "mIoU": 50.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "Swin Transformer",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/swin",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/swin/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_22K/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_22K_20210531_125459-429057bf.pth",
-            "config_url": "configs/swin/upernet_swin_base_patch4_window12_512x512_160k_ade20k_pretrain_384x384_22K.py",
-        },
-    },
-    {
-        "Model": "dpt_vit-b16_512x512_160k_ade20k",
-        "Backbone": "ViT-B",
-        "Method": "DPT",
-        "Dataset": "ADE20K",
-        "mIoU": 46.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DPT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dpt",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dpt/dpt_vit-b16_512x512_160k_ade20k/dpt_vit-b16_512x512_160k_ade20k-db31cf52.pth",
-            "config_url": "configs/dpt/dpt_vit-b16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "setr_naive_512x512_160k_b16_ade20k",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "ADE20K",
-        "mIoU": 48.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_naive_512x512_160k_b16_ade20k/setr_naive_512x512_160k_b16_ade20k_20210619_191258-061f24f5.pth",
-            "config_url": "configs/setr/setr_naive_512x512_160k_b16_ade20k.py",
-        },
-    },
-    {
-        "Model": "setr_pup_512x512_160k_b16_ade20k",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "ADE20K",
-        "mIoU": 48.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_pup_512x512_160k_b16_ade20k/setr_pup_512x512_160k_b16_ade20k_20210619_191343-7e0ce826.pth",
-            "config_url": "configs/setr/setr_pup_512x512_160k_b16_ade20k.py",
-        },
-    },
-    {
-        "Model": "setr_mla_512x512_160k_b8_ade20k",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "ADE20K",
-        "mIoU": 47.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_mla_512x512_160k_b8_ade20k/setr_mla_512x512_160k_b8_ade20k_20210619_191118-c6d21df0.pth",
-            "config_url": "configs/setr/setr_mla_512x512_160k_b8_ade20k.py",
-        },
-    },
-    {
-        "Model": "setr_mla_512x512_160k_b16_ade20k",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "ADE20K",
-        "mIoU": 47.54,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_mla_512x512_160k_b16_ade20k/setr_mla_512x512_160k_b16_ade20k_20210619_191057-f9741de7.pth",
-            "config_url": "configs/setr/setr_mla_512x512_160k_b16_ade20k.py",
-        },
-    },
-    {
-        "Model": "setr_vit-large_naive_8x1_768x768_80k_cityscapes",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_naive_vit-large_8x1_768x768_80k_cityscapes/setr_naive_vit-large_8x1_768x768_80k_cityscapes_20211123_000505-20728e80.pth",
-            "config_url": "configs/setr/setr_vit-large_naive_8x1_768x768_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "setr_vit-large_pup_8x1_768x768_80k_cityscapes",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.21,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_pup_vit-large_8x1_768x768_80k_cityscapes/setr_pup_vit-large_8x1_768x768_80k_cityscapes_20211122_155115-f6f37b8f.pth",
-            "config_url": "configs/setr/setr_vit-large_pup_8x1_768x768_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "setr_vit-large_mla_8x1_768x768_80k_cityscapes",
-        "Backbone": "ViT-L",
-        "Method": "SETR",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.0,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SETR",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/setr",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/setr/setr_mla_vit-large_8x1_768x768_80k_cityscapes/setr_mla_vit-large_8x1_768x768_80k_cityscapes_20211119_101003-7f8dccbe.pth",
-            "config_url": "configs/setr/setr_vit-large_mla_8x1_768x768_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_vit-b16_mln_512x512_80k_ade20k",
-        "Backbone": "ViT-B + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 47.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_vit-b16_mln_512x512_80k_ade20k/upernet_vit-b16_mln_512x512_80k_ade20k_20210624_130547-0403cee1.pth",
-            "config_url": "configs/vit/upernet_vit-b16_mln_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_vit-b16_mln_512x512_160k_ade20k",
-        "Backbone": "ViT-B + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 46.75,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_vit-b16_mln_512x512_160k_ade20k/upernet_vit-b16_mln_512x512_160k_ade20k_20210624_130547-852fa768.pth",
-            "config_url": "configs/vit/upernet_vit-b16_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_vit-b16_ln_mln_512x512_160k_ade20k",
-        "Backbone": "ViT-B + LN + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 47.73,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_vit-b16_ln_mln_512x512_160k_ade20k/upernet_vit-b16_ln_mln_512x512_160k_ade20k_20210621_172828-f444c077.pth",
-            "config_url": "configs/vit/upernet_vit-b16_ln_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-s16_512x512_80k_ade20k",
-        "Backbone": "DeiT-S",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-s16_512x512_80k_ade20k/upernet_deit-s16_512x512_80k_ade20k_20210624_095228-afc93ec2.pth",
-            "config_url": "configs/vit/upernet_deit-s16_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-s16_512x512_160k_ade20k",
-        "Backbone": "DeiT-S",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-s16_512x512_160k_ade20k/upernet_deit-s16_512x512_160k_ade20k_20210621_160903-5110d916.pth",
-            "config_url": "configs/vit/upernet_deit-s16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-s16_mln_512x512_160k_ade20k",
-        "Backbone": "DeiT-S + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-s16_mln_512x512_160k_ade20k/upernet_deit-s16_mln_512x512_160k_ade20k_20210621_161021-fb9a5dfb.pth",
-            "config_url": "configs/vit/upernet_deit-s16_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-s16_ln_mln_512x512_160k_ade20k",
-        "Backbone": "DeiT-S + LN + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-s16_ln_mln_512x512_160k_ade20k/upernet_deit-s16_ln_mln_512x512_160k_ade20k_20210621_161021-c0cd652f.pth",
-            "config_url": "configs/vit/upernet_deit-s16_ln_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-b16_512x512_80k_ade20k",
-        "Backbone": "DeiT-B",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-b16_512x512_80k_ade20k/upernet_deit-b16_512x512_80k_ade20k_20210624_130529-1e090789.pth",
-            "config_url": "configs/vit/upernet_deit-b16_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-b16_512x512_160k_ade20k",
-        "Backbone": "DeiT-B",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-b16_512x512_160k_ade20k/upernet_deit-b16_512x512_160k_ade20k_20210621_180100-828705d7.pth",
-            "config_url": "configs/vit/upernet_deit-b16_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-b16_mln_512x512_160k_ade20k",
-        "Backbone": "DeiT-B + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-b16_mln_512x512_160k_ade20k/upernet_deit-b16_mln_512x512_160k_ade20k_20210621_191949-4e1450f3.pth",
-            "config_url": "configs/vit/upernet_deit-b16_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_deit-b16_ln_mln_512x512_160k_ade20k",
-        "Backbone": "DeiT-B + LN + MLN",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ViT",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/vit",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/vit/upernet_deit-b16_ln_mln_512x512_160k_ade20k/upernet_deit-b16_ln_mln_512x512_160k_ade20k_20210623_153535-8a959c14.pth",
-            "config_url": "configs/vit/upernet_deit-b16_ln_mln_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "stdc1_512x1024_80k_cityscapes",
-        "Backbone": "STDC1",
-        "Method": "STDC",
-        "Dataset": "Cityscapes",
-        "mIoU": 71.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "STDC",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/stdc",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/stdc/stdc1_512x1024_80k_cityscapes/stdc1_512x1024_80k_cityscapes_20220224_073048-74e6920a.pth",
-            "config_url": "configs/stdc/stdc1_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "stdc1_in1k-pre_512x1024_80k_cityscapes",
-        "Backbone": "STDC1",
-        "Method": "STDC",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "STDC",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/stdc",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/stdc/stdc1_in1k-pre_512x1024_80k_cityscapes/stdc1_in1k-pre_512x1024_80k_cityscapes_20220224_141648-3d4c2981.pth",
-            "config_url": "configs/stdc/stdc1_in1k-pre_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "stdc2_512x1024_80k_cityscapes",
-        "Backbone": "STDC2",
-        "Method": "STDC",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.15,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "STDC",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/stdc",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/stdc/stdc2_512x1024_80k_cityscapes/stdc2_512x1024_80k_cityscapes_20220222_132015-fb1e3a1a.pth",
-            "config_url": "configs/stdc/stdc2_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "stdc2_in1k-pre_512x1024_80k_cityscapes",
-        "Backbone": "STDC2",
-        "Method": "STDC",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "STDC",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/stdc",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/stdc/stdc2_in1k-pre_512x1024_80k_cityscapes/stdc2_in1k-pre_512x1024_80k_cityscapes_20220224_073048-1f8f0f6c.pth",
-            "config_url": "configs/stdc/stdc2_in1k-pre_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv2_fcn_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "BiSeNetV2",
-        "Method": "BiSeNetV2",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.21,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv2/bisenetv2_fcn_4x4_1024x1024_160k_cityscapes/bisenetv2_fcn_4x4_1024x1024_160k_cityscapes_20210902_015551-bcf10f09.pth",
-            "config_url": "configs/bisenetv2/bisenetv2_fcn_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv2_fcn_ohem_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "BiSeNetV2",
-        "Method": "BiSeNetV2",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv2/bisenetv2_fcn_ohem_4x4_1024x1024_160k_cityscapes/bisenetv2_fcn_ohem_4x4_1024x1024_160k_cityscapes_20210902_112947-5f8103b4.pth",
-            "config_url": "configs/bisenetv2/bisenetv2_fcn_ohem_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv2_fcn_4x8_1024x1024_160k_cityscapes",
-        "Backbone": "BiSeNetV2",
-        "Method": "BiSeNetV2",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv2/bisenetv2_fcn_4x8_1024x1024_160k_cityscapes/bisenetv2_fcn_4x8_1024x1024_160k_cityscapes_20210903_000032-e1a2eed6.pth",
-            "config_url": "configs/bisenetv2/bisenetv2_fcn_4x8_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv2_fcn_fp16_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "BiSeNetV2",
-        "Method": "BiSeNetV2",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.07,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv2/bisenetv2_fcn_fp16_4x4_1024x1024_160k_cityscapes/bisenetv2_fcn_fp16_4x4_1024x1024_160k_cityscapes_20210902_045942-b979777b.pth",
-            "config_url": "configs/bisenetv2/bisenetv2_fcn_fp16_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "cgnet_680x680_60k_cityscapes",
-        "Backbone": "M3N21",
-        "Method": "CGNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 65.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CGNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/cgnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/cgnet/cgnet_680x680_60k_cityscapes/cgnet_680x680_60k_cityscapes_20201101_110253-4c0b2f2d.pth",
-            "config_url": "configs/cgnet/cgnet_680x680_60k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "cgnet_512x1024_60k_cityscapes",
-        "Backbone": "M3N21",
-        "Method": "CGNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 68.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CGNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/cgnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/cgnet/cgnet_512x1024_60k_cityscapes/cgnet_512x1024_60k_cityscapes_20201101_110254-124ea03b.pth",
-            "config_url": "configs/cgnet/cgnet_512x1024_60k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pointrend_r50_512x1024_80k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "PointRend",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/point_rend/pointrend_r50_512x1024_80k_cityscapes/pointrend_r50_512x1024_80k_cityscapes_20200711_015821-bb1ff523.pth",
-            "config_url": "configs/point_rend/pointrend_r50_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pointrend_r101_512x1024_80k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "PointRend",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/point_rend/pointrend_r101_512x1024_80k_cityscapes/pointrend_r101_512x1024_80k_cityscapes_20200711_170850-d0ca84be.pth",
-            "config_url": "configs/point_rend/pointrend_r101_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pointrend_r50_512x512_160k_ade20k",
-        "Backbone": "R-50",
-        "Method": "PointRend",
-        "Dataset": "ADE20K",
-        "mIoU": 37.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/point_rend/pointrend_r50_512x512_160k_ade20k/pointrend_r50_512x512_160k_ade20k_20200807_232644-ac3febf2.pth",
-            "config_url": "configs/point_rend/pointrend_r50_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pointrend_r101_512x512_160k_ade20k",
-        "Backbone": "R-101",
-        "Method": "PointRend",
-        "Dataset": "ADE20K",
-        "mIoU": 40.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PointRend",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/point_rend",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/point_rend/pointrend_r101_512x512_160k_ade20k/pointrend_r101_512x512_160k_ade20k_20200808_030852-8834902a.pth",
-            "config_url": "configs/point_rend/pointrend_r101_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_512x1024_40k_cityscapes/dnl_r50-d8_512x1024_40k_cityscapes_20200904_233629-53d4ea93.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_512x1024_40k_cityscapes/dnl_r101-d8_512x1024_40k_cityscapes_20200904_233629-9928ffef.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.44,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_769x769_40k_cityscapes/dnl_r50-d8_769x769_40k_cityscapes_20200820_232206-0f283785.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.39,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_769x769_40k_cityscapes/dnl_r101-d8_769x769_40k_cityscapes_20200820_171256-76c596df.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_512x1024_80k_cityscapes/dnl_r50-d8_512x1024_80k_cityscapes_20200904_233629-58b2f778.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_512x1024_80k_cityscapes/dnl_r101-d8_512x1024_80k_cityscapes_20200904_233629-758e2dd4.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_769x769_80k_cityscapes/dnl_r50-d8_769x769_80k_cityscapes_20200820_011925-366bc4c7.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_769x769_80k_cityscapes/dnl_r101-d8_769x769_80k_cityscapes_20200821_051111-95ff84ab.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_512x512_80k_ade20k/dnl_r50-d8_512x512_80k_ade20k_20200826_183354-1cf6e0c1.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_512x512_80k_ade20k/dnl_r101-d8_512x512_80k_ade20k_20200826_183354-d820d6ea.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dnl_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DNLNet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r50-d8_512x512_160k_ade20k/dnl_r50-d8_512x512_160k_ade20k_20200826_183350-37837798.pth",
-            "config_url": "configs/dnlnet/dnl_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dnl_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DNLNet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.25,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DNLNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dnlnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dnlnet/dnl_r101-d8_512x512_160k_ade20k/dnl_r101-d8_512x512_160k_ade20k_20200826_183350-ed522c61.pth",
-            "config_url": "configs/dnlnet/dnl_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x1024_40k_cityscapes/ocrnet_hr18s_512x1024_40k_cityscapes_20200601_033304-fa2436c2.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.72,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x1024_40k_cityscapes/ocrnet_hr18_512x1024_40k_cityscapes_20200601_033320-401c5bdd.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x1024_40k_cityscapes/ocrnet_hr48_512x1024_40k_cityscapes_20200601_033336-55b32491.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x1024_80k_cityscapes/ocrnet_hr18s_512x1024_80k_cityscapes_20200601_222735-55979e63.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x1024_80k_cityscapes/ocrnet_hr18_512x1024_80k_cityscapes_20200614_230521-c2e1dd4a.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x1024_80k_cityscapes/ocrnet_hr48_512x1024_80k_cityscapes_20200601_222752-9076bcdf.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x1024_160k_cityscapes/ocrnet_hr18s_512x1024_160k_cityscapes_20200602_191005-f4a7af28.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x1024_160k_cityscapes/ocrnet_hr18_512x1024_160k_cityscapes_20200602_191001-b9172d0c.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 81.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x1024_160k_cityscapes/ocrnet_hr48_512x1024_160k_cityscapes_20200602_191037-dfbf1b0c.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_r101-d8_512x1024_40k_b8_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_r101-d8_512x1024_40k_b8_cityscapes/ocrnet_r101-d8_512x1024_40k_b8_cityscapes_20200717_110721-02ac0f13.pth",
-            "config_url": "configs/ocrnet/ocrnet_r101-d8_512x1024_40k_b8_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_r101-d8_512x1024_40k_b16_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_r101-d8_512x1024_40k_b16_cityscapes/ocrnet_r101-d8_512x1024_40k_b16_cityscapes_20200723_193726-db500f80.pth",
-            "config_url": "configs/ocrnet/ocrnet_r101-d8_512x1024_40k_b16_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_r101-d8_512x1024_80k_b16_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "OCRNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_r101-d8_512x1024_80k_b16_cityscapes/ocrnet_r101-d8_512x1024_80k_b16_cityscapes_20200723_192421-78688424.pth",
-            "config_url": "configs/ocrnet/ocrnet_r101-d8_512x1024_80k_b16_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 35.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x512_80k_ade20k/ocrnet_hr18s_512x512_80k_ade20k_20200615_055600-e80b62af.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 37.79,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x512_80k_ade20k/ocrnet_hr18_512x512_80k_ade20k_20200615_053157-d173d83b.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.0,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x512_80k_ade20k/ocrnet_hr48_512x512_80k_ade20k_20200615_021518-d168c2d1.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 37.19,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x512_160k_ade20k/ocrnet_hr18s_512x512_160k_ade20k_20200615_184505-8e913058.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 39.32,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x512_160k_ade20k/ocrnet_hr18_512x512_160k_ade20k_20200615_200940-d8fcd9d1.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.25,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x512_160k_ade20k/ocrnet_hr48_512x512_160k_ade20k_20200615_184705-a073726d.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 71.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x512_20k_voc12aug/ocrnet_hr18s_512x512_20k_voc12aug_20200617_233913-02b04fcb.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 74.75,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x512_20k_voc12aug/ocrnet_hr18_512x512_20k_voc12aug_20200617_233932-8954cbb7.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.72,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x512_20k_voc12aug/ocrnet_hr48_512x512_20k_voc12aug_20200617_233932-9e82080a.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18s_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 72.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18s_512x512_40k_voc12aug/ocrnet_hr18s_512x512_40k_voc12aug_20200614_002025-42b587ac.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18s_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr18_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 74.98,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr18_512x512_40k_voc12aug/ocrnet_hr18_512x512_40k_voc12aug_20200614_015958-714302be.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr18_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ocrnet_hr48_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "OCRNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "OCRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ocrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ocrnet/ocrnet_hr48_512x512_40k_voc12aug/ocrnet_hr48_512x512_40k_voc12aug_20200614_015958-255bc5ce.pth",
-            "config_url": "configs/ocrnet/ocrnet_hr48_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_s101-d8_512x1024_80k_cityscapes",
-        "Backbone": "S-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.56,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/fcn_s101-d8_512x1024_80k_cityscapes/fcn_s101-d8_512x1024_80k_cityscapes_20200807_140631-f8d155b3.pth",
-            "config_url": "configs/resnest/fcn_s101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_s101-d8_512x1024_80k_cityscapes",
-        "Backbone": "S-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/pspnet_s101-d8_512x1024_80k_cityscapes/pspnet_s101-d8_512x1024_80k_cityscapes_20200807_140631-c75f3b99.pth",
-            "config_url": "configs/resnest/pspnet_s101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_s101-d8_512x1024_80k_cityscapes",
-        "Backbone": "S-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/deeplabv3_s101-d8_512x1024_80k_cityscapes/deeplabv3_s101-d8_512x1024_80k_cityscapes_20200807_144429-b73c4270.pth",
-            "config_url": "configs/resnest/deeplabv3_s101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_s101-d8_512x1024_80k_cityscapes",
-        "Backbone": "S-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/deeplabv3plus_s101-d8_512x1024_80k_cityscapes/deeplabv3plus_s101-d8_512x1024_80k_cityscapes_20200807_144429-1239eb43.pth",
-            "config_url": "configs/resnest/deeplabv3plus_s101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_s101-d8_512x512_160k_ade20k",
-        "Backbone": "S-101-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 45.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/fcn_s101-d8_512x512_160k_ade20k/fcn_s101-d8_512x512_160k_ade20k_20200807_145416-d3160329.pth",
-            "config_url": "configs/resnest/fcn_s101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_s101-d8_512x512_160k_ade20k",
-        "Backbone": "S-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.44,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/pspnet_s101-d8_512x512_160k_ade20k/pspnet_s101-d8_512x512_160k_ade20k_20200807_145416-a6daa92a.pth",
-            "config_url": "configs/resnest/pspnet_s101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_s101-d8_512x512_160k_ade20k",
-        "Backbone": "S-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 45.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/deeplabv3_s101-d8_512x512_160k_ade20k/deeplabv3_s101-d8_512x512_160k_ade20k_20200807_144503-17ecabe5.pth",
-            "config_url": "configs/resnest/deeplabv3_s101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_s101-d8_512x512_160k_ade20k",
-        "Backbone": "S-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 46.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ResNeSt",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/resnest",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/resnest/deeplabv3plus_s101-d8_512x512_160k_ade20k/deeplabv3plus_s101-d8_512x512_160k_ade20k_20200807_144503-27b26226.pth",
-            "config_url": "configs/resnest/deeplabv3plus_s101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.49,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x1024_40k_cityscapes/isanet_r50-d8_512x1024_40k_cityscapes_20210901_054739-981bd763.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x1024_80k_cityscapes/isanet_r50-d8_512x1024_80k_cityscapes_20210901_074202-89384497.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_769x769_40k_cityscapes/isanet_r50-d8_769x769_40k_cityscapes_20210903_050200-4ae7e65b.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.29,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_769x769_80k_cityscapes/isanet_r50-d8_769x769_80k_cityscapes_20210903_101126-99b54519.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x1024_40k_cityscapes/isanet_r101-d8_512x1024_40k_cityscapes_20210901_145553-293e6bd6.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.32,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x1024_80k_cityscapes/isanet_r101-d8_512x1024_80k_cityscapes_20210901_145243-5b99c9b2.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_769x769_40k_cityscapes/isanet_r101-d8_769x769_40k_cityscapes_20210903_111320-509e7224.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_769x769_80k_cityscapes/isanet_r101-d8_769x769_80k_cityscapes_20210903_111319-24f71dfa.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x512_80k_ade20k/isanet_r50-d8_512x512_80k_ade20k_20210903_124557-6ed83a0c.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.59,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x512_160k_ade20k/isanet_r50-d8_512x512_160k_ade20k_20210903_104850-f752d0a3.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.51,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x512_80k_ade20k/isanet_r101-d8_512x512_80k_ade20k_20210903_162056-68b235c2.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x512_160k_ade20k/isanet_r101-d8_512x512_160k_ade20k_20210903_211431-a7879dcd.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.78,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x512_20k_voc12aug/isanet_r50-d8_512x512_20k_voc12aug_20210901_164838-79d59b80.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "isanet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "ISANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r50-d8_512x512_40k_voc12aug/isanet_r50-d8_512x512_40k_voc12aug_20210901_151349-7d08a54e.pth",
-            "config_url": "configs/isanet/isanet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x512_20k_voc12aug/isanet_r101-d8_512x512_20k_voc12aug_20210901_115805-3ccbf355.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "isanet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "ISANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ISANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/isanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/isanet/isanet_r101-d8_512x512_40k_voc12aug/isanet_r101-d8_512x512_40k_voc12aug_20210901_145814-bc71233b.pth",
-            "config_url": "configs/isanet/isanet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fast_scnn_lr0.12_8x4_160k_cityscapes",
-        "Backbone": "FastSCNN",
-        "Method": "FastSCNN",
-        "Dataset": "Cityscapes",
-        "mIoU": 70.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastSCNN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastscnn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fast_scnn/fast_scnn_lr0.12_8x4_160k_cityscapes/fast_scnn_lr0.12_8x4_160k_cityscapes_20210630_164853-0cec9937.pth",
-            "config_url": "configs/fastscnn/fast_scnn_lr0.12_8x4_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_aspp_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_aspp_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_aspp_512x1024_80k_cityscapes_20210928_053722-5d1a2648.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_aspp_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_aspp_4x4_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_aspp_4x4_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_aspp_4x4_512x1024_80k_cityscapes_20210924_214357-72220849.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_aspp_4x4_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_psp_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_psp_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_psp_512x1024_80k_cityscapes_20210928_053722-57749bed.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_psp_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_psp_4x4_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_psp_4x4_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_psp_4x4_512x1024_80k_cityscapes_20210925_061841-77e87b0a.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_psp_4x4_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_enc_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_enc_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_enc_512x1024_80k_cityscapes_20210928_030036-78da5046.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_enc_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_enc_4x4_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_enc_4x4_512x1024_80k_cityscapes/fastfcn_r50-d32_jpu_enc_4x4_512x1024_80k_cityscapes_20210926_093217-e1eb6dbb.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_enc_4x4_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_aspp_512x512_80k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 41.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_aspp_512x512_80k_ade20k/fastfcn_r50-d32_jpu_aspp_512x512_80k_ade20k_20211013_190619-3aa40f2d.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_aspp_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_aspp_512x512_160k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 43.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_aspp_512x512_160k_ade20k/fastfcn_r50-d32_jpu_aspp_512x512_160k_ade20k_20211008_152246-27036aee.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_aspp_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_psp_512x512_80k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 41.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_psp_512x512_80k_ade20k/fastfcn_r50-d32_jpu_psp_512x512_80k_ade20k_20210930_225137-993d07c8.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_psp_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_psp_512x512_160k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 42.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_psp_512x512_160k_ade20k/fastfcn_r50-d32_jpu_psp_512x512_160k_ade20k_20211008_105455-e8f5a2fd.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_psp_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_enc_512x512_80k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 40.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_enc_512x512_80k_ade20k/fastfcn_r50-d32_jpu_enc_512x512_80k_ade20k_20210930_225214-65aef6dd.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_enc_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fastfcn_r50-d32_jpu_enc_512x512_160k_ade20k",
-        "Backbone": "R-50-D32",
-        "Method": "FastFCN",
-        "Dataset": "ADE20K",
-        "mIoU": 42.5,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FastFCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fastfcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fastfcn/fastfcn_r50-d32_jpu_enc_512x512_160k_ade20k/fastfcn_r50-d32_jpu_enc_512x512_160k_ade20k_20211008_105456-d875ce3c.pth",
-            "config_url": "configs/fastfcn/fastfcn_r50-d32_jpu_enc_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x1024_40k_cityscapes/gcnet_r50-d8_512x1024_40k_cityscapes_20200618_074436-4b0fd17b.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x1024_40k_cityscapes/gcnet_r101-d8_512x1024_40k_cityscapes_20200618_074436-5e62567f.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_769x769_40k_cityscapes/gcnet_r50-d8_769x769_40k_cityscapes_20200618_182814-a26f4471.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.95,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_769x769_40k_cityscapes/gcnet_r101-d8_769x769_40k_cityscapes_20200619_092550-ca4f0a84.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.48,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x1024_80k_cityscapes/gcnet_r50-d8_512x1024_80k_cityscapes_20200618_074450-ef8f069b.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.03,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x1024_80k_cityscapes/gcnet_r101-d8_512x1024_80k_cityscapes_20200618_074450-778ebf69.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_769x769_80k_cityscapes/gcnet_r50-d8_769x769_80k_cityscapes_20200619_092516-4839565b.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.18,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_769x769_80k_cityscapes/gcnet_r101-d8_769x769_80k_cityscapes_20200619_092628-8e043423.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x512_80k_ade20k/gcnet_r50-d8_512x512_80k_ade20k_20200614_185146-91a6da41.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x512_80k_ade20k/gcnet_r101-d8_512x512_80k_ade20k_20200615_020811-c3fcb6dd.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x512_160k_ade20k/gcnet_r50-d8_512x512_160k_ade20k_20200615_224122-d95f3e1f.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x512_160k_ade20k/gcnet_r101-d8_512x512_160k_ade20k_20200615_225406-615528d7.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x512_20k_voc12aug/gcnet_r50-d8_512x512_20k_voc12aug_20200617_165701-3cbfdab1.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x512_20k_voc12aug/gcnet_r101-d8_512x512_20k_voc12aug_20200617_165713-6c720aa9.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "gcnet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "GCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r50-d8_512x512_40k_voc12aug/gcnet_r50-d8_512x512_40k_voc12aug_20200613_195105-9797336d.pth",
-            "config_url": "configs/gcnet/gcnet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "gcnet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "GCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.84,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "GCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/gcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/gcnet/gcnet_r101-d8_512x512_40k_voc12aug/gcnet_r101-d8_512x512_40k_voc12aug_20200613_185806-1e38208d.pth",
-            "config_url": "configs/gcnet/gcnet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x1024_40k_cityscapes/ann_r50-d8_512x1024_40k_cityscapes_20200605_095211-049fc292.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x1024_40k_cityscapes/ann_r101-d8_512x1024_40k_cityscapes_20200605_095243-adf6eece.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.89,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_769x769_40k_cityscapes/ann_r50-d8_769x769_40k_cityscapes_20200530_025712-2b46b04d.pth",
-            "config_url": "configs/ann/ann_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.32,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_769x769_40k_cityscapes/ann_r101-d8_769x769_40k_cityscapes_20200530_025720-059bff28.pth",
-            "config_url": "configs/ann/ann_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x1024_80k_cityscapes/ann_r50-d8_512x1024_80k_cityscapes_20200607_101911-5a9ad545.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x1024_80k_cityscapes/ann_r101-d8_512x1024_80k_cityscapes_20200607_013728-aceccc6e.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_769x769_80k_cityscapes/ann_r50-d8_769x769_80k_cityscapes_20200607_044426-cc7ff323.pth",
-            "config_url": "configs/ann/ann_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_769x769_80k_cityscapes/ann_r101-d8_769x769_80k_cityscapes_20200607_013713-a9d4be8d.pth",
-            "config_url": "configs/ann/ann_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "ADE20K",
-        "mIoU": 41.01,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x512_80k_ade20k/ann_r50-d8_512x512_80k_ade20k_20200615_014818-26f75e11.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "ADE20K",
-        "mIoU": 42.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x512_80k_ade20k/ann_r101-d8_512x512_80k_ade20k_20200615_014818-c0153543.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "ADE20K",
-        "mIoU": 41.74,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x512_160k_ade20k/ann_r50-d8_512x512_160k_ade20k_20200615_231733-892247bc.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "ADE20K",
-        "mIoU": 42.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x512_160k_ade20k/ann_r101-d8_512x512_160k_ade20k_20200615_231733-955eb1ec.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 74.86,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x512_20k_voc12aug/ann_r50-d8_512x512_20k_voc12aug_20200617_222246-dfcb1c62.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x512_20k_voc12aug/ann_r101-d8_512x512_20k_voc12aug_20200617_222246-2fad0042.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ann_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "ANN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.56,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r50-d8_512x512_40k_voc12aug/ann_r50-d8_512x512_40k_voc12aug_20200613_231314-b5dac322.pth",
-            "config_url": "configs/ann/ann_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ann_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "ANN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ANN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ann",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ann/ann_r101-d8_512x512_40k_voc12aug/ann_r101-d8_512x512_40k_voc12aug_20200613_231314-bd205bbe.pth",
-            "config_url": "configs/ann/ann_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.78,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_512x1024_40k_cityscapes/dmnet_r50-d8_512x1024_40k_cityscapes_20201215_042326-615373cf.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_512x1024_40k_cityscapes/dmnet_r101-d8_512x1024_40k_cityscapes_20201215_043100-8291e976.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.49,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_769x769_40k_cityscapes/dmnet_r50-d8_769x769_40k_cityscapes_20201215_093706-e7f0e23e.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_769x769_40k_cityscapes/dmnet_r101-d8_769x769_40k_cityscapes_20201215_081348-a74261f6.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.07,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_512x1024_80k_cityscapes/dmnet_r50-d8_512x1024_80k_cityscapes_20201215_053728-3c8893b9.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_512x1024_80k_cityscapes/dmnet_r101-d8_512x1024_80k_cityscapes_20201215_031718-fa081cb8.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.22,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_769x769_80k_cityscapes/dmnet_r50-d8_769x769_80k_cityscapes_20201215_034006-6060840e.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.19,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_769x769_80k_cityscapes/dmnet_r101-d8_769x769_80k_cityscapes_20201215_082810-7f0de59a.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_512x512_80k_ade20k/dmnet_r50-d8_512x512_80k_ade20k_20201215_144744-f89092a6.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_512x512_80k_ade20k/dmnet_r101-d8_512x512_80k_ade20k_20201215_104812-bfa45311.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dmnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DMNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.15,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r50-d8_512x512_160k_ade20k/dmnet_r50-d8_512x512_160k_ade20k_20201215_115313-025ab3f9.pth",
-            "config_url": "configs/dmnet/dmnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "dmnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DMNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DMNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/dmnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/dmnet/dmnet_r101-d8_512x512_160k_ade20k/dmnet_r101-d8_512x512_160k_ade20k_20201215_111145-a0bc02ef.pth",
-            "config_url": "configs/dmnet/dmnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x1024_40k_cityscapes/ccnet_r50-d8_512x1024_40k_cityscapes_20200616_142517-4123f401.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x1024_40k_cityscapes/ccnet_r101-d8_512x1024_40k_cityscapes_20200616_142540-a3b84ba6.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_769x769_40k_cityscapes/ccnet_r50-d8_769x769_40k_cityscapes_20200616_145125-76d11884.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_769x769_40k_cityscapes/ccnet_r101-d8_769x769_40k_cityscapes_20200617_101428-4f57c8d0.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.03,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x1024_80k_cityscapes/ccnet_r50-d8_512x1024_80k_cityscapes_20200617_010421-869a3423.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x1024_80k_cityscapes/ccnet_r101-d8_512x1024_80k_cityscapes_20200617_203935-ffae8917.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.29,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_769x769_80k_cityscapes/ccnet_r50-d8_769x769_80k_cityscapes_20200617_010421-73eed8ca.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_769x769_80k_cityscapes/ccnet_r101-d8_769x769_80k_cityscapes_20200618_011502-ad3cd481.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.78,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x512_80k_ade20k/ccnet_r50-d8_512x512_80k_ade20k_20200615_014848-aa37f61e.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x512_80k_ade20k/ccnet_r101-d8_512x512_80k_ade20k_20200615_014848-1f4929a3.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x512_160k_ade20k/ccnet_r50-d8_512x512_160k_ade20k_20200616_084435-7c97193b.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x512_160k_ade20k/ccnet_r101-d8_512x512_160k_ade20k_20200616_000644-e849e007.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.17,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x512_20k_voc12aug/ccnet_r50-d8_512x512_20k_voc12aug_20200617_193212-fad81784.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x512_20k_voc12aug/ccnet_r101-d8_512x512_20k_voc12aug_20200617_193212-0007b61d.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ccnet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "CCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 75.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r50-d8_512x512_40k_voc12aug/ccnet_r50-d8_512x512_40k_voc12aug_20200613_232127-c2a15f02.pth",
-            "config_url": "configs/ccnet/ccnet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "ccnet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "CCNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "CCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/ccnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/ccnet/ccnet_r101-d8_512x512_40k_voc12aug/ccnet_r101-d8_512x512_40k_voc12aug_20200613_232127-c30da577.pth",
-            "config_url": "configs/ccnet/ccnet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "emanet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EMANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.59,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "EMANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/emanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/emanet/emanet_r50-d8_512x1024_80k_cityscapes/emanet_r50-d8_512x1024_80k_cityscapes_20200901_100301-c43fcef1.pth",
-            "config_url": "configs/emanet/emanet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "emanet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EMANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "EMANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/emanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/emanet/emanet_r101-d8_512x1024_80k_cityscapes/emanet_r101-d8_512x1024_80k_cityscapes_20200901_100301-2d970745.pth",
-            "config_url": "configs/emanet/emanet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "emanet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EMANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "EMANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/emanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/emanet/emanet_r50-d8_769x769_80k_cityscapes/emanet_r50-d8_769x769_80k_cityscapes_20200901_100301-16f8de52.pth",
-            "config_url": "configs/emanet/emanet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "emanet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EMANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "EMANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/emanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/emanet/emanet_r101-d8_769x769_80k_cityscapes/emanet_r101-d8_769x769_80k_cityscapes_20200901_100301-47a324ce.pth",
-            "config_url": "configs/emanet/emanet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_512x1024_40k_cityscapes/apcnet_r50-d8_512x1024_40k_cityscapes_20201214_115717-5e88fa33.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_512x1024_40k_cityscapes/apcnet_r101-d8_512x1024_40k_cityscapes_20201214_115716-abc9d111.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.89,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_769x769_40k_cityscapes/apcnet_r50-d8_769x769_40k_cityscapes_20201214_115717-2a2628d7.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_769x769_40k_cityscapes/apcnet_r101-d8_769x769_40k_cityscapes_20201214_115718-b650de90.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_512x1024_80k_cityscapes/apcnet_r50-d8_512x1024_80k_cityscapes_20201214_115716-987f51e3.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_512x1024_80k_cityscapes/apcnet_r101-d8_512x1024_80k_cityscapes_20201214_115705-b1ff208a.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.79,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_769x769_80k_cityscapes/apcnet_r50-d8_769x769_80k_cityscapes_20201214_115718-7ea9fa12.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_769x769_80k_cityscapes/apcnet_r101-d8_769x769_80k_cityscapes_20201214_115716-a7fbc2ab.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_512x512_80k_ade20k/apcnet_r50-d8_512x512_80k_ade20k_20201214_115705-a8626293.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.54,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_512x512_80k_ade20k/apcnet_r101-d8_512x512_80k_ade20k_20201214_115704-c656c3fb.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "apcnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "APCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r50-d8_512x512_160k_ade20k/apcnet_r50-d8_512x512_160k_ade20k_20201214_115706-25fb92c2.pth",
-            "config_url": "configs/apcnet/apcnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "apcnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "APCNet",
-        "Dataset": "ADE20K",
-        "mIoU": 45.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "APCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/apcnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/apcnet/apcnet_r101-d8_512x512_160k_ade20k/apcnet_r101-d8_512x512_160k_ade20k_20201214_115705-73f9a8d7.pth",
-            "config_url": "configs/apcnet/apcnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.74,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x1024_40k_cityscapes/danet_r50-d8_512x1024_40k_cityscapes_20200605_191324-c0dbfa5f.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x1024_40k_cityscapes/danet_r101-d8_512x1024_40k_cityscapes_20200605_200831-c57a7157.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_769x769_40k_cityscapes/danet_r50-d8_769x769_40k_cityscapes_20200530_025703-76681c60.pth",
-            "config_url": "configs/danet/danet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_769x769_40k_cityscapes/danet_r101-d8_769x769_40k_cityscapes_20200530_025717-dcb7fd4e.pth",
-            "config_url": "configs/danet/danet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x1024_80k_cityscapes/danet_r50-d8_512x1024_80k_cityscapes_20200607_133029-2bfa2293.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x1024_80k_cityscapes/danet_r101-d8_512x1024_80k_cityscapes_20200607_132918-955e6350.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_769x769_80k_cityscapes/danet_r50-d8_769x769_80k_cityscapes_20200607_132954-495689b4.pth",
-            "config_url": "configs/danet/danet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_769x769_80k_cityscapes/danet_r101-d8_769x769_80k_cityscapes_20200607_132918-f3a929e7.pth",
-            "config_url": "configs/danet/danet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x512_80k_ade20k/danet_r50-d8_512x512_80k_ade20k_20200615_015125-edb18e08.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x512_80k_ade20k/danet_r101-d8_512x512_80k_ade20k_20200615_015126-d0357c73.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x512_160k_ade20k/danet_r50-d8_512x512_160k_ade20k_20200616_082340-9cb35dcd.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.17,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x512_160k_ade20k/danet_r101-d8_512x512_160k_ade20k_20200616_082348-23bf12f9.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 74.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x512_20k_voc12aug/danet_r50-d8_512x512_20k_voc12aug_20200618_070026-9e9e3ab3.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x512_20k_voc12aug/danet_r101-d8_512x512_20k_voc12aug_20200618_070026-d48d23b2.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "danet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r50-d8_512x512_40k_voc12aug/danet_r50-d8_512x512_40k_voc12aug_20200613_235526-426e3a64.pth",
-            "config_url": "configs/danet/danet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "danet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.51,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/danet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/danet/danet_r101-d8_512x512_40k_voc12aug/danet_r101-d8_512x512_40k_voc12aug_20200613_223031-788e232a.pth",
-            "config_url": "configs/danet/danet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fpn_r50_512x1024_80k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "FPN",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SemanticFPN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/sem_fpn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/sem_fpn/fpn_r50_512x1024_80k_cityscapes/fpn_r50_512x1024_80k_cityscapes_20200717_021437-94018a0d.pth",
-            "config_url": "configs/sem_fpn/fpn_r50_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fpn_r101_512x1024_80k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "FPN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SemanticFPN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/sem_fpn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/sem_fpn/fpn_r101_512x1024_80k_cityscapes/fpn_r101_512x1024_80k_cityscapes_20200717_012416-c5800d4c.pth",
-            "config_url": "configs/sem_fpn/fpn_r101_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fpn_r50_512x512_160k_ade20k",
-        "Backbone": "R-50",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 37.49,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SemanticFPN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/sem_fpn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/sem_fpn/fpn_r50_512x512_160k_ade20k/fpn_r50_512x512_160k_ade20k_20200718_131734-5b5a6ab9.pth",
-            "config_url": "configs/sem_fpn/fpn_r50_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fpn_r101_512x512_160k_ade20k",
-        "Backbone": "R-101",
-        "Method": "FPN",
-        "Dataset": "ADE20K",
-        "mIoU": 39.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "SemanticFPN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/sem_fpn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/sem_fpn/fpn_r101_512x512_160k_ade20k/fpn_r101_512x512_160k_ade20k_20200718_131734-306b5004.pth",
-            "config_url": "configs/sem_fpn/fpn_r101_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.86,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x1024_40k_cityscapes/fcn_hr18s_512x1024_40k_cityscapes_20200601_014216-93db27d0.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.19,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x1024_40k_cityscapes/fcn_hr18_512x1024_40k_cityscapes_20200601_014216-f196fb4e.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x1024_40k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.48,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x1024_40k_cityscapes/fcn_hr48_512x1024_40k_cityscapes_20200601_014240-a989b146.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x1024_80k_cityscapes/fcn_hr18s_512x1024_80k_cityscapes_20200601_202700-1462b75d.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.65,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x1024_80k_cityscapes/fcn_hr18_512x1024_80k_cityscapes_20200601_223255-4e7b345e.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x1024_80k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.93,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x1024_80k_cityscapes/fcn_hr48_512x1024_80k_cityscapes_20200601_202606-58ea95d6.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x1024_160k_cityscapes/fcn_hr18s_512x1024_160k_cityscapes_20200602_190901-4a0797ea.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x1024_160k_cityscapes/fcn_hr18_512x1024_160k_cityscapes_20200602_190822-221e4a4f.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x1024_160k_cityscapes",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.65,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x1024_160k_cityscapes/fcn_hr48_512x1024_160k_cityscapes_20200602_190946-59b7973e.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 31.38,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_80k_ade20k/fcn_hr18s_512x512_80k_ade20k_20200614_144345-77fc814a.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 36.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_80k_ade20k/fcn_hr18_512x512_80k_ade20k_20210827_114910-6c9382c0.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_80k_ade20k",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 41.9,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_80k_ade20k/fcn_hr48_512x512_80k_ade20k_20200614_193946-7ba5258d.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 33.07,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_160k_ade20k/fcn_hr18s_512x512_160k_ade20k_20210829_174739-f1e7c2e7.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 36.79,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_160k_ade20k/fcn_hr18_512x512_160k_ade20k_20200614_214426-ca961836.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_160k_ade20k",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 42.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_160k_ade20k/fcn_hr48_512x512_160k_ade20k_20200614_214407-a52fc02c.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 65.5,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_20k_voc12aug/fcn_hr18s_512x512_20k_voc12aug_20210829_174910-0aceadb4.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 72.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_20k_voc12aug/fcn_hr18_512x512_20k_voc12aug_20200617_224503-488d45f7.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_20k_voc12aug",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 75.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_20k_voc12aug/fcn_hr48_512x512_20k_voc12aug_20200617_224419-89de05cd.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 66.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_40k_voc12aug/fcn_hr18s_512x512_40k_voc12aug_20200614_000648-4f8d6e7f.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 72.9,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_40k_voc12aug/fcn_hr18_512x512_40k_voc12aug_20200613_224401-1b4b76cd.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_40k_voc12aug",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_40k_voc12aug/fcn_hr48_512x512_40k_voc12aug_20200613_222111-1b0f18bc.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_480x480_40k_pascal_context",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal Context",
-        "mIoU": 45.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_480x480_40k_pascal_context/fcn_hr48_480x480_40k_pascal_context_20200911_164852-667d00b0.pth",
-            "config_url": "configs/hrnet/fcn_hr48_480x480_40k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_480x480_80k_pascal_context",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal Context",
-        "mIoU": 45.84,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_480x480_80k_pascal_context/fcn_hr48_480x480_80k_pascal_context_20200911_155322-847a6711.pth",
-            "config_url": "configs/hrnet/fcn_hr48_480x480_80k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_480x480_40k_pascal_context_59",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 50.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_480x480_40k_pascal_context_59/fcn_hr48_480x480_40k_pascal_context_59_20210410_122738-b808b8b2.pth",
-            "config_url": "configs/hrnet/fcn_hr48_480x480_40k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_480x480_80k_pascal_context_59",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 51.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_480x480_80k_pascal_context_59/fcn_hr48_480x480_80k_pascal_context_59_20210411_003240-3ae7081e.pth",
-            "config_url": "configs/hrnet/fcn_hr48_480x480_80k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_80k_loveda",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "LoveDA",
-        "mIoU": 49.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_80k_loveda/fcn_hr18s_512x512_80k_loveda_20211210_203228-60a86a7a.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_80k_loveda",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "LoveDA",
-        "mIoU": 50.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_80k_loveda/fcn_hr18_512x512_80k_loveda_20211210_203952-93d9c3b3.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_80k_loveda",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "LoveDA",
-        "mIoU": 51.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_80k_loveda/fcn_hr48_512x512_80k_loveda_20211211_044756-67072f55.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_512x512_80k_potsdam",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Potsdam",
-        "mIoU": 77.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_512x512_80k_potsdam/fcn_hr18s_512x512_80k_potsdam_20211218_205517-ba32af63.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_512x512_80k_potsdam",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Potsdam",
-        "mIoU": 78.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_512x512_80k_potsdam/fcn_hr18_512x512_80k_potsdam_20211218_205517-5d0387ad.pth",
-            "config_url": "configs/hrnet/fcn_hr18_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_512x512_80k_potsdam",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Potsdam",
-        "mIoU": 78.39,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_512x512_80k_potsdam/fcn_hr48_512x512_80k_potsdam_20211219_020601-97434c78.pth",
-            "config_url": "configs/hrnet/fcn_hr48_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_4x4_512x512_80k_vaihingen",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "Vaihingen",
-        "mIoU": 71.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_4x4_512x512_80k_vaihingen/fcn_hr18s_4x4_512x512_80k_vaihingen_20211231_230909-b23aae02.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_4x4_512x512_80k_vaihingen",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "Vaihingen",
-        "mIoU": 72.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_4x4_512x512_80k_vaihingen/fcn_hr18_4x4_512x512_80k_vaihingen_20211231_231216-2ec3ae8a.pth",
-            "config_url": "configs/hrnet/fcn_hr18_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_4x4_512x512_80k_vaihingen",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "Vaihingen",
-        "mIoU": 72.5,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_4x4_512x512_80k_vaihingen/fcn_hr48_4x4_512x512_80k_vaihingen_20211231_231244-7133cb22.pth",
-            "config_url": "configs/hrnet/fcn_hr48_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18s_4x4_896x896_80k_isaid",
-        "Backbone": "HRNetV2p-W18-Small",
-        "Method": "FCN",
-        "Dataset": "iSAID",
-        "mIoU": 62.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18s_4x4_896x896_80k_isaid/fcn_hr18s_4x4_896x896_80k_isaid_20220118_001603-3cc0769b.pth",
-            "config_url": "configs/hrnet/fcn_hr18s_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "fcn_hr18_4x4_896x896_80k_isaid",
-        "Backbone": "HRNetV2p-W18",
-        "Method": "FCN",
-        "Dataset": "iSAID",
-        "mIoU": 65.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr18_4x4_896x896_80k_isaid/fcn_hr18_4x4_896x896_80k_isaid_20220110_182230-49bf752e.pth",
-            "config_url": "configs/hrnet/fcn_hr18_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "fcn_hr48_4x4_896x896_80k_isaid",
-        "Backbone": "HRNetV2p-W48",
-        "Method": "FCN",
-        "Dataset": "iSAID",
-        "mIoU": 67.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "HRNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/hrnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/hrnet/fcn_hr48_4x4_896x896_80k_isaid/fcn_hr48_4x4_896x896_80k_isaid_20220114_174643-547fc420.pth",
-            "config_url": "configs/hrnet/fcn_hr48_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "lraspp_m-v3-d8_512x1024_320k_cityscapes",
-        "Backbone": "M-V3-D8",
-        "Method": "LRASPP",
-        "Dataset": "Cityscapes",
-        "mIoU": 69.54,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v3/lraspp_m-v3-d8_512x1024_320k_cityscapes/lraspp_m-v3-d8_512x1024_320k_cityscapes_20201224_220337-cfe8fb07.pth",
-            "config_url": "configs/mobilenet_v3/lraspp_m-v3-d8_512x1024_320k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "lraspp_m-v3-d8_scratch_512x1024_320k_cityscapes",
-        "Backbone": "M-V3-D8 (scratch)",
-        "Method": "LRASPP",
-        "Dataset": "Cityscapes",
-        "mIoU": 67.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v3/lraspp_m-v3-d8_scratch_512x1024_320k_cityscapes/lraspp_m-v3-d8_scratch_512x1024_320k_cityscapes_20201224_220337-9f29cd72.pth",
-            "config_url": "configs/mobilenet_v3/lraspp_m-v3-d8_scratch_512x1024_320k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "lraspp_m-v3s-d8_512x1024_320k_cityscapes",
-        "Backbone": "M-V3s-D8",
-        "Method": "LRASPP",
-        "Dataset": "Cityscapes",
-        "mIoU": 64.11,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v3/lraspp_m-v3s-d8_512x1024_320k_cityscapes/lraspp_m-v3s-d8_512x1024_320k_cityscapes_20201224_223935-61565b34.pth",
-            "config_url": "configs/mobilenet_v3/lraspp_m-v3s-d8_512x1024_320k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "lraspp_m-v3s-d8_scratch_512x1024_320k_cityscapes",
-        "Backbone": "M-V3s-D8 (scratch)",
-        "Method": "LRASPP",
-        "Dataset": "Cityscapes",
-        "mIoU": 62.74,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v3/lraspp_m-v3s-d8_scratch_512x1024_320k_cityscapes/lraspp_m-v3s-d8_scratch_512x1024_320k_cityscapes_20201224_223935-03daeabb.pth",
-            "config_url": "configs/mobilenet_v3/lraspp_m-v3s-d8_scratch_512x1024_320k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_512x1024_40k_cityscapes/encnet_r50-d8_512x1024_40k_cityscapes_20200621_220958-68638a47.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_512x1024_40k_cityscapes/encnet_r101-d8_512x1024_40k_cityscapes_20200621_220933-35e0a3e8.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_769x769_40k_cityscapes/encnet_r50-d8_769x769_40k_cityscapes_20200621_220958-3bcd2884.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.25,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_769x769_40k_cityscapes/encnet_r101-d8_769x769_40k_cityscapes_20200621_220933-2fafed55.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_512x1024_80k_cityscapes/encnet_r50-d8_512x1024_80k_cityscapes_20200622_003554-fc5c5624.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_512x1024_80k_cityscapes/encnet_r101-d8_512x1024_80k_cityscapes_20200622_003555-1de64bec.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.44,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_769x769_80k_cityscapes/encnet_r50-d8_769x769_80k_cityscapes_20200622_003554-55096dcb.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_769x769_80k_cityscapes/encnet_r101-d8_769x769_80k_cityscapes_20200622_003555-470ef79d.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "ADE20K",
-        "mIoU": 39.53,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_512x512_80k_ade20k/encnet_r50-d8_512x512_80k_ade20k_20200622_042412-44b46b04.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.11,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_512x512_80k_ade20k/encnet_r101-d8_512x512_80k_ade20k_20200622_101128-dd35e237.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "encnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "EncNet",
-        "Dataset": "ADE20K",
-        "mIoU": 40.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r50-d8_512x512_160k_ade20k/encnet_r50-d8_512x512_160k_ade20k_20200622_101059-b2db95e0.pth",
-            "config_url": "configs/encnet/encnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "encnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "EncNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ENCNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/encnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/encnet/encnet_r101-d8_512x512_160k_ade20k/encnet_r101-d8_512x512_160k_ade20k_20200622_073348-7989641f.pth",
-            "config_url": "configs/encnet/encnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x1024_40k_cityscapes/nonlocal_r50-d8_512x1024_40k_cityscapes_20200605_210748-c75e81e3.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x1024_40k_cityscapes/nonlocal_r101-d8_512x1024_40k_cityscapes_20200605_210748-d63729fa.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_769x769_40k_cityscapes/nonlocal_r50-d8_769x769_40k_cityscapes_20200530_045243-82ef6749.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_769x769_40k_cityscapes/nonlocal_r101-d8_769x769_40k_cityscapes_20200530_045348-8fe9a9dc.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.01,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x1024_80k_cityscapes/nonlocal_r50-d8_512x1024_80k_cityscapes_20200607_193518-d6839fae.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.93,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x1024_80k_cityscapes/nonlocal_r101-d8_512x1024_80k_cityscapes_20200607_183411-32700183.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.05,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_769x769_80k_cityscapes/nonlocal_r50-d8_769x769_80k_cityscapes_20200607_193506-1f9792f6.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_769x769_80k_cityscapes/nonlocal_r101-d8_769x769_80k_cityscapes_20200607_183428-0e1fa4f9.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "ADE20K",
-        "mIoU": 40.75,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x512_80k_ade20k/nonlocal_r50-d8_512x512_80k_ade20k_20200615_015801-5ae0aa33.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.9,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x512_80k_ade20k/nonlocal_r101-d8_512x512_80k_ade20k_20200615_015758-24105919.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.03,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x512_160k_ade20k/nonlocal_r50-d8_512x512_160k_ade20k_20200616_005410-baef45e3.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x512_160k_ade20k/nonlocal_r101-d8_512x512_160k_ade20k_20210827_221502-7881aa1a.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x512_20k_voc12aug/nonlocal_r50-d8_512x512_20k_voc12aug_20200617_222613-07f2a57c.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.15,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x512_20k_voc12aug/nonlocal_r101-d8_512x512_20k_voc12aug_20200617_222615-948c68ab.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.65,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r50-d8_512x512_40k_voc12aug/nonlocal_r50-d8_512x512_40k_voc12aug_20200614_000028-0139d4a9.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "nonlocal_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "NonLocalNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "NonLocalNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/nonlocal_net",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/nonlocal_net/nonlocal_r101-d8_512x512_40k_voc12aug/nonlocal_r101-d8_512x512_40k_voc12aug_20200614_000028-7e5ff470.pth",
-            "config_url": "configs/nonlocal_net/nonlocal_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "icnet_r18-d8_832x832_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 68.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r18-d8_832x832_80k_cityscapes/icnet_r18-d8_832x832_80k_cityscapes_20210925_225521-2e36638d.pth",
-            "config_url": "configs/icnet/icnet_r18-d8_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r18-d8_832x832_160k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 71.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r18-d8_832x832_160k_cityscapes/icnet_r18-d8_832x832_160k_cityscapes_20210925_230153-2c6eb6e0.pth",
-            "config_url": "configs/icnet/icnet_r18-d8_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r18-d8_in1k-pre_832x832_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 72.51,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r18-d8_in1k-pre_832x832_80k_cityscapes/icnet_r18-d8_in1k-pre_832x832_80k_cityscapes_20210925_230354-1cbe3022.pth",
-            "config_url": "configs/icnet/icnet_r18-d8_in1k-pre_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r18-d8_in1k-pre_832x832_160k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.43,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r18-d8_in1k-pre_832x832_160k_cityscapes/icnet_r18-d8_in1k-pre_832x832_160k_cityscapes_20210926_052702-619c8ae1.pth",
-            "config_url": "configs/icnet/icnet_r18-d8_in1k-pre_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r50-d8_832x832_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 68.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r50-d8_832x832_80k_cityscapes/icnet_r50-d8_832x832_80k_cityscapes_20210926_044625-c6407341.pth",
-            "config_url": "configs/icnet/icnet_r50-d8_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r50-d8_832x832_160k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r50-d8_832x832_160k_cityscapes/icnet_r50-d8_832x832_160k_cityscapes_20210925_232612-a95f0d4e.pth",
-            "config_url": "configs/icnet/icnet_r50-d8_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r50-d8_in1k-pre_832x832_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r50-d8_in1k-pre_832x832_80k_cityscapes/icnet_r50-d8_in1k-pre_832x832_80k_cityscapes_20210926_032943-1743dc7b.pth",
-            "config_url": "configs/icnet/icnet_r50-d8_in1k-pre_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r50-d8_in1k-pre_832x832_160k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.29,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r50-d8_in1k-pre_832x832_160k_cityscapes/icnet_r50-d8_in1k-pre_832x832_160k_cityscapes_20210926_042715-ce310aea.pth",
-            "config_url": "configs/icnet/icnet_r50-d8_in1k-pre_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r101-d8_832x832_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 70.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r101-d8_832x832_80k_cityscapes/icnet_r101-d8_832x832_80k_cityscapes_20210926_072447-b52f936e.pth",
-            "config_url": "configs/icnet/icnet_r101-d8_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r101-d8_832x832_160k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r101-d8_832x832_160k_cityscapes/icnet_r101-d8_832x832_160k_cityscapes_20210926_092350-3a1ebf1a.pth",
-            "config_url": "configs/icnet/icnet_r101-d8_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r101-d8_in1k-pre_832x832_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r101-d8_in1k-pre_832x832_80k_cityscapes/icnet_r101-d8_in1k-pre_832x832_80k_cityscapes_20210926_020414-7ceb12c5.pth",
-            "config_url": "configs/icnet/icnet_r101-d8_in1k-pre_832x832_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "icnet_r101-d8_in1k-pre_832x832_160k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "ICNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.15,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ICNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/icnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/icnet/icnet_r101-d8_in1k-pre_832x832_160k_cityscapes/icnet_r101-d8_in1k-pre_832x832_160k_cityscapes_20210925_232612-9484ae8a.pth",
-            "config_url": "configs/icnet/icnet_r101-d8_in1k-pre_832x832_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x1024_40k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x1024_40k_cityscapes/upernet_r50_512x1024_40k_cityscapes_20200605_094827-aa54cb54.pth",
-            "config_url": "configs/upernet/upernet_r50_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x1024_40k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x1024_40k_cityscapes/upernet_r101_512x1024_40k_cityscapes_20200605_094933-ebce3b10.pth",
-            "config_url": "configs/upernet/upernet_r101_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_769x769_40k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.98,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_769x769_40k_cityscapes/upernet_r50_769x769_40k_cityscapes_20200530_033048-92d21539.pth",
-            "config_url": "configs/upernet/upernet_r50_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_769x769_40k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.03,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_769x769_40k_cityscapes/upernet_r101_769x769_40k_cityscapes_20200530_040819-83c95d01.pth",
-            "config_url": "configs/upernet/upernet_r101_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x1024_80k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.19,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x1024_80k_cityscapes/upernet_r50_512x1024_80k_cityscapes_20200607_052207-848beca8.pth",
-            "config_url": "configs/upernet/upernet_r50_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x1024_80k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x1024_80k_cityscapes/upernet_r101_512x1024_80k_cityscapes_20200607_002403-f05f2345.pth",
-            "config_url": "configs/upernet/upernet_r101_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_769x769_80k_cityscapes",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.39,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_769x769_80k_cityscapes/upernet_r50_769x769_80k_cityscapes_20200607_005107-82ae7d15.pth",
-            "config_url": "configs/upernet/upernet_r50_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_769x769_80k_cityscapes",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_769x769_80k_cityscapes/upernet_r101_769x769_80k_cityscapes_20200607_001014-082fc334.pth",
-            "config_url": "configs/upernet/upernet_r101_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x512_80k_ade20k",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 40.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x512_80k_ade20k/upernet_r50_512x512_80k_ade20k_20200614_144127-ecc8377b.pth",
-            "config_url": "configs/upernet/upernet_r50_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x512_80k_ade20k",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x512_80k_ade20k/upernet_r101_512x512_80k_ade20k_20200614_185117-32e4db94.pth",
-            "config_url": "configs/upernet/upernet_r101_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x512_160k_ade20k",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.05,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x512_160k_ade20k/upernet_r50_512x512_160k_ade20k_20200615_184328-8534de8d.pth",
-            "config_url": "configs/upernet/upernet_r50_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x512_160k_ade20k",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x512_160k_ade20k/upernet_r101_512x512_160k_ade20k_20200615_161951-91b32684.pth",
-            "config_url": "configs/upernet/upernet_r101_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x512_20k_voc12aug",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 74.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x512_20k_voc12aug/upernet_r50_512x512_20k_voc12aug_20200617_165330-5b5890a7.pth",
-            "config_url": "configs/upernet/upernet_r50_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x512_20k_voc12aug",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x512_20k_voc12aug/upernet_r101_512x512_20k_voc12aug_20200617_165629-f14e7f27.pth",
-            "config_url": "configs/upernet/upernet_r101_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "upernet_r50_512x512_40k_voc12aug",
-        "Backbone": "R-50",
-        "Method": "UPerNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 75.92,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r50_512x512_40k_voc12aug/upernet_r50_512x512_40k_voc12aug_20200613_162257-ca9bcc6b.pth",
-            "config_url": "configs/upernet/upernet_r50_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "upernet_r101_512x512_40k_voc12aug",
-        "Backbone": "R-101",
-        "Method": "UPerNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.43,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UPerNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/upernet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/upernet/upernet_r101_512x512_40k_voc12aug/upernet_r101_512x512_40k_voc12aug_20200613_163549-e26476ac.pth",
-            "config_url": "configs/upernet/upernet_r101_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x1024_40k_cityscapes/deeplabv3plus_r50-d8_512x1024_40k_cityscapes_20200605_094610-d222ffcd.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.21,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x1024_40k_cityscapes/deeplabv3plus_r101-d8_512x1024_40k_cityscapes_20200605_094614-3769eecf.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_769x769_40k_cityscapes/deeplabv3plus_r50-d8_769x769_40k_cityscapes_20200606_114143-1dcb0e3c.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_769x769_40k_cityscapes/deeplabv3plus_r101-d8_769x769_40k_cityscapes_20200606_114304-ff414b9e.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.89,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_512x1024_80k_cityscapes/deeplabv3plus_r18-d8_512x1024_80k_cityscapes_20201226_080942-cff257fe.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x1024_80k_cityscapes/deeplabv3plus_r50-d8_512x1024_80k_cityscapes_20200606_114049-f9fb496d.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x1024_80k_cityscapes/deeplabv3plus_r101-d8_512x1024_80k_cityscapes_20200606_114143-068fcfe9.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_fp16_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_fp16_512x1024_80k_cityscapes/deeplabv3plus_r101-d8_fp16_512x1024_80k_cityscapes_20200717_230920-f1104f4b.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_fp16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_769x769_80k_cityscapes/deeplabv3plus_r18-d8_769x769_80k_cityscapes_20201226_083346-f326e06a.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.83,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_769x769_80k_cityscapes/deeplabv3plus_r50-d8_769x769_80k_cityscapes_20200606_210233-0e9dfdc4.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.98,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_769x769_80k_cityscapes/deeplabv3plus_r101-d8_769x769_80k_cityscapes_20200607_000405-a7573d20.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d16-mg124_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D16-MG124",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d16-mg124_512x1024_40k_cityscapes/deeplabv3plus_r101-d16-mg124_512x1024_40k_cityscapes_20200908_005644-cf9ce186.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d16-mg124_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d16-mg124_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D16-MG124",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.9,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d16-mg124_512x1024_80k_cityscapes/deeplabv3plus_r101-d16-mg124_512x1024_80k_cityscapes_20200908_005644-ee6158e0.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d16-mg124_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18b-d8_512x1024_80k_cityscapes/deeplabv3plus_r18b-d8_512x1024_80k_cityscapes_20201226_090828-e451abd9.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50b-d8_512x1024_80k_cityscapes/deeplabv3plus_r50b-d8_512x1024_80k_cityscapes_20201225_213645-a97e4e43.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101b-d8_512x1024_80k_cityscapes/deeplabv3plus_r101b-d8_512x1024_80k_cityscapes_20201226_190843-9c3c93a4.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18b-d8_769x769_80k_cityscapes/deeplabv3plus_r18b-d8_769x769_80k_cityscapes_20201226_151312-2c868aff.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50b-d8_769x769_80k_cityscapes/deeplabv3plus_r50b-d8_769x769_80k_cityscapes_20201225_224655-8b596d1c.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101b-d8_769x769_80k_cityscapes/deeplabv3plus_r101b-d8_769x769_80k_cityscapes_20201226_205041-227cdf7c.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 42.72,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_ade20k/deeplabv3plus_r50-d8_512x512_80k_ade20k_20200614_185028-bf1400d8.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 44.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_ade20k/deeplabv3plus_r101-d8_512x512_80k_ade20k_20200615_014139-d5730af7.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 43.95,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_160k_ade20k/deeplabv3plus_r50-d8_512x512_160k_ade20k_20200615_124504-6135c7e0.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 45.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_160k_ade20k/deeplabv3plus_r101-d8_512x512_160k_ade20k_20200615_123232-38ed86bb.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 75.93,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_20k_voc12aug/deeplabv3plus_r50-d8_512x512_20k_voc12aug_20200617_102323-aad58ef1.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.22,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_20k_voc12aug/deeplabv3plus_r101-d8_512x512_20k_voc12aug_20200617_102345-c7ff3d56.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_40k_voc12aug/deeplabv3plus_r50-d8_512x512_40k_voc12aug_20200613_161759-e1b43aa9.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_40k_voc12aug/deeplabv3plus_r101-d8_512x512_40k_voc12aug_20200613_205333-faf03387.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_480x480_40k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal Context",
-        "mIoU": 47.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_480x480_40k_pascal_context/deeplabv3plus_r101-d8_480x480_40k_pascal_context_20200911_165459-d3c8a29e.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_480x480_40k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_480x480_80k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal Context",
-        "mIoU": 47.23,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_480x480_80k_pascal_context/deeplabv3plus_r101-d8_480x480_80k_pascal_context_20200911_155322-145d3ee8.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_480x480_80k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_480x480_40k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 52.86,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_480x480_40k_pascal_context_59/deeplabv3plus_r101-d8_480x480_40k_pascal_context_59_20210416_111233-ed937f15.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_480x480_40k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_480x480_80k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 53.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_480x480_80k_pascal_context_59/deeplabv3plus_r101-d8_480x480_80k_pascal_context_59_20210416_111127-7ca0331d.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_480x480_80k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_512x512_80k_loveda",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "LoveDA",
-        "mIoU": 50.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_512x512_80k_loveda/deeplabv3plus_r18-d8_512x512_80k_loveda_20211104_132800-ce0fa0ca.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_80k_loveda",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "LoveDA",
-        "mIoU": 50.99,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_loveda/deeplabv3plus_r50-d8_512x512_80k_loveda_20211105_080442-f0720392.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_80k_loveda",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "LoveDA",
-        "mIoU": 51.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_loveda/deeplabv3plus_r101-d8_512x512_80k_loveda_20211105_110759-4c1f297e.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_512x512_80k_potsdam",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Potsdam",
-        "mIoU": 77.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_512x512_80k_potsdam/deeplabv3plus_r18-d8_512x512_80k_potsdam_20211219_020601-75fd5bc3.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_512x512_80k_potsdam",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Potsdam",
-        "mIoU": 78.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_potsdam/deeplabv3plus_r50-d8_512x512_80k_potsdam_20211219_031508-7e7a2b24.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_512x512_80k_potsdam",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Potsdam",
-        "mIoU": 78.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_potsdam/deeplabv3plus_r101-d8_512x512_80k_potsdam_20211219_031508-8b112708.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Vaihingen",
-        "mIoU": 72.5,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_4x4_512x512_80k_vaihingen/deeplabv3plus_r18-d8_4x4_512x512_80k_vaihingen_20211231_230805-7626a263.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Vaihingen",
-        "mIoU": 73.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_4x4_512x512_80k_vaihingen/deeplabv3plus_r50-d8_4x4_512x512_80k_vaihingen_20211231_230816-5040938d.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r101-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Vaihingen",
-        "mIoU": 73.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r101-d8_4x4_512x512_80k_vaihingen/deeplabv3plus_r101-d8_4x4_512x512_80k_vaihingen_20211231_230816-8a095afa.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r101-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r18-d8_4x4_896x896_80k_isaid",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "iSAID",
-        "mIoU": 61.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r18-d8_4x4_896x896_80k_isaid/deeplabv3plus_r18-d8_4x4_896x896_80k_isaid_20220110_180526-7059991d.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r18-d8_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_r50-d8_4x4_896x896_80k_isaid",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "iSAID",
-        "mIoU": 67.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3+",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3plus",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3plus/deeplabv3plus_r50-d8_4x4_896x896_80k_isaid/deeplabv3plus_r50-d8_4x4_896x896_80k_isaid_20220110_180526-598be439.pth",
-            "config_url": "configs/deeplabv3plus/deeplabv3plus_r50-d8_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x1024_40k_cityscapes/psanet_r50-d8_512x1024_40k_cityscapes_20200606_103117-99fac37c.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x1024_40k_cityscapes/psanet_r101-d8_512x1024_40k_cityscapes_20200606_001418-27b9cfa7.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.99,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_769x769_40k_cityscapes/psanet_r50-d8_769x769_40k_cityscapes_20200530_033717-d5365506.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.43,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_769x769_40k_cityscapes/psanet_r101-d8_769x769_40k_cityscapes_20200530_035107-997da1e6.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x1024_80k_cityscapes/psanet_r50-d8_512x1024_80k_cityscapes_20200606_161842-ab60a24f.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x1024_80k_cityscapes/psanet_r101-d8_512x1024_80k_cityscapes_20200606_161823-0f73a169.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.31,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_769x769_80k_cityscapes/psanet_r50-d8_769x769_80k_cityscapes_20200606_225134-fe42f49e.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_769x769_80k_cityscapes/psanet_r101-d8_769x769_80k_cityscapes_20200606_214550-7665827b.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x512_80k_ade20k/psanet_r50-d8_512x512_80k_ade20k_20200614_144141-835e4b97.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x512_80k_ade20k/psanet_r101-d8_512x512_80k_ade20k_20200614_185117-1fab60d4.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x512_160k_ade20k/psanet_r50-d8_512x512_160k_ade20k_20200615_161258-148077dd.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.74,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x512_160k_ade20k/psanet_r101-d8_512x512_160k_ade20k_20200615_161537-dbfa564c.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.39,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x512_20k_voc12aug/psanet_r50-d8_512x512_20k_voc12aug_20200617_102413-2f1bbaa1.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x512_20k_voc12aug/psanet_r101-d8_512x512_20k_voc12aug_20200617_110624-946fef11.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "psanet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "PSANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r50-d8_512x512_40k_voc12aug/psanet_r50-d8_512x512_40k_voc12aug_20200613_161946-f596afb5.pth",
-            "config_url": "configs/psanet/psanet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "psanet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "PSANet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.73,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSANet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/psanet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/psanet/psanet_r101-d8_512x512_40k_voc12aug/psanet_r101-d8_512x512_40k_voc12aug_20200613_161946-1f560f9e.pth",
-            "config_url": "configs/psanet/psanet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_m-v2-d8_512x1024_80k_cityscapes",
-        "Backbone": "M-V2-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 61.54,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/fcn_m-v2-d8_512x1024_80k_cityscapes/fcn_m-v2-d8_512x1024_80k_cityscapes_20200825_124817-d24c28c1.pth",
-            "config_url": "configs/mobilenet_v2/fcn_m-v2-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_m-v2-d8_512x1024_80k_cityscapes",
-        "Backbone": "M-V2-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 70.23,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/pspnet_m-v2-d8_512x1024_80k_cityscapes/pspnet_m-v2-d8_512x1024_80k_cityscapes_20200825_124817-19e81d51.pth",
-            "config_url": "configs/mobilenet_v2/pspnet_m-v2-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_m-v2-d8_512x1024_80k_cityscapes",
-        "Backbone": "M-V2-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.84,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/deeplabv3_m-v2-d8_512x1024_80k_cityscapes/deeplabv3_m-v2-d8_512x1024_80k_cityscapes_20200825_124836-bef03590.pth",
-            "config_url": "configs/mobilenet_v2/deeplabv3_m-v2-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_m-v2-d8_512x1024_80k_cityscapes",
-        "Backbone": "M-V2-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/deeplabv3plus_m-v2-d8_512x1024_80k_cityscapes/deeplabv3plus_m-v2-d8_512x1024_80k_cityscapes_20200825_124836-d256dd4b.pth",
-            "config_url": "configs/mobilenet_v2/deeplabv3plus_m-v2-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_m-v2-d8_512x512_160k_ade20k",
-        "Backbone": "M-V2-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 19.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/fcn_m-v2-d8_512x512_160k_ade20k/fcn_m-v2-d8_512x512_160k_ade20k_20200825_214953-c40e1095.pth",
-            "config_url": "configs/mobilenet_v2/fcn_m-v2-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_m-v2-d8_512x512_160k_ade20k",
-        "Backbone": "M-V2-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 29.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/pspnet_m-v2-d8_512x512_160k_ade20k/pspnet_m-v2-d8_512x512_160k_ade20k_20200825_214953-f5942f7a.pth",
-            "config_url": "configs/mobilenet_v2/pspnet_m-v2-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_m-v2-d8_512x512_160k_ade20k",
-        "Backbone": "M-V2-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 34.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/deeplabv3_m-v2-d8_512x512_160k_ade20k/deeplabv3_m-v2-d8_512x512_160k_ade20k_20200825_223255-63986343.pth",
-            "config_url": "configs/mobilenet_v2/deeplabv3_m-v2-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3plus_m-v2-d8_512x512_160k_ade20k",
-        "Backbone": "M-V2-D8",
-        "Method": "DeepLabV3+",
-        "Dataset": "ADE20K",
-        "mIoU": 34.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "MobileNetV2",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/mobilenet_v2",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/mobilenet_v2/deeplabv3plus_m-v2-d8_512x512_160k_ade20k/deeplabv3plus_m-v2-d8_512x512_160k_ade20k_20200825_223255-465a01d4.pth",
-            "config_url": "configs/mobilenet_v2/deeplabv3plus_m-v2-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r18-d32_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "R-18-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.44,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r18-d32_4x4_1024x1024_160k_cityscapes/bisenetv1_r18-d32_4x4_1024x1024_160k_cityscapes_20210922_172239-c55e78e2.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r18-d32_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r18-d32_in1k-pre_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "R-18-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r18-d32_in1k-pre_4x4_1024x1024_160k_cityscapes/bisenetv1_r18-d32_in1k-pre_4x4_1024x1024_160k_cityscapes_20210905_220251-8ba80eff.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r18-d32_in1k-pre_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r18-d32_in1k-pre_4x8_1024x1024_160k_cityscapes",
-        "Backbone": "R-18-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r18-d32_in1k-pre_4x8_1024x1024_160k_cityscapes/bisenetv1_r18-d32_in1k-pre_4x8_1024x1024_160k_cityscapes_20210905_220322-bb8db75f.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r18-d32_in1k-pre_4x8_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r50-d32_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.92,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r50-d32_4x4_1024x1024_160k_cityscapes/bisenetv1_r50-d32_4x4_1024x1024_160k_cityscapes_20210923_222639-7b28a2a6.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r50-d32_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r50-d32_in1k-pre_4x4_1024x1024_160k_cityscapes",
-        "Backbone": "R-50-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r50-d32_in1k-pre_4x4_1024x1024_160k_cityscapes/bisenetv1_r50-d32_in1k-pre_4x4_1024x1024_160k_cityscapes_20210917_234628-8b304447.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r50-d32_in1k-pre_4x4_1024x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r18-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-18-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 25.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r18-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r18-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211022_054328-046aa2f2.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r18-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r18-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-18-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 28.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r18-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r18-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211023_013100-f700dbf7.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r18-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r50-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-50-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 29.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r50-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r50-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211101_040616-d2bb0df4.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r50-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r50-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-50-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 34.88,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r50-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r50-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211101_181932-66747911.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r50-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r101-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-101-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 31.14,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r101-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r101-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211102_164147-c6b32c3b.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r101-d32_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "bisenetv1_r101-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k",
-        "Backbone": "R-101-D32",
-        "Method": "BiSeNetV1",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 37.38,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "BiSeNetV1",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/bisenetv1",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/bisenetv1/bisenetv1_r101-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k/bisenetv1_r101-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k_20211101_225220-28c8f092.pth",
-            "config_url": "configs/bisenetv1/bisenetv1_r101-d32_in1k-pre_lr5e-3_4x4_512x512_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x1024_40k_cityscapes/deeplabv3_r50-d8_512x1024_40k_cityscapes_20200605_022449-acadc2f8.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x1024_40k_cityscapes/deeplabv3_r101-d8_512x1024_40k_cityscapes_20200605_012241-7fd3f799.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.58,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_769x769_40k_cityscapes/deeplabv3_r50-d8_769x769_40k_cityscapes_20200606_113723-7eda553c.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_769x769_40k_cityscapes/deeplabv3_r101-d8_769x769_40k_cityscapes_20200606_113809-c64f889f.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r18-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r18-d8_512x1024_80k_cityscapes/deeplabv3_r18-d8_512x1024_80k_cityscapes_20201225_021506-23dffbe2.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r18-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.32,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x1024_80k_cityscapes/deeplabv3_r50-d8_512x1024_80k_cityscapes_20200606_113404-b92cfdd4.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.2,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x1024_80k_cityscapes/deeplabv3_r101-d8_512x1024_80k_cityscapes_20200606_113503-9e428899.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_fp16_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.48,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_fp16_512x1024_80k_cityscapes/deeplabv3_r101-d8_fp16_512x1024_80k_cityscapes_20200717_230920-774d9cec.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_fp16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r18-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r18-d8_769x769_80k_cityscapes/deeplabv3_r18-d8_769x769_80k_cityscapes_20201225_021506-6452126a.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r18-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.89,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_769x769_80k_cityscapes/deeplabv3_r50-d8_769x769_80k_cityscapes_20200606_221338-788d6228.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_769x769_80k_cityscapes/deeplabv3_r101-d8_769x769_80k_cityscapes_20200607_013353-60e95418.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d16-mg124_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D16-MG124",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d16-mg124_512x1024_80k_cityscapes/deeplabv3_r101-d16-mg124_512x1024_80k_cityscapes_20200908_005644-57bb8425.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d16-mg124_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r18b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r18b-d8_512x1024_80k_cityscapes/deeplabv3_r18b-d8_512x1024_80k_cityscapes_20201225_094144-46040cef.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r18b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50b-d8_512x1024_80k_cityscapes/deeplabv3_r50b-d8_512x1024_80k_cityscapes_20201225_155148-ec368954.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 80.01,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101b-d8_512x1024_80k_cityscapes/deeplabv3_r101b-d8_512x1024_80k_cityscapes_20201226_171821-8fd49503.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r18b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.63,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r18b-d8_769x769_80k_cityscapes/deeplabv3_r18b-d8_769x769_80k_cityscapes_20201225_094144-fdc985d9.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r18b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50b-d8_769x769_80k_cityscapes/deeplabv3_r50b-d8_769x769_80k_cityscapes_20201225_155404-87fb0cf4.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.41,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101b-d8_769x769_80k_cityscapes/deeplabv3_r101b-d8_769x769_80k_cityscapes_20201226_190843-9142ee57.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 42.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_80k_ade20k/deeplabv3_r50-d8_512x512_80k_ade20k_20200614_185028-0bb3f844.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 44.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_80k_ade20k/deeplabv3_r101-d8_512x512_80k_ade20k_20200615_021256-d89c7fa4.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 42.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_160k_ade20k/deeplabv3_r50-d8_512x512_160k_ade20k_20200615_123227-5d0ee427.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "ADE20K",
-        "mIoU": 45.0,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_160k_ade20k/deeplabv3_r101-d8_512x512_160k_ade20k_20200615_105816-b1f72b3b.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.17,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_20k_voc12aug/deeplabv3_r50-d8_512x512_20k_voc12aug_20200617_010906-596905ef.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_20k_voc12aug/deeplabv3_r101-d8_512x512_20k_voc12aug_20200617_010932-8d13832f.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.68,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_40k_voc12aug/deeplabv3_r50-d8_512x512_40k_voc12aug_20200613_161546-2ae96e7e.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.92,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_40k_voc12aug/deeplabv3_r101-d8_512x512_40k_voc12aug_20200613_161432-0017d784.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_480x480_40k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal Context",
-        "mIoU": 46.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_480x480_40k_pascal_context/deeplabv3_r101-d8_480x480_40k_pascal_context_20200911_204118-1aa27336.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_480x480_40k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_480x480_80k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal Context",
-        "mIoU": 46.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_480x480_80k_pascal_context/deeplabv3_r101-d8_480x480_80k_pascal_context_20200911_170155-2a21fff3.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_480x480_80k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_480x480_40k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 52.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_480x480_40k_pascal_context_59/deeplabv3_r101-d8_480x480_40k_pascal_context_59_20210416_110332-cb08ea46.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_480x480_40k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_480x480_80k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 52.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_480x480_80k_pascal_context_59/deeplabv3_r101-d8_480x480_80k_pascal_context_59_20210416_113002-26303993.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_480x480_80k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_4x4_20k_coco-stuff10k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 34.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_4x4_20k_coco-stuff10k/deeplabv3_r50-d8_512x512_4x4_20k_coco-stuff10k_20210821_043025-b35f789d.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_4x4_20k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_4x4_20k_coco-stuff10k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 37.3,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_4x4_20k_coco-stuff10k/deeplabv3_r101-d8_512x512_4x4_20k_coco-stuff10k_20210821_043025-c49752cb.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_4x4_20k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_4x4_40k_coco-stuff10k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 35.73,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_4x4_40k_coco-stuff10k/deeplabv3_r50-d8_512x512_4x4_40k_coco-stuff10k_20210821_043305-dc76f3ff.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_4x4_40k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_4x4_40k_coco-stuff10k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 37.81,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_4x4_40k_coco-stuff10k/deeplabv3_r101-d8_512x512_4x4_40k_coco-stuff10k_20210821_043305-636cb433.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_4x4_40k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_4x4_80k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 39.38,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_4x4_80k_coco-stuff164k/deeplabv3_r50-d8_512x512_4x4_80k_coco-stuff164k_20210709_163016-88675c24.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_4x4_80k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_4x4_80k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 40.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_4x4_80k_coco-stuff164k/deeplabv3_r101-d8_512x512_4x4_80k_coco-stuff164k_20210709_201252-13600dc2.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_4x4_80k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_4x4_160k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 41.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_4x4_160k_coco-stuff164k/deeplabv3_r50-d8_512x512_4x4_160k_coco-stuff164k_20210709_163016-49f2812b.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_4x4_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_4x4_160k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 41.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_4x4_160k_coco-stuff164k/deeplabv3_r101-d8_512x512_4x4_160k_coco-stuff164k_20210709_155402-f035acfd.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_4x4_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r50-d8_512x512_4x4_320k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 41.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r50-d8_512x512_4x4_320k_coco-stuff164k/deeplabv3_r50-d8_512x512_4x4_320k_coco-stuff164k_20210709_155403-51b21115.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r50-d8_512x512_4x4_320k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_r101-d8_512x512_4x4_320k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "DeepLabV3",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 42.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "DeepLabV3",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/deeplabv3",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/deeplabv3/deeplabv3_r101-d8_512x512_4x4_320k_coco-stuff164k/deeplabv3_r101-d8_512x512_4x4_320k_coco-stuff164k_20210709_155402-3cbca14d.pth",
-            "config_url": "configs/deeplabv3/deeplabv3_r101-d8_512x512_4x4_320k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.85,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x1024_40k_cityscapes/pspnet_r50-d8_512x1024_40k_cityscapes_20200605_003338-2966598c.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x1024_40k_cityscapes/pspnet_r101-d8_512x1024_40k_cityscapes_20200604_232751-467e7cf4.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_769x769_40k_cityscapes/pspnet_r50-d8_769x769_40k_cityscapes_20200606_112725-86638686.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_769x769_40k_cityscapes/pspnet_r101-d8_769x769_40k_cityscapes_20200606_112753-61c6f5be.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_512x1024_80k_cityscapes/pspnet_r18-d8_512x1024_80k_cityscapes_20201225_021458-09ffa746.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.55,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x1024_80k_cityscapes/pspnet_r50-d8_512x1024_80k_cityscapes_20200606_112131-2376f12b.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x1024_80k_cityscapes/pspnet_r101-d8_512x1024_80k_cityscapes_20200606_112211-e1e1100f.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_fp16_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_fp16_512x1024_80k_cityscapes/pspnet_r101-d8_fp16_512x1024_80k_cityscapes_20200717_230919-a0875e5c.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_fp16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.9,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_769x769_80k_cityscapes/pspnet_r18-d8_769x769_80k_cityscapes_20201225_021458-3deefc62.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.59,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_769x769_80k_cityscapes/pspnet_r50-d8_769x769_80k_cityscapes_20200606_210121-5ccf03dd.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.77,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_769x769_80k_cityscapes/pspnet_r101-d8_769x769_80k_cityscapes_20200606_225055-dba412fa.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.23,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18b-d8_512x1024_80k_cityscapes/pspnet_r18b-d8_512x1024_80k_cityscapes_20201226_063116-26928a60.pth",
-            "config_url": "configs/pspnet/pspnet_r18b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.22,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50b-d8_512x1024_80k_cityscapes/pspnet_r50b-d8_512x1024_80k_cityscapes_20201225_094315-6344287a.pth",
-            "config_url": "configs/pspnet/pspnet_r50b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 79.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101b-d8_512x1024_80k_cityscapes/pspnet_r101b-d8_512x1024_80k_cityscapes_20201226_170012-3a4d38ab.pth",
-            "config_url": "configs/pspnet/pspnet_r101b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 74.92,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18b-d8_769x769_80k_cityscapes/pspnet_r18b-d8_769x769_80k_cityscapes_20201226_080942-bf98d186.pth",
-            "config_url": "configs/pspnet/pspnet_r18b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.5,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50b-d8_769x769_80k_cityscapes/pspnet_r50b-d8_769x769_80k_cityscapes_20201225_094316-4c643cf6.pth",
-            "config_url": "configs/pspnet/pspnet_r50b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "PSPNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101b-d8_769x769_80k_cityscapes/pspnet_r101b-d8_769x769_80k_cityscapes_20201226_171823-f0e7c293.pth",
-            "config_url": "configs/pspnet/pspnet_r101b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 41.13,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_80k_ade20k/pspnet_r50-d8_512x512_80k_ade20k_20200615_014128-15a8b914.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 43.57,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_80k_ade20k/pspnet_r101-d8_512x512_80k_ade20k_20200614_031423-b6e782f0.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 42.48,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_160k_ade20k/pspnet_r50-d8_512x512_160k_ade20k_20200615_184358-1890b0bd.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "ADE20K",
-        "mIoU": 44.39,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_160k_ade20k/pspnet_r101-d8_512x512_160k_ade20k_20200615_100650-967c316f.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 76.78,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_20k_voc12aug/pspnet_r50-d8_512x512_20k_voc12aug_20200617_101958-ed5dfbd9.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_20k_voc12aug/pspnet_r101-d8_512x512_20k_voc12aug_20200617_102003-4aef3c9a.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 77.29,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_40k_voc12aug/pspnet_r50-d8_512x512_40k_voc12aug_20200613_161222-ae9c1b8c.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 78.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_40k_voc12aug/pspnet_r101-d8_512x512_40k_voc12aug_20200613_161222-bc933b18.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_480x480_40k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal Context",
-        "mIoU": 46.6,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_480x480_40k_pascal_context/pspnet_r101-d8_480x480_40k_pascal_context_20200911_211210-bf0f5d7c.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_480x480_40k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_480x480_80k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal Context",
-        "mIoU": 46.03,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_480x480_80k_pascal_context/pspnet_r101-d8_480x480_80k_pascal_context_20200911_190530-c86d6233.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_480x480_80k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_480x480_40k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 52.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_480x480_40k_pascal_context_59/pspnet_r101-d8_480x480_40k_pascal_context_59_20210416_114524-86d44cd4.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_480x480_40k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_480x480_80k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 52.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_480x480_80k_pascal_context_59/pspnet_r101-d8_480x480_80k_pascal_context_59_20210416_114418-fa6caaa2.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_480x480_80k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_4x4_20k_coco-stuff10k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 35.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_4x4_20k_coco-stuff10k/pspnet_r50-d8_512x512_4x4_20k_coco-stuff10k_20210820_203258-b88df27f.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_4x4_20k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_4x4_20k_coco-stuff10k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 37.26,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_4x4_20k_coco-stuff10k/pspnet_r101-d8_512x512_4x4_20k_coco-stuff10k_20210820_232135-76aae482.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_4x4_20k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_4x4_40k_coco-stuff10k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 36.33,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_4x4_40k_coco-stuff10k/pspnet_r50-d8_512x512_4x4_40k_coco-stuff10k_20210821_030857-92e2902b.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_4x4_40k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_4x4_40k_coco-stuff10k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 10k",
-        "mIoU": 37.76,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_4x4_40k_coco-stuff10k/pspnet_r101-d8_512x512_4x4_40k_coco-stuff10k_20210821_014022-831aec95.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_4x4_40k_coco-stuff10k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_4x4_80k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 38.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_4x4_80k_coco-stuff164k/pspnet_r50-d8_512x512_4x4_80k_coco-stuff164k_20210707_152034-0e41b2db.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_4x4_80k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_4x4_80k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 40.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_4x4_80k_coco-stuff164k/pspnet_r101-d8_512x512_4x4_80k_coco-stuff164k_20210707_152034-7eb41789.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_4x4_80k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_4x4_160k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 39.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_4x4_160k_coco-stuff164k/pspnet_r50-d8_512x512_4x4_160k_coco-stuff164k_20210707_152004-51276a57.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_4x4_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_4x4_160k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 41.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_4x4_160k_coco-stuff164k/pspnet_r101-d8_512x512_4x4_160k_coco-stuff164k_20210707_152004-4af9621b.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_4x4_160k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_4x4_320k_coco-stuff164k",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 40.53,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_4x4_320k_coco-stuff164k/pspnet_r50-d8_512x512_4x4_320k_coco-stuff164k_20210707_152004-be9610cc.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_4x4_320k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_4x4_320k_coco-stuff164k",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "COCO-Stuff 164k",
-        "mIoU": 41.95,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_4x4_320k_coco-stuff164k/pspnet_r101-d8_512x512_4x4_320k_coco-stuff164k_20210707_152004-72220c60.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_4x4_320k_coco-stuff164k.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_512x512_80k_loveda",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "LoveDA",
-        "mIoU": 48.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_512x512_80k_loveda/pspnet_r18-d8_512x512_80k_loveda_20211105_052100-b97697f1.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_512x512_80k_loveda",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "LoveDA",
-        "mIoU": 50.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_512x512_80k_loveda/pspnet_r50-d8_512x512_80k_loveda_20211104_155728-88610f9f.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_512x512_80k_loveda",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "LoveDA",
-        "mIoU": 51.86,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_512x512_80k_loveda/pspnet_r101-d8_512x512_80k_loveda_20211104_153212-1c06c6a8.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_512x512_80k_loveda.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_4x4_512x512_80k_potsdam",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "Potsdam",
-        "mIoU": 77.09,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_4x4_512x512_80k_potsdam/pspnet_r18-d8_4x4_512x512_80k_potsdam_20211220_125612-7cd046e1.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_4x4_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_4x4_512x512_80k_potsdam",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Potsdam",
-        "mIoU": 78.12,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_4x4_512x512_80k_potsdam/pspnet_r50-d8_4x4_512x512_80k_potsdam_20211219_043541-2dd5fe67.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_4x4_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_4x4_512x512_80k_potsdam",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Potsdam",
-        "mIoU": 78.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_4x4_512x512_80k_potsdam/pspnet_r101-d8_4x4_512x512_80k_potsdam_20211220_125612-aed036c4.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_4x4_512x512_80k_potsdam.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "Vaihingen",
-        "mIoU": 71.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_4x4_512x512_80k_vaihingen/pspnet_r18-d8_4x4_512x512_80k_vaihingen_20211228_160355-52a8a6f6.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "Vaihingen",
-        "mIoU": 72.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_4x4_512x512_80k_vaihingen/pspnet_r50-d8_4x4_512x512_80k_vaihingen_20211228_160355-382f8f5b.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "pspnet_r101-d8_4x4_512x512_80k_vaihingen",
-        "Backbone": "R-101-D8",
-        "Method": "PSPNet",
-        "Dataset": "Vaihingen",
-        "mIoU": 72.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r101-d8_4x4_512x512_80k_vaihingen/pspnet_r101-d8_4x4_512x512_80k_vaihingen_20211231_230806-8eba0a09.pth",
-            "config_url": "configs/pspnet/pspnet_r101-d8_4x4_512x512_80k_vaihingen.py",
-        },
-    },
-    {
-        "Model": "pspnet_r18-d8_4x4_896x896_80k_isaid",
-        "Backbone": "R-18-D8",
-        "Method": "PSPNet",
-        "Dataset": "iSAID",
-        "mIoU": 60.22,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r18-d8_4x4_896x896_80k_isaid/pspnet_r18-d8_4x4_896x896_80k_isaid_20220110_180526-e84c0b6a.pth",
-            "config_url": "configs/pspnet/pspnet_r18-d8_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "pspnet_r50-d8_4x4_896x896_80k_isaid",
-        "Backbone": "R-50-D8",
-        "Method": "PSPNet",
-        "Dataset": "iSAID",
-        "mIoU": 65.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "PSPNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/pspnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/pspnet/pspnet_r50-d8_4x4_896x896_80k_isaid/pspnet_r50-d8_4x4_896x896_80k_isaid_20220110_180629-1f21dc32.pth",
-            "config_url": "configs/pspnet/pspnet_r50-d8_4x4_896x896_80k_isaid.py",
-        },
-    },
-    {
-        "Model": "erfnet_fcn_4x4_512x1024_160k_cityscapes",
-        "Backbone": "ERFNet",
-        "Method": "ERFNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 71.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "ERFNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/erfnet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/erfnet/erfnet_fcn_4x4_512x1024_160k_cityscapes/erfnet_fcn_4x4_512x1024_160k_cityscapes_20211126_082056-03d333ed.pth",
-            "config_url": "configs/erfnet/erfnet_fcn_4x4_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_4x4_512x1024_160k_cityscapes",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "Cityscapes",
-        "mIoU": 69.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_4x4_512x1024_160k_cityscapes/fcn_unet_s5-d16_4x4_512x1024_160k_cityscapes_20211210_145204-6860854e.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_4x4_512x1024_160k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 78.67,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_64x64_40k_drive/fcn_unet_s5-d16_64x64_40k_drive_20201223_191051-5daf6d3b.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 79.32,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive/fcn_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive_20211210_201820-785de5c2.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 78.62,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_64x64_40k_drive/pspnet_unet_s5-d16_64x64_40k_drive_20201227_181818-aac73387.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 79.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive/pspnet_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive_20211210_201821-22b3e3ba.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 78.69,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_64x64_40k_drive/deeplabv3_unet_s5-d16_64x64_40k_drive_20201226_094047-0671ff20.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "DRIVE",
-        "Dice": 79.56,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive_20211210_201825-6bf0efd7.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_64x64_40k_drive.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 81.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_128x128_40k_stare/fcn_unet_s5-d16_128x128_40k_stare_20201223_191051-7d77e78b.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 82.7,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare_20211210_201821-f75705a9.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 81.22,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_128x128_40k_stare/pspnet_unet_s5-d16_128x128_40k_stare_20201227_181818-3c2923c4.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 82.84,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare_20211210_201823-f1063ef7.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 80.93,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_128x128_40k_stare/deeplabv3_unet_s5-d16_128x128_40k_stare_20201226_094047-93dcb93c.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "STARE",
-        "Dice": 82.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare_20211210_201825-21db614c.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_stare.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_128x128_40k_chase_db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_128x128_40k_chase_db1/fcn_unet_s5-d16_128x128_40k_chase_db1_20201223_191051-11543527.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_128x128_40k_chase_db1.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.4,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1_20211210_201821-1c4eb7cf.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_128x128_40k_chase_db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_128x128_40k_chase_db1/pspnet_unet_s5-d16_128x128_40k_chase_db1_20201227_181818-68d4e609.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_128x128_40k_chase_db1.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1_20211210_201823-c0802c4d.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_128x128_40k_chase_db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_128x128_40k_chase_db1/deeplabv3_unet_s5-d16_128x128_40k_chase_db1_20201226_094047-4c5aefa3.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_128x128_40k_chase_db1.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "CHASE_DB1",
-        "Dice": 80.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1_20211210_201825-4ef29df5.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_128x128_40k_chase-db1.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 79.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_256x256_40k_hrf/fcn_unet_s5-d16_256x256_40k_hrf_20201223_173724-d89cf1ed.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "fcn_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 80.87,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf/fcn_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf_20211210_201821-c314da8a.pth",
-            "config_url": "configs/unet/fcn_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 80.07,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_256x256_40k_hrf/pspnet_unet_s5-d16_256x256_40k_hrf_20201227_181818-fdb7e29b.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "pspnet_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 80.96,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf/pspnet_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf_20211210_201823-53d492fa.pth",
-            "config_url": "configs/unet/pspnet_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 80.21,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_256x256_40k_hrf/deeplabv3_unet_s5-d16_256x256_40k_hrf_20201226_094047-3a1fdf85.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf",
-        "Backbone": "UNet-S5-D16",
-        "Method": "UNet",
-        "Dataset": "HRF",
-        "Dice": 80.71,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "UNet",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/unet",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf_20211210_202032-59daf7a4.pth",
-            "config_url": "configs/unet/deeplabv3_unet_s5-d16_ce-1.0-dice-3.0_256x256_40k_hrf.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 72.25,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x1024_40k_cityscapes/fcn_r50-d8_512x1024_40k_cityscapes_20200604_192608-efe53f0d.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.45,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x1024_40k_cityscapes/fcn_r101-d8_512x1024_40k_cityscapes_20200604_181852-a883d3a1.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_769x769_40k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 71.47,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_769x769_40k_cityscapes/fcn_r50-d8_769x769_40k_cityscapes_20200606_113104-977b5d02.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_769x769_40k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.93,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_769x769_40k_cityscapes/fcn_r101-d8_769x769_40k_cityscapes_20200606_113208-7d4ab69c.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r18-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 71.11,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r18-d8_512x1024_80k_cityscapes/fcn_r18-d8_512x1024_80k_cityscapes_20201225_021327-6c50f8b4.pth",
-            "config_url": "configs/fcn/fcn_r18-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x1024_80k_cityscapes/fcn_r50-d8_512x1024_80k_cityscapes_20200606_113019-03aa804d.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.13,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x1024_80k_cityscapes/fcn_r101-d8_512x1024_80k_cityscapes_20200606_113038-3fb937eb.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_fp16_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_fp16_512x1024_80k_cityscapes/fcn_r101-d8_fp16_512x1024_80k_cityscapes_20200717_230921-fb13e883.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_fp16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r18-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 70.8,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r18-d8_769x769_80k_cityscapes/fcn_r18-d8_769x769_80k_cityscapes_20201225_021451-9739d1b8.pth",
-            "config_url": "configs/fcn/fcn_r18-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 72.64,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_769x769_80k_cityscapes/fcn_r50-d8_769x769_80k_cityscapes_20200606_195749-f5caeabc.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.52,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_769x769_80k_cityscapes/fcn_r101-d8_769x769_80k_cityscapes_20200606_214354-45cbac68.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r18b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 70.24,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r18b-d8_512x1024_80k_cityscapes/fcn_r18b-d8_512x1024_80k_cityscapes_20201225_230143-92c0f445.pth",
-            "config_url": "configs/fcn/fcn_r18b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 75.65,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50b-d8_512x1024_80k_cityscapes/fcn_r50b-d8_512x1024_80k_cityscapes_20201225_094221-82957416.pth",
-            "config_url": "configs/fcn/fcn_r50b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101b-d8_512x1024_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.37,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101b-d8_512x1024_80k_cityscapes/fcn_r101b-d8_512x1024_80k_cityscapes_20201226_160213-4543858f.pth",
-            "config_url": "configs/fcn/fcn_r101b-d8_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r18b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-18b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 69.66,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r18b-d8_769x769_80k_cityscapes/fcn_r18b-d8_769x769_80k_cityscapes_20201226_004430-32d504e5.pth",
-            "config_url": "configs/fcn/fcn_r18b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-50b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 73.83,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50b-d8_769x769_80k_cityscapes/fcn_r50b-d8_769x769_80k_cityscapes_20201225_094223-94552d38.pth",
-            "config_url": "configs/fcn/fcn_r50b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r101b-d8_769x769_80k_cityscapes",
-        "Backbone": "R-101b-D8",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.02,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101b-d8_769x769_80k_cityscapes/fcn_r101b-d8_769x769_80k_cityscapes_20201226_170012-82be37e2.pth",
-            "config_url": "configs/fcn/fcn_r101b-d8_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50-d16_512x1024_40k_cityscapes",
-        "Backbone": "R-50-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50-d16_512x1024_40k_cityscapes/fcn_d6_r50-d16_512x1024_40k_cityscapes_20210305_130133-98d5d1bc.pth",
-            "config_url": "configs/fcn/fcn_d6_r50-d16_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50-d16_512x1024_80k_cityscapes",
-        "Backbone": "R-50-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.27,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50-d16_512x1024_80k_cityscapes/fcn_d6_r50-d16_512x1024_80k_cityscapes_20210306_115604-133c292f.pth",
-            "config_url": "configs/fcn/fcn_d6_r50-d16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50-d16_769x769_40k_cityscapes",
-        "Backbone": "R-50-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.82,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50-d16_769x769_40k_cityscapes/fcn_d6_r50-d16_769x769_40k_cityscapes_20210305_185744-1aab18ed.pth",
-            "config_url": "configs/fcn/fcn_d6_r50-d16_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50-d16_769x769_80k_cityscapes",
-        "Backbone": "R-50-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.04,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50-d16_769x769_80k_cityscapes/fcn_d6_r50-d16_769x769_80k_cityscapes_20210305_200413-109d88eb.pth",
-            "config_url": "configs/fcn/fcn_d6_r50-d16_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101-d16_512x1024_40k_cityscapes",
-        "Backbone": "R-101-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.36,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101-d16_512x1024_40k_cityscapes/fcn_d6_r101-d16_512x1024_40k_cityscapes_20210305_130337-9cf2b450.pth",
-            "config_url": "configs/fcn/fcn_d6_r101-d16_512x1024_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101-d16_512x1024_80k_cityscapes",
-        "Backbone": "R-101-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.46,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101-d16_512x1024_80k_cityscapes/fcn_d6_r101-d16_512x1024_80k_cityscapes_20210308_102747-cb336445.pth",
-            "config_url": "configs/fcn/fcn_d6_r101-d16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101-d16_769x769_40k_cityscapes",
-        "Backbone": "R-101-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.28,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101-d16_769x769_40k_cityscapes/fcn_d6_r101-d16_769x769_40k_cityscapes_20210308_102453-60b114e9.pth",
-            "config_url": "configs/fcn/fcn_d6_r101-d16_769x769_40k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101-d16_769x769_80k_cityscapes",
-        "Backbone": "R-101-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 78.06,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101-d16_769x769_80k_cityscapes/fcn_d6_r101-d16_769x769_80k_cityscapes_20210306_120016-e33adc4f.pth",
-            "config_url": "configs/fcn/fcn_d6_r101-d16_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50b-d16_512x1024_80k_cityscapes",
-        "Backbone": "R-50b-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.99,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50b-d16_512x1024_80k_cityscapes/fcn_d6_r50b-d16_512x1024_80k_cityscapes_20210311_125550-6a0b62e9.pth",
-            "config_url": "configs/fcn/fcn_d6_r50b-d16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r50b-d16_769x769_80k_cityscapes",
-        "Backbone": "R-50b-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 76.86,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r50b-d16_769x769_80k_cityscapes/fcn_d6_r50b-d16_769x769_80k_cityscapes_20210311_131012-d665f231.pth",
-            "config_url": "configs/fcn/fcn_d6_r50b-d16_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101b-d16_512x1024_80k_cityscapes",
-        "Backbone": "R-101b-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.72,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101b-d16_512x1024_80k_cityscapes/fcn_d6_r101b-d16_512x1024_80k_cityscapes_20210311_144305-3f2eb5b4.pth",
-            "config_url": "configs/fcn/fcn_d6_r101b-d16_512x1024_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_d6_r101b-d16_769x769_80k_cityscapes",
-        "Backbone": "R-101b-D16",
-        "Method": "FCN",
-        "Dataset": "Cityscapes",
-        "mIoU": 77.34,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_d6_r101b-d16_769x769_80k_cityscapes/fcn_d6_r101b-d16_769x769_80k_cityscapes_20210311_154527-c4d8bfbc.pth",
-            "config_url": "configs/fcn/fcn_d6_r101b-d16_769x769_80k_cityscapes.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x512_80k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 35.94,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x512_80k_ade20k/fcn_r50-d8_512x512_80k_ade20k_20200614_144016-f8ac5082.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x512_80k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 39.61,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x512_80k_ade20k/fcn_r101-d8_512x512_80k_ade20k_20200615_014143-bc1809f7.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x512_80k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x512_160k_ade20k",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 36.1,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x512_160k_ade20k/fcn_r50-d8_512x512_160k_ade20k_20200615_100713-4edbc3b4.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x512_160k_ade20k",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "ADE20K",
-        "mIoU": 39.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x512_160k_ade20k/fcn_r101-d8_512x512_160k_ade20k_20200615_105816-fd192bd5.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x512_160k_ade20k.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x512_20k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 67.08,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x512_20k_voc12aug/fcn_r50-d8_512x512_20k_voc12aug_20200617_010715-52dc5306.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x512_20k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 71.16,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x512_20k_voc12aug/fcn_r101-d8_512x512_20k_voc12aug_20200617_010842-0bb4e798.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x512_20k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_r50-d8_512x512_40k_voc12aug",
-        "Backbone": "R-50-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 66.97,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r50-d8_512x512_40k_voc12aug/fcn_r50-d8_512x512_40k_voc12aug_20200613_161222-5e2dbf40.pth",
-            "config_url": "configs/fcn/fcn_r50-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_512x512_40k_voc12aug",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal VOC 2012 + Aug",
-        "mIoU": 69.91,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_512x512_40k_voc12aug/fcn_r101-d8_512x512_40k_voc12aug_20200613_161240-4c8bcefd.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_512x512_40k_voc12aug.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_480x480_40k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal Context",
-        "mIoU": 44.43,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_480x480_40k_pascal_context/fcn_r101-d8_480x480_40k_pascal_context_20210421_154757-b5e97937.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_480x480_40k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_480x480_80k_pascal_context",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal Context",
-        "mIoU": 44.13,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_480x480_80k_pascal_context/fcn_r101-d8_480x480_80k_pascal_context_20210421_163310-4711813f.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_480x480_80k_pascal_context.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_480x480_40k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 48.42,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_480x480_40k_pascal_context_59/fcn_r101-d8_480x480_40k_pascal_context_59_20210415_230724-8cf83682.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_480x480_40k_pascal_context_59.py",
-        },
-    },
-    {
-        "Model": "fcn_r101-d8_480x480_80k_pascal_context_59",
-        "Backbone": "R-101-D8",
-        "Method": "FCN",
-        "Dataset": "Pascal Context 59",
-        "mIoU": 49.35,
-        "meta": {
-            "task_type": "semantic segmentation",
-            "arch_type": "FCN",
-            "arch_link": "https://github.com/open-mmlab/mmsegmentation/tree/v0.23.0/configs/fcn",
-            "weights_url": "https://download.openmmlab.com/mmsegmentation/v0.5/fcn/fcn_r101-d8_480x480_80k_pascal_context_59/fcn_r101-d8_480x480_80k_pascal_context_59_20210416_110804-9a6f2c94.pth",
-            "config_url": "configs/fcn/fcn_r101-d8_480x480_80k_pascal_context_59.py",
-        },
-    },
-]
-
-rtdetr = [
-    {
-        "Model": "rtdetr_r18vd_coco",
-        "dataset": "COCO",
-        "AP_val": 46.4,
-        "Params(M)": 20,
-        "FPS(T4)": 217,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r18vd_dec3_6x_coco_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r34vd_coco",
-        "dataset": "COCO",
-        "AP_val": 48.9,
-        "Params(M)": 31,
-        "FPS(T4)": 161,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r34vd_dec4_6x_coco_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r50vd_m_coco",
-        "dataset": "COCO",
-        "AP_val": 51.3,
-        "Params(M)": 36,
-        "FPS(T4)": 145,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r50vd_m_6x_coco_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r50vd_coco",
-        "dataset": "COCO",
-        "AP_val": 53.1,
-        "Params(M)": 42,
-        "FPS(T4)": 108,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r50vd_6x_coco_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r101vd_coco",
-        "dataset": "COCO",
-        "AP_val": 54.3,
-        "Params(M)": 76,
-        "FPS(T4)": 74,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r101vd_6x_coco_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r18vd_coco_objects365",
-        "dataset": "COCO+Objects365",
-        "AP_val": 49.0,
-        "Params(M)": 20,
-        "FPS(T4)": 217,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r18vd_5x_coco_objects365_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r50vd_coco_objects365",
-        "dataset": "COCO+Objects365",
-        "AP_val": 55.2,
-        "Params(M)": 42,
-        "FPS(T4)": 108,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r50vd_2x_coco_objects365_from_paddle.pth",
-        },
-    },
-    {
-        "Model": "rtdetr_r101vd_coco_objects365",
-        "dataset": "COCO+Objects365",
-        "AP_val": 56.2,
-        "Params(M)": 76,
-        "FPS(T4)": 74,
-        "meta": {
-            "task_type": "object detection",
-            "weights_url": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetr_r101vd_2x_coco_objects365_from_paddle.pth",
-        },
-    },
-]
-
-rtdetrv2 = [
-    {
-        "Model": "RT-DETRv2-S",
-        "dataset": "COCO",
-        "AP_val": 48.1,
-        "Params(M)": 20,
-        "FPS(T4)": 217,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "RT-DETRv2-S",
-            "model_files": {
-                "checkpoint": "https://github.com/lyuwenyu/storage/releases/download/v0.2/rtdetrv2_r18vd_120e_coco_rerun_48.1.pth",
-                "config": "rtdetrv2_r18vd_120e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "RT-DETRv2-M*",
-        "dataset": "COCO",
-        "AP_val": 49.9,
-        "Params(M)": 31,
-        "FPS(T4)": 161,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "RT-DETRv2-M*",
-            "model_files": {
-                "checkpoint": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetrv2_r34vd_120e_coco_ema.pth",
-                "config": "rtdetrv2_r34vd_120e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "RT-DETRv2-M",
-        "dataset": "COCO",
-        "AP_val": 51.9,
-        "Params(M)": 36,
-        "FPS(T4)": 145,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "RT-DETRv2-M",
-            "model_files": {
-                "checkpoint": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetrv2_r50vd_m_7x_coco_ema.pth",
-                "config": "rtdetrv2_r50vd_m_7x_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "RT-DETRv2-L",
-        "dataset": "COCO",
-        "AP_val": 53.4,
-        "Params(M)": 42,
-        "FPS(T4)": 108,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "RT-DETRv2-L",
-            "model_files": {
-                "checkpoint": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetrv2_r50vd_6x_coco_ema.pth",
-                "config": "rtdetrv2_r50vd_6x_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "RT-DETRv2-X",
-        "dataset": "COCO",
-        "AP_val": 54.3,
-        "Params(M)": 76,
-        "FPS(T4)": 74,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "RT-DETRv2-X",
-            "model_files": {
-                "checkpoint": "https://github.com/lyuwenyu/storage/releases/download/v0.1/rtdetrv2_r101vd_6x_coco_from_paddle.pth",
-                "config": "rtdetrv2_r101vd_6x_coco.yml",
-            },
-        },
-    },
-]
-
-yolo = [
-    {
-        "model_name": "YOLO26n-det",
-        "Size (pixels)": "640",
-        "mAP": "40.9",
-        "params (M)": "2.4",
-        "FLOPs (B)": "5.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26n.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26s-det",
-        "Size (pixels)": "640",
-        "mAP": "48.6",
-        "params (M)": "9.5",
-        "FLOPs (B)": "20.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26s.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26m-det",
-        "Size (pixels)": "640",
-        "mAP": "53.1",
-        "params (M)": "20.4",
-        "FLOPs (B)": "68.2",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26m.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26l-det",
-        "Size (pixels)": "640",
-        "mAP": "55.0",
-        "params (M)": "24.8",
-        "FLOPs (B)": "86.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26l.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26x-det",
-        "Size (pixels)": "640",
-        "mAP": "57.5",
-        "params (M)": "55.7",
-        "FLOPs (B)": "193.9",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26x.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26n-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "39.6",
-        "mAP (mask)": "33.9",
-        "params (M)": "2.7",
-        "FLOPs (B)": "9.1",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26n-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26s-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "47.3",
-        "mAP (mask)": "40.0",
-        "params (M)": "10.4",
-        "FLOPs (B)": "34.2",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26s-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26m-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "52.5",
-        "mAP (mask)": "44.1",
-        "params (M)": "23.6",
-        "FLOPs (B)": "121.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26m-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26l-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "54.4",
-        "mAP (mask)": "45.5",
-        "params (M)": "28.0",
-        "FLOPs (B)": "139.8",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26l-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO26x-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "56.5",
-        "mAP (mask)": "47.0",
-        "params (M)": "62.8",
-        "FLOPs (B)": "313.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.4.0/yolo26x-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO12n",
-        "Size (pixels)": "640",
-        "mAP": "40.6",
-        "params (M)": "2.6",
-        "FLOPs (B)": "6.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo12n.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO12s",
-        "Size (pixels)": "640",
-        "mAP": "48.0",
-        "params (M)": "9.3",
-        "FLOPs (B)": "21.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo12s.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO12m",
-        "Size (pixels)": "640",
-        "mAP": "52.5",
-        "params (M)": "20.2",
-        "FLOPs (B)": "67.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo12m.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO12l",
-        "Size (pixels)": "640",
-        "mAP": "53.7",
-        "params (M)": "26.4",
-        "FLOPs (B)": "88.9",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo12l.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO12x",
-        "Size (pixels)": "640",
-        "mAP": "55.2",
-        "params (M)": "59.1",
-        "FLOPs (B)": "199.0",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo12x.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11n-det",
-        "Size (pixels)": "640",
-        "mAP": "39.5",
-        "params (M)": "2.6",
-        "FLOPs (B)": "6.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11s-det",
-        "Size (pixels)": "640",
-        "mAP": "47.0",
-        "params (M)": "9.4",
-        "FLOPs (B)": "21.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11s.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11m-det",
-        "Size (pixels)": "640",
-        "mAP": "51.5",
-        "params (M)": "20.1",
-        "FLOPs (B)": "68.0",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11m.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11l-det",
-        "Size (pixels)": "640",
-        "mAP": "53.4",
-        "params (M)": "25.3",
-        "FLOPs (B)": "86.9",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11l.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11x-det",
-        "Size (pixels)": "640",
-        "mAP": "54.7",
-        "params (M)": "56.9",
-        "FLOPs (B)": "194.9",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11x.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11n-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "38.9",
-        "mAP (mask)": "32.0",
-        "params (M)": "2.9",
-        "FLOPs (B)": "10.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11s-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "46.6",
-        "mAP (mask)": "37.8",
-        "params (M)": "10.1",
-        "FLOPs (B)": "35.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11s-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11m-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "51.5",
-        "mAP (mask)": "41.5",
-        "params (M)": "22.4",
-        "FLOPs (B)": "123.3",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11m-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11l-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "53.4",
-        "mAP (mask)": "42.9",
-        "params (M)": "27.6",
-        "FLOPs (B)": "142.2",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11l-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLO11x-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "54.7",
-        "mAP (mask)": "43.8",
-        "params (M)": "62.1",
-        "FLOPs (B)": "319.0",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11x-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv10n-det",
-        "Size (pixels)": "640",
-        "mAP": "39.5",
-        "params (M)": "2.3",
-        "FLOPs (B)": "6.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10n.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv10s-det",
-        "Size (pixels)": "640",
-        "mAP": "46.8",
-        "params (M)": "7.2",
-        "FLOPs (B)": "21.6",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10s.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv10m-det",
-        "Size (pixels)": "640",
-        "mAP": "51.3",
-        "params (M)": "15.4",
-        "FLOPs (B)": "59.1",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10m.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv10l-det",
-        "Size (pixels)": "640",
-        "mAP": "53.4",
-        "params (M)": "24.4",
-        "FLOPs (B)": "120.3",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10l.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv10x-det",
-        "Size (pixels)": "640",
-        "mAP": "54.4",
-        "params (M)": "29.5",
-        "FLOPs (B)": "160.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov10x.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv9c-det",
-        "Size (pixels)": "640",
-        "mAP": "53.0",
-        "params (M)": "25.5",
-        "FLOPs (B)": "102.8",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9c.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv9e-det",
-        "Size (pixels)": "640",
-        "mAP": "55.6",
-        "params (M)": "58.1",
-        "FLOPs (B)": "192.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9e.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv9c-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "52.4",
-        "mAP (mask)": "42.2",
-        "params (M)": "27.9",
-        "FLOPs (B)": "159.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9c-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv9e-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "55.1",
-        "mAP (mask)": "44.3",
-        "params (M)": "60.5",
-        "FLOPs (B)": "248.4",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov9e-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8n-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "37.3",
-        "params (M)": "3.2",
-        "FLOPs (B)": "8.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8n.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8n-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "18.4",
-        "params (M)": "3.5",
-        "FLOPs (B)": "10.5",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8n-oiv7.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8s-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "44.9",
-        "params (M)": "11.2",
-        "FLOPs (B)": "28.6",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8s.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8s-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "27.7",
-        "params (M)": "11.4",
-        "FLOPs (B)": "29.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8s-oiv7.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8m-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "50.2",
-        "params (M)": "25.9",
-        "FLOPs (B)": "78.9",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8m.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8m-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "33.6",
-        "params (M)": "26.2",
-        "FLOPs (B)": "80.6",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8m-oiv7.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8l-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "52.9",
-        "params (M)": "43.7",
-        "FLOPs (B)": "165.2",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8l.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8l-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "34.9",
-        "params (M)": "44.1",
-        "FLOPs (B)": "167.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8l-oiv7.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8x-det (COCO)",
-        "Size (pixels)": "640",
-        "mAP": "53.9",
-        "params (M)": "68.2",
-        "FLOPs (B)": "257.8",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8x.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8x-det (Open Images V7)",
-        "Size (pixels)": "640",
-        "mAP": "36.3",
-        "params (M)": "68.7",
-        "FLOPs (B)": "260.6",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8x-oiv7.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8n-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "36.7",
-        "mAP (mask)": "30.5",
-        "params (M)": "3.4",
-        "FLOPs (B)": "12.6",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8n-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8s-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "44.6",
-        "mAP (mask)": "36.8",
-        "params (M)": "11.8",
-        "FLOPs (B)": "42.6",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8s-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8m-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "49.9",
-        "mAP (mask)": "40.8",
-        "params (M)": "27.3",
-        "FLOPs (B)": "110.2",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8m-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8l-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "52.3",
-        "mAP (mask)": "42.6",
-        "params (M)": "46.0",
-        "FLOPs (B)": "220.5",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8l-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv8x-seg",
-        "Size (pixels)": "640",
-        "mAP (box)": "53.4",
-        "mAP (mask)": "43.4",
-        "params (M)": "71.8",
-        "FLOPs (B)": "344.1",
-        "meta": {
-            "task_type": "instance segmentation",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8x-seg.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5nu",
-        "Size (pixels)": "640",
-        "mAP": "34.3",
-        "params (M)": "2.6",
-        "FLOPs (B)": "7.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5nu.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5su",
-        "Size (pixels)": "640",
-        "mAP": "43.0",
-        "params (M)": "9.1",
-        "FLOPs (B)": "24.0",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5su.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5mu",
-        "Size (pixels)": "640",
-        "mAP": "49.0",
-        "params (M)": "25.1",
-        "FLOPs (B)": "64.2",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5mu.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5lu",
-        "Size (pixels)": "640",
-        "mAP": "52.2",
-        "params (M)": "43.2",
-        "FLOPs (B)": "135.0",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5lu.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5xu",
-        "Size (pixels)": "640",
-        "mAP": "53.2",
-        "params (M)": "97.2",
-        "FLOPs (B)": "246.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5xu.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5n6u",
-        "Size (pixels)": "1280",
-        "mAP": "42.1",
-        "params (M)": "4.3",
-        "FLOPs (B)": "7.8",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5n6u.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5s6u",
-        "Size (pixels)": "1280",
-        "mAP": "48.6",
-        "params (M)": "15.3",
-        "FLOPs (B)": "24.6",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5s6u.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5m6u",
-        "Size (pixels)": "1280",
-        "mAP": "53.6",
-        "params (M)": "41.2",
-        "FLOPs (B)": "65.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5m6u.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5l6u",
-        "Size (pixels)": "1280",
-        "mAP": "55.7",
-        "params (M)": "86.1",
-        "FLOPs (B)": "137.4",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5l6u.pt"
-            },
-        },
-    },
-    {
-        "model_name": "YOLOv5x6u",
-        "Size (pixels)": "1280",
-        "mAP": "56.8",
-        "params (M)": "155.4",
-        "FLOPs (B)": "250.7",
-        "meta": {
-            "task_type": "object detection",
-            "model_files": {
-                "checkpoint": "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolov5x6u.pt"
-            },
-        },
-    },
-]
-
-deim = [
-    {
-        "Model": "DEIM D-FINE-N",
-        "dataset": "COCO",
-        "AP_val": 43.0,
-        "Params(M)": 4,
-        "Latency": "2.12ms",
-        "GFLOPs": 7,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM D-FINE-N",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_dfine_hgnetv2_n_coco_160e.pth",
-                "config": "deim_hgnetv2_n_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM D-FINE-S",
-        "dataset": "COCO",
-        "AP_val": 49.0,
-        "Params(M)": 10,
-        "Latency": "3.49ms",
-        "GFLOPs": 25,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM D-FINE-S",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_dfine_hgnetv2_s_coco_120e.pth",
-                "config": "deim_hgnetv2_s_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM D-FINE-M",
-        "dataset": "COCO",
-        "AP_val": 52.7,
-        "Params(M)": 19,
-        "Latency": "5.62ms",
-        "GFLOPs": 57,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM D-FINE-M",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_dfine_hgnetv2_m_coco_90e.pth",
-                "config": "deim_hgnetv2_m_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM D-FINE-L",
-        "dataset": "COCO",
-        "AP_val": 54.7,
-        "Params(M)": 31,
-        "Latency": "8.07ms",
-        "GFLOPs": 91,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM D-FINE-L",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_dfine_hgnetv2_l_coco_50e.pth",
-                "config": "deim_hgnetv2_l_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM D-FINE-X",
-        "dataset": "COCO",
-        "AP_val": 56.5,
-        "Params(M)": 62,
-        "Latency": "12.89ms",
-        "GFLOPs": 202,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM D-FINE-X",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_dfine_hgnetv2_x_coco_50e.pth",
-                "config": "deim_hgnetv2_x_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM RT-DETRv2-S",
-        "dataset": "COCO",
-        "AP_val": 49.0,
-        "Params(M)": 20,
-        "Latency": "4.59ms",
-        "GFLOPs": 60,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM RT-DETRv2-S",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_rtdetrv2_r18vd_coco_120e.pth",
-                "config": "deim_r18vd_120e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM RT-DETRv2-M",
-        "dataset": "COCO",
-        "AP_val": 50.9,
-        "Params(M)": 31,
-        "Latency": "6.40ms",
-        "GFLOPs": 92,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM RT-DETRv2-M",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_rtdetrv2_r34vd_coco_120e.pth",
-                "config": "deim_r34vd_120e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM RT-DETRv2-M*",
-        "dataset": "COCO",
-        "AP_val": 53.2,
-        "Params(M)": 33,
-        "Latency": "6.90ms",
-        "GFLOPs": 100,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM RT-DETRv2-M*",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_rtdetrv2_r50vd_m_coco_60e.pth",
-                "config": "deim_r50vd_m_60e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM RT-DETRv2-L",
-        "dataset": "COCO",
-        "AP_val": 54.3,
-        "Params(M)": 42,
-        "Latency": "9.15ms",
-        "GFLOPs": 136,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM RT-DETRv2-L",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_rtdetrv2_r50vd_coco_60e.pth",
-                "config": "deim_r50vd_60e_coco.yml",
-            },
-        },
-    },
-    {
-        "Model": "DEIM RT-DETRv2-X",
-        "dataset": "COCO",
-        "AP_val": 55.5,
-        "Params(M)": 76,
-        "Latency": "13.66ms",
-        "GFLOPs": 259,
-        "meta": {
-            "task_type": "object detection",
-            "model_name": "DEIM RT-DETRv2-X",
-            "model_files": {
-                "checkpoint": "https://github.com/supervisely-ecosystem/deim/releases/download/v0.0.1/deim_rtdetrv2_r101vd_coco_60e.pth",
-                "config": "deim_r101vd_60e_coco.yml",
-            },
-        },
-    },
-]
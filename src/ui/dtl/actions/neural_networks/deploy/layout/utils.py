@@ -1,4 +1,6 @@
-from os.path import join
+import json
+from functools import lru_cache
+from os.path import dirname, join, realpath
 from typing import List
 
 import src.globals as g
@@ -18,6 +20,19 @@ from supervisely.app.widgets import (
 from supervisely.io.fs import get_file_name_with_ext
 from supervisely.nn.utils import ModelSource
 
+PRETRAINED_MODELS_PATH = join(dirname(realpath(__file__)), "pretrained_models.json")
+
+
+@lru_cache(maxsize=1)
+def _load_pretrained_models() -> dict:
+    with open(PRETRAINED_MODELS_PATH, "r") as f:
+        return json.load(f)
+
+
+def get_pretrained_models(framework: str) -> List[dict]:
+    """Returns the table of pretrained models, the data file is read on the first call."""
+    return _load_pretrained_models()[framework]
+
 
 def set_agent_selector_preview(
     agent_selector_sidebar_selector: Select,
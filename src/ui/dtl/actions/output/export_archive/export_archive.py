@@ -4,8 +4,9 @@ from os.path import realpath, dirname
 
 from src.ui.dtl import OutputAction
 from src.ui.dtl.Layer import Layer
-from supervisely.app.widgets import NodesFlow, Text, Input, Checkbox, Markdown
+from supervisely.app.widgets import NodesFlow, Text, Input, Checkbox, Markdown, InputNumber, Field
 from src.ui.dtl.utils import get_layer_docs, get_text_font_size
+from src.compute.dtl_utils.export_writer import DEFAULT_PNG_COMPRESSION
 import src.globals as g
 
 
@@ -26,12 +27,21 @@ class ExportArchiveAction(OutputAction):
         visualize_checkbox = Checkbox("Visualize")
         if g.MODALITY_TYPE == "videos":
             visualize_checkbox.hide()
+        png_compression_input = InputNumber(
+            value=DEFAULT_PNG_COMPRESSION, min=0, max=9, step=1, size="small"
+        )
+        png_compression_field = Field(
+            title="PNG compression",
+            description="0-9, higher values give smaller files but slower export",
+            content=png_compression_input,
+        )
 
         def get_settings(options_json: dict) -> dict:
             """This function is used to get settings from options json we get from NodesFlow widget"""
             return {
                 "archive_name": save_path_input.get_value(),
                 "visualize": visualize_checkbox.is_checked(),
+                "png_compression": png_compression_input.get_value(),
             }
 
         def get_dst(options_json: dict) -> dict:
@@ -55,6 +65,8 @@ class ExportArchiveAction(OutputAction):
             archive_name = settings.get("archive_name", "")
             save_path_input.set_value(archive_name)
 
+            png_compression_input.value = settings.get("png_compression", DEFAULT_PNG_COMPRESSION)
+
         def create_options(src: list, dst: list, settings: dict) -> dict:
             _set_settings_from_json(settings)
             settings_options = [
@@ -69,6 +81,10 @@ class ExportArchiveAction(OutputAction):
                     name="Visualize",
                     option_component=NodesFlow.WidgetOptionComponent(visualize_checkbox),
                 ),
+                NodesFlow.Node.Option(
+                    name="PNG compression",
+                    option_component=NodesFlow.WidgetOptionComponent(png_compression_field),
+                ),
             ]
             return {
                 "src": [],
@@ -2,10 +2,20 @@ from typing import Optional
 import json
 from os.path import realpath, dirname
 
-from supervisely.app.widgets import NodesFlow, Button, Container, Text, Input, Checkbox, Field
+from supervisely.app.widgets import (
+    NodesFlow,
+    Button,
+    Container,
+    Text,
+    Input,
+    Checkbox,
+    Field,
+    InputNumber,
+)
 from supervisely import ProjectMeta
 from supervisely.imaging.color import hex2rgb, rgb2hex
 
+from src.compute.dtl_utils.export_writer import DEFAULT_PNG_COMPRESSION
 from src.ui.dtl import OutputAction
 from src.ui.dtl.Layer import Layer
 from src.ui.widgets import ClassesColorMapping, ClassesMappingPreview
@@ -35,6 +45,15 @@ class ExportArchiveWithMasksAction(OutputAction):
             value="", placeholder="Enter archive name (without extension)", size="small"
         )
 
+        png_compression_input = InputNumber(
+            value=DEFAULT_PNG_COMPRESSION, min=0, max=9, step=1, size="small"
+        )
+        png_compression_field = Field(
+            title="PNG compression",
+            description="0-9, higher values give smaller files but slower export",
+            content=png_compression_input,
+        )
+
         add_human_masks_checkbox = Checkbox("Add human masks")
         add_machine_masks_checkbox = Checkbox("Add machine masks")
 
@@ -184,6 +203,7 @@ class ExportArchiveWithMasksAction(OutputAction):
                 "masks_machine": masks_machine,
                 "gt_human_color": gt_human_color,
                 "gt_machine_color": gt_machine_color,
+                "png_compression": png_compression_input.get_value(),
             }
 
         def data_changed_cb(**kwargs):
@@ -259,6 +279,8 @@ class ExportArchiveWithMasksAction(OutputAction):
             archive_name = settings.get("archive_name", "")
             destination_input.set_value(archive_name)
 
+            png_compression_input.value = settings.get("png_compression", DEFAULT_PNG_COMPRESSION)
+
         @human_classes_colors_save_btn.click
         def human_classes_saved():
             _save_human_classes_colors()
@@ -318,6 +340,10 @@ class ExportArchiveWithMasksAction(OutputAction):
                         machine_classes_colors_preview
                     ),
                 ),
+                NodesFlow.Node.Option(
+                    name="PNG compression",
+                    option_component=NodesFlow.WidgetOptionComponent(png_compression_field),
+                ),
             ]
             return {
                 "src": [],
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import cv2
+import numpy as np
+from supervisely import Annotation
+from supervisely.imaging.image import write_bytes
+
+# Previews are calculated on a proxy image with this longest side,
+# full resolution is used only when "Full resolution preview" is checked
+PREVIEW_MAX_SIDE = int(os.getenv("PREVIEW_MAX_SIDE", "1024"))
+PREVIEW_CACHE_BYTES = int(os.getenv("PREVIEW_CACHE_MB", "64")) * 1024 * 1024
+
+
+def get_proxy_size(img_size: Tuple[int, int], max_side: int = PREVIEW_MAX_SIDE):
+    """Returns (height, width) of the proxy image or None if the image is small enough."""
+    height, width = img_size[:2]
+    if max(height, width) <= max_side:
+        return None
+    scale = max_side / max(height, width)
+    return max(1, round(height * scale)), max(1, round(width * scale))
+
+
+def downscale_for_preview(
+    img: np.ndarray, ann: Optional[Annotation], max_side: int = PREVIEW_MAX_SIDE
+) -> Tuple[np.ndarray, Optional[Annotation]]:
+    """Downscales the image and scales the annotation to the same size."""
+    proxy_size = get_proxy_size(img.shape, max_side)
+    if proxy_size is None:
+        return img, ann
+    height, width = proxy_size
+    img = cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+    if ann is not None:
+        ann = ann.resize((height, width))
+    return img, ann
+
+
+class EncodedPreviewCache:
+    """
+    In-memory LRU cache of encoded preview images, bounded by the total size in bytes.
+    Every image gets an ETag derived from its content, so the browser can revalidate
+    the image instead of downloading it again. Evicted previews are encoded again on request
+    (see get_or_put), encoding is deterministic, so they keep their ETags.
+    """
+
+    def __init__(self, max_bytes: int = PREVIEW_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()  # {key: (etag, data)}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, key: str, img: np.ndarray) -> str:
+        etag, _ = self._put(key, img)
+        return etag
+
+    def _put(self, key: str, img: np.ndarray) -> Tuple[str, bytes]:
+        data = write_bytes(img, ".jpg")
+        etag = hashlib.blake2b(data, digest_size=8).hexdigest()
+        with self._lock:
+            self._pop(key)
+            self._items[key] = (etag, data)
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._items) > 1:
+                _, (_, old_data) = self._items.popitem(last=False)
+                self._size -= len(old_data)
+        return etag, data
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def get_or_put(
+        self, key: str, get_img: Callable[[], Optional[np.ndarray]]
+    ) -> Optional[Tuple[str, bytes]]:
+        """Returns the cached preview or caches the image from get_img, None if there is none."""
+        item = self.get(key)
+        if item is not None:
+            return item
+        img = get_img()
+        if img is None:
+            return None
+        return self._put(key, img)
+
+    def _pop(self, key: str):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._size -= len(item[1])
+
+    def pop(self, key: str):
+        with self._lock:
+            self._pop(key)
+
+
+preview_cache = EncodedPreviewCache()
+
+
+def get_preview_url(key: str, etag: str) -> str:
+    return f"previews/{key}.jpg?v={etag}"
@@ -0,0 +1,148 @@
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, List
+
+from supervisely.sly_logger import logger
+
+
+class PreviewCancelled(Exception):
+    """Raised inside a preview job when a newer update has superseded it."""
+
+
+class PreviewJob:
+    """
+    Preview update of one layer and its children.
+    The job is stale when any layer from `cancel_on` (the layer itself and its parents)
+    received a newer update, or when the whole graph was refreshed after the job was created.
+    `layers_ids` are all layers whose previews the job touches, jobs with overlapping layers
+    never run at the same time.
+    """
+
+    def __init__(
+        self,
+        scheduler: "PreviewScheduler",
+        layer_id: str,
+        cancel_on: Iterable[str],
+        layers_ids: Iterable[str],
+    ):
+        self.layer_id = layer_id
+        self.layers_ids = set(layers_ids)
+        self._scheduler = scheduler
+        self._epoch = scheduler._epoch
+        self._generations = {lid: scheduler._generations[lid] for lid in cancel_on}
+
+    def is_cancelled(self) -> bool:
+        if self._scheduler._epoch != self._epoch:
+            return True
+        generations = self._scheduler._generations
+        return any(generations[lid] != gen for lid, gen in self._generations.items())
+
+    def check_cancelled(self):
+        if self.is_cancelled():
+            raise PreviewCancelled(self.layer_id)
+
+
+class PreviewScheduler:
+    """
+    Event-driven replacement of the polling update loop.
+    Updates are coalesced when they are submitted: an update which is already pending is
+    dropped, and every update bumps a generation counter so in-flight preview jobs of the
+    same layer (or of the whole graph) see that they are stale and stop at the next check.
+    Pending updates are passed in batches to the handler, which runs graph-wide updates
+    with `run_exclusive` and per-layer previews with `run_job`. Jobs with disjoint layers
+    run concurrently in the pool, so everything that changes the layers jobs use (e.g.
+    syncing the net with the graph) has to run with `run_exclusive`.
+    """
+
+    def __init__(self, workers: int = 4):
+        self.workers = workers
+        self._cond = threading.Condition()
+        self._pending: Dict[Hashable, None] = {}  # ordered set of updates
+        self._generations = defaultdict(int)  # {layer_id: generation}
+        self._epoch = 0
+        self._running: List[PreviewJob] = []
+        self._exclusive = False
+        self._handler = None
+        self._thread = None
+        self._executor = None
+
+    def submit(self, update: Hashable):
+        with self._cond:
+            if update == "load_json":
+                self._epoch += 1
+            elif isinstance(update, tuple) and update[0] == "nodes":
+                if update[1] is None:
+                    self._epoch += 1
+                else:
+                    self._generations[update[1]] += 1
+            if update in self._pending:
+                logger.debug("Coalesce update: %s", update)
+                return
+            self._pending[update] = None
+            self._cond.notify_all()
+
+    def start(self, handler: Callable[[List[Hashable]], None]):
+        """Starts dispatching, handler receives lists of pending updates in submit order."""
+        self._handler = handler
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="Preview")
+        self._thread = threading.Thread(target=self._loop, name="App update loop", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while len(self._pending) == 0:
+                    self._cond.wait()
+                updates = list(self._pending)
+                self._pending = {}
+            try:
+                self._handler(updates)
+            except Exception:
+                logger.error("Error processing updates", exc_info=True)
+
+    def create_job(
+        self, layer_id: str, cancel_on: Iterable[str], layers_ids: Iterable[str]
+    ) -> PreviewJob:
+        with self._cond:
+            return PreviewJob(self, layer_id, cancel_on, layers_ids)
+
+    def run_job(self, job: PreviewJob, func: Callable[[PreviewJob], None]):
+        """Runs func(job) in the pool as soon as no running job overlaps its layers."""
+        self._executor.submit(self._run_job, job, func)
+
+    def _run_job(self, job: PreviewJob, func: Callable[[PreviewJob], None]):
+        with self._cond:
+            while self._exclusive or any(
+                job.layers_ids & running.layers_ids for running in self._running
+            ):
+                self._cond.wait()
+            if job.is_cancelled():
+                logger.debug("Skip stale preview of layer: %s", job.layer_id)
+                return
+            self._running.append(job)
+        try:
+            func(job)
+        except PreviewCancelled:
+            logger.debug("Preview of layer %s has been cancelled", job.layer_id)
+        except Exception:
+            logger.error("Error updating preview of layer: %s", job.layer_id, exc_info=True)
+        finally:
+            with self._cond:
+                self._running.remove(job)
+                self._cond.notify_all()
+
+    def run_exclusive(self, func: Callable, *args, **kwargs):
+        """Waits for running jobs to finish and runs func while no job can start."""
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._exclusive = True
+            while len(self._running) > 0:
+                self._cond.wait()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
@@ -34,11 +34,32 @@ from src.exceptions import handle_exception
 import src.globals as g
 from src.compute.Net import Net
 from src.ui.widgets import LayerCard
+from src.ui.preview_scheduler import PreviewCancelled, PreviewJob
 
 from supervisely.app.content import StateJson
 
 
 nodes_flow_lock = threading.Lock()
+# guards ui layers state and the preview net while they are updated
+graph_lock = threading.RLock()
+
+# Net for previews and metas, it lives across UI updates and receives graph diffs,
+# so only added or reconfigured layers are recreated
+preview_net: Net = None
+
+
+def get_preview_net(all_layers_ids: List[str]) -> Net:
+    global preview_net
+    dtl_json = [g.layers[layer_id].to_json() for layer_id in all_layers_ids]
+    if preview_net is None:
+        preview_net = Net(dtl_json, g.RESULTS_DIR, g.MODALITY_TYPE)
+        preview_net.layers_keys = list(all_layers_ids)
+    else:
+        preview_net.update_graph(dtl_json, all_layers_ids)
+        preview_net.reset_existing_names()
+    preview_net.preview_mode = True
+    return preview_net
+
 
 # context menu "select" option dialog
 select_action_name = Select(
@@ -338,12 +359,13 @@ def item_dropped_cb(item):
 @nodes_flow.node_removed
 def node_removed(layer_id: str):
     if layer_id.startswith("filtered_project"):
-        g.FILTERED_ENTITIES = []
+        g.FILTERED_ENTITIES.clear()
         return
     if layer_id.startswith("deploy"):
         utils.kill_deployed_app_by_layer_id(layer_id)
 
     g.layers.pop(layer_id, None)
+    utils.delete_dir(f"{g.PREVIEW_DIR}/{layer_id}")
     if layer_id.startswith("images_project"):
         utils.clean_current_srcs()
     logger.debug("node_removed", extra={"layer_id": layer_id, "g.layers": list(g.layers.keys())})
@@ -361,9 +383,9 @@ def add_layer_from_dialog_btn_cb():
 
 @filter_actions_input.value_changed
 def filter(value):
-    g.cache["last_search"] = value
+    g.last_search = value
     time.sleep(0.4)
-    if g.cache["last_search"] != value:
+    if g.last_search != value:
         return
 
     if value == "":
@@ -391,31 +413,34 @@ def filter(value):
 
 
 @handle_exception
-def update_nodes(layer_id: str = None):
+def update_nodes(layer_id: str = None, job: PreviewJob = None, preview: tuple = None):
+    """Updates previews of all layers or of the layer and its children.
+    Updating all layers syncs the preview net with the graph itself, so it has to run with
+    `run_exclusive`. The layer preview is calculated on the net snapshot from `prepare_preview`
+    (preview argument), so previews of independent layers can be calculated concurrently."""
+    loading_layers_ids = None
     try:
         if layer_id is None:
             for layer in g.layers.values():
                 layer.set_preview_loading(True)
 
-            edges = nodes_flow.get_edges_json()
-            nodes_state = nodes_flow.get_nodes_state_json()
+            with graph_lock:
+                edges = nodes_flow.get_edges_json()
+                nodes_state = nodes_flow.get_nodes_state_json()
 
-            # Init layers data
-            layers_ids = ui_utils.init_layers(nodes_state)
-            data_layers_ids = layers_ids["data_layers_ids"]
-            all_layers_ids = layers_ids["all_layers_ids"]
+                # Init layers data
+                layers_ids = ui_utils.init_layers(nodes_state)
+                data_layers_ids = layers_ids["data_layers_ids"]
+                all_layers_ids = layers_ids["all_layers_ids"]
 
-            # Init sources
-            ui_utils.init_src(edges)
+                # Init sources
+                ui_utils.init_src(edges)
 
-            utils.delete_results_dir()
-            utils.create_results_dir()
-            dtl_json = [g.layers[layer_id].to_json() for layer_id in all_layers_ids]
-            net = Net(dtl_json, g.RESULTS_DIR, g.MODALITY_TYPE)
-            net.preview_mode = True
+                utils.create_results_dir()
+                net = get_preview_net(all_layers_ids)
+                ui_utils.prepare_preview_net(net)
 
             # Load preview for data layers
-            utils.delete_preview_dir()
             utils.create_preview_dir()
 
             # Update preview
@@ -425,7 +450,40 @@ def update_nodes(layer_id: str = None):
             layer = g.layers[layer_id]
             layer: Layer
             layer.set_preview_loading(True)
+            if job is not None:
+                loading_layers_ids = job.layers_ids
+
+            net, data_layers_ids, all_layers_ids = preview
+            # own layers list of the job, the prepared snapshot is shared by the jobs
+            net = net.snapshot()
+
+            check_cancelled = job.check_cancelled if job is not None else None
+            ui_utils.update_preview(net, data_layers_ids, all_layers_ids, layer_id, check_cancelled)
+
+    except PreviewCancelled:
+        logger.debug(f"Preview update of layer '{layer_id}' has been superseded")
+    except CustomException as e:
+        ui_utils.show_error("Error updating nodes", e)
+        raise e
+    except Exception as e:
+        show_dialog(
+            title="Error updating nodes", description=f"Unexpected Error: {str(e)}", status="error"
+        )
+        raise e
+    finally:
+        current_layers = g.layers.copy()
+        for current_layer_id, layer in current_layers.items():
+            if loading_layers_ids is None or current_layer_id in loading_layers_ids:
+                layer.set_preview_loading(False)
 
+
+@handle_exception
+def prepare_preview():
+    """Syncs the preview net with the graph for preview jobs, returns its snapshot with data
+    and all layers ids (None on error). The snapshot shares layers with the preview net and
+    this call changes them, so it has to run with `run_exclusive`, while no job uses them."""
+    try:
+        with graph_lock:
             edges = nodes_flow.get_edges_json()
             nodes_state = nodes_flow.get_nodes_state_json()
 
@@ -437,15 +495,12 @@ def update_nodes(layer_id: str = None):
             # Init sources
             ui_utils.init_src(edges)
 
-            utils.delete_results_dir()
             utils.create_results_dir()
-            dtl_json = [g.layers[layer_id].to_json() for layer_id in all_layers_ids]
-            net = Net(dtl_json, g.RESULTS_DIR, g.MODALITY_TYPE)
-            net.preview_mode = True
+            net = get_preview_net(all_layers_ids)
 
             ui_utils.init_nodes_state(net, data_layers_ids, all_layers_ids, nodes_state, edges)
-            ui_utils.update_preview(net, data_layers_ids, all_layers_ids, layer_id)
-
+            ui_utils.prepare_preview_net(net)
+            return net.snapshot(), data_layers_ids, all_layers_ids
     except CustomException as e:
         ui_utils.show_error("Error updating nodes", e)
         raise e
@@ -454,59 +509,79 @@ def update_nodes(layer_id: str = None):
             title="Error updating nodes", description=f"Unexpected Error: {str(e)}", status="error"
         )
         raise e
-    finally:
-        current_layers = g.layers.copy()
-        for layer in current_layers.values():
-            layer.set_preview_loading(False)
+
+
+def create_preview_jobs(layers_ids: List[str]) -> List[PreviewJob]:
+    """Creates preview jobs for the updated layers. A layer is skipped when one of its
+    ancestors is updated too, because the ancestor job updates previews of its children."""
+    all_layers_ids = list(g.layers.keys())
+    updated = set(layers_ids)
+    jobs = []
+    for layer_id in dict.fromkeys(layers_ids):
+        if layer_id not in g.layers:
+            continue
+        ancestors = ui_utils.get_layer_ancestors(layer_id)
+        if any(ancestor in updated for ancestor in ancestors):
+            continue
+        children = ui_utils.get_layer_children_list(layer_id, all_layers_ids)
+        job = g.update_scheduler.create_job(
+            layer_id, cancel_on=[layer_id, *ancestors], layers_ids=[*ancestors, *children]
+        )
+        jobs.append(job)
+    return jobs
+
+
+def run_preview_job(job: PreviewJob, preview: tuple):
+    update_nodes(job.layer_id, job, preview)
 
 
 @handle_exception
 def update_state():
-    try:
-        edges = nodes_flow.get_edges_json()
-        nodes_state = nodes_flow.get_nodes_state_json()
-
-        # Init layers data
-        layers_ids = ui_utils.init_layers(nodes_state)
-        all_layers_ids = layers_ids["all_layers_ids"]
-        data_layers_ids = layers_ids["data_layers_ids"]
-        labeling_jobs_layers_ids = [
-            layer_id
-            for layer_id in all_layers_ids
-            if g.layers[layer_id].action.name.startswith(
-                "create_labeling_job"
-            )  # use action.name instead of hardcoded string
-        ]
-
-        # Init sources
-        ui_utils.init_src(edges)
-
-        # Calculate output metas for all layers
-        utils.delete_results_dir()
-        utils.create_results_dir()
-        dtl_json = [g.layers[layer_id].to_json() for layer_id in all_layers_ids]
-        net = Net(dtl_json, g.RESULTS_DIR, g.MODALITY_TYPE)
-
-        for layer_id in labeling_jobs_layers_ids:
-            modifies_data = False
-            parents = ui_utils.get_layer_parents_chain(layer_id)
-            for parent in parents:
-                net_layer = net.layers[all_layers_ids.index(parent)]
-                modifies_data = modifies_data or net_layer.modifies_data()
-            layer = g.layers[layer_id]
-            layer.modifies_data(modifies_data)
+    with graph_lock:
+        try:
+            edges = nodes_flow.get_edges_json()
+            nodes_state = nodes_flow.get_nodes_state_json()
 
-        net.preview_mode = True
-        ui_utils.init_nodes_state(net, data_layers_ids, all_layers_ids, nodes_state, edges)
+            # Init layers data
+            layers_ids = ui_utils.init_layers(nodes_state)
+            all_layers_ids = layers_ids["all_layers_ids"]
+            data_layers_ids = layers_ids["data_layers_ids"]
+            labeling_jobs_layers_ids = [
+                layer_id
+                for layer_id in all_layers_ids
+                if g.layers[layer_id].action.name.startswith(
+                    "create_labeling_job"
+                )  # use action.name instead of hardcoded string
+            ]
 
-    except CustomException as e:
-        ui_utils.show_error("Error updating nodes", e)
-        raise e
-    except Exception as e:
-        show_dialog(
-            title="Error updating nodes", description=f"Unexpected Error: {str(e)}", status="error"
-        )
-        raise e
+            # Init sources
+            ui_utils.init_src(edges)
+
+            # Calculate output metas for all layers
+            utils.create_results_dir()
+            net = get_preview_net(all_layers_ids)
+
+            for layer_id in labeling_jobs_layers_ids:
+                modifies_data = False
+                parents = ui_utils.get_layer_parents_chain(layer_id)
+                for parent in parents:
+                    net_layer = net.layers[all_layers_ids.index(parent)]
+                    modifies_data = modifies_data or net_layer.modifies_data()
+                layer = g.layers[layer_id]
+                layer.modifies_data(modifies_data)
+
+            ui_utils.init_nodes_state(net, data_layers_ids, all_layers_ids, nodes_state, edges)
+
+        except CustomException as e:
+            ui_utils.show_error("Error updating nodes", e)
+            raise e
+        except Exception as e:
+            show_dialog(
+                title="Error updating nodes",
+                description=f"Unexpected Error: {str(e)}",
+                status="error",
+            )
+            raise e
 
 
 def update_nodes_cb():
@@ -46,6 +46,10 @@ header = Container(
                     widgets=[g.connect_node_checkbox],
                     style="margin-left: 10px; margin-top: 10px; align-self: center;",
                 ),
+                Container(
+                    widgets=[g.full_resolution_preview_checkbox],
+                    style="margin-left: 10px; margin-top: 10px; align-self: center;",
+                ),
             ],
             gap=7,
         )
@@ -86,3 +90,8 @@ def save_presets_dialog():
 def load_presets_dialog():
     load_dialog.show()
     update_load_dialog()
+
+
+@g.full_resolution_preview_checkbox.value_changed
+def full_resolution_preview_changed(value):
+    g.updater(("nodes", None))
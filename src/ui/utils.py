@@ -1,6 +1,7 @@
 import json
 import time
 from functools import wraps
+from typing import Callable
 from supervisely.app.widgets import Container, Flexbox, FileThumbnail, ProjectThumbnail, Text
 from supervisely import ProjectMeta
 from supervisely.app.content import StateJson, DataJson
@@ -14,14 +15,18 @@ from src.utils import (
     get_dataset_by_name,
     get_project_meta,
     download_preview,
+    get_all_datasets,
+    load_video_preview,
     update_project_info,
+    video_frame_to_image_ann,
 )
 from src.compute.Net import Net
-from src.compute.Layer import Layer as NetLayer
-from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor, VideoDescriptor
 from src.ui.dtl import actions_dict, actions_list, hidden_actions_dict
 from src.ui.dtl.Action import Action, SourceAction
 from src.ui.dtl.Layer import Layer
+from src.ui.preview_scheduler import PreviewCancelled
+from src.ui.preview_images import downscale_for_preview
 from src.ui.dtl import (
     SAVE_ACTIONS,
     PIXEL_LEVEL_TRANSFORMS,
@@ -117,7 +122,7 @@ def init_layers(nodes_state: dict):
     }
 
 
-def init_src(edges: list):
+def get_layers_connections(edges: list):
     layer_connections = {}
     for edge in edges:
         from_node_id = edge["output"]["node"]
@@ -127,7 +132,11 @@ def init_src(edges: list):
         layer_connections.setdefault(to_node_id, []).append(
             (from_node_id, from_node_interface, to_node_interface)
         )
+    return layer_connections
+
 
+def init_src(edges: list):
+    layer_connections = get_layers_connections(edges)
     for layer in g.layers.values():
         layer.update_sources(layer_connections.get(layer.id, []))
 
@@ -213,6 +222,7 @@ def init_nodes_state(
             return True
             # return all((x in metas_dict for x in the_layer.srcs))
 
+        layer_connections = get_layers_connections(edges)
         datas_dict = {}
         processed_layers = set()
         while len(cur_level_layers_idxs) != 0:
@@ -260,27 +270,17 @@ def init_nodes_state(
                 # update settings according to new meta
                 node_options = nodes_state.get(ui_layer_id, {})
                 ui_layer.parse_options(node_options)
-                init_src(edges)
-                ui_layer = g.layers[ui_layer_id]
-
-                # update net layer with new settings
-                layer_config = ui_layer.to_json()
-                action = layer_config["action"]
-                if action not in NetLayer.actions_mapping:
-                    raise ActionNotFoundError(action)
-                layer_cls = NetLayer.actions_mapping[action]
-                if layer_cls.type == "data":
-                    layer = layer_cls(layer_config, net=net)
-                elif layer_cls.type == "processing":
-                    layer = layer_cls(layer_config, net=net)
-                elif layer_cls.type == "save":
-                    layer = layer_cls(layer_config, g.RESULTS_DIR, net=net)
-                    net.save_layer = layer
-                net.layers[cur_layer_idx] = layer
+                # sources of the layer depend only on already processed parents
+                ui_layer.update_sources(layer_connections.get(ui_layer_id, []))
+
+                # update net layer with new settings, unchanged layers are kept as is
+                net.update_layer(cur_layer_idx, ui_layer.to_json())
 
                 # calculate output meta of current net layer
                 cur_layer = net.layers[cur_layer_idx]
-                cur_layer_res_meta = cur_layer.make_output_meta(cur_layer_input_metas)
+                cur_layer_res_meta = net.make_layer_output_meta(
+                    cur_layer_idx, cur_layer_input_metas
+                )
 
                 # update output meta of current ui layer
                 ui_layer.output_meta = cur_layer_res_meta
@@ -297,6 +297,7 @@ def init_nodes_state(
 
             cur_level_layers_idxs = next_level_layers_idxs
 
+        init_src(edges)
         return processed_layers
 
     processed_layers = calc_metas(net)
@@ -337,6 +338,25 @@ def get_layer_parents_chain(layer_id: str, chain: list = None):
     return chain
 
 
+def get_layer_ancestors(layer_id: str):
+    ancestors = []
+    queue = [layer_id]
+    while len(queue) > 0:
+        layer = g.layers.get(queue.pop(), None)
+        if layer is None:
+            continue
+        layer_sources = layer.get_src()
+        if isinstance(layer_sources, dict):
+            layer_sources = [src for srcs in layer_sources.values() for src in srcs]
+        for src in layer_sources:
+            src_layer_id = find_layer_id_by_dst(src)
+            if src_layer_id is None or src_layer_id == layer_id or src_layer_id in ancestors:
+                continue
+            ancestors.append(src_layer_id)
+            queue.append(src_layer_id)
+    return ancestors
+
+
 def get_layer_children_list(
     layer_id: str,
     all_layers_ids: list,
@@ -353,6 +373,14 @@ def get_layer_children_list(
     return layers
 
 
+def get_preview_source(img, ann):
+    """Returns the image and annotation the graph preview is calculated on:
+    a downscaled proxy, or the originals when full resolution preview is enabled."""
+    if g.full_resolution_preview_checkbox.is_checked():
+        return img, ann
+    return downscale_for_preview(img, ann)
+
+
 def load_preview_for_data_layer(layer: Layer):
     src = layer.get_src()
     if src is None or len(src) == 0:
@@ -415,6 +443,7 @@ def load_preview_for_data_layer(layer: Layer):
     preview_img = sly.image.read(preview_img_path)
     with open(preview_ann_path, "r") as f:
         preview_ann = sly.Annotation.from_json(json.load(f), project_meta)
+    preview_img, preview_ann = get_preview_source(preview_img, preview_ann)
     preview_path = f"{g.PREVIEW_DIR}/{layer.id}"
     img_desc = ImageDescriptor(
         LegacyProjectItem(
@@ -431,15 +460,134 @@ def load_preview_for_data_layer(layer: Layer):
         False,
     )
     img_desc = img_desc.clone_with_item(preview_img)
-    img_desc.write_image_local(f"{preview_path}/preview_image.jpg")
     layer.set_src_img_desc(img_desc)
     layer.set_src_ann(preview_ann)
     return img_desc, preview_ann
 
 
-def update_preview(net: Net, data_layers_ids: list, all_layers_ids: list, layer_id: str):
-    # disable preview if "videos"
+def load_video_preview_for_data_layer(layer: Layer):
+    """Returns (video_desc, ann, frame_desc, frame_index) for the video preview, where
+    ann is the video annotation sliced to the preview frame and frame_desc holds the frame.
+    Frames and annotations are cached, so repeated calls do not download anything."""
+    src = layer.get_src()
+    if src is None or len(src) == 0:
+        return None
+
+    # nested datasets sources are "project/parent/.../dataset"
+    src_parts = src[0].split("/")
+    project_name, dataset_name = src_parts[0], src_parts[-1]
+    try:
+        project_info = get_project_by_name(project_name)
+        project_meta = get_project_meta(project_info.id)
+        if dataset_name == "*":
+            dataset_info = get_all_datasets(project_info.id)[0]
+        else:
+            dataset_info = get_dataset_by_name(dataset_name, project_info.id)
+        video_info, frame_index, frame, ann = load_video_preview(dataset_info.id, project_meta)
+    except Exception as e:
+        raise CustomException(
+            f"Error downloading video frame and annotation for preview. Please check if the selected project or dataset is not empty.",
+            error=e,
+            extra={"project_name": project_name, "dataset_name": dataset_name},
+        )
+
+    video_desc = VideoDescriptor(
+        LegacyProjectItem(
+            project_name=project_name,
+            ds_name=dataset_info.name,
+            ds_info=dataset_info,
+            item_name=video_info.name,
+            item_info=video_info,
+            ia_data={"item_ext": ""},
+            item_path=None,
+            ann_path=None,
+        ),
+        0,
+        False,
+    )
+    frame, _ = get_preview_source(frame, None)
+    frame_desc = ImageDescriptor(
+        LegacyProjectItem(
+            project_name=project_name,
+            ds_name=dataset_info.name,
+            ds_info=None,
+            item_name="preview_image",
+            item_info=video_info,
+            ia_data={"item_ext": ".jpg"},
+            item_path=None,
+            ann_path=None,
+        ),
+        0,
+        False,
+    )
+    frame_desc = frame_desc.clone_with_item(frame)
+    return video_desc, ann, frame_desc, frame_index
+
+
+def _update_video_previews(
+    net: Net,
+    all_layers_ids: list,
+    data_layer_id: str,
+    layers_ids: list = None,
+    preview_layers_ids: list = None,
+    check_cancelled: Callable = None,
+):
+    """Runs the graph from the data layer through `layers_ids` (all layers if None) on the
+    sliced video annotation and shows the result of every layer from `preview_layers_ids`
+    (all processed layers if None) on the cached frame."""
+    preview = load_video_preview_for_data_layer(g.layers[data_layer_id])
+    if preview is None:
+        return
+    video_desc, ann, frame_desc, frame_index = preview
+    frame_size = frame_desc.read_image().shape[:2]
+
+    layer_idx = all_layers_ids.index(data_layer_id)
+    layers_idx_whitelist = None
+    if layers_ids is not None:
+        layers_idx_whitelist = [layer_idx]
+        layers_idx_whitelist.extend([all_layers_ids.index(id) for id in layers_ids])
+    processing_generator = net.start_iterate(
+        [(video_desc, ann)], layer_idx=layer_idx, layers_idx_whitelist=layers_idx_whitelist
+    )
+    updated = set()
+    for element in processing_generator:
+        if check_cancelled is not None:
+            check_cancelled()
+        if len(element) == 0:
+            continue
+        data_el, layer_indx = element
+        layer_id = all_layers_ids[layer_indx]
+        if layer_indx in updated:
+            continue
+        if preview_layers_ids is not None and layer_id not in preview_layers_ids:
+            continue
+        layer_ann = video_frame_to_image_ann(data_el[0][1], frame_index)
+        if tuple(layer_ann.img_size) != tuple(frame_size):
+            layer_ann = layer_ann.resize(frame_size)
+        layer = g.layers[layer_id]
+        layer.update_preview(frame_desc, layer_ann)
+        layer.set_preview_loading(False)
+        updated.add(layer_indx)
+
+
+def prepare_preview_net(net: Net):
+    net.preview_mode = True
+    net.calc_metas()
+    net.preprocess()
+
+
+def update_preview(
+    net: Net,
+    data_layers_ids: list,
+    all_layers_ids: list,
+    layer_id: str,
+    check_cancelled: Callable = None,
+):
+    """Updates preview of the layer and its children. Expects the net to be prepared
+    with `prepare_preview_net`. `check_cancelled` is called between the layers and may
+    raise to stop the update."""
     if net.modality == "videos":
+        update_video_preview(net, all_layers_ids, layer_id, check_cancelled)
         return
 
     layer = g.layers[layer_id]
@@ -452,10 +600,6 @@ def update_preview(net: Net, data_layers_ids: list, all_layers_ids: list, layer_
         # g.layers.pop(layer_id)
         return
 
-    net.preview_mode = True
-    net.calc_metas()
-    net.preprocess()
-
     layer = g.layers[layer_id]
 
     layer.clear_preview()
@@ -465,6 +609,8 @@ def update_preview(net: Net, data_layers_ids: list, all_layers_ids: list, layer_
             g.layers[l_id].clear_preview()
 
     layers_id_chain = None  # parents chain
+    if check_cancelled is not None:
+        check_cancelled()
     try:
         if issubclass(layer.action, SourceAction):
             img_desc, preview_ann = load_preview_for_data_layer(layer)
@@ -523,6 +669,8 @@ def update_preview(net: Net, data_layers_ids: list, all_layers_ids: list, layer_
     prev_ann = None
     try:
         for element in processing_generator:
+            if check_cancelled is not None:
+                check_cancelled()
             if len(element) == 0:
                 continue
             data_el, layer_indx = element
@@ -545,25 +693,52 @@ def update_preview(net: Net, data_layers_ids: list, all_layers_ids: list, layer_
             layer.set_preview_loading(False)
             is_starting_layer = False
             updated.add(layer_indx)
+    except PreviewCancelled:
+        raise
     except Exception as e:
         sly.logger.error(f"Error updating preview", exc_info=str(e))
-    net.preview_mode = False
-    # ^?remove?^
 
 
-def update_all_previews(net: Net, data_layers_ids: list, all_layers_ids: list):
-    # disable preview if "videos"
-    if net.modality == "videos":
+def update_video_preview(
+    net: Net, all_layers_ids: list, layer_id: str, check_cancelled: Callable = None
+):
+    """Video counterpart of `update_preview`: the graph is run again from the data layers
+    the layer depends on, the frame and annotation are taken from the cache."""
+    if layer_id not in all_layers_ids:
         return
+    children = get_layer_children_list(layer_id, all_layers_ids)
+    for l_id in children:
+        g.layers[l_id].clear_preview()
+    ancestors = get_layer_ancestors(layer_id)
+    data_layers_ids = [
+        id
+        for id in [layer_id, *ancestors]
+        if id in all_layers_ids and issubclass(g.layers[id].action, SourceAction)
+    ]
+    layers_ids = [id for id in [*ancestors, *children] if id in all_layers_ids]
+    try:
+        for data_layer_id in data_layers_ids:
+            if check_cancelled is not None:
+                check_cancelled()
+            _update_video_previews(
+                net, all_layers_ids, data_layer_id, layers_ids, children, check_cancelled
+            )
+    except PreviewCancelled:
+        raise
+    except Exception as e:
+        sly.logger.error(f"Error updating preview", exc_info=str(e))
+
 
+def update_all_previews(net: Net, data_layers_ids: list, all_layers_ids: list):
+    """Updates previews of all layers. Expects the net to be prepared with `prepare_preview_net`."""
     for layer in g.layers.values():
         layer.clear_preview()
+    if net.modality == "videos":
+        for data_layer_id in data_layers_ids:
+            _update_video_previews(net, all_layers_ids, data_layer_id)
+        return
     updated = set()
 
-    net.preview_mode = True
-    net.calc_metas()
-    net.preprocess()
-
     for data_layer_id in data_layers_ids:
         data_layer = g.layers[data_layer_id]
         src = data_layer.get_src()
@@ -601,6 +776,7 @@ def update_all_previews(net: Net, data_layers_ids: list, all_layers_ids: list):
         preview_img = sly.image.read(preview_img_path)
         with open(preview_ann_path, "r") as f:
             preview_ann = sly.Annotation.from_json(json.load(f), project_meta)
+        preview_img, preview_ann = get_preview_source(preview_img, preview_ann)
         preview_path = f"{g.PREVIEW_DIR}/{data_layer.id}"
         img_desc = ImageDescriptor(
             LegacyProjectItem(
@@ -617,7 +793,6 @@ def update_all_previews(net: Net, data_layers_ids: list, all_layers_ids: list):
             False,
         )
         img_desc = img_desc.clone_with_item(preview_img)
-        img_desc.write_image_local(f"{preview_path}/preview_image.jpg")
 
         data_el = [(img_desc, preview_ann)]
 
@@ -636,8 +811,6 @@ def update_all_previews(net: Net, data_layers_ids: list, all_layers_ids: list):
             layer.update_preview(img_desc, ann)
             layer.set_preview_loading(False)
             updated.add(layer_indx)
-    net.preview_mode = False
-    # ^?remove?^
 
 
 def create_results_widget(file_infos, supervisely_layers, labeling_job_layers):
@@ -1,6 +1,8 @@
 import json
 import os
 import random
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable, List, Optional, Tuple, Union
 
@@ -59,29 +61,104 @@ def download_preview_image(
     return image, ann_json
 
 
+# Decoded video frames are cached for previews, so editing the graph never downloads
+# the same frame again. Keys are (video_id, frame_index).
+PREVIEW_FRAMES_CACHE_SIZE = int(os.getenv("PREVIEW_FRAMES_CACHE_SIZE", "16"))
+PREVIEW_VIDEO_ANNS_CACHE_SIZE = 8
+
+_preview_cache_lock = threading.Lock()
+_preview_frames = OrderedDict()  # {(video_id, frame_index): np.ndarray}
+_preview_video_anns = OrderedDict()  # {video_id: ann_json}
+_preview_video_frames = {}  # {dataset_id: (VideoInfo, frame_index)}
+
+
+def _get_cached(cache: OrderedDict, key, load: Callable, max_size: int):
+    with _preview_cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    value = load()
+    with _preview_cache_lock:
+        cache[key] = value
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+    return value
+
+
+def get_preview_frame(video_id: int, frame_index: int) -> np.ndarray:
+    """Returns decoded RGB frame, frames are downloaded once and kept in a bounded LRU cache."""
+    return _get_cached(
+        _preview_frames,
+        (video_id, frame_index),
+        lambda: g.api.video.frame.download_np(video_id, frame_index),
+        PREVIEW_FRAMES_CACHE_SIZE,
+    )
+
+
+def get_preview_video_ann_json(video_id: int) -> dict:
+    return _get_cached(
+        _preview_video_anns,
+        video_id,
+        lambda: g.api.video.annotation.download(video_id),
+        PREVIEW_VIDEO_ANNS_CACHE_SIZE,
+    )
+
+
+def get_preview_video_frame(dataset_id: int):
+    """Returns (video_info, frame_index) used for the preview of the dataset.
+    The frame is chosen randomly once per dataset, so the cached frame is reused."""
+    with _preview_cache_lock:
+        choice = _preview_video_frames.get(dataset_id)
+    if choice is None:
+        choice = get_random_video_frame(dataset_id)
+        with _preview_cache_lock:
+            _preview_video_frames[dataset_id] = choice
+    return choice
+
+
+def slice_video_ann(ann: sly.VideoAnnotation, frame_indexes: List[int]) -> sly.VideoAnnotation:
+    """Keeps only the given frames in the annotation. Missing frames are added empty,
+    so the layers which work per frame (e.g. background) still see them."""
+    frames = []
+    for idx in frame_indexes:
+        frame = ann.frames.get(idx)
+        frames.append(frame if frame is not None else sly.Frame(idx))
+    return ann.clone(frames=sly.FrameCollection(frames))
+
+
+def video_frame_to_image_ann(ann: sly.VideoAnnotation, frame_index: int) -> sly.Annotation:
+    labels = []
+    frame = ann.frames.get(frame_index)
+    if frame is not None:
+        for figure in frame.figures:
+            labels.append(sly.Label(figure.geometry, figure.parent_object.obj_class))
+    return sly.Annotation(ann.img_size, labels)
+
+
 def download_preview_video(
     dataset_id: int, preview_img_path: str, project_meta: ProjectMeta
 ) -> tuple:
-    video, frame_id = get_random_video_frame(dataset_id)
-    g.api.video.frame.download_path(video.id, frame_id, preview_img_path)
-    ann_json = g.api.video.annotation.download(video.id)
+    video, frame_id = get_preview_video_frame(dataset_id)
+    sly.image.write(preview_img_path, get_preview_frame(video.id, frame_id))
+    ann_json = get_preview_video_ann_json(video.id)
     ann = sly.VideoAnnotation.from_json(ann_json, project_meta, KeyIdMap())
-    labels = []
-    frame_annotation = ann.frames.get(frame_id)
-    if frame_annotation is not None:
-        for figure in frame_annotation.figures:
-            cur_label = sly.Label(
-                figure.geometry,
-                figure.parent_object.obj_class,
-            )
-            labels.append(cur_label)
-
     img_size = (video.frame_height, video.frame_width)
-    ann = sly.Annotation(img_size, labels)
+    ann = video_frame_to_image_ann(ann.clone(img_size=img_size), frame_id)
     ann_json = ann.to_json()
     return video, ann_json
 
 
+def load_video_preview(dataset_id: int, project_meta: ProjectMeta):
+    """Returns (video_info, frame_index, frame, ann) for the video preview of the dataset,
+    ann is the video annotation sliced to the preview frame."""
+    video, frame_id = get_preview_video_frame(dataset_id)
+    frame = get_preview_frame(video.id, frame_id)
+    ann_json = get_preview_video_ann_json(video.id)
+    ann = sly.VideoAnnotation.from_json(ann_json, project_meta, KeyIdMap())
+    ann = slice_video_ann(ann, [frame_id])
+    return video, frame_id, frame, ann
+
+
 def download_preview(
     project_name: str,
     dataset_name: str,
@@ -125,31 +202,49 @@ def download_preview(
     return item_info, preview_img_path, preview_ann_path
 
 
+def _get_by_alias(alias_namespace: str, info_namespace: str, alias, load: Callable):
+    """Returns info cached by id, alias (e.g. name) -> id is cached separately.
+    `load` receives nothing and returns the info."""
+
+    def _load_id():
+        info = load()
+        g.cache[info_namespace].set(info.id, info)
+        return info.id
+
+    item_id = g.cache[alias_namespace].get_or_load(alias, _load_id)
+    info = g.cache[info_namespace].get(item_id)
+    if info is None:
+        # info has expired or was invalidated before the alias
+        info = load()
+        g.cache[info_namespace].set(info.id, info)
+        g.cache[alias_namespace].set(alias, info.id)
+    return info
+
+
 def _get_project_by_name_or_id(name: str = None, id: int = None):
     if id is None:
         if name is None:
             raise ValueError("name or id must be specified")
-        if name not in g.cache["project_id"]:
+
+        def _load():
             try:
-                project_info = g.api.project.get_info_by_name(
-                    g.WORKSPACE_ID, name, raise_error=True
-                )
+                return g.api.project.get_info_by_name(g.WORKSPACE_ID, name, raise_error=True)
             except:
                 raise RuntimeError(f"Project {name} not found")
-            g.cache["project_info"][project_info.id] = project_info
-            g.cache["project_id"][name] = project_info.id
-        project_id = g.cache["project_id"][name]
-        return g.cache["project_info"][project_id]
-    if id not in g.cache["project_info"]:
+
+        return _get_by_alias("project_id", "project_info", name, _load)
+
+    def _load():
         try:
             project_info = g.api.project.get_info_by_id(
                 id, expected_type=sly.ProjectType.IMAGES, raise_error=True
             )
         except:
             raise RuntimeError(f"Project {id} not found")
-        g.cache["project_info"][id] = project_info
-        g.cache["project_id"][project_info.name] = project_info.id
-    return g.cache["project_info"][id]
+        g.cache["project_id"].set(project_info.name, project_info.id)
+        return project_info
+
+    return g.cache["project_info"].get_or_load(id, _load)
 
 
 def get_project_by_name(name: str) -> sly.ProjectInfo:
@@ -161,13 +256,15 @@ def get_project_by_id(id: int) -> sly.ProjectInfo:
 
 
 def get_dataset_by_id(id: int = None) -> sly.DatasetInfo:
-    try:
-        dataset_info = g.api.dataset.get_info_by_id(id, raise_error=True)
-    except:
-        raise RuntimeError(f"Dataset {id} not found")
-    g.cache["dataset_info"][id] = dataset_info
-    g.cache["dataset_id"][(dataset_info.project_id, dataset_info.name)] = dataset_info.id
-    return g.cache["dataset_info"][id]
+    def _load():
+        try:
+            dataset_info = g.api.dataset.get_info_by_id(id, raise_error=True)
+        except:
+            raise RuntimeError(f"Dataset {id} not found")
+        g.cache["dataset_id"].set((dataset_info.project_id, dataset_info.name), dataset_info.id)
+        return dataset_info
+
+    return g.cache["dataset_info"].get_or_load(id, _load)
 
 
 def get_dataset_by_name(dataset_name: str, project_id: int) -> sly.DatasetInfo:
@@ -181,8 +278,7 @@ def get_dataset_by_name(dataset_name: str, project_id: int) -> sly.DatasetInfo:
                     return result
         return None
 
-    key = (project_id, dataset_name)
-    if key not in g.cache["dataset_id"]:
+    def _load():
         try:
             dataset_tree = g.api.dataset.get_tree(project_id)
             dataset_info = _get_info_by_name_tree(dataset_tree, dataset_name)
@@ -190,21 +286,34 @@ def get_dataset_by_name(dataset_name: str, project_id: int) -> sly.DatasetInfo:
                 raise RuntimeError
         except:
             raise RuntimeError(f"Dataset {dataset_name} not found")
-        g.cache["dataset_info"][dataset_info.id] = dataset_info
-        g.cache["dataset_id"][key] = dataset_info.id
-    dataset_id = g.cache["dataset_id"][key]
-    return g.cache["dataset_info"][dataset_id]
+        return dataset_info
+
+    return _get_by_alias("dataset_id", "dataset_info", (project_id, dataset_name), _load)
 
 
 def get_project_meta(project_id: int):
-    if project_id not in g.cache["project_meta"]:
+    def _load():
         try:
             project_meta_json = g.api.project.get_meta(project_id)
         except:
             raise RuntimeError(f"Project {project_id} not found")
-        project_meta = sly.ProjectMeta.from_json(project_meta_json)
-        g.cache["project_meta"][project_id] = project_meta
-    return g.cache["project_meta"][project_id]
+        return sly.ProjectMeta.from_json(project_meta_json)
+
+    return g.cache["project_meta"].get_or_load(project_id, _load)
+
+
+def invalidate_project_cache(project_id: int):
+    """Must be called after the project is changed, e.g. after `api.project.update_meta`."""
+    g.cache["project_meta"].invalidate(project_id)
+    g.cache["project_info"].invalidate(project_id)
+    g.cache["all_datasets"].invalidate(project_id)
+
+
+def invalidate_datasets_cache():
+    """Must be called when a pipeline run starts: items counts of the cached dataset infos
+    (e.g. filled by the UI) may be stale, and the run splits and counts items by them."""
+    g.cache.invalidate("dataset_info")
+    g.cache.invalidate("all_datasets")
 
 
 def merge_input_metas(input_metas: List[sly.ProjectMeta]) -> sly.ProjectMeta:
@@ -230,17 +339,14 @@ def merge_input_metas(input_metas: List[sly.ProjectMeta]) -> sly.ProjectMeta:
 
 
 def get_all_datasets(project_id: int) -> List[sly.DatasetInfo]:
-    if project_id not in g.cache["all_datasets"]:
+    def _load():
         datasets = g.api.dataset.get_list(project_id, recursive=True)
-        g.cache["all_datasets"][project_id] = [dataset.id for dataset in datasets]
-        g.cache["dataset_info"].update(
-            {
-                dataset.id: dataset
-                for dataset in datasets
-                if dataset.id not in g.cache["dataset_info"]
-            }
-        )
-    dataset_infos = [get_dataset_by_id(ds_id) for ds_id in g.cache["all_datasets"][project_id]]
+        for dataset in datasets:
+            g.cache["dataset_info"].set(dataset.id, dataset)
+        return [dataset.id for dataset in datasets]
+
+    datasets_ids = g.cache["all_datasets"].get_or_load(project_id, _load)
+    dataset_infos = [get_dataset_by_id(ds_id) for ds_id in datasets_ids]
     return dataset_infos
 
 
@@ -317,18 +423,18 @@ def get_task():
 
 
 def get_workspace_by_id(workspace_id) -> sly.WorkspaceInfo:
-    if workspace_id not in g.cache["workspace_info"]:
+    def _load():
         try:
-            workspace_info = g.api.workspace.get_info_by_id(workspace_id)
+            return g.api.workspace.get_info_by_id(workspace_id)
         except:
             raise RuntimeError(f"Workspace {workspace_id} not found")
-        g.cache["workspace_info"][workspace_id] = workspace_info
-    return g.cache["workspace_info"][workspace_id]
+
+    return g.cache["workspace_info"].get_or_load(workspace_id, _load)
 
 
 def update_project_info(project_info: sly.ProjectInfo):
     updated = g.api.project.get_info_by_id(project_info.id)
-    g.cache["project_info"][project_info.id] = updated
+    g.cache["project_info"].set(project_info.id, updated)
     return updated
 
 
@@ -368,4 +474,8 @@ def clean_current_srcs():
 
 
 def on_app_shutdown():
+    g.cache.log_stats()
+    logger.debug("Predictions cache stats", extra={"stats": g.prediction_cache.stats()})
+    g.prediction_cache.close()
+    g.model_sessions.close()
     kill_serving_app()
@@ -0,0 +1,11 @@
+import os
+
+# src.globals creates the Api on import, tests never send requests
+for _name, _value in {
+    "SERVER_ADDRESS": "http://localhost",
+    "API_TOKEN": "test",
+    "TEAM_ID": "1",
+    "WORKSPACE_ID": "1",
+    "USER_ID": "1",
+}.items():
+    os.environ.setdefault(_name, _value)
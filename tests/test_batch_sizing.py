@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+import src.globals as g
+from src.compute.dtl_utils.batch_sizing import BatchSizer, get_item_memory, get_memory_factor
+from src.compute.Net import Net
+
+DATA_LAYER = {
+    "action": "images_project",
+    "src": ["proj/*"],
+    "dst": "$data",
+    "settings": {"classes_mapping": "default", "tags_mapping": "default"},
+}
+# data -> multiply x3 -> blur
+MULTIPLY_BRANCH = [
+    {"action": "multiply", "src": ["$data"], "dst": "$multiplied", "settings": {"multiply": 3}},
+    {
+        "action": "blur",
+        "src": ["$multiplied"],
+        "dst": "$blurred",
+        "settings": {"name": "median", "kernel": 3},
+    },
+]
+# data -> sliding window (4 windows per image) -> flip
+WINDOWS_BRANCH = [
+    {
+        "action": "sliding_window",
+        "src": ["$data"],
+        "dst": "$windows",
+        "settings": {"window": {"height": 100, "width": 100}, "min_overlap": {"x": 50, "y": 50}},
+    },
+    {"action": "flip", "src": ["$windows"], "dst": "$flipped", "settings": {"axis": "vertical"}},
+]
+
+
+def _image(height: int, width: int, name: str = "img") -> SimpleNamespace:
+    return SimpleNamespace(height=height, width=width, name=name)
+
+
+def test_item_memory():
+    assert get_item_memory(_image(10, 20), "images") == 600
+    assert get_item_memory(None, "images") == 0
+    video = SimpleNamespace(file_meta={"size": 1000}, frame_height=10, frame_width=10)
+    assert get_item_memory(video, "videos") == 1000
+
+
+def test_split_by_memory_budget():
+    # 300 bytes per item, 2 items fit into the budget
+    sizer = BatchSizer(budget=600, max_batch_size=10, modality="images")
+    items = [_image(10, 10) for _ in range(5)]
+    batches = list(sizer.split(items))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sizer.get_summary()["max_size"] == 2
+
+
+def test_split_by_max_batch_size_and_memory_factor():
+    items = [_image(10, 10) for _ in range(5)]
+    sizer = BatchSizer(budget=10**9, max_batch_size=3, modality="images")
+    assert [len(batch) for batch in sizer.split(items)] == [3, 2]
+
+    # outputs of the layers take 3 times the memory of the items
+    sizer = BatchSizer(budget=1800, max_batch_size=10, modality="images", memory_factor=3)
+    assert [len(batch) for batch in sizer.split(items)] == [2, 2, 1]
+
+
+def test_oversized_item_gets_own_batch():
+    sizer = BatchSizer(budget=600, max_batch_size=10, modality="images")
+    items = ["a", "big", "b"]
+    infos = [_image(10, 10), _image(100, 100), _image(10, 10)]
+    assert list(sizer.split(items, infos)) == [["a"], ["big"], ["b"]]
+    summary = sizer.get_summary()
+    assert summary["oversized_items"] == 1
+    assert summary["batches"] == 3
+
+
+def test_unknown_memory_is_limited_by_batch_size():
+    sizer = BatchSizer(budget=1, max_batch_size=2, modality="images")
+    assert [len(batch) for batch in sizer.split([None] * 3)] == [2, 1]
+
+
+@pytest.fixture
+def net_factory(monkeypatch):
+    # data layers look up the input project, there is no server in tests
+    monkeypatch.setattr(g, "api", SimpleNamespace())
+    return lambda graph: Net([DATA_LAYER] + graph, "", "images")
+
+
+def test_memory_factor_of_layers_path(net_factory):
+    net = net_factory(MULTIPLY_BRANCH)
+    # multiply passes the images, the blur makes 3 new images of every input item
+    assert get_memory_factor(net) == 1 + 3
+
+
+def test_memory_factor_is_max_of_branches(net_factory):
+    # windows and their flipped copies: 4 + 4 images of every input item
+    assert get_memory_factor(net_factory(WINDOWS_BRANCH)) == 1 + 8
+    assert get_memory_factor(net_factory(MULTIPLY_BRANCH + WINDOWS_BRANCH)) == 1 + 8
+    assert get_memory_factor(net_factory(WINDOWS_BRANCH + MULTIPLY_BRANCH)) == 1 + 8
@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from supervisely import Annotation, Label, ObjClass, Rectangle
+
+import src.globals as g
+from src.compute.dtl_utils.item_descriptor import ImageDescriptor
+from src.compute.Net import Net
+from src.utils import LegacyProjectItem
+
+BOX = ObjClass("box", Rectangle)
+RARE = ObjClass("rare", Rectangle)
+DATA_LAYER = {
+    "action": "images_project",
+    "src": ["proj/*"],
+    "dst": "$data",
+    "settings": {"classes_mapping": {"box": "box", "rare": "rare"}, "tags_mapping": "default"},
+}
+BLUR = {"action": "blur", "dst": "$blurred", "settings": {"name": "median", "kernel": 3}}
+
+
+class _ImageApi:
+    def __init__(self):
+        self.calls = []
+
+    def download_nps(self, dataset_id, ids):
+        self.calls.append((dataset_id, list(ids)))
+        return [np.full((10, 10, 3), image_id, dtype=np.uint8) for image_id in ids]
+
+
+@pytest.fixture
+def image_api(monkeypatch):
+    image_api = _ImageApi()
+    monkeypatch.setattr(g, "api", SimpleNamespace(image=image_api))
+    return image_api
+
+
+def _make_item(image_id, dataset_id, obj_class):
+    item_info = SimpleNamespace(id=image_id, dataset_id=dataset_id, name=f"{image_id}.png")
+    img_desc = ImageDescriptor(
+        LegacyProjectItem(
+            project_name="proj",
+            ds_name=f"ds{dataset_id}",
+            ds_info=None,
+            item_name=str(image_id),
+            item_info=item_info,
+            ia_data={"item_ext": ".png"},
+            item_path="",
+            ann_path="",
+        ),
+        image_id,
+        False,
+    )
+    return img_desc, Annotation((10, 10), [Label(Rectangle(1, 1, 5, 5), obj_class)])
+
+
+def _make_net(graph):
+    net = Net([DATA_LAYER] + graph, "", "images")
+    net.download_on_demand = net.may_require_items()
+    return net
+
+
+def _run(net, data_batch):
+    for _ in net.start(data_batch):
+        pass
+
+
+def test_items_dropped_by_filter_are_not_downloaded(image_api):
+    net = _make_net(
+        [
+            {
+                "action": "filter_image_without_objects",
+                "src": ["$data"],
+                "dst": ["null", "$rare"],
+                "settings": {"exclude_classes": ["rare"]},
+            },
+            dict(BLUR, src=["$rare"]),
+        ]
+    )
+    # items with the rare class pass the filter
+    data_batch = [
+        _make_item(image_id, dataset_id, RARE if image_id in (3, 12) else BOX)
+        for image_id, dataset_id in [(1, 1), (2, 1), (3, 1), (11, 2), (12, 2), (13, 2)]
+    ]
+
+    _run(net, data_batch)
+
+    # one request per dataset, only for the items which reached the blur
+    assert image_api.calls == [(1, [3]), (2, [12])]
+    assert net.downloaded_items_cnt == 2
+    assert [img_desc.item_data is not None for img_desc, _ in data_batch] == [
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_copies_of_item_get_own_images(image_api):
+    net = _make_net([dict(BLUR, src=["$data"])])
+    # e.g. the same image from two data layers
+    first, ann = _make_item(7, 1, BOX)
+    second, _ = _make_item(7, 1, BOX)
+
+    _run(net, [(first, ann), (second, ann)])
+
+    assert image_api.calls == [(1, [7])]
+    assert net.downloaded_items_cnt == 1
+    assert first.item_data is not second.item_data
+    assert np.array_equal(first.item_data, second.item_data)
+
+
+def test_save_layers_without_images_do_not_download(image_api):
+    net = _make_net(
+        [
+            {
+                "action": "copy_annotations",
+                "src": ["$data"],
+                "dst": ["1"],
+                "settings": {"project_id": 1, "dataset_ids": [1]},
+            },
+            dict(BLUR, src=["$data"]),
+        ]
+    )
+    copy_layer = net.layers[1]
+    copied_items_data = []
+
+    def process_timed(data_batch):
+        copied_items_data.extend(img_desc.item_data for img_desc, _ in data_batch)
+        yield [(img_desc,) for img_desc, _ in data_batch]
+
+    copy_layer.process_timed = process_timed
+    data_batch = [_make_item(1, 1, BOX)]
+
+    _run(net, data_batch)
+
+    assert not copy_layer.saves_items()
+    # the blur downloads the image after the annotations are copied
+    assert copied_items_data == [None]
+    assert image_api.calls == [(1, [1])]
@@ -0,0 +1,66 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.entity_selection import EntitySelection
+from src.exceptions import CustomException
+
+
+class _FakeApi:
+    """Datasets 1 and 2, pages of images of dataset 2 are served after `release` is set."""
+
+    def __init__(self, fail_dataset: int = None):
+        self.fail_dataset = fail_dataset
+        self.release = threading.Event()
+        self.dataset = SimpleNamespace(
+            get_list=lambda project_id: [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+        )
+        self.image = SimpleNamespace(get_list_all_pages_generator=self._pages)
+
+    def _pages(self, method, data):
+        dataset_id = data["datasetId"]
+        if dataset_id == self.fail_dataset:
+            raise RuntimeError("filters request failed")
+        if dataset_id == 2:
+            self.release.wait(5)
+        yield [SimpleNamespace(id=dataset_id * 10 + idx) for idx in range(3)]
+
+
+def test_filters_resolved():
+    api = _FakeApi()
+    api.release.set()
+    selection = EntitySelection()
+    selection.resolve_filters(api, 1, [])
+    assert sorted(selection.to_list()) == [10, 11, 12, 20, 21, 22]
+    assert 21 in selection
+    assert 30 not in selection
+
+
+def test_resolution_error_is_raised():
+    api = _FakeApi(fail_dataset=2)
+    selection = EntitySelection()
+    selection.resolve_filters(api, 1, [])
+    assert selection.wait(5)
+    assert selection.has_selection
+    with pytest.raises(CustomException):
+        len(selection)
+    with pytest.raises(CustomException):
+        10 in selection
+
+
+def test_clear_does_not_wait_for_resolution():
+    api = _FakeApi()
+    selection = EntitySelection()
+    selection.resolve_filters(api, 1, [])
+    selection.clear()
+    assert not selection.has_selection
+    assert selection.is_ready()
+    assert len(selection) == 0
+
+    # pages of the cleared resolution are dropped
+    api.release.set()
+    for thread in threading.enumerate():
+        if thread.name == "Entities filter":
+            thread.join(5)
+    assert len(selection) == 0
@@ -0,0 +1,137 @@
+import os
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from supervisely import Annotation, Bitmap, Label, ObjClass, Polygon, Polyline, Rectangle
+from supervisely.geometry.point_location import PointLocation
+
+from src.compute.dtl_utils.export_writer import (
+    ExportWriter,
+    colorize_classes,
+    rasterize_classes,
+    write_image,
+)
+from src.compute.layers.save.ExportArchiveWithMasksLayer import ExportArchiveWithMasksLayer
+
+CAR = ObjClass("car", Rectangle)
+ROAD = ObjClass("road", Polygon)
+LANE = ObjClass("lane", Polyline)
+SKY = ObjClass("sky", Bitmap)
+
+
+def _make_annotation():
+    mask = np.zeros((20, 30), dtype=bool)
+    mask[2:8, 5:25] = True
+    labels = [
+        Label(Bitmap(mask), SKY),
+        Label(
+            Polygon(
+                [PointLocation(row, col) for row, col in [(10, 0), (39, 0), (39, 59), (15, 59)]]
+            ),
+            ROAD,
+        ),
+        Label(Polyline([PointLocation(39, 30), PointLocation(12, 30)]), LANE),
+        # overlaps the road, drawn on top of it
+        Label(Rectangle(20, 10, 35, 25), CAR),
+        Label(Rectangle(5, 40, 30, 55), CAR),
+    ]
+    return Annotation((40, 60), labels)
+
+
+@pytest.mark.parametrize(
+    "color_mapping",
+    [
+        {"car": [255, 0, 0], "road": [0, 255, 0], "lane": [0, 0, 255], "sky": [10, 20, 30]},
+        # machine masks, lane is not exported
+        {"car": [1, 1, 1], "road": [2, 2, 2], "sky": [3, 3, 3]},
+        # classes of the same color
+        {"car": [7, 7, 7], "road": [7, 7, 7]},
+    ],
+)
+def test_colorized_classes_equal_colored_mask(color_mapping):
+    ann = _make_annotation()
+    class_names = tuple(sorted(color_mapping))
+
+    mask = colorize_classes(rasterize_classes(ann, class_names), class_names, color_mapping)
+
+    expected = ExportArchiveWithMasksLayer.draw_colored_mask(ann, color_mapping)
+    assert mask.dtype == expected.dtype
+    assert np.array_equal(mask, expected)
+
+
+def test_rasterize_classes_of_many_classes():
+    class_names = [f"class_{idx}" for idx in range(300)]
+    ann = Annotation((10, 10), [Label(Rectangle(0, 0, 4, 4), ObjClass("class_299", Rectangle))])
+
+    index_map = rasterize_classes(ann, class_names)
+
+    assert index_map.dtype == np.uint16
+    assert index_map[2, 2] == 300 and index_map[8, 8] == 0
+
+
+@pytest.mark.parametrize("channels", [None, 1, 3, 4])
+def test_write_png(tmp_path, channels):
+    shape = (16, 24) if channels is None else (16, 24, channels)
+    img = np.random.RandomState(0).randint(0, 255, shape, dtype=np.uint8)
+    path = str(tmp_path / "nested" / "img.png")
+
+    write_image(path, img)
+
+    # images are saved as RGB, alpha is dropped
+    expected = img if img.ndim == 2 else img[:, :, :3]
+    if expected.ndim == 2 or expected.shape[2] == 1:
+        expected = np.repeat(expected.reshape(16, 24, 1), 3, axis=2)
+    written = cv2.cvtColor(cv2.imread(path), cv2.COLOR_BGR2RGB)
+    assert np.array_equal(written, expected)
+
+
+def test_png_compression_level(tmp_path):
+    img = np.zeros((200, 200, 3), dtype=np.uint8)
+    img[50:150, 50:150] = [255, 0, 0]
+    fast, small = str(tmp_path / "fast.png"), str(tmp_path / "small.png")
+
+    write_image(fast, img, png_compression=0)
+    write_image(small, img, png_compression=9)
+
+    assert os.path.getsize(small) < os.path.getsize(fast)
+    assert np.array_equal(cv2.imread(fast), cv2.imread(small))
+
+
+def test_write_jpg(tmp_path):
+    path = str(tmp_path / "img.jpg")
+
+    write_image(path, np.full((8, 8, 3), 128, dtype=np.uint8))
+
+    assert cv2.imread(path).shape == (8, 8, 3)
+
+
+def test_writer_runs_jobs_in_parallel():
+    writer = ExportWriter(workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+    results = []
+
+    def job(value):
+        barrier.wait()  # both jobs run at the same time
+        results.append(value)
+
+    writer.submit(job, 1)
+    writer.submit(job, 2)
+    writer.wait()
+    writer.shutdown()
+
+    assert sorted(results) == [1, 2]
+
+
+def test_writer_reraises_errors():
+    writer = ExportWriter(workers=2)
+
+    def fail():
+        raise ValueError("write failed")
+
+    writer.submit(fail)
+    with pytest.raises(ValueError):
+        writer.wait()
+    # the failed job is not raised again
+    writer.shutdown()
@@ -0,0 +1,44 @@
+import numpy as np
+from supervisely import Bitmap, Polygon, Polyline, Rectangle
+from supervisely.geometry.point_location import PointLocation
+
+from src.compute.dtl_utils import geometry_to_bitmap
+
+IMG_SIZE = (20, 30)
+
+
+def _full_mask(bitmap: Bitmap) -> np.ndarray:
+    mask = np.zeros(IMG_SIZE, bool)
+    bitmap.draw(mask, color=True)
+    return mask
+
+
+def test_inner_geometry_matches_full_image_drawing():
+    polygon = Polygon([PointLocation(2, 3), PointLocation(2, 12), PointLocation(10, 12)])
+    bitmap = geometry_to_bitmap(polygon, IMG_SIZE)
+
+    expected = np.zeros(IMG_SIZE, np.uint8)
+    polygon.draw(expected, color=1, thickness=1)
+    assert np.array_equal(_full_mask(bitmap), expected.astype(bool))
+    assert bitmap.origin.row >= 1 and bitmap.origin.col >= 2
+
+
+def test_geometry_is_clipped_to_image():
+    bitmap = geometry_to_bitmap(Rectangle(-5, -5, 4, 40), IMG_SIZE)
+    bbox = bitmap.to_bbox()
+    assert (bbox.top, bbox.left, bbox.bottom, bbox.right) == (0, 0, 4, 29)
+    assert _full_mask(bitmap)[:5].all()
+
+
+def test_geometry_outside_image():
+    assert geometry_to_bitmap(Rectangle(30, 40, 35, 45), IMG_SIZE) is None
+    line = Polyline([PointLocation(-10, -10), PointLocation(-10, 50)])
+    assert geometry_to_bitmap(line, IMG_SIZE) is None
+
+
+def test_bitmap_is_cropped():
+    data = np.ones((10, 10), bool)
+    bitmap = geometry_to_bitmap(Bitmap(data, origin=PointLocation(15, 25)), IMG_SIZE)
+    bbox = bitmap.to_bbox()
+    assert (bbox.top, bbox.left, bbox.bottom, bbox.right) == (15, 25, 19, 29)
+    assert geometry_to_bitmap(Bitmap(data, origin=PointLocation(40, 40)), IMG_SIZE) is None
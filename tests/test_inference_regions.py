@@ -0,0 +1,55 @@
+from supervisely import Label, ObjClass, Rectangle, Tag, TagMeta, TagValueType
+
+from src.compute.layers.processing.ApplyNNInferenceLayer import get_sliding_windows, nms_labels
+
+CAR = ObjClass("car", Rectangle)
+PERSON = ObjClass("person", Rectangle)
+CONFIDENCE = TagMeta("confidence", TagValueType.ANY_NUMBER)
+
+
+def _label(obj_class: ObjClass, top: int, left: int, bottom: int, right: int, confidence=None):
+    tags = [] if confidence is None else [Tag(CONFIDENCE, confidence)]
+    return Label(Rectangle(top, left, bottom, right), obj_class, tags=tags)
+
+
+def test_nms_keeps_most_confident_of_overlapping_boxes():
+    weak = _label(CAR, 0, 0, 9, 9, 0.5)
+    strong = _label(CAR, 1, 1, 10, 10, 0.9)
+    apart = _label(CAR, 50, 50, 59, 59, 0.1)
+    assert nms_labels([weak, strong, apart], 0.5) == [strong, apart]
+
+
+def test_nms_is_class_wise_and_respects_threshold():
+    car = _label(CAR, 0, 0, 9, 9, 0.9)
+    person = _label(PERSON, 0, 0, 9, 9, 0.8)
+    assert nms_labels([car, person], 0.5) == [car, person]
+
+    # IoU of the boxes is 0.5, it is not above the threshold
+    left = _label(CAR, 0, 0, 9, 14)
+    right = _label(CAR, 0, 5, 9, 19)
+    assert nms_labels([left, right], 0.5) == [left, right]
+    assert nms_labels([left, right], 0.4) == [left]
+
+
+def _covers(windows, height: int, width: int) -> bool:
+    covered = set()
+    for rect in windows:
+        for row in range(rect.top, rect.bottom + 1):
+            for col in range(rect.left, rect.right + 1):
+                covered.add((row, col))
+    return len(covered) == height * width
+
+
+def test_sliding_windows_cover_the_image():
+    params = {"window": {"height": 16, "width": 16}, "min_overlap": {"x": 4, "y": 4}}
+    windows = get_sliding_windows((40, 30), params)
+    assert all(rect.height == 16 and rect.width == 16 for rect in windows)
+    assert all(rect.bottom < 40 and rect.right < 30 for rect in windows)
+    assert _covers(windows, 40, 30)
+
+
+def test_sliding_window_larger_than_image_is_shrinked():
+    params = {"window": {"height": 64, "width": 64}, "min_overlap": {"x": 64, "y": 64}}
+    windows = get_sliding_windows((20, 30), params)
+    assert len(windows) == 1
+    assert (windows[0].height, windows[0].width) == (20, 30)
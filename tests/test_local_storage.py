@@ -0,0 +1,237 @@
+import os
+
+import numpy as np
+import pytest
+from supervisely import Annotation, Label, ObjClass, OpenMode, Project, ProjectMeta, Rectangle
+
+import src.globals as g
+from scripts.benchmark.fake_api import FakeApi
+from src.compute.dtl_utils.local_storage import LocalProjectSink, LocalProjectSource
+from src.compute.Net import Net
+from src.exceptions import BadSettingsError, GraphError
+
+BOX = ObjClass("box", Rectangle)
+# dataset name -> image sizes (height, width) of its items
+DATASETS = {"ds1": [(30, 40), (20, 50), (40, 30)], "ds2": [(25, 35), (35, 25)]}
+
+
+def _make_image(height, width, seed):
+    return np.random.RandomState(seed).randint(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    project = Project(str(tmp_path / "proj"), OpenMode.CREATE)
+    project.set_meta(ProjectMeta([BOX]))
+    for ds_name, sizes in DATASETS.items():
+        dataset = project.create_dataset(ds_name)
+        for idx, (height, width) in enumerate(sizes):
+            ann = Annotation((height, width), [Label(Rectangle(1, 1, 10, 10), BOX)])
+            dataset.add_item_np(f"img_{idx}.png", _make_image(height, width, idx), ann=ann)
+    return str(tmp_path)
+
+
+def test_source_filters_datasets(source_dir):
+    source = LocalProjectSource(source_dir)
+
+    def names(srcs):
+        return [dataset.name for _, dataset in source.get_datasets(srcs)]
+
+    assert sorted(names(["proj/*"])) == ["ds1", "ds2"]
+    assert sorted(names(["proj"])) == ["ds1", "ds2"]
+    assert names(["proj/ds2"]) == ["ds2"]
+    assert sorted(names(["proj/ds2", "proj/*"])) == ["ds1", "ds2"]  # every dataset once
+    assert source.get_total_elements(["proj/ds1"]) == 3
+    assert source.get_items_keys(["proj/ds2"]) == [("proj/ds2", ["img_0.png", "img_1.png"])]
+    with pytest.raises(FileNotFoundError):
+        source.get_datasets(["proj/missing"])
+    with pytest.raises(FileNotFoundError):
+        source.get_datasets(["missing/*"])
+
+
+def test_source_reads_images_lazily(source_dir):
+    source = LocalProjectSource(source_dir)
+
+    batch = next(source.get_elements_generator_batched(["proj/ds1"], 10))
+
+    item_desc, ann = batch[1]
+    assert item_desc.item_data is None
+    assert item_desc.get_item_path() == os.path.join(source_dir, "proj", "ds1", "img", "img_1.png")
+    assert item_desc.get_item_name() == "img_1"
+    assert item_desc.get_item_ext() == ".png"
+    assert item_desc.info.item_info.id is None
+    # the size comes from the image header
+    assert (item_desc.info.item_info.height, item_desc.info.item_info.width) == (20, 50)
+    assert ann.img_size == (20, 50) and len(ann.labels) == 1
+    assert np.array_equal(item_desc.read_image(), _make_image(20, 50, 1))
+    assert item_desc.item_data is None
+
+
+def test_source_batches_items_of_datasets(source_dir):
+    source = LocalProjectSource(source_dir)
+
+    batches = list(source.get_elements_generator_batched(["proj/*"], 2))
+
+    # batches do not mix datasets
+    assert [[desc.get_ds_name() for desc, _ in batch] for batch in batches] == [
+        ["ds1", "ds1"],
+        ["ds1"],
+        ["ds2", "ds2"],
+    ]
+    assert [desc.get_item_idx() for batch in batches for desc, _ in batch] == [1, 2, 3, 4, 5]
+
+
+def test_sink_writes_items(source_dir, tmp_path):
+    source = LocalProjectSource(source_dir)
+    sink = LocalProjectSink(str(tmp_path / "out"))
+    (unchanged, ann), (changed, changed_ann) = next(
+        source.get_elements_generator_batched(["proj/ds1"], 2)
+    )
+    changed.update_item(np.zeros((20, 50, 3), dtype=np.uint8))
+
+    project = sink.create_project("result", ProjectMeta([BOX]), "images")
+    sink.add_items(project, "ds1", ["a.png", "b.png"], [(unchanged, ann), (changed, changed_ann)])
+
+    result = Project(str(tmp_path / "out" / "result"), OpenMode.READ)
+    dataset = result.datasets.get("ds1")
+    assert sorted(dataset.get_items_names()) == ["a.png", "b.png"]
+    assert len(dataset.get_ann("a.png", result.meta).labels) == 1
+    # unchanged image is linked to the source file, the changed one is written
+    assert os.path.samefile(dataset.get_item_path("a.png"), unchanged.get_item_path())
+    assert not os.path.samefile(dataset.get_item_path("b.png"), changed.get_item_path())
+    assert not np.any(changed.read_image())
+
+
+def test_sink_records_only_its_projects(tmp_path):
+    os.makedirs(tmp_path / "result")  # project of a previous run
+    sink = LocalProjectSink(str(tmp_path))
+
+    sink.create_project("result", ProjectMeta(), "images")
+
+    assert sink.projects_dirs == [str(tmp_path / "result_001")]
+
+
+def _labeling_job_settings(create_new_project):
+    return {
+        "job_name": "job",
+        "description": None,
+        "readme": None,
+        "user_ids": [1],
+        "reviewer_id": 1,
+        "classes_to_label": "default",
+        "tags_to_label": [],
+        "create_new_project": create_new_project,
+        "project_name": "result",
+        "dataset_name": None,
+        "keep_original_ds": True,
+    }
+
+
+class _LabelingJobApi:
+    def __init__(self):
+        self.images_ids = []
+
+    def create(self, images_ids, **kwargs):
+        self.images_ids.extend(images_ids)
+        return [images_ids]
+
+
+def _make_net(source_dir, save_layer):
+    graph = [
+        {
+            "action": "images_project",
+            "src": ["proj/*"],
+            "dst": "$data",
+            "settings": {"classes_mapping": "default", "tags_mapping": "default"},
+        },
+        dict(save_layer, src=["$data"]),
+    ]
+    return Net(graph, source_dir, "images", source=LocalProjectSource(source_dir))
+
+
+@pytest.mark.parametrize(
+    "action, dst, settings",
+    [
+        ("create_new_project", "result", {"project_name": "result"}),
+        (
+            "output_project",
+            "result",
+            {"is_existing_project": False, "project_name": "result", "dataset_option": "keep"},
+        ),
+        (
+            "output_project",
+            "existing",
+            {"is_existing_project": True, "project_name": None, "dataset_option": "keep"},
+        ),
+        (
+            "output_project",
+            "existing",
+            {
+                "is_existing_project": True,
+                "project_name": None,
+                "dataset_option": "new",
+                "dataset_name": "new",
+            },
+        ),
+        ("add_to_existing_project", "existing", {"dataset_option": "keep"}),
+        (
+            "add_to_existing_project",
+            "existing",
+            {"dataset_option": "new", "dataset_name": "new"},
+        ),
+        ("create_labeling_job", "result", _labeling_job_settings(create_new_project=True)),
+    ],
+)
+def test_local_source_is_uploaded_as_pixels(source_dir, monkeypatch, action, dst, settings):
+    api = FakeApi()
+    api.labeling_job = _LabelingJobApi()
+    monkeypatch.setattr(g, "api", api)
+    if dst == "existing":
+        project = api.project.create(api.workspace_id, "existing", type="images")
+        api.project.update_meta(project.id, ProjectMeta([BOX]))
+        dst = str(project.id)
+    net = _make_net(source_dir, {"action": action, "dst": [dst], "settings": settings})
+
+    net.validate(None)
+    net.calc_metas()
+    net.preprocess()
+    for batch in net.get_elements_generator_batched(2):
+        for _ in net.start(batch):
+            pass
+    net.postprocess()
+
+    # local items have no ids on the server to copy
+    assert api.stats["requests.image.upload_ids"] == 0
+    assert api.stats["uploaded_items"] == 5
+    if action == "create_labeling_job":
+        assert len(api.labeling_job.images_ids) == 5
+
+
+@pytest.mark.parametrize(
+    "save_layer, error",
+    [
+        (
+            {
+                "action": "create_labeling_job",
+                "dst": [],
+                "settings": _labeling_job_settings(create_new_project=False),
+            },
+            BadSettingsError,
+        ),
+        (
+            {
+                "action": "copy_annotations",
+                "dst": [],
+                "settings": {"project_id": 1, "dataset_ids": [1]},
+            },
+            GraphError,
+        ),
+    ],
+)
+def test_save_layers_of_server_items_reject_local_source(source_dir, save_layer, error):
+    net = _make_net(source_dir, save_layer)
+
+    with pytest.raises(error) as exc_info:
+        net.validate(None)
+    # str() of the error looks up layer titles in the UI actions
+    assert "local source" in exc_info.value.args[0]
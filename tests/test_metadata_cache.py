@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+import src.globals as g
+from src.utils import get_dataset_by_id, invalidate_datasets_cache
+
+
+def test_run_reloads_dataset_infos(monkeypatch):
+    items_count = {"value": 10}
+
+    def get_info_by_id(id, raise_error=False):
+        return SimpleNamespace(id=id, project_id=1, name="ds", items_count=items_count["value"])
+
+    monkeypatch.setattr(
+        g, "api", SimpleNamespace(dataset=SimpleNamespace(get_info_by_id=get_info_by_id))
+    )
+    g.cache.invalidate()
+
+    assert get_dataset_by_id(5).items_count == 10
+    items_count["value"] = 20
+    # served from the cache until a run starts
+    assert get_dataset_by_id(5).items_count == 10
+    invalidate_datasets_cache()
+    assert get_dataset_by_id(5).items_count == 20
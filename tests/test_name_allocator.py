@@ -0,0 +1,38 @@
+from src.compute.dtl_utils.name_allocator import NameAllocator
+
+
+def test_collisions_get_suffixes():
+    allocator = NameAllocator()
+    names = allocator.allocate_batch(["img", "img", "other", "img"], "project/ds")
+    assert names == ["img", "img_001", "other", "img_002"]
+    # datasets are independent
+    assert allocator.allocate("img", "project/ds2") == "img"
+
+
+def test_existing_names_are_loaded_lazily():
+    calls = []
+
+    def source():
+        calls.append(1)
+        return [["img", "img_001"], ["img_003"]]
+
+    allocator = NameAllocator()
+    allocator.register_existing("project/ds", source)
+    allocator.allocate("img", "project/other")
+    assert calls == []
+
+    assert allocator.allocate_batch(["img", "img", "new"], "project/ds") == [
+        "img_002",
+        "img_004",
+        "new",
+    ]
+    allocator.allocate("img", "project/ds")
+    assert calls == [1]
+
+
+def test_reset():
+    allocator = NameAllocator()
+    allocator.add_existing("project/ds", ["img"])
+    assert allocator.allocate("img", "project/ds") == "img_001"
+    allocator.reset()
+    assert allocator.allocate("img", "project/ds") == "img"
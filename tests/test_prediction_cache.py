@@ -0,0 +1,49 @@
+import time
+
+from src.prediction_cache import PredictionCache
+
+
+def _ann(idx: int) -> dict:
+    # incompressible enough for the sizes to be predictable
+    return {"labels": [f"{idx}-{value}" for value in range(50)]}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    probe = PredictionCache(str(tmp_path / "probe.sqlite"), 10**9)
+    probe.put_many({"a": _ann(0)})
+    entry_size = probe.stats()["size"]
+    probe.close()
+
+    cache = PredictionCache(str(tmp_path / "cache.sqlite"), int(entry_size * 2.5))
+    cache.put_many({"a": _ann(0)})
+    time.sleep(0.01)
+    cache.put_many({"b": _ann(1)})
+    time.sleep(0.01)
+    assert cache.get_many(["a"]) == {"a": _ann(0)}  # "b" is the least recently used now
+    time.sleep(0.01)
+    cache.put_many({"c": _ann(2)})
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["size"] <= cache.max_bytes
+    cache.close()
+
+
+def test_size_is_restored_on_reopen(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = PredictionCache(path, 10**9)
+    cache.put_many({"a": _ann(0), "b": _ann(1)})
+    cache.put_many({"a": _ann(0)})  # replaced entry is not counted twice
+    size = cache.stats()["size"]
+    cache.close()
+
+    cache = PredictionCache(path, 10**9)
+    assert cache.get_many(["a"]) == {"a": _ann(0)}
+    assert cache.stats()["size"] == size
+    cache.close()
+
+
+def test_disabled_cache():
+    cache = PredictionCache("unused.sqlite", 0)
+    assert not cache.enabled
+    cache.put_many({"a": _ann(0)})
+    assert cache.get_many(["a"]) == {}
@@ -0,0 +1,20 @@
+import numpy as np
+
+from src.ui.preview_images import EncodedPreviewCache
+
+
+def _image(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 255, (64, 64, 3), dtype=np.uint8)
+
+
+def test_evicted_preview_is_encoded_again_with_same_etag():
+    cache = EncodedPreviewCache(max_bytes=1)
+    images = {"a": _image(0), "b": _image(1)}
+    etag_a = cache.put("a", images["a"])
+    cache.put("b", images["b"])
+    assert cache.get("a") is None
+
+    etag, data = cache.get_or_put("a", lambda: images["a"])
+    assert etag == etag_a
+    assert len(data) > 0
+    assert cache.get_or_put("c", lambda: None) is None
@@ -0,0 +1,39 @@
+import json
+import os
+
+from src.compute.dtl_utils.run_journal import RunJournal
+
+
+def _record(cursor: int, items: list, saved: dict = None, state: dict = None) -> str:
+    return json.dumps(
+        {"cursor": cursor, "items": items, "saved": saved or {}, "state": state or {}}
+    )
+
+
+def test_load_truncates_incomplete_record(tmp_path):
+    path = str(tmp_path / "journal" / "0.jsonl")
+    os.makedirs(os.path.dirname(path))
+    complete = (
+        _record(2, [["1", 10], ["1", 11]], saved={"3": [["1", 10]]}, state={"3": {"jobs": 1}})
+        + "\n"
+        + _record(3, [["1", 12]])
+        + "\n"
+    )
+    with open(path, "w") as f:
+        f.write(complete + _record(5, [["1", 13]])[:20])
+
+    journal = RunJournal(path, resume=True)
+    assert journal.resumed
+    assert journal.cursor == 3
+    assert journal.done_items == {("1", 10), ("1", 11), ("1", 12)}
+    assert journal.saved_items == {3: {("1", 10)}}
+    assert journal.layers_states == {3: [{"jobs": 1}]}
+    with open(path) as f:
+        assert f.read() == complete
+
+    # new records go after the complete ones and are loaded by the next resume
+    journal.write_checkpoint(1, [], {})
+    journal.close()
+    journal = RunJournal(path, resume=True)
+    assert journal.cursor == 4
+    journal.close()
@@ -0,0 +1,145 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.compute.dtl_utils.sharding import ShardCoordinator, ShardPlan, split_items
+from src.compute.Layer import Layer
+from src.compute.Net import Net
+
+
+class _RecordingLayer:
+    def __init__(self):
+        self.postprocessed = False
+
+    def postprocess(self):
+        self.postprocessed = True
+
+    def get_shard_state(self):
+        return {"state": 1}
+
+
+def _is_shard_run(coordinator) -> bool:
+    return Layer.is_shard_run(SimpleNamespace(net=SimpleNamespace(coordinator=coordinator)))
+
+
+def _postprocess(coordinator) -> _RecordingLayer:
+    layer = _RecordingLayer()
+    Net.postprocess(SimpleNamespace(layers=[layer], coordinator=coordinator))
+    return layer
+
+
+def test_single_run_finalizes_inline(tmp_path):
+    coordinator = ShardCoordinator.for_single_run(str(tmp_path))
+    assert coordinator.is_shard
+    assert not coordinator.defers_finalize
+    assert not _is_shard_run(coordinator)
+
+    layer = _postprocess(coordinator)
+    assert layer.postprocessed
+    # no finalize step, so no state is saved for it
+    assert coordinator.get_unfinished_shards() == [0]
+
+
+def test_shard_defers_finalize(tmp_path):
+    coordinator = ShardCoordinator(str(tmp_path), 2, 1)
+    assert coordinator.defers_finalize
+    assert _is_shard_run(coordinator)
+
+    _postprocess(coordinator)
+    assert coordinator.get_unfinished_shards() == [0]
+    assert os.path.isfile(os.path.join(str(tmp_path), "shards", "1.json"))
+
+
+def test_single_shard_of_sharded_run_defers_finalize(tmp_path):
+    # --shards 1 still has a separate --finalize step
+    coordinator = ShardCoordinator(str(tmp_path), 1, 0)
+    assert _is_shard_run(coordinator)
+    _postprocess(coordinator)
+    assert coordinator.get_unfinished_shards() == []
+    assert coordinator.load_states() == {0: [{"state": 1}]}
+
+
+def test_finalize_inline_requires_single_shard(tmp_path):
+    with pytest.raises(ValueError):
+        ShardCoordinator(str(tmp_path), 2, 0, finalize_inline=True)
+    with pytest.raises(ValueError):
+        ShardCoordinator(str(tmp_path), 1, None, finalize_inline=True)
+
+
+def test_split_items_covers_all_items_once():
+    datasets_keys = [("1", [1, 2, 3]), ("2", []), ("3", [10, 11, 12, 13, 14])]
+    shards = split_items(datasets_keys, 3)
+
+    assert shards == [
+        [["1", 1, 2, 2]],
+        [["1", 3, 3, 1], ["3", 10, 11, 2]],
+        [["3", 12, 14, 3]],
+    ]
+    assert sum(count for ranges in shards for *_, count in ranges) == 8
+
+
+def test_split_items_more_shards_than_items():
+    shards = split_items([("1", [5, 6])], 4)
+    assert [len(ranges) for ranges in shards].count(0) == 2
+    assert sum(ranges[0][3] for ranges in shards if ranges) == 2
+
+
+def test_shard_plan():
+    plan = ShardPlan([["1", 3, 3, 1], ["3", 10, 11, 2]])
+    assert plan.items_count == 3
+    assert plan.has_dataset("3")
+    assert not plan.has_dataset("2")
+    assert plan.contains("3", 11)
+    assert not plan.contains("3", 12)
+    assert not plan.contains("1", 2)
+
+    plan.skip([("3", 10), ("3", 12)])
+    assert plan.items_count == 2
+    assert not plan.contains("3", 10)
+    assert plan.contains("3", 11)
+
+
+def test_once_runs_fn_in_one_worker(tmp_path):
+    calls = []
+
+    def create():
+        calls.append(1)
+        return {"id": len(calls)}
+
+    first = ShardCoordinator(str(tmp_path), 2, 0)
+    second = ShardCoordinator(str(tmp_path), 2, 1)
+    assert first.once("project", create) == {"id": 1}
+    assert second.once("project", create) == {"id": 1}
+    assert second.once("dataset", create) == {"id": 2}
+    assert len(calls) == 2
+
+
+def test_once_retries_after_failure(tmp_path):
+    coordinator = ShardCoordinator(str(tmp_path), 1, 0)
+
+    def fail():
+        raise RuntimeError("create failed")
+
+    with pytest.raises(RuntimeError):
+        coordinator.once("project", fail)
+    # the lock is released, so another attempt can create the entity
+    assert coordinator.once("project", lambda: 7) == 7
+
+
+def test_reserve_name(tmp_path):
+    first = ShardCoordinator(str(tmp_path), 2, 0)
+    second = ShardCoordinator(str(tmp_path), 2, 1)
+    assert first.reserve_name("project/ds", "img")
+    assert not second.reserve_name("project/ds", "img")
+    assert second.reserve_name("project/ds", "img_001")
+    assert second.reserve_name("project/other", "img")
+
+
+def test_shard_started_again_gets_new_names(tmp_path):
+    first_attempt = ShardCoordinator(str(tmp_path), 2, 0)
+    assert first_attempt.reserve_name("project/ds", "img")
+
+    # the item may be already saved by the first attempt, its name is not given back
+    second_attempt = ShardCoordinator(str(tmp_path), 2, 0)
+    assert not second_attempt.reserve_name("project/ds", "img")